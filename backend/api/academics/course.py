@@ -4,6 +4,7 @@ This API is used to access course data."""
 
 from fastapi import APIRouter, Depends
 from ..authentication import registered_user
+from ..readonly_services import readonly_course_svc
 from ...services.academics import CourseService
 from ...models import User
 from ...models.academics import Course, CourseDetails
@@ -21,7 +22,9 @@ openapi_tags = {
 
 
 @api.get("", tags=["Academics"])
-def get_courses(course_service: CourseService = Depends()) -> list[Course]:
+def get_courses(
+    course_service: CourseService = Depends(readonly_course_svc),
+) -> list[Course]:
     """
     Get all courses
 
@@ -33,7 +36,7 @@ def get_courses(course_service: CourseService = Depends()) -> list[Course]:
 
 @api.get("/{id}", response_model=CourseDetails, tags=["Academics"])
 def get_course_by_id(
-    id: str, course_service: CourseService = Depends()
+    id: str, course_service: CourseService = Depends(readonly_course_svc)
 ) -> CourseDetails:
     """
     Gets one course by its id
@@ -3,6 +3,7 @@
 This API is used to access all courses data."""
 
 from fastapi import APIRouter, Depends
+from ..readonly_services import readonly_course_svc
 from ...services.academics import CourseService
 from ...models.academics import Course
 
@@ -19,7 +20,9 @@ openapi_tags = {
 
 
 @api.get("", tags=["Academics"])
-def get_all_courses(course_service: CourseService = Depends()) -> list[Course]:
+def get_all_courses(
+    course_service: CourseService = Depends(readonly_course_svc),
+) -> list[Course]:
     """
     Get all courses
 
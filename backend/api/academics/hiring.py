@@ -2,16 +2,20 @@
 
 Hiring routes are used for hiring based on TA Applications."""
 
+from typing import Iterable, Iterator
 from fastapi import APIRouter, Depends
 import io
 import csv
 from fastapi.responses import StreamingResponse
 
-from backend.models.pagination import Paginated, PaginationParams
+from backend.models.pagination import Paginated, PaginationCount, PaginationParams
 
 from ...services.academics import HiringService
 
-from ...models.academics.hiring.application_review import HiringStatus
+from ...models.academics.hiring.application_review import (
+    ApplicationReviewCsvRow,
+    HiringStatus,
+)
 from ...models.academics.hiring.hiring_assignment import *
 from ...models.academics.hiring.hiring_level import *
 from ...models.academics.hiring.conflict_check import ConflictCheck
@@ -30,6 +34,35 @@ openapi_tags = {
     "description": "View and update the hiring status for a course site.",
 }
 
+CSV_CHUNK_SIZE = 64 * 1024
+"""Approximate number of characters of CSV text sent in each chunk of a streamed export."""
+
+
+def _csv_response(
+    rows: Iterable[dict], fieldnames: list[str], filename: str
+) -> StreamingResponse:
+    """
+    Streams rows as a CSV attachment, writing each chunk as the rows are loaded so that
+    neither the rows nor the CSV text of an export are held in memory all at once.
+    """
+
+    def chunks() -> Iterator[str]:
+        stream = io.StringIO()
+        wr = csv.DictWriter(stream, delimiter=",", fieldnames=fieldnames)
+        wr.writeheader()
+        for row in rows:
+            wr.writerow(row)
+            if stream.tell() >= CSV_CHUNK_SIZE:
+                yield stream.getvalue()
+                stream.seek(0)
+                stream.truncate()
+        yield stream.getvalue()
+
+    # Create HTTP response of type `text/csv`
+    response = StreamingResponse(chunks(), media_type="text/csv")
+    response.headers["Content-Disposition"] = f"attachment; filename={filename}"
+    return response
+
 
 @api.get("/admin/{term_id}", tags=["Hiring"])
 def get_hiring_admin_overview(
@@ -170,6 +203,8 @@ def get_hiring_summary_overview(
     page_size: int = 100,
     order_by: str = "",
     filter: str = "",
+    cursor: str = "",
+    count: PaginationCount = "exact",
     subject: User = Depends(registered_user),
     hiring_service: HiringService = Depends(),
 ) -> Paginated[HiringAssignmentSummaryOverview]:
@@ -177,7 +212,12 @@ def get_hiring_summary_overview(
     Returns the state of hiring as a summary.
     """
     pagination_params = PaginationParams(
-        page=page, page_size=page_size, order_by=order_by, filter=filter
+        page=page,
+        page_size=page_size,
+        order_by=order_by,
+        filter=filter,
+        cursor=cursor,
+        count=count,
     )
     return hiring_service.get_hiring_summary_overview(
         subject, term_id, pagination_params
@@ -195,19 +235,13 @@ def get_hiring_summary_csv(
     """
     # Get the data
     data = hiring_service.get_hiring_summary_for_csv(subject, term_id)
-    # Create IO Stream
-    stream = io.StringIO()
-    # Create dictionary writer to convert objects to CSV rows
     # Note: __dict__ converts the Pydantic model into a dictionary of key-value
     # pairs, enabling access of the object's keys.
-    wr = csv.DictWriter(stream, delimiter=",", fieldnames=list(data[0].__dict__.keys()))
-    wr.writeheader()
-    wr.writerows([d.__dict__ for d in data])
-    # Create HTTP response of type `text/csv`
-    response = StreamingResponse(iter([stream.getvalue()]), media_type="text/csv")
-    response.headers["Content-Disposition"] = "attachment; filename=export.csv"
-    # Return the response
-    return response
+    return _csv_response(
+        (d.__dict__ for d in data),
+        list(HiringAssignmentCsvRow.model_fields.keys()),
+        "export.csv",
+    )
 
 
 @api.get("/{course_site_id}/csv", tags=["Hiring"])
@@ -221,19 +255,13 @@ def get_applicants_for_site_csv(
     """
     # Get the data
     data = hiring_service.get_course_site_hiring_status_csv(subject, course_site_id)
-    # Create IO Stream
-    stream = io.StringIO()
-    # Create dictionary writer to convert objects to CSV rows
     # Note: __dict__ converts the Pydantic model into a dictionary of key-value
     # pairs, enabling access of the object's keys.
-    wr = csv.DictWriter(stream, delimiter=",", fieldnames=list(data[0].__dict__.keys()))
-    wr.writeheader()
-    wr.writerows([d.__dict__ for d in data])
-    # Create HTTP response of type `text/csv`
-    response = StreamingResponse(iter([stream.getvalue()]), media_type="text/csv")
-    response.headers["Content-Disposition"] = "attachment; filename=export.csv"
-    # Return the response
-    return response
+    return _csv_response(
+        (d.__dict__ for d in data),
+        list(ApplicationReviewCsvRow.model_fields.keys()),
+        "export.csv",
+    )
 
 
 @api.get("/summary/{term_id}/phd_applicants", tags=["Hiring"])
@@ -246,11 +274,6 @@ def get_hiring_summary_csv(
     Returns the state of hiring as a summary.
     """
     data = hiring_service.get_phd_applicants(subject, term_id)
-    # Create IO Stream
-    stream = io.StringIO()
-    # Create dictionary writer to convert objects to CSV rows
-    # Note: __dict__ converts the Pydantic model into a dictionary of key-value
-    # pairs, enabling access of the object's keys.
     keys = [
         "id",
         "last_name",
@@ -264,33 +287,23 @@ def get_hiring_summary_csv(
         "student_preferences",
         "instructor_preferences",
     ]
-    wr = csv.DictWriter(stream, delimiter=",", fieldnames=keys)
-    wr.writeheader()
-    rows = []
-    for d in data:
-        rows.append(
-            {
-                "id": d.id,
-                "last_name": d.applicant.last_name,
-                "first_name": d.applicant.first_name,
-                "pid": d.applicant.pid,
-                "onyen": d.applicant.onyen,
-                "email": d.applicant.email,
-                "advisor": d.advisor,
-                "program_pursued": d.program_pursued,
-                "intro_video_url": d.intro_video_url,
-                "student_preferences": ", ".join(d.student_preferences),
-                "instructor_preferences": ", ".join(d.instructor_preferences),
-            }
-        )
-    wr.writerows(rows)
-    # Create HTTP response of type `text/csv`
-    response = StreamingResponse(iter([stream.getvalue()]), media_type="text/csv")
-    response.headers["Content-Disposition"] = (
-        f"attachment; filename=phd_applicants_{term_id}.csv"
+    rows = (
+        {
+            "id": d.id,
+            "last_name": d.applicant.last_name,
+            "first_name": d.applicant.first_name,
+            "pid": d.applicant.pid,
+            "onyen": d.applicant.onyen,
+            "email": d.applicant.email,
+            "advisor": d.advisor,
+            "program_pursued": d.program_pursued,
+            "intro_video_url": d.intro_video_url,
+            "student_preferences": ", ".join(d.student_preferences),
+            "instructor_preferences": ", ".join(d.instructor_preferences),
+        }
+        for d in data
     )
-    # Return the response
-    return response
+    return _csv_response(rows, keys, f"phd_applicants_{term_id}.csv")
 
 
 @api.get("/assignments/{course_site_id}", tags=["Hiring"])
@@ -324,35 +337,19 @@ def get_assignments_csv(
     data = hiring_service.get_assignment_summary_for_instructors_csv(
         subject, course_site_id
     )
-    # Create IO Stream
-    stream = io.StringIO()
-    # Create dictionary writer to convert objects to CSV rows
-    # Note: __dict__ converts the Pydantic model into a dictionary of key-value
-    # pairs, enabling access of the object's keys.
     keys = ["first_name", "last_name", "onyen", "pid", "email", "level_title"]
-
-    wr = csv.DictWriter(stream, delimiter=",", fieldnames=keys)
-    wr.writeheader()
-    rows = []
-    for d in data:
-        rows.append(
-            {
-                "first_name": d.first_name,
-                "last_name": d.last_name,
-                "pid": d.pid,
-                "onyen": d.onyen,
-                "email": d.email,
-                "level_title": d.level_title,
-            }
-        )
-    wr.writerows(rows)
-    # Create HTTP response of type `text/csv`
-    response = StreamingResponse(iter([stream.getvalue()]), media_type="text/csv")
-    response.headers["Content-Disposition"] = (
-        f"attachment; filename=hiring_assignments.csv"
+    rows = (
+        {
+            "first_name": d.first_name,
+            "last_name": d.last_name,
+            "pid": d.pid,
+            "onyen": d.onyen,
+            "email": d.email,
+            "level_title": d.level_title,
+        }
+        for d in data
     )
-    # Return the response
-    return response
+    return _csv_response(rows, keys, "hiring_assignments.csv")
 
 
 @api.get("/conflict_check/{application_id}", tags=["Hiring"])
@@ -362,3 +359,13 @@ def conflict_check(
     hiring_service: HiringService = Depends(),
 ) -> ConflictCheck:
     return hiring_service.conflict_check(subject, application_id)
+
+
+@api.get("/conflicts/{term_id}", tags=["Hiring"])
+def get_conflicts(
+    term_id: str,
+    subject: User = Depends(registered_user),
+    hiring_service: HiringService = Depends(),
+) -> list[ConflictCheck]:
+    """Returns every application in a term preferred by more than one course site."""
+    return hiring_service.get_conflicts(subject, term_id)
@@ -29,7 +29,12 @@ from ...models.office_hours.course_site import (
     UpdatedCourseSite,
 )
 from ...models.office_hours.course_site_details import CourseSiteDetails
-from ...models.pagination import PaginationParams, Paginated, TicketPaginationParams
+from ...models.pagination import (
+    PaginationCount,
+    PaginationParams,
+    Paginated,
+    TicketPaginationParams,
+)
 
 __authors__ = ["Kris Jordan", "Ajay Gandecha"]
 __copyright__ = "Copyright 2024"
@@ -78,6 +83,8 @@ def get_course_site_roster(
     page_size: int = 10,
     order_by: str = "",
     filter: str = "",
+    cursor: str = "",
+    count: PaginationCount = "exact",
     subject: User = Depends(registered_user),
     course_site_svc: CourseSiteService = Depends(),
 ) -> Paginated[CourseMemberOverview]:
@@ -88,7 +95,12 @@ def get_course_site_roster(
         CourseRosterOverview
     """
     pagination_params = PaginationParams(
-        page=page, page_size=page_size, order_by=order_by, filter=filter
+        page=page,
+        page_size=page_size,
+        order_by=order_by,
+        filter=filter,
+        cursor=cursor,
+        count=count,
     )
     return course_site_svc.get_course_site_roster(
         subject, course_site_id, pagination_params
@@ -197,6 +209,8 @@ def get_paginated_ticket_history(
     staff_ids: str = "",
     range_start: str = "",
     range_end: str = "",
+    cursor: str = "",
+    count: PaginationCount = "exact",
     subject: User = Depends(registered_user),
     oh_statistics_svc: OfficeHoursStatisticsService = Depends(),
 ) -> Paginated[OfficeHourTicketOverview]:
@@ -214,6 +228,8 @@ def get_paginated_ticket_history(
         staff_ids=json.loads(staff_ids) if len(staff_ids) > 0 else [],
         range_start=range_start,
         range_end=range_end,
+        cursor=cursor,
+        count=count,
     )
 
     return oh_statistics_svc.get_paginated_tickets(
@@ -239,6 +255,8 @@ def get_paginated_ticket_history(
     staff_ids: str = "",
     range_start: str = "",
     range_end: str = "",
+    cursor: str = "",
+    count: PaginationCount = "exact",
     subject: User = Depends(registered_user),
     oh_statistics_svc: OfficeHoursStatisticsService = Depends(),
 ) -> Paginated[OfficeHourTicketOverview]:
@@ -256,6 +274,8 @@ def get_paginated_ticket_history(
         staff_ids=json.loads(staff_ids) if len(staff_ids) > 0 else [],
         range_start=range_start,
         range_end=range_end,
+        cursor=cursor,
+        count=count,
     )
 
     return oh_statistics_svc.get_paginated_tickets(
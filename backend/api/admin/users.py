@@ -3,6 +3,7 @@
 from fastapi import APIRouter, Depends, HTTPException
 from ...services import UserService, UserPermissionException
 from ...models import User, Paginated, PaginationParams
+from ...models.pagination import PaginationCount
 from ..authentication import registered_user
 
 
@@ -26,11 +27,18 @@ def list_users(
     page_size: int = 10,
     order_by: str = "first_name",
     filter: str = "",
+    cursor: str = "",
+    count: PaginationCount = "exact",
 ) -> Paginated[User]:
     """List users via standard backend pagination query parameters."""
     try:
         pagination_params = PaginationParams(
-            page=page, page_size=page_size, order_by=order_by, filter=filter
+            page=page,
+            page_size=page_size,
+            order_by=order_by,
+            filter=filter,
+            cursor=cursor,
+            count=count,
         )
         return user_service.list(subject, pagination_params)
     except UserPermissionException as e:
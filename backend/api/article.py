@@ -3,12 +3,13 @@
 from fastapi import APIRouter, Depends
 
 from ..api.authentication import registered_user
+from ..api.readonly_services import readonly_article_svc
 
 from ..services.article import ArticleService
 
 from ..models import User
 from ..models.articles import WelcomeOverview, ArticleOverview, ArticleDraft
-from ..models.pagination import Paginated, PaginationParams
+from ..models.pagination import Paginated, PaginationCount, PaginationParams
 
 __authors__ = ["Ajay Gandecha"]
 __copyright__ = "Copyright 2024"
@@ -23,7 +24,8 @@ openapi_tags = {
 
 @api.get("/welcome", tags=["Articles"])
 def get_welcome_status(
-    subject: User = Depends(registered_user), article_svc: ArticleService = Depends()
+    subject: User = Depends(registered_user),
+    article_svc: ArticleService = Depends(readonly_article_svc),
 ) -> WelcomeOverview:
     """Retrieves the welcome status."""
     return article_svc.get_welcome_overview(subject)
@@ -31,7 +33,7 @@ def get_welcome_status(
 
 @api.get("/welcome/unauthenticated", tags=["Articles"])
 def get_welcome_status_unauthenticated(
-    article_svc: ArticleService = Depends(),
+    article_svc: ArticleService = Depends(readonly_article_svc),
 ) -> WelcomeOverview:
     """Retrieves the welcome status for an unauthenticated user."""
     return article_svc.get_welcome_overview(None)
@@ -45,10 +47,17 @@ def list(
     page_size: int = 10,
     order_by: str = "",
     filter: str = "",
+    cursor: str = "",
+    count: PaginationCount = "exact",
 ) -> Paginated[ArticleOverview]:
     """List paginated articles."""
     pagination_params = PaginationParams(
-        page=page, page_size=page_size, order_by=order_by, filter=filter
+        page=page,
+        page_size=page_size,
+        order_by=order_by,
+        filter=filter,
+        cursor=cursor,
+        count=count,
     )
     return article_svc.list(subject, pagination_params)
 
@@ -56,7 +65,7 @@ def list(
 @api.get("/{slug}", tags=["Articles"])
 def get_article(
     slug: str,
-    article_svc: ArticleService = Depends(),
+    article_svc: ArticleService = Depends(readonly_article_svc),
 ) -> ArticleOverview:
     """Retrieves the welcome status."""
     return article_svc.get_article(slug)
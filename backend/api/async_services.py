@@ -0,0 +1,147 @@
+"""Dependency injection of services bound to an AsyncSession, for `async def` routes.
+
+FastAPI constructs class dependencies such as `StatusService = Depends()` over the synchronous
+`db_session`, and runs the routes using them in its threadpool. The dependencies here instead
+return an `AsyncService`, which constructs a service, and every service it depends on, inside
+`AsyncSession.run_sync`. All of them share that AsyncSession's synchronous Session, so their
+queries run on the event loop and await asyncpg for I/O. Routes call the service's ordinary
+methods through `AsyncService.run`.
+"""
+
+from typing import Callable, Generic, TypeVar
+
+from fastapi import Depends
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from ..database import async_db_session, async_readonly_db_session, run_async
+from ..services import (
+    EventService,
+    PermissionService,
+    RoomService,
+    SignageService,
+    UserService,
+)
+from ..services.coworking import (
+    OperatingHoursService,
+    PolicyService,
+    ReservationService,
+    SeatService,
+    StatusService,
+)
+from ..services.coworking.availability_snapshot import (
+    AvailabilitySnapshot,
+    get_availability_snapshot,
+)
+from ..services.office_hours.office_hours import OfficeHoursService
+from ..services.office_hours.queue_index import (
+    OfficeHoursQueueIndex,
+    get_office_hours_queue_index,
+)
+from ..services.permission_cache import PermissionCache, get_permission_cache
+from ..services.user_cache import UserCache, get_user_cache
+
+__authors__ = ["Kris Jordan"]
+__copyright__ = "Copyright 2025"
+__license__ = "MIT"
+
+S = TypeVar("S")
+T = TypeVar("T")
+
+
+class AsyncService(Generic[S]):
+    """A service constructed on demand over the synchronous Session of an AsyncSession."""
+
+    def __init__(self, session: AsyncSession, build: Callable[[Session], S]):
+        self._session = session
+        self._build = build
+
+    async def run(self, call: Callable[[S], T]) -> T:
+        """Constructs the service inside `run_sync` and returns the result of calling `call` on it."""
+        return await run_async(
+            self._session, lambda sync_session: call(self._build(sync_session))
+        )
+
+
+def _reservation_svc(
+    session: Session,
+    permission_svc: PermissionService,
+    availability_snapshot: AvailabilitySnapshot,
+) -> ReservationService:
+    return ReservationService(
+        session,
+        permission_svc,
+        PolicyService(),
+        OperatingHoursService(session, permission_svc),
+        SeatService(session),
+        availability_snapshot,
+    )
+
+
+async def async_status_svc(
+    session: AsyncSession = Depends(async_db_session),
+    permission_cache: PermissionCache = Depends(get_permission_cache),
+    availability_snapshot: AvailabilitySnapshot = Depends(get_availability_snapshot),
+) -> AsyncService[StatusService]:
+    """StatusService over an AsyncSession."""
+
+    def build(session: Session) -> StatusService:
+        permission_svc = PermissionService(session, permission_cache)
+        return StatusService(
+            PolicyService(),
+            OperatingHoursService(session, permission_svc),
+            SeatService(session),
+            _reservation_svc(session, permission_svc, availability_snapshot),
+        )
+
+    return AsyncService(session, build)
+
+
+async def async_signage_svc(
+    session: AsyncSession = Depends(async_readonly_db_session),
+    permission_cache: PermissionCache = Depends(get_permission_cache),
+    availability_snapshot: AvailabilitySnapshot = Depends(get_availability_snapshot),
+) -> AsyncService[SignageService]:
+    """SignageService over a read-only AsyncSession.
+
+    Signage displays poll these endpoints continuously and never write, so they are served from
+    the read replica when one is configured."""
+
+    def build(session: Session) -> SignageService:
+        permission_svc = PermissionService(session, permission_cache)
+        return SignageService(
+            session,
+            _reservation_svc(session, permission_svc, availability_snapshot),
+            SeatService(session),
+            RoomService(session, permission_svc),
+        )
+
+    return AsyncService(session, build)
+
+
+async def async_office_hours_svc(
+    session: AsyncSession = Depends(async_db_session),
+    queue_index: OfficeHoursQueueIndex = Depends(get_office_hours_queue_index),
+) -> AsyncService[OfficeHoursService]:
+    """OfficeHoursService over an AsyncSession."""
+    return AsyncService(
+        session, lambda session: OfficeHoursService(session, queue_index)
+    )
+
+
+async def async_event_svc(
+    session: AsyncSession = Depends(async_db_session),
+    permission_cache: PermissionCache = Depends(get_permission_cache),
+    user_cache: UserCache = Depends(get_user_cache),
+) -> AsyncService[EventService]:
+    """EventService over an AsyncSession."""
+
+    def build(session: Session) -> EventService:
+        permission_svc = PermissionService(session, permission_cache)
+        return EventService(
+            session,
+            permission_svc,
+            UserService(session, permission_svc, user_cache),
+        )
+
+    return AsyncService(session, build)
@@ -61,13 +61,26 @@ for routes used in the process of registering a user.
 import jwt
 import requests
 from datetime import datetime, timedelta
-from fastapi import APIRouter, Header, HTTPException, Request, Response, Depends
+from fastapi import (
+    APIRouter,
+    Header,
+    HTTPException,
+    Request,
+    Response,
+    Depends,
+    WebSocketException,
+    status,
+)
 from fastapi.exceptions import HTTPException
 from fastapi.security import HTTPBearer
 from fastapi.security.http import HTTPAuthorizationCredentials
 from fastapi.responses import RedirectResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+from ..database import async_engine, run_async
 from ..env import getenv
-from ..services import UserService, GitHubService
+from ..services import UserService, GitHubService, PermissionService
+from ..services.permission_cache import PermissionCache, get_permission_cache
+from ..services.user_cache import UserCache, get_user_cache
 from ..models import User
 
 
@@ -86,14 +99,28 @@ _JST_ALGORITHM = "HS256"
 def registered_user(
     user_service: UserService = Depends(),
     token: HTTPAuthorizationCredentials | None = Depends(HTTPBearer()),
+    user_cache: UserCache = Depends(get_user_cache),
+    permission_cache: PermissionCache = Depends(get_permission_cache),
 ) -> User:
-    """Returns the authenticated user or raises a 401 HTTPException if the user is not authenticated."""
+    """Returns the authenticated user or raises a 401 HTTPException if the user is not authenticated.
+
+    Decoded tokens and users are served from the UserCache when possible."""
     if token:
         try:
-            auth_info = jwt.decode(
-                token.credentials, _JWT_SECRET, algorithms=[_JST_ALGORITHM]
-            )
-            user = user_service.get(auth_info["pid"])
+            auth_info = user_cache.get_claims(token.credentials)
+            if auth_info is None:
+                auth_info = jwt.decode(
+                    token.credentials, _JWT_SECRET, algorithms=[_JST_ALGORITHM]
+                )
+                user_cache.put_claims(token.credentials, auth_info)
+
+            pid = auth_info["pid"]
+            version = permission_cache.version()
+            user = user_cache.get_user(pid, version)
+            if user is None:
+                user = user_service.get(pid)
+                if user:
+                    user_cache.put_user(user, version)
             if user:
                 return user
         except:
@@ -101,6 +128,42 @@ def registered_user(
     raise HTTPException(status_code=401, detail="Unauthorized")
 
 
+async def websocket_user(
+    token: str,
+    user_cache: UserCache = Depends(get_user_cache),
+    permission_cache: PermissionCache = Depends(get_permission_cache),
+) -> User:
+    """Returns the user authenticated by a WebSocket's `token` query parameter or closes the WebSocket.
+
+    Browsers cannot set headers when opening a WebSocket, so the bearer token is sent in the query
+    string instead. A user missing from the UserCache is loaded in a short-lived session, rather
+    than one held open for as long as the WebSocket is connected."""
+    try:
+        auth_info = user_cache.get_claims(token)
+        if auth_info is None:
+            auth_info = jwt.decode(token, _JWT_SECRET, algorithms=[_JST_ALGORITHM])
+            user_cache.put_claims(token, auth_info)
+
+        pid = auth_info["pid"]
+        version = permission_cache.version()
+        user = user_cache.get_user(pid, version)
+        if user is None:
+            async with AsyncSession(async_engine) as session:
+                user = await run_async(
+                    session,
+                    lambda s: UserService(
+                        s, PermissionService(s, permission_cache), user_cache
+                    ).get(pid),
+                )
+            if user:
+                user_cache.put_user(user, version)
+        if user:
+            return user
+    except jwt.exceptions.PyJWTError:
+        ...
+    raise WebSocketException(code=status.WS_1008_POLICY_VIOLATION)
+
+
 def authenticated_pid(
     token: HTTPAuthorizationCredentials | None = Depends(HTTPBearer()),
 ) -> tuple[int, str]:
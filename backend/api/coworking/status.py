@@ -3,6 +3,7 @@
 This API is used to retrieve and update a user's profile."""
 
 from fastapi import APIRouter, Depends
+from ..async_services import AsyncService, async_status_svc
 from ..authentication import registered_user
 from ...services.coworking import StatusService
 from ...models import User
@@ -21,8 +22,9 @@ openapi_tags = {
 
 
 @api.get("", response_model=Status, tags=["Coworking"])
-def get_coworking_status(
-    subject: User = Depends(registered_user), status_svc: StatusService = Depends()
+async def get_coworking_status(
+    subject: User = Depends(registered_user),
+    status_svc: AsyncService[StatusService] = Depends(async_status_svc),
 ):
     """Status endpoint supports the primary screen of the coworking features.
 
@@ -30,4 +32,4 @@ def get_coworking_status(
     It also fetches the current seat availability of the XL during operating hours.
     Finally, it provides a list of upcoming hours.
     """
-    return status_svc.get_coworking_status(subject)
+    return await status_svc.run(lambda svc: svc.get_coworking_status(subject))
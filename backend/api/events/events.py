@@ -6,7 +6,12 @@ from fastapi import APIRouter, Depends, HTTPException
 from datetime import datetime, timedelta
 from typing import Sequence
 from backend.models.public_user import PublicUser
-from backend.models.pagination import EventPaginationParams, Paginated, PaginationParams
+from backend.models.pagination import (
+    EventPaginationParams,
+    Paginated,
+    PaginationCount,
+    PaginationParams,
+)
 
 from backend.services.organization import OrganizationService
 
@@ -16,6 +21,7 @@ from ...services.exceptions import ResourceNotFoundException, UserPermissionExce
 from ...models.event import EventDraft, EventOverview, EventStatusOverview
 from ...models.coworking.time_range import TimeRange
 from ...api.authentication import registered_user
+from ...api.async_services import AsyncService, async_event_svc
 from ...models.user import User
 
 __authors__ = [
@@ -36,13 +42,15 @@ openapi_tags = {
 
 
 @api.get("/unauthenticated/paginate", tags=["Events"])
-def list_events(
-    event_service: EventService = Depends(),
+async def list_events(
+    event_service: AsyncService[EventService] = Depends(async_event_svc),
     order_by: str = "time",
     ascending: str = "true",
     filter: str = "",
     range_start: str = "",
     range_end: str = "",
+    cursor: str = "",
+    count: PaginationCount = "exact",
 ) -> Paginated[EventOverview]:
     """List events in time range via standard backend pagination query parameters."""
 
@@ -52,19 +60,25 @@ def list_events(
         filter=filter,
         range_start=range_start,
         range_end=range_end,
+        cursor=cursor,
+        count=count,
+    )
+    return await event_service.run(
+        lambda svc: svc.get_paginated_events(pagination_params, None)
     )
-    return event_service.get_paginated_events(pagination_params, None)
 
 
 @api.get("/paginate", tags=["Events"])
-def list_events(
+async def list_events(
     subject: User = Depends(registered_user),
-    event_service: EventService = Depends(),
+    event_service: AsyncService[EventService] = Depends(async_event_svc),
     order_by: str = "time",
     ascending: str = "true",
     filter: str = "",
     range_start: str = "",
     range_end: str = "",
+    cursor: str = "",
+    count: PaginationCount = "exact",
 ) -> Paginated[EventOverview]:
     """List events in time range via standard backend pagination query parameters."""
 
@@ -74,8 +88,12 @@ def list_events(
         filter=filter,
         range_start=range_start,
         range_end=range_end,
+        cursor=cursor,
+        count=count,
+    )
+    return await event_service.run(
+        lambda svc: svc.get_paginated_events(pagination_params, subject)
     )
-    return event_service.get_paginated_events(pagination_params, subject)
 
 
 @api.get("/unauthenticated/status", tags=["Events"])
@@ -6,6 +6,7 @@ Production systems monitor these end points upon deployment, and at regular inte
 from typing import Annotated
 from fastapi import APIRouter, Depends
 from ..models.openai_test_response import OpenAITestResponse
+from ..models.pool_status import HealthStatus
 from ..services.health import HealthService
 
 
@@ -22,16 +23,18 @@ api = APIRouter(prefix="/api/health")
 
 
 @api.get("", tags=["System Health"])
-def health_check(health_svc: Annotated[HealthService, Depends()]) -> str:
+def health_check(health_svc: Annotated[HealthService, Depends()]) -> HealthStatus:
     """Check the health status of the system.
 
     Args:
         health_svc: Service that performs health checks.
 
     Returns:
-        str: Status message indicating system health.
+        HealthStatus: Status message indicating system health, and the usage of this worker's
+            database connection pools: connections checked out and in overflow, and time spent
+            waiting for them.
     """
-    return health_svc.check()
+    return HealthStatus(status=health_svc.check(), pool=health_svc.check_pool())
 
 
 @api.get("/openai", tags=["System Health"])
@@ -13,6 +13,7 @@ from ...models.office_hours.office_hours_recurrence_pattern import (
 from ...services.office_hours.office_hours_recurrence import (
     OfficeHoursRecurrenceService,
 )
+from ..async_services import AsyncService, async_office_hours_svc
 from ..authentication import registered_user
 from ...services.office_hours.office_hours import OfficeHoursService
 from ...models.user import User
@@ -31,10 +32,10 @@ api = APIRouter(prefix="/api/office-hours")
 
 
 @api.get("/{id}/queue", tags=["Office Hours"])
-def get_office_hours_queue(
+async def get_office_hours_queue(
     id: int,
     subject: User = Depends(registered_user),
-    oh_event_svc: OfficeHoursService = Depends(),
+    oh_event_svc: AsyncService[OfficeHoursService] = Depends(async_office_hours_svc),
 ) -> OfficeHourQueueOverview:
     """
     Gets the queue overview for an office hour event.
@@ -42,7 +43,7 @@ def get_office_hours_queue(
     Returns:
         OfficeHourQueueOverview
     """
-    return oh_event_svc.get_office_hour_queue(subject, id)
+    return await oh_event_svc.run(lambda svc: svc.get_office_hour_queue(subject, id))
 
 
 @api.get("/{id}/role", tags=["Office Hours"])
@@ -8,6 +8,7 @@ from ..services import OrganizationService, RoleService
 from ..models.organization import Organization
 from ..models.organization_details import OrganizationDetails
 from ..api.authentication import registered_user
+from ..api.readonly_services import readonly_organization_svc
 from ..models.user import User
 
 __authors__ = ["Ajay Gandecha", "Jade Keegan", "Brianna Ta", "Audrey Toney"]
@@ -23,7 +24,7 @@ openapi_tags = {
 
 @api.get("", response_model=list[Organization], tags=["Organizations"])
 def get_organizations(
-    organization_service: OrganizationService = Depends(),
+    organization_service: OrganizationService = Depends(readonly_organization_svc),
 ) -> list[Organization]:
     """
     Get all organizations
@@ -0,0 +1,54 @@
+"""Dependency injection of services bound to a read-only Session, for hot GET routes.
+
+FastAPI constructs class dependencies such as `ArticleService = Depends()` over `db_session`, and
+every service a route depends on shares that one Session. The functions here instead construct a
+service, and every service it depends on, over one `readonly_db_session`. That session is served
+by the read replica when one is configured, so routes depending on these services must never write.
+"""
+
+from fastapi import Depends
+from sqlalchemy.orm import Session
+
+from ..database import readonly_db_session
+from ..services import OrganizationService, PermissionService
+from ..services.academics import CourseService
+from ..services.article import ArticleService
+from ..services.coworking import OperatingHoursService, PolicyService
+from ..services.permission_cache import PermissionCache, get_permission_cache
+
+__authors__ = ["Kris Jordan"]
+__copyright__ = "Copyright 2025"
+__license__ = "MIT"
+
+
+def readonly_article_svc(
+    session: Session = Depends(readonly_db_session),
+    permission_cache: PermissionCache = Depends(get_permission_cache),
+) -> ArticleService:
+    """ArticleService over a read-only Session.
+
+    The welcome overview is loaded by the home page of every visitor, signed in or not.
+    """
+    permission_svc = PermissionService(session, permission_cache)
+    return ArticleService(
+        session,
+        permission_svc,
+        PolicyService(),
+        OperatingHoursService(session, permission_svc),
+    )
+
+
+def readonly_organization_svc(
+    session: Session = Depends(readonly_db_session),
+    permission_cache: PermissionCache = Depends(get_permission_cache),
+) -> OrganizationService:
+    """OrganizationService over a read-only Session."""
+    return OrganizationService(session, PermissionService(session, permission_cache))
+
+
+def readonly_course_svc(
+    session: Session = Depends(readonly_db_session),
+    permission_cache: PermissionCache = Depends(get_permission_cache),
+) -> CourseService:
+    """CourseService over a read-only Session."""
+    return CourseService(session, PermissionService(session, permission_cache))
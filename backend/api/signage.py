@@ -3,6 +3,7 @@
 from fastapi import APIRouter, Depends
 from ..services import SignageService
 from ..models import SignageOverviewFast, SignageOverviewSlow
+from .async_services import AsyncService, async_signage_svc
 
 __authors__ = ["Will Zahrt", "Andrew Lockard", "Audrey Toney"]
 __copyright__ = "Copyright 2024"
@@ -16,26 +17,30 @@ openapi_tags = {
 
 
 @api.get("/slow", tags=["Signage"])
-def get_slow_signage(signage_svc: SignageService = Depends()) -> SignageOverviewSlow:
+async def get_slow_signage(
+    signage_svc: AsyncService[SignageService] = Depends(async_signage_svc),
+) -> SignageOverviewSlow:
     """Gets signage data that does not need to be updated frequently.
-    
+
     Parameters:
         None
 
     Returns:
         SignageOverviewSlow - contains news, top users, events, and announcements
     """
-    return signage_svc.get_slow_data()
+    return await signage_svc.run(SignageService.get_slow_data)
 
 
 @api.get("/fast", tags=["Signage"])
-def get_fast_signage(signage_svc: SignageService = Depends()) -> SignageOverviewFast:
+async def get_fast_signage(
+    signage_svc: AsyncService[SignageService] = Depends(async_signage_svc),
+) -> SignageOverviewFast:
     """Gets signage data that needs to be updated in real time.
 
     Parameters:
         None
-    
+
     Returns:
         SignageOverviewFast - contains office hours information for queue time, room and seat availability
     """
-    return signage_svc.get_fast_data()
+    return await signage_svc.run(SignageService.get_fast_data)
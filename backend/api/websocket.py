@@ -1,7 +1,25 @@
-from fastapi import APIRouter
+import asyncio
+
+from fastapi import APIRouter, Depends, WebSocketException, status
+from sqlalchemy.ext.asyncio import AsyncSession
 from starlette.types import Scope, Receive, Send
 from fastapi.websockets import WebSocket, WebSocketDisconnect
 from starlette.middleware.base import BaseHTTPMiddleware
+from .authentication import websocket_user
+from ..database import async_engine, run_async
+from ..models import User
+from ..models.academics.section_member import RosterRole
+from ..services.exceptions import CoursePermissionException
+from ..services.office_hours.office_hours import OfficeHoursService
+from ..services.office_hours.queue_feed import (
+    OfficeHoursQueueFeed,
+    get_office_hours_queue_feed,
+)
+from ..services.office_hours.queue_index import (
+    OfficeHoursQueueIndex,
+    get_office_hours_queue_index,
+)
+from ..services.signage_feed import SignageFeed, get_signage_feed
 
 
 class WebSocketMiddleware(BaseHTTPMiddleware):
@@ -27,3 +45,68 @@ async def echo(websocket: WebSocket):
             await websocket.send_json({"type": "echo", "data": message})
     except WebSocketDisconnect:
         ...
+
+
+async def _forward(websocket: WebSocket, queue: asyncio.Queue) -> None:
+    """Sends the messages put in a queue over a WebSocket until the client disconnects."""
+    # Clients never send anything, but receiving is how a disconnect is noticed.
+    disconnected = asyncio.create_task(websocket.receive())
+    try:
+        while True:
+            message = asyncio.create_task(queue.get())
+            done, _ = await asyncio.wait(
+                {message, disconnected}, return_when=asyncio.FIRST_COMPLETED
+            )
+            if disconnected in done:
+                message.cancel()
+                break
+            await websocket.send_json(message.result())
+    except WebSocketDisconnect:
+        ...
+    finally:
+        disconnected.cancel()
+
+
+@api.websocket("/signage")
+async def signage(
+    websocket: WebSocket, signage_feed: SignageFeed = Depends(get_signage_feed)
+):
+    """Pushes the signage data, then changes to it, to a signage display."""
+    await websocket.accept()
+    queue = signage_feed.subscribe()
+    try:
+        await _forward(websocket, queue)
+    finally:
+        signage_feed.unsubscribe(queue)
+
+
+@api.websocket("/office-hours/{id}/queue")
+async def office_hours_queue(
+    websocket: WebSocket,
+    id: int,
+    subject: User = Depends(websocket_user),
+    queue_feed: OfficeHoursQueueFeed = Depends(get_office_hours_queue_feed),
+    queue_index: OfficeHoursQueueIndex = Depends(get_office_hours_queue_index),
+):
+    """Pushes changes to an office hours event's tickets to its queue or get help page.
+
+    Staff are sent every ticket as it changes; students are sent their own ticket and position.
+    """
+    try:
+        async with AsyncSession(async_engine) as session:
+            role = await run_async(
+                session,
+                lambda s: OfficeHoursService(s, queue_index).get_oh_event_role(
+                    subject, id
+                ),
+            )
+    except CoursePermissionException:
+        raise WebSocketException(code=status.WS_1008_POLICY_VIOLATION)
+
+    await websocket.accept()
+    staff = role.role != RosterRole.STUDENT.value
+    queue = queue_feed.subscribe(id, subject.id, staff)
+    try:
+        await _forward(websocket, queue)
+    finally:
+        queue_feed.unsubscribe(id, queue)
@@ -34,6 +34,7 @@ from .article_author_entity import article_author_table
 
 from .academics.hiring.hiring_assignment_entity import HiringAssignmentEntity
 from .academics.hiring.hiring_level_entity import HiringLevelEntity
+from .academics.hiring.application_priority_entity import ApplicationPriorityEntity
 
 # Study Buddy Entities
 from .study_buddy.study_buddy_entity import (
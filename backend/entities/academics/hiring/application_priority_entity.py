@@ -0,0 +1,62 @@
+"""Definition of SQLAlchemy table-backed object mapping entity for the matrix of applicant priorities.
+
+Each row pairs an application with a course site the applicant ranked a section of, or that
+reviewed the application, and records how highly the student ranked the site, how highly the
+site's instructors ranked the student, and the hiring assignment made from the site's review.
+
+Rows are kept in sync by `HiringService`, `ApplicationService`, and `CourseSiteService` through
+`refresh_application_priorities` in `services/academics/application_priorities.py`, so conflict
+checks read them by index instead of aggregating section applications and reviews."""
+
+from sqlalchemy import Integer, ForeignKey, Index
+from sqlalchemy.orm import Mapped, mapped_column
+
+from ...entity_base import EntityBase
+
+__authors__ = ["Kris Jordan"]
+__copyright__ = "Copyright 2025"
+__license__ = "MIT"
+
+
+class ApplicationPriorityEntity(EntityBase):
+    """Serves as the database model schema defining the shape of the application priority table"""
+
+    # Name for the priority table in the PostgreSQL database
+    __tablename__ = "academics__hiring__application_priority"
+
+    __table_args__ = (
+        Index(
+            "academics__hiring__application_priority_key_idx",
+            "application_id",
+            "course_site_id",
+            unique=True,
+        ),
+        Index("academics__hiring__application_priority_term_idx", "term_id"),
+        Index(
+            "academics__hiring__application_priority_course_site_idx", "course_site_id"
+        ),
+    )
+
+    # Unique ID
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+
+    # Term of the application
+    term_id: Mapped[str] = mapped_column(
+        ForeignKey("academics__term.id"), nullable=False
+    )
+    application_id: Mapped[int] = mapped_column(
+        ForeignKey("application.id", ondelete="CASCADE"), nullable=False
+    )
+    course_site_id: Mapped[int] = mapped_column(
+        ForeignKey("course_site.id", ondelete="CASCADE"), nullable=False
+    )
+
+    # Lowest preference the student gave a section of the course site, if any
+    student_priority: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    # Preference of the course site's review, if its instructors preferred the student
+    instructor_priority: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    # Latest hiring assignment made from the course site's review, if any
+    hiring_assignment_id: Mapped[int | None] = mapped_column(
+        ForeignKey("academics__hiring__assignment.id", ondelete="SET NULL"),
+        nullable=True,
+    )
@@ -1,4 +1,10 @@
 from .operating_hours_entity import OperatingHoursEntity
 from .reservation_entity import ReservationEntity
 from .reservation_seat_table import reservation_seat_table
+from .reservation_archive_entity import ReservationArchiveEntity
+from .reservation_archive_tables import (
+    reservation_archive_user_table,
+    reservation_archive_seat_table,
+)
 from .seat_entity import SeatEntity
+from .checkin_leaderboard_entity import CheckinLeaderboardEntity
@@ -0,0 +1,104 @@
+"""Entity for the monthly check-in leaderboard.
+
+Each row counts a user's checked out reservations ending in a month. Rows are maintained by database
+triggers as reservations are checked out, so the signage leaderboard reads its top users from an
+index instead of aggregating the month's reservations. Archiving a reservation removes it from the
+hot tables without touching the leaderboard, so past months keep their counts.
+
+`rebuild_checkin_leaderboard` in `services/coworking/checkin_leaderboard.py` recomputes any month
+from the full reservation history."""
+
+from datetime import date
+from sqlalchemy import DDL, Date, ForeignKey, Index, Integer, event
+from sqlalchemy.orm import Mapped, mapped_column
+from ..entity_base import EntityBase
+from .reservation_entity import ReservationEntity
+from .reservation_user_table import reservation_user_table
+
+__authors__ = ["Kris Jordan"]
+__copyright__ = "Copyright 2024"
+__license__ = "MIT"
+
+
+class CheckinLeaderboardEntity(EntityBase):
+    __tablename__ = "coworking__checkin_leaderboard"
+    __table_args__ = (
+        Index(
+            "coworking__checkin_leaderboard_rank_idx",
+            "month",
+            "checkouts",
+            "user_id",
+        ),
+    )
+
+    month: Mapped[date] = mapped_column(Date, primary_key=True)
+    user_id: Mapped[int] = mapped_column(
+        Integer, ForeignKey("user.id"), primary_key=True
+    )
+    checkouts: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+
+
+CHECKIN_LEADERBOARD_RESERVATION_DDL = [
+    """
+    CREATE OR REPLACE FUNCTION coworking__checkin_leaderboard_reservation() RETURNS trigger AS $$
+    BEGIN
+        IF OLD.state = 'CHECKED_OUT' THEN
+            UPDATE coworking__checkin_leaderboard
+               SET checkouts = checkouts - 1
+             WHERE month = date_trunc('month', OLD."end")::date
+               AND user_id IN (
+                   SELECT user_id FROM coworking__reservation_user WHERE reservation_id = OLD.id
+               );
+        END IF;
+        IF NEW.state = 'CHECKED_OUT' THEN
+            INSERT INTO coworking__checkin_leaderboard (month, user_id, checkouts)
+            SELECT date_trunc('month', NEW."end")::date, user_id, 1
+              FROM coworking__reservation_user
+             WHERE reservation_id = NEW.id
+                ON CONFLICT (month, user_id)
+                DO UPDATE SET checkouts = coworking__checkin_leaderboard.checkouts + 1;
+        END IF;
+        RETURN NULL;
+    END
+    $$ LANGUAGE plpgsql
+    """,
+    """
+    CREATE TRIGGER coworking__checkin_leaderboard_reservation
+    AFTER UPDATE OF state, "end" ON coworking__reservation
+    FOR EACH ROW
+    WHEN (
+        (OLD.state = 'CHECKED_OUT' OR NEW.state = 'CHECKED_OUT')
+        AND (OLD.state IS DISTINCT FROM NEW.state OR OLD."end" IS DISTINCT FROM NEW."end")
+    )
+    EXECUTE FUNCTION coworking__checkin_leaderboard_reservation()
+    """,
+]
+"""Trigger counting reservations as they are checked out, or uncounting them if that changes."""
+
+CHECKIN_LEADERBOARD_RESERVATION_USER_DDL = [
+    """
+    CREATE OR REPLACE FUNCTION coworking__checkin_leaderboard_reservation_user() RETURNS trigger AS $$
+    BEGIN
+        INSERT INTO coworking__checkin_leaderboard (month, user_id, checkouts)
+        SELECT date_trunc('month', r."end")::date, NEW.user_id, 1
+          FROM coworking__reservation r
+         WHERE r.id = NEW.reservation_id
+           AND r.state = 'CHECKED_OUT'
+            ON CONFLICT (month, user_id)
+            DO UPDATE SET checkouts = coworking__checkin_leaderboard.checkouts + 1;
+        RETURN NULL;
+    END
+    $$ LANGUAGE plpgsql
+    """,
+    """
+    CREATE TRIGGER coworking__checkin_leaderboard_reservation_user
+    AFTER INSERT ON coworking__reservation_user
+    FOR EACH ROW EXECUTE FUNCTION coworking__checkin_leaderboard_reservation_user()
+    """,
+]
+"""Trigger counting users added to a reservation that is already checked out."""
+
+for statement in CHECKIN_LEADERBOARD_RESERVATION_DDL:
+    event.listen(ReservationEntity.__table__, "after_create", DDL(statement))
+for statement in CHECKIN_LEADERBOARD_RESERVATION_USER_DDL:
+    event.listen(reservation_user_table, "after_create", DDL(statement))
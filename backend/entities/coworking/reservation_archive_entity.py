@@ -0,0 +1,65 @@
+"""Entity for archived Reservations.
+
+Reservations that are checked out or cancelled and have ended before the archive horizon are moved
+out of `coworking__reservation` and into this cold table by `ReservationService#archive_reservations`.
+Archived reservations keep their original IDs, so they can still be looked up by ID."""
+
+from datetime import datetime
+from sqlalchemy import Integer, String, Boolean, ForeignKey, DateTime, Index
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+from ..entity_base import EntityBase
+from ...models.coworking import Reservation, ReservationState
+from .seat_entity import SeatEntity
+from ..user_entity import UserEntity
+from .reservation_archive_tables import (
+    reservation_archive_user_table,
+    reservation_archive_seat_table,
+)
+
+__authors__ = ["Kris Jordan"]
+__copyright__ = "Copyright 2024"
+__license__ = "MIT"
+
+
+class ReservationArchiveEntity(EntityBase):
+    __tablename__ = "coworking__reservation_archive"
+    __table_args__ = (
+        Index("coworking__reservation_archive_time_idx", "end", "state", unique=False),
+    )
+
+    # Reservation Model Fields
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=False)
+    start: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+    end: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+    state: Mapped[ReservationState] = mapped_column(String, nullable=False)
+    walkin: Mapped[bool] = mapped_column(Boolean, nullable=False)
+    room_id: Mapped[str] = mapped_column(String, ForeignKey("room.id"), nullable=True)
+    created_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+    updated_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+
+    # Relationships
+    users: Mapped[list[UserEntity]] = relationship(
+        secondary=reservation_archive_user_table
+    )
+    seats: Mapped[list[SeatEntity]] = relationship(
+        secondary=reservation_archive_seat_table
+    )
+    room: Mapped["RoomEntity"] = relationship("RoomEntity")
+
+    def to_model(self) -> Reservation:
+        """Converts the entity to a model.
+
+        Returns:
+            Reservation: The model representation of the entity."""
+        return Reservation(
+            id=self.id,
+            start=self.start,
+            end=self.end,
+            state=self.state,
+            users=[user.to_model() for user in self.users],
+            seats=[seat.to_model() for seat in self.seats],
+            walkin=self.walkin,
+            room=self.room.to_model() if self.room else None,
+            created_at=self.created_at,
+            updated_at=self.updated_at,
+        )
@@ -0,0 +1,30 @@
+"""Join tables between archived Reservations and their User and Seat entities."""
+
+from sqlalchemy import Table, Column, ForeignKey
+from ..entity_base import EntityBase
+
+__authors__ = ["Kris Jordan"]
+__copyright__ = "Copyright 2024"
+__license__ = "MIT"
+
+reservation_archive_user_table = Table(
+    "coworking__reservation_archive_user",
+    EntityBase.metadata,
+    Column(
+        "reservation_id",
+        ForeignKey("coworking__reservation_archive.id"),
+        primary_key=True,
+    ),
+    Column("user_id", ForeignKey("user.id"), primary_key=True),
+)
+
+reservation_archive_seat_table = Table(
+    "coworking__reservation_archive_seat",
+    EntityBase.metadata,
+    Column(
+        "reservation_id",
+        ForeignKey("coworking__reservation_archive.id"),
+        primary_key=True,
+    ),
+    Column("seat_id", ForeignKey("coworking__seat.id"), primary_key=True),
+)
@@ -1,15 +1,80 @@
-"""Join table between Reservation and Seat entities."""
+"""Join table between Reservation and Seat entities.
 
-from sqlalchemy import Table, Column, ForeignKey
+Each row is also the reservation's claim on the seat. Its `during` range and `active` flag mirror the
+reservation's start, end, and state, and are maintained by database triggers rather than the ORM. An
+exclusion constraint over (seat, during) for active claims makes Postgres reject any reservation that
+would double book a seat, atomically, at INSERT time."""
+
+from sqlalchemy import DDL, Table, Column, ForeignKey, Boolean, event, text
+from sqlalchemy.dialects.postgresql import TSRANGE, ExcludeConstraint
 from ..entity_base import EntityBase
 
 __authors__ = ["Kris Jordan"]
 __copyright__ = "Copyright 2023"
 __license__ = "MIT"
 
+SEAT_CLAIM_OVERLAP_CONSTRAINT = "coworking__reservation_seat_no_overlap"
+"""Name of the exclusion constraint rejecting overlapping active claims on a seat."""
+
 reservation_seat_table = Table(
     "coworking__reservation_seat",
     EntityBase.metadata,
     Column("reservation_id", ForeignKey("coworking__reservation.id"), primary_key=True),
     Column("seat_id", ForeignKey("coworking__seat.id"), primary_key=True),
+    Column("during", TSRANGE, nullable=True),
+    Column("active", Boolean, nullable=True),
+    # Seat IDs are compared as single-point ranges so the constraint needs only core GiST
+    # range operators and not the btree_gist extension.
+    ExcludeConstraint(
+        (text("int4range(seat_id, seat_id, '[]')"), "&&"),
+        ("during", "&&"),
+        where=text("active"),
+        using="gist",
+        name=SEAT_CLAIM_OVERLAP_CONSTRAINT,
+    ),
 )
+
+RESERVATION_SEAT_CLAIM_DDL = [
+    """
+    CREATE OR REPLACE FUNCTION coworking__reservation_seat_claim() RETURNS trigger AS $$
+    BEGIN
+        SELECT tsrange(r.start, r."end"), r.state IN ('DRAFT', 'CONFIRMED', 'CHECKED_IN')
+          INTO NEW.during, NEW.active
+          FROM coworking__reservation r
+         WHERE r.id = NEW.reservation_id;
+        RETURN NEW;
+    END
+    $$ LANGUAGE plpgsql
+    """,
+    """
+    CREATE TRIGGER coworking__reservation_seat_claim
+    BEFORE INSERT OR UPDATE OF reservation_id ON coworking__reservation_seat
+    FOR EACH ROW EXECUTE FUNCTION coworking__reservation_seat_claim()
+    """,
+    """
+    CREATE OR REPLACE FUNCTION coworking__reservation_seat_claim_sync() RETURNS trigger AS $$
+    BEGIN
+        UPDATE coworking__reservation_seat
+           SET during = tsrange(NEW.start, NEW."end"),
+               active = NEW.state IN ('DRAFT', 'CONFIRMED', 'CHECKED_IN')
+         WHERE reservation_id = NEW.id;
+        RETURN NULL;
+    END
+    $$ LANGUAGE plpgsql
+    """,
+    """
+    CREATE TRIGGER coworking__reservation_seat_claim_sync
+    AFTER UPDATE OF start, "end", state ON coworking__reservation
+    FOR EACH ROW
+    WHEN (
+        OLD.start IS DISTINCT FROM NEW.start
+        OR OLD."end" IS DISTINCT FROM NEW."end"
+        OR OLD.state IS DISTINCT FROM NEW.state
+    )
+    EXECUTE FUNCTION coworking__reservation_seat_claim_sync()
+    """,
+]
+"""Trigger functions keeping each seat claim in step with its reservation."""
+
+for statement in RESERVATION_SEAT_CLAIM_DDL:
+    event.listen(reservation_seat_table, "after_create", DDL(statement))
@@ -0,0 +1,61 @@
+"""Entity for the daily rollup of closed office hours ticket statistics.
+
+Each row sums the closed tickets of a course site created on one day and called by one staff
+member. Rows with a `creator_user_id` count each ticket once per creator, so that statistics
+filtered by student match the tickets those students created; the row whose `creator_user_id` is
+null counts each ticket once, for statistics across all students.
+
+Rows are added to as tickets are closed by `OfficeHourTicketService.close_ticket`, so
+`OfficeHoursStatisticsService` reads date ranges from this table instead of aggregating raw
+tickets. `rebuild_ticket_statistics` in `services/office_hours/ticket_statistics.py` recomputes
+any range of days from the tickets themselves."""
+
+from datetime import date
+from sqlalchemy import Date, Float, ForeignKey, Index, Integer
+from sqlalchemy.orm import Mapped, mapped_column
+from ..entity_base import EntityBase
+
+__authors__ = ["Kris Jordan"]
+__copyright__ = "Copyright 2025"
+__license__ = "MIT"
+
+
+class OfficeHoursTicketStatisticsEntity(EntityBase):
+    __tablename__ = "office_hours__ticket_daily_statistics"
+    __table_args__ = (
+        Index(
+            "office_hours__ticket_daily_statistics_key_idx",
+            "course_site_id",
+            "day",
+            "caller_user_id",
+            "creator_user_id",
+            unique=True,
+            postgresql_nulls_not_distinct=True,
+        ),
+    )
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+
+    # Day the tickets were created on
+    day: Mapped[date] = mapped_column(Date, nullable=False)
+    course_site_id: Mapped[int] = mapped_column(
+        ForeignKey("course_site.id"), nullable=False
+    )
+    # User who called the tickets, if they still have a caller
+    caller_user_id: Mapped[int | None] = mapped_column(
+        ForeignKey("user.id"), nullable=True
+    )
+    # User who created the tickets, or null for the row counting each ticket once
+    creator_user_id: Mapped[int | None] = mapped_column(
+        ForeignKey("user.id"), nullable=True
+    )
+
+    tickets: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    conceptual_tickets: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    assignment_tickets: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    # Tickets with a called time, and the seconds from their creation until they were called
+    called_tickets: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    wait_seconds: Mapped[float] = mapped_column(Float, nullable=False, default=0)
+    # Tickets with called and closed times, and the seconds from their calling until they closed
+    closed_tickets: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    duration_seconds: Mapped[float] = mapped_column(Float, nullable=False, default=0)
@@ -1,11 +1,19 @@
 """Entrypoint of backend API exposing the FastAPI `app` to be served by an application server such as uvicorn."""
 
+import asyncio
+from contextlib import asynccontextmanager
 from pathlib import Path
 from fastapi import FastAPI, Request
 from fastapi.responses import JSONResponse
 from fastapi.middleware.gzip import GZipMiddleware
 
 from backend.services.coworking.reservation import ReservationException
+from backend.services.coworking.reservation_sweeper import (
+    run_reservation_state_sweeper,
+)
+from backend.services.permission_cache import permission_cache
+from backend.services.signage_feed import signage_feed
+from backend.services.office_hours.queue_feed import office_hours_queue_feed
 
 from .api.events import events
 
@@ -20,6 +28,7 @@ from .api import (
     application,
     article,
     signage,
+    websocket,
 )
 from .api.coworking import status, reservation, ambassador, operating_hours
 from .api.academics import section_member, term, course, section, my_courses, hiring
@@ -37,6 +46,7 @@ from .services.exceptions import (
     ResourceNotFoundException,
     CoursePermissionException,
     CourseDataScrapingException,
+    InvalidPaginationCursorException,
 )
 
 from backend.api.study_buddy import router as study_buddy_router
@@ -49,11 +59,27 @@ description = """
 Welcome to the UNC Computer Science **Experience Labs** RESTful Application Programming Interface.
 """
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Runs background tasks for the lifetime of the application."""
+    # Permissions cached by a previous run may describe a database that has since changed.
+    permission_cache.bump()
+    reservation_state_sweeper = asyncio.create_task(run_reservation_state_sweeper())
+    signage_feed_task = asyncio.create_task(signage_feed.run())
+    office_hours_queue_feed_task = asyncio.create_task(office_hours_queue_feed.run())
+    yield
+    reservation_state_sweeper.cancel()
+    signage_feed_task.cancel()
+    office_hours_queue_feed_task.cancel()
+
+
 # Metadata to improve the usefulness of OpenAPI Docs /docs API Explorer
 app = FastAPI(
     title="UNC CS Experience Labs API",
     version="0.0.1",
     description=description,
+    lifespan=lifespan,
     openapi_tags=[
         profile.openapi_tags,
         user.openapi_tags,
@@ -103,6 +129,7 @@ feature_apis = [
     admin_facts,
     article,
     signage,
+    websocket,
     study_buddy_router,
 ]
 
@@ -139,6 +166,13 @@ def resource_not_found_exception_handler(
     return JSONResponse(status_code=404, content={"message": str(e)})
 
 
+@app.exception_handler(InvalidPaginationCursorException)
+def invalid_pagination_cursor_exception_handler(
+    request: Request, e: InvalidPaginationCursorException
+):
+    return JSONResponse(status_code=400, content={"message": str(e)})
+
+
 @app.exception_handler(ReservationException)
 def reservation_exception_handler(request: Request, e: ReservationException):
     return JSONResponse(status_code=403, content={"message": str(e)})
@@ -172,4 +206,4 @@ async def general_exception_handler(request: Request, exc: Exception):
             "error": str(exc),
             "type": type(exc).__name__,
         },
-    )
\ No newline at end of file
+    )
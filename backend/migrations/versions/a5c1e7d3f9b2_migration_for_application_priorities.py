@@ -0,0 +1,121 @@
+"""Migration for the matrix of applicant priorities used to check hiring conflicts
+
+Revision ID: a5c1e7d3f9b2
+Revises: e4b8d2f6a9c3
+Create Date: 2026-10-17 19:12:40.318275
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "a5c1e7d3f9b2"
+down_revision = "e4b8d2f6a9c3"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "academics__hiring__application_priority",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("term_id", sa.String(length=6), nullable=False),
+        sa.Column("application_id", sa.Integer(), nullable=False),
+        sa.Column("course_site_id", sa.Integer(), nullable=False),
+        sa.Column("student_priority", sa.Integer(), nullable=True),
+        sa.Column("instructor_priority", sa.Integer(), nullable=True),
+        sa.Column("hiring_assignment_id", sa.Integer(), nullable=True),
+        sa.ForeignKeyConstraint(
+            ["term_id"],
+            ["academics__term.id"],
+        ),
+        sa.ForeignKeyConstraint(
+            ["application_id"],
+            ["application.id"],
+            ondelete="CASCADE",
+        ),
+        sa.ForeignKeyConstraint(
+            ["course_site_id"],
+            ["course_site.id"],
+            ondelete="CASCADE",
+        ),
+        sa.ForeignKeyConstraint(
+            ["hiring_assignment_id"],
+            ["academics__hiring__assignment.id"],
+            ondelete="SET NULL",
+        ),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        "academics__hiring__application_priority_key_idx",
+        "academics__hiring__application_priority",
+        ["application_id", "course_site_id"],
+        unique=True,
+    )
+    op.create_index(
+        "academics__hiring__application_priority_term_idx",
+        "academics__hiring__application_priority",
+        ["term_id"],
+        unique=False,
+    )
+    op.create_index(
+        "academics__hiring__application_priority_course_site_idx",
+        "academics__hiring__application_priority",
+        ["course_site_id"],
+        unique=False,
+    )
+
+    # Backfill every term with the rows rebuild_application_priorities computes, so that conflict
+    # checks of existing applications keep their data.
+    op.execute(
+        """
+        INSERT INTO academics__hiring__application_priority (
+            term_id, application_id, course_site_id,
+            student_priority, instructor_priority, hiring_assignment_id
+        )
+        SELECT a.term_id, pairs.application_id, pairs.course_site_id,
+               pairs.student_priority, pairs.instructor_priority, pairs.hiring_assignment_id
+          FROM (
+                SELECT COALESCE(student.application_id, instructor.application_id) AS application_id,
+                       COALESCE(student.course_site_id, instructor.course_site_id) AS course_site_id,
+                       student.priority AS student_priority,
+                       instructor.priority AS instructor_priority,
+                       instructor.hiring_assignment_id
+                  FROM (
+                        SELECT sa.application_id, s.course_site_id, MIN(sa.preference) AS priority
+                          FROM section_application sa
+                          JOIN academics__section s ON s.id = sa.section_id
+                         WHERE s.course_site_id IS NOT NULL
+                         GROUP BY sa.application_id, s.course_site_id
+                       ) student
+                  FULL OUTER JOIN (
+                        SELECT r.application_id, r.course_site_id,
+                               CASE WHEN r.status = 'PREFERRED' THEN r.preference END AS priority,
+                               (SELECT MAX(h.id)
+                                  FROM academics__hiring__assignment h
+                                 WHERE h.application_review_id = r.id) AS hiring_assignment_id
+                          FROM academics__hiring__application_review r
+                       ) instructor
+                    ON student.application_id = instructor.application_id
+                   AND student.course_site_id = instructor.course_site_id
+               ) pairs
+          JOIN application a ON a.id = pairs.application_id
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "academics__hiring__application_priority_course_site_idx",
+        table_name="academics__hiring__application_priority",
+    )
+    op.drop_index(
+        "academics__hiring__application_priority_term_idx",
+        table_name="academics__hiring__application_priority",
+    )
+    op.drop_index(
+        "academics__hiring__application_priority_key_idx",
+        table_name="academics__hiring__application_priority",
+    )
+    op.drop_table("academics__hiring__application_priority")
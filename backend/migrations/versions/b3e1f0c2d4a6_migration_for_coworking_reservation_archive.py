@@ -0,0 +1,81 @@
+"""Migration for the coworking reservation archive
+
+Revision ID: b3e1f0c2d4a6
+Revises: a9f09b49d862
+Create Date: 2026-10-17 09:12:40.218311
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "b3e1f0c2d4a6"
+down_revision = "a9f09b49d862"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "coworking__reservation_archive",
+        sa.Column("id", sa.Integer(), autoincrement=False, nullable=False),
+        sa.Column("start", sa.DateTime(), nullable=False),
+        sa.Column("end", sa.DateTime(), nullable=False),
+        sa.Column("state", sa.String(), nullable=False),
+        sa.Column("walkin", sa.Boolean(), nullable=False),
+        sa.Column("room_id", sa.String(), nullable=True),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(["room_id"], ["room.id"]),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        "coworking__reservation_archive_time_idx",
+        "coworking__reservation_archive",
+        ["end", "state"],
+        unique=False,
+    )
+    op.create_table(
+        "coworking__reservation_archive_user",
+        sa.Column("reservation_id", sa.Integer(), nullable=False),
+        sa.Column("user_id", sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["reservation_id"], ["coworking__reservation_archive.id"]
+        ),
+        sa.ForeignKeyConstraint(["user_id"], ["user.id"]),
+        sa.PrimaryKeyConstraint("reservation_id", "user_id"),
+    )
+    op.create_table(
+        "coworking__reservation_archive_seat",
+        sa.Column("reservation_id", sa.Integer(), nullable=False),
+        sa.Column("seat_id", sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["reservation_id"], ["coworking__reservation_archive.id"]
+        ),
+        sa.ForeignKeyConstraint(["seat_id"], ["coworking__seat.id"]),
+        sa.PrimaryKeyConstraint("reservation_id", "seat_id"),
+    )
+
+
+def downgrade() -> None:
+    # Archived reservations are moved back into the hot table before the archive is dropped.
+    op.execute(
+        'INSERT INTO coworking__reservation (id, start, "end", state, walkin, room_id, created_at, updated_at) '
+        'SELECT id, start, "end", state, walkin, room_id, created_at, updated_at FROM coworking__reservation_archive'
+    )
+    op.execute(
+        "INSERT INTO coworking__reservation_user (reservation_id, user_id) "
+        "SELECT reservation_id, user_id FROM coworking__reservation_archive_user"
+    )
+    op.execute(
+        "INSERT INTO coworking__reservation_seat (reservation_id, seat_id) "
+        "SELECT reservation_id, seat_id FROM coworking__reservation_archive_seat"
+    )
+    op.drop_table("coworking__reservation_archive_seat")
+    op.drop_table("coworking__reservation_archive_user")
+    op.drop_index(
+        "coworking__reservation_archive_time_idx",
+        table_name="coworking__reservation_archive",
+    )
+    op.drop_table("coworking__reservation_archive")
@@ -0,0 +1,114 @@
+"""Migration for coworking seat claims with an exclusion constraint
+
+Revision ID: c5d2e8a1f3b7
+Revises: b3e1f0c2d4a6
+Create Date: 2026-10-17 11:40:05.771902
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = "c5d2e8a1f3b7"
+down_revision = "b3e1f0c2d4a6"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "coworking__reservation_seat",
+        sa.Column("during", postgresql.TSRANGE(), nullable=True),
+    )
+    op.add_column(
+        "coworking__reservation_seat",
+        sa.Column("active", sa.Boolean(), nullable=True),
+    )
+
+    # Reservations that have already ended but were never swept out of an active state are
+    # backfilled as inactive so that historical double bookings do not block the constraint.
+    op.execute(
+        """
+        UPDATE coworking__reservation_seat rs
+           SET during = tsrange(r.start, r."end"),
+               active = r.state IN ('DRAFT', 'CONFIRMED', 'CHECKED_IN') AND r."end" > now()
+          FROM coworking__reservation r
+         WHERE r.id = rs.reservation_id
+        """
+    )
+
+    # Alembic's create_exclude_constraint cannot name an expression element, so the constraint
+    # over the seat's range is written out directly.
+    op.execute(
+        """
+        ALTER TABLE coworking__reservation_seat
+        ADD CONSTRAINT coworking__reservation_seat_no_overlap
+        EXCLUDE USING gist (int4range(seat_id, seat_id, '[]') WITH &&, during WITH &&)
+        WHERE (active)
+        """
+    )
+
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION coworking__reservation_seat_claim() RETURNS trigger AS $$
+        BEGIN
+            SELECT tsrange(r.start, r."end"), r.state IN ('DRAFT', 'CONFIRMED', 'CHECKED_IN')
+              INTO NEW.during, NEW.active
+              FROM coworking__reservation r
+             WHERE r.id = NEW.reservation_id;
+            RETURN NEW;
+        END
+        $$ LANGUAGE plpgsql
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER coworking__reservation_seat_claim
+        BEFORE INSERT OR UPDATE OF reservation_id ON coworking__reservation_seat
+        FOR EACH ROW EXECUTE FUNCTION coworking__reservation_seat_claim()
+        """
+    )
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION coworking__reservation_seat_claim_sync() RETURNS trigger AS $$
+        BEGIN
+            UPDATE coworking__reservation_seat
+               SET during = tsrange(NEW.start, NEW."end"),
+                   active = NEW.state IN ('DRAFT', 'CONFIRMED', 'CHECKED_IN')
+             WHERE reservation_id = NEW.id;
+            RETURN NULL;
+        END
+        $$ LANGUAGE plpgsql
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER coworking__reservation_seat_claim_sync
+        AFTER UPDATE OF start, "end", state ON coworking__reservation
+        FOR EACH ROW
+        WHEN (
+            OLD.start IS DISTINCT FROM NEW.start
+            OR OLD."end" IS DISTINCT FROM NEW."end"
+            OR OLD.state IS DISTINCT FROM NEW.state
+        )
+        EXECUTE FUNCTION coworking__reservation_seat_claim_sync()
+        """
+    )
+
+
+def downgrade() -> None:
+    op.execute(
+        "DROP TRIGGER IF EXISTS coworking__reservation_seat_claim_sync ON coworking__reservation"
+    )
+    op.execute("DROP FUNCTION IF EXISTS coworking__reservation_seat_claim_sync()")
+    op.execute(
+        "DROP TRIGGER IF EXISTS coworking__reservation_seat_claim ON coworking__reservation_seat"
+    )
+    op.execute("DROP FUNCTION IF EXISTS coworking__reservation_seat_claim()")
+    op.drop_constraint(
+        "coworking__reservation_seat_no_overlap", "coworking__reservation_seat"
+    )
+    op.drop_column("coworking__reservation_seat", "active")
+    op.drop_column("coworking__reservation_seat", "during")
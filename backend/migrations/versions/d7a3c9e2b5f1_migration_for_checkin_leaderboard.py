@@ -0,0 +1,138 @@
+"""Migration for the monthly check-in leaderboard
+
+Revision ID: d7a3c9e2b5f1
+Revises: c5d2e8a1f3b7
+Create Date: 2026-10-17 15:02:41.318554
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "d7a3c9e2b5f1"
+down_revision = "c5d2e8a1f3b7"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "coworking__checkin_leaderboard",
+        sa.Column("month", sa.Date(), nullable=False),
+        sa.Column("user_id", sa.Integer(), nullable=False),
+        sa.Column("checkouts", sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["user_id"],
+            ["user.id"],
+        ),
+        sa.PrimaryKeyConstraint("month", "user_id"),
+    )
+    op.create_index(
+        "coworking__checkin_leaderboard_rank_idx",
+        "coworking__checkin_leaderboard",
+        ["month", "checkouts", "user_id"],
+        unique=False,
+    )
+
+    # Every month of history, hot and archived, is counted before the triggers take over.
+    op.execute(
+        """
+        INSERT INTO coworking__checkin_leaderboard (month, user_id, checkouts)
+        SELECT date_trunc('month', history."end")::date, history.user_id, count(*)
+          FROM (
+                SELECT r."end", ru.user_id
+                  FROM coworking__reservation r
+                  JOIN coworking__reservation_user ru ON ru.reservation_id = r.id
+                 WHERE r.state = 'CHECKED_OUT'
+                 UNION ALL
+                SELECT a."end", au.user_id
+                  FROM coworking__reservation_archive a
+                  JOIN coworking__reservation_archive_user au ON au.reservation_id = a.id
+                 WHERE a.state = 'CHECKED_OUT'
+               ) history
+         GROUP BY 1, 2
+        """
+    )
+
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION coworking__checkin_leaderboard_reservation() RETURNS trigger AS $$
+        BEGIN
+            IF OLD.state = 'CHECKED_OUT' THEN
+                UPDATE coworking__checkin_leaderboard
+                   SET checkouts = checkouts - 1
+                 WHERE month = date_trunc('month', OLD."end")::date
+                   AND user_id IN (
+                       SELECT user_id FROM coworking__reservation_user WHERE reservation_id = OLD.id
+                   );
+            END IF;
+            IF NEW.state = 'CHECKED_OUT' THEN
+                INSERT INTO coworking__checkin_leaderboard (month, user_id, checkouts)
+                SELECT date_trunc('month', NEW."end")::date, user_id, 1
+                  FROM coworking__reservation_user
+                 WHERE reservation_id = NEW.id
+                    ON CONFLICT (month, user_id)
+                    DO UPDATE SET checkouts = coworking__checkin_leaderboard.checkouts + 1;
+            END IF;
+            RETURN NULL;
+        END
+        $$ LANGUAGE plpgsql
+        """
+    )
+
+    op.execute(
+        """
+        CREATE TRIGGER coworking__checkin_leaderboard_reservation
+        AFTER UPDATE OF state, "end" ON coworking__reservation
+        FOR EACH ROW
+        WHEN (
+            (OLD.state = 'CHECKED_OUT' OR NEW.state = 'CHECKED_OUT')
+            AND (OLD.state IS DISTINCT FROM NEW.state OR OLD."end" IS DISTINCT FROM NEW."end")
+        )
+        EXECUTE FUNCTION coworking__checkin_leaderboard_reservation()
+        """
+    )
+
+    op.execute(
+        """
+        CREATE OR REPLACE FUNCTION coworking__checkin_leaderboard_reservation_user() RETURNS trigger AS $$
+        BEGIN
+            INSERT INTO coworking__checkin_leaderboard (month, user_id, checkouts)
+            SELECT date_trunc('month', r."end")::date, NEW.user_id, 1
+              FROM coworking__reservation r
+             WHERE r.id = NEW.reservation_id
+               AND r.state = 'CHECKED_OUT'
+                ON CONFLICT (month, user_id)
+                DO UPDATE SET checkouts = coworking__checkin_leaderboard.checkouts + 1;
+            RETURN NULL;
+        END
+        $$ LANGUAGE plpgsql
+        """
+    )
+
+    op.execute(
+        """
+        CREATE TRIGGER coworking__checkin_leaderboard_reservation_user
+        AFTER INSERT ON coworking__reservation_user
+        FOR EACH ROW EXECUTE FUNCTION coworking__checkin_leaderboard_reservation_user()
+        """
+    )
+
+
+def downgrade() -> None:
+    op.execute(
+        "DROP TRIGGER IF EXISTS coworking__checkin_leaderboard_reservation_user ON coworking__reservation_user"
+    )
+    op.execute(
+        "DROP TRIGGER IF EXISTS coworking__checkin_leaderboard_reservation ON coworking__reservation"
+    )
+    op.execute(
+        "DROP FUNCTION IF EXISTS coworking__checkin_leaderboard_reservation_user()"
+    )
+    op.execute("DROP FUNCTION IF EXISTS coworking__checkin_leaderboard_reservation()")
+    op.drop_index(
+        "coworking__checkin_leaderboard_rank_idx",
+        table_name="coworking__checkin_leaderboard",
+    )
+    op.drop_table("coworking__checkin_leaderboard")
@@ -0,0 +1,106 @@
+"""Migration for the daily rollup of office hours ticket statistics
+
+Revision ID: e4b8d2f6a9c3
+Revises: d7a3c9e2b5f1
+Create Date: 2026-10-17 16:48:12.502391
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = "e4b8d2f6a9c3"
+down_revision = "d7a3c9e2b5f1"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "office_hours__ticket_daily_statistics",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("day", sa.Date(), nullable=False),
+        sa.Column("course_site_id", sa.Integer(), nullable=False),
+        sa.Column("caller_user_id", sa.Integer(), nullable=True),
+        sa.Column("creator_user_id", sa.Integer(), nullable=True),
+        sa.Column("tickets", sa.Integer(), nullable=False),
+        sa.Column("conceptual_tickets", sa.Integer(), nullable=False),
+        sa.Column("assignment_tickets", sa.Integer(), nullable=False),
+        sa.Column("called_tickets", sa.Integer(), nullable=False),
+        sa.Column("wait_seconds", sa.Float(), nullable=False),
+        sa.Column("closed_tickets", sa.Integer(), nullable=False),
+        sa.Column("duration_seconds", sa.Float(), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["course_site_id"],
+            ["course_site.id"],
+        ),
+        sa.ForeignKeyConstraint(
+            ["caller_user_id"],
+            ["user.id"],
+        ),
+        sa.ForeignKeyConstraint(
+            ["creator_user_id"],
+            ["user.id"],
+        ),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        "office_hours__ticket_daily_statistics_key_idx",
+        "office_hours__ticket_daily_statistics",
+        ["course_site_id", "day", "caller_user_id", "creator_user_id"],
+        unique=True,
+        postgresql_nulls_not_distinct=True,
+    )
+
+    # Roll up the tickets closed before this migration with the rows rebuild_ticket_statistics
+    # computes: each ticket once, then each ticket once per creator.
+    op.execute(
+        """
+        INSERT INTO office_hours__ticket_daily_statistics (
+            course_site_id, day, caller_user_id, creator_user_id,
+            tickets, conceptual_tickets, assignment_tickets,
+            called_tickets, wait_seconds, closed_tickets, duration_seconds
+        )
+        WITH closed AS (
+            SELECT oh.course_site_id,
+                   CAST(t.created_at AS DATE) AS day,
+                   caller.user_id AS caller_user_id,
+                   t.id AS ticket_id,
+                   t.type,
+                   EXTRACT(epoch FROM t.called_at - t.created_at) AS wait_seconds,
+                   EXTRACT(epoch FROM t.closed_at - t.called_at) AS duration_seconds
+              FROM office_hours__ticket t
+              JOIN office_hours oh ON oh.id = t.office_hours_id
+              LEFT OUTER JOIN academics__user_section caller ON caller.id = t.caller_id
+             WHERE t.state = 'CLOSED'
+        )
+        SELECT course_site_id, day, caller_user_id, CAST(NULL AS INTEGER),
+               count(*),
+               count(*) FILTER (WHERE type = 'CONCEPTUAL_HELP'),
+               count(*) FILTER (WHERE type = 'ASSIGNMENT_HELP'),
+               count(wait_seconds), coalesce(sum(wait_seconds), 0),
+               count(duration_seconds), coalesce(sum(duration_seconds), 0)
+          FROM closed
+         GROUP BY course_site_id, day, caller_user_id
+        UNION ALL
+        SELECT closed.course_site_id, closed.day, closed.caller_user_id, creator.user_id,
+               count(*),
+               count(*) FILTER (WHERE closed.type = 'CONCEPTUAL_HELP'),
+               count(*) FILTER (WHERE closed.type = 'ASSIGNMENT_HELP'),
+               count(closed.wait_seconds), coalesce(sum(closed.wait_seconds), 0),
+               count(closed.duration_seconds), coalesce(sum(closed.duration_seconds), 0)
+          FROM closed
+          JOIN office_hours__user_created_ticket created ON created.ticket_id = closed.ticket_id
+          JOIN academics__user_section creator ON creator.id = created.member_id
+         GROUP BY closed.course_site_id, closed.day, closed.caller_user_id, creator.user_id
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(
+        "office_hours__ticket_daily_statistics_key_idx",
+        table_name="office_hours__ticket_daily_statistics",
+    )
+    op.drop_table("office_hours__ticket_daily_statistics")
@@ -15,6 +15,7 @@ from .reservation import (
     ReservationIdentity,
 )
 
+from .availability_index import AvailabilityIndex
 from .availability_list import AvailabilityList
 from .availability import RoomState, SeatAvailability, RoomAvailability
 
@@ -30,6 +31,7 @@ __all__ = [
     "ReservationRequest",
     "ReservationPartial",
     "ReservationIdentity",
+    "AvailabilityIndex",
     "AvailabilityList",
     "RoomAvailability",
     "SeatAvailability",
@@ -0,0 +1,114 @@
+"""Sorted index over non-overlapping TimeRanges with logarithmic-time lookups.
+
+Because availability ranges are sorted by start and never overlap, they are also sorted by end.
+This lets the ranges overlapping any block be found with two binary searches, rather than a
+linear scan, and replaced with at most two remainders in a single slice assignment.
+"""
+
+from bisect import bisect_left, bisect_right
+from datetime import timedelta
+from .time_range import TimeRange
+
+__authors__ = ["Kris Jordan"]
+__copyright__ = "Copyright 2024"
+__license__ = "MIT"
+
+
+def _start(time_range: TimeRange):
+    return time_range.start
+
+
+def _end(time_range: TimeRange):
+    return time_range.end
+
+
+class AvailabilityIndex:
+    """Index over a sorted, non-overlapping list of TimeRanges.
+
+    The index operates on the list it is given in place. This is how `AvailabilityList` is
+    layered on top of it: the list's `availability` field is the storage the index searches.
+
+    TimeRanges held by the list are never mutated. Operations that trim a range replace it with a
+    new TimeRange, so lists of availability may safely share TimeRange instances.
+    """
+
+    ranges: list[TimeRange]
+
+    def __init__(self, ranges: list[TimeRange]):
+        self.ranges = ranges
+
+    def overlapping(self, block: TimeRange) -> tuple[int, int]:
+        """Find the slice of ranges that overlap a block.
+
+        Args:
+            block (TimeRange): The block of time to search for.
+
+        Returns:
+            tuple[int, int]: Indices `(lo, hi)` such that `ranges[lo:hi]` overlap the block.
+        """
+        lo = bisect_right(self.ranges, block.start, key=_end)
+        hi = bisect_left(self.ranges, block.end, lo=lo, key=_start)
+        return lo, hi
+
+    def subtract(self, block: TimeRange) -> None:
+        """Removes availability that overlaps a given block.
+
+        Args:
+            block (TimeRange): The block of time to remove.
+
+        Returns:
+            None"""
+        lo, hi = self.overlapping(block)
+        if lo >= hi:
+            return
+
+        remainders: list[TimeRange] = []
+        first, last = self.ranges[lo], self.ranges[hi - 1]
+        if first.start < block.start:
+            remainders.append(TimeRange(start=first.start, end=block.start))
+        if last.end > block.end:
+            remainders.append(TimeRange(start=block.end, end=last.end))
+        self.ranges[lo:hi] = remainders
+
+    def constrain(self, bounds: TimeRange) -> None:
+        """Constrains availability within given bounds.
+
+        Args:
+            bounds (TimeRange): The bounds to constrain availability within.
+
+        Returns:
+            None"""
+        lo, hi = self.overlapping(bounds)
+        del self.ranges[hi:]
+        del self.ranges[:lo]
+        if len(self.ranges) == 0:
+            return
+
+        if self.ranges[0].start < bounds.start:
+            self.ranges[0] = TimeRange(start=bounds.start, end=self.ranges[0].end)
+        if self.ranges[-1].end > bounds.end:
+            self.ranges[-1] = TimeRange(start=self.ranges[-1].start, end=bounds.end)
+
+    def filter_time_ranges_below(self, minimum: timedelta) -> None:
+        """Remove all TimeRanges that are not at least the minimum timedelta.
+
+        Args:
+            minimum (timedelta): The threshold of which to remove beneath.
+
+        Returns:
+            None"""
+        self.ranges[:] = [
+            time_range
+            for time_range in self.ranges
+            if time_range.end - time_range.start >= minimum
+        ]
+
+    def total_duration(self) -> timedelta:
+        """Sum the durations of all availability.
+
+        Returns:
+            timedelta - Total amount of time available in this index."""
+        return sum(
+            (time_range.end - time_range.start for time_range in self.ranges),
+            timedelta(0),
+        )
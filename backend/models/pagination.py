@@ -1,6 +1,6 @@
 """Models for paginating results via the API."""
 
-from typing import Generic, TypeVar
+from typing import Generic, Literal, TypeVar
 from pydantic import BaseModel
 
 __authors__ = ["Kris Jordan"]
@@ -9,14 +9,24 @@ __license__ = "MIT"
 
 T = TypeVar("T")
 
+PaginationCount = Literal["exact", "estimate", "none"]
+"""How the total length of paginated results is counted: exactly, estimated by the query
+planner, or not at all, in which case the length is -1."""
+
 
 class PaginationParams(BaseModel):
-    """Parameters passed from the client to paginate results."""
+    """Parameters passed from the client to paginate results.
+
+    A page is selected either by its `page` number or, to resume after the last item of a
+    previous page, by that page's `next_cursor` as the `cursor`, which takes precedence.
+    """
 
     page: int = 0
     page_size: int = 10
     order_by: str = ""
     filter: str = ""
+    cursor: str = ""
+    count: PaginationCount = "exact"
 
 
 class TicketPaginationParams(PaginationParams):
@@ -44,3 +54,4 @@ class Paginated(BaseModel, Generic[T]):
     items: list[T]
     length: int
     params: PaginationParams | EventPaginationParams | TicketPaginationParams
+    next_cursor: str | None = None
@@ -0,0 +1,34 @@
+"""Models reporting the state of the database connection pools."""
+
+from pydantic import BaseModel
+
+__authors__ = ["Kris Jordan"]
+__copyright__ = "Copyright 2025"
+__license__ = "MIT"
+
+
+class PoolStatus(BaseModel):
+    """Usage of one worker process' connection pool to a database."""
+
+    size: int
+    checked_out: int
+    overflow: int
+    checkouts: int
+    total_wait_ms: float
+    max_wait_ms: float
+
+
+class DatabasePoolStatus(BaseModel):
+    """Usage of the primary connection pools and, if a replica is configured, the read-only pools."""
+
+    primary: PoolStatus
+    replica: PoolStatus | None = None
+    async_primary: PoolStatus
+    async_replica: PoolStatus | None = None
+
+
+class HealthStatus(BaseModel):
+    """Result of a health check: the database's response and this worker's pool usage."""
+
+    status: str
+    pool: DatabasePoolStatus
@@ -0,0 +1,191 @@
+"""
+This script compares the throughput of the async read endpoints against their synchronous versions.
+
+It serves the async routes at their usual paths and, at the same paths under `/sync`, routes that
+call the synchronous service methods from FastAPI's threadpool. A single uvicorn worker is started
+against the development database, then each endpoint pair is driven by the same number of
+concurrent clients for a fixed duration. Requests per second and latency percentiles are reported.
+
+Run `python3 -m backend.script.reset_demo` first so the default user and office hours exist.
+
+Usage: python3 -m backend.script.load_test [--clients 200] [--duration 10]
+"""
+
+import argparse
+import asyncio
+import statistics
+import subprocess
+import sys
+import time
+
+import httpx
+from fastapi import APIRouter, Depends, FastAPI
+
+from ..api import signage
+from ..api.authentication import _generate_token, registered_user
+from ..api.coworking import status
+from ..api.events import events
+from ..api.office_hours import office_hours
+from ..models import EventPaginationParams, User
+from ..services import EventService, SignageService
+from ..services.coworking import StatusService
+from ..services.office_hours.office_hours import OfficeHoursService
+from ..test.services import user_data
+
+__authors__ = ["Kris Jordan"]
+__copyright__ = "Copyright 2025"
+__license__ = "MIT"
+
+sync_api = APIRouter(prefix="/sync")
+
+
+@sync_api.get("/api/coworking/status")
+def get_coworking_status(
+    subject: User = Depends(registered_user), status_svc: StatusService = Depends()
+):
+    return status_svc.get_coworking_status(subject)
+
+
+@sync_api.get("/api/signage/fast")
+def get_fast_signage(signage_svc: SignageService = Depends()):
+    return signage_svc.get_fast_data()
+
+
+@sync_api.get("/api/signage/slow")
+def get_slow_signage(signage_svc: SignageService = Depends()):
+    return signage_svc.get_slow_data()
+
+
+@sync_api.get("/api/office-hours/{id}/queue")
+def get_office_hours_queue(
+    id: int,
+    subject: User = Depends(registered_user),
+    oh_event_svc: OfficeHoursService = Depends(),
+):
+    return oh_event_svc.get_office_hour_queue(subject, id)
+
+
+@sync_api.get("/api/events/unauthenticated/paginate")
+def list_events(event_service: EventService = Depends(), order_by: str = "start"):
+    return event_service.get_paginated_events(
+        EventPaginationParams(order_by=order_by), None
+    )
+
+
+app = FastAPI()
+app.include_router(status.api)
+app.include_router(signage.api)
+app.include_router(office_hours.api)
+app.include_router(events.api)
+app.include_router(sync_api)
+
+
+async def _client(
+    client: httpx.AsyncClient, path: str, deadline: float, latencies: list[float]
+) -> int:
+    errors = 0
+    while time.perf_counter() < deadline:
+        start = time.perf_counter()
+        try:
+            response = await client.get(path)
+        except httpx.TransportError:
+            errors += 1
+            continue
+        latencies.append(time.perf_counter() - start)
+        if response.status_code != 200:
+            errors += 1
+    return errors
+
+
+async def _load(
+    base_url: str, token: str, path: str, clients: int, duration: float
+) -> tuple[float, float, float, int]:
+    """Drives one path with concurrent clients, returning requests/s, p50 and p99 latency in ms, and errors."""
+    latencies: list[float] = []
+    async with httpx.AsyncClient(
+        base_url=base_url,
+        headers={"Authorization": f"Bearer {token}"},
+        limits=httpx.Limits(max_connections=clients),
+        timeout=60,
+    ) as client:
+        await client.get(path)  # Warm up caches and the connection pools
+        start = time.perf_counter()
+        errors = await asyncio.gather(
+            *[
+                _client(client, path, start + duration, latencies)
+                for _ in range(clients)
+            ]
+        )
+        elapsed = time.perf_counter() - start
+    percentiles = statistics.quantiles(latencies, n=100)
+    return (
+        len(latencies) / elapsed,
+        percentiles[49] * 1000,
+        percentiles[98] * 1000,
+        sum(errors),
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[1])
+    parser.add_argument("--clients", type=int, default=200)
+    parser.add_argument("--duration", type=float, default=10)
+    parser.add_argument("--port", type=int, default=1563)
+    parser.add_argument("--office-hours-id", type=int, default=1)
+    args = parser.parse_args()
+
+    paths = [
+        "/api/coworking/status",
+        "/api/signage/fast",
+        "/api/signage/slow",
+        f"/api/office-hours/{args.office_hours_id}/queue",
+        "/api/events/unauthenticated/paginate?order_by=start",
+    ]
+    token = _generate_token(user_data.instructor.onyen, user_data.instructor.pid)
+    base_url = f"http://127.0.0.1:{args.port}"
+
+    server = subprocess.Popen(
+        [
+            sys.executable,
+            "-m",
+            "uvicorn",
+            f"--port={args.port}",
+            "--log-level=warning",
+            "--no-access-log",
+            "--timeout-keep-alive=60",
+            "backend.script.load_test:app",
+        ]
+    )
+    try:
+        for _ in range(100):
+            try:
+                httpx.get(f"{base_url}/docs")
+                break
+            except httpx.HTTPError:
+                time.sleep(0.1)
+
+        print(f"{args.clients} concurrent clients, {args.duration:g}s per endpoint")
+        print(
+            f"{'endpoint':<56}{'sync req/s':>12}{'async req/s':>13}"
+            f"{'sync p50/p99 ms':>19}{'async p50/p99 ms':>19}{'errors':>8}"
+        )
+        for path in paths:
+            sync = asyncio.run(
+                _load(base_url, token, f"/sync{path}", args.clients, args.duration)
+            )
+            async_ = asyncio.run(
+                _load(base_url, token, path, args.clients, args.duration)
+            )
+            print(
+                f"{path:<56}{sync[0]:>12.1f}{async_[0]:>13.1f}"
+                f"{f'{sync[1]:.0f}/{sync[2]:.0f}':>19}"
+                f"{f'{async_[1]:.0f}/{async_[2]:.0f}':>19}"
+                f"{sync[3] + async_[3]:>8}"
+            )
+    finally:
+        server.terminate()
+        server.wait()
+
+
+if __name__ == "__main__":
+    main()
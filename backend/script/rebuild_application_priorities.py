@@ -0,0 +1,29 @@
+"""
+This script rebuilds the matrix of applicant priorities used to check hiring conflicts from the
+section applications, reviews, and hiring assignments themselves.
+
+The migration creating the matrix backfills it, and the services changing its sources keep it in
+sync, so rebuilding is only needed to repair a term whose data was changed outside of the
+services, such as after a restore.
+
+Usage: python3 -m backend.script.rebuild_application_priorities [TERM_ID]
+
+With no term given, every term is rebuilt.
+"""
+
+import sys
+from sqlalchemy.orm import Session
+from ..database import engine
+from ..services.academics.application_priorities import (
+    rebuild_application_priorities,
+)
+
+__authors__ = ["Kris Jordan"]
+__copyright__ = "Copyright 2025"
+__license__ = "MIT"
+
+term_id = sys.argv[1] if len(sys.argv) > 1 else None
+
+with Session(engine) as session:
+    rows = rebuild_application_priorities(session, term_id)
+    print(f"Rebuilt {term_id or 'every term'}: {rows} rows")
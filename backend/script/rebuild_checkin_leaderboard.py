@@ -0,0 +1,32 @@
+"""
+This script recomputes the monthly check-in leaderboard shown on signage from the full reservation
+history, including archived reservations.
+
+The leaderboard is maintained by database triggers as reservations are checked out, so rebuilding
+is only needed for months whose reservations were changed outside of them, such as after a restore.
+
+Usage: python3 -m backend.script.rebuild_checkin_leaderboard [YYYY-MM ...]
+
+With no months given, the current month is rebuilt.
+"""
+
+import sys
+from datetime import date, datetime
+from sqlalchemy.orm import Session
+from ..database import engine
+from ..services.coworking.checkin_leaderboard import rebuild_checkin_leaderboard
+
+__authors__ = ["Kris Jordan"]
+__copyright__ = "Copyright 2024"
+__license__ = "MIT"
+
+try:
+    months = [datetime.strptime(arg, "%Y-%m").date() for arg in sys.argv[1:]]
+except ValueError:
+    print("Months must be given as YYYY-MM, e.g. 2024-09", file=sys.stderr)
+    exit(1)
+
+with Session(engine) as session:
+    for month in months or [date.today()]:
+        ranked = rebuild_checkin_leaderboard(session, month)
+        print(f"Rebuilt {month:%Y-%m}: {ranked} users ranked")
@@ -0,0 +1,36 @@
+"""
+This script rebuilds the daily rollup of closed office hours ticket statistics from the tickets
+themselves.
+
+The migration creating the rollup backfills it, and closing a ticket adds it to the rollup, so
+rebuilding is only needed for days whose tickets were changed outside of the ticket service, such
+as after a restore.
+
+Usage: python3 -m backend.script.rebuild_office_hours_ticket_statistics [START [END]]
+
+START and END are days given as YYYY-MM-DD, and both are included. With no days given, every
+day of ticket history is rebuilt; with only START, every day from START on.
+"""
+
+import sys
+from datetime import datetime
+from sqlalchemy.orm import Session
+from ..database import engine
+from ..services.office_hours.ticket_statistics import rebuild_ticket_statistics
+
+__authors__ = ["Kris Jordan"]
+__copyright__ = "Copyright 2025"
+__license__ = "MIT"
+
+try:
+    days = [datetime.strptime(arg, "%Y-%m-%d").date() for arg in sys.argv[1:3]]
+except ValueError:
+    print("Days must be given as YYYY-MM-DD, e.g. 2025-01-13", file=sys.stderr)
+    exit(1)
+
+start = days[0] if len(days) > 0 else None
+end = days[1] if len(days) > 1 else None
+
+with Session(engine) as session:
+    rows = rebuild_ticket_statistics(session, start, end)
+    print(f"Rebuilt {start or 'the first day'} to {end or 'the last day'}: {rows} rows")
@@ -20,6 +20,8 @@ from sqlalchemy import select, join
 from sqlalchemy.orm import joinedload, aliased
 from backend.database import db_session
 from backend.services import PermissionService, UserService
+from backend.services.permission_cache import get_permission_cache
+from backend.services.user_cache import get_user_cache
 
 print("=== CSXL Development Repl ===\n")
 
@@ -42,10 +44,10 @@ print(" - all models in backend/models/coworking/__init__.py")
 session = next(db_session())
 print(" - session: a SQLAlchemy ORM Session")
 
-permission_svc = PermissionService(session)
+permission_svc = PermissionService(session, get_permission_cache())
 print(" - permission_svc: a PermissionService")
 
-user_svc = UserService(session, permission_svc)
+user_svc = UserService(session, permission_svc, get_user_cache())
 print(" - user_svc: a UserService")
 
 print("\n=============================\n")
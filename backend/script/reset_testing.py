@@ -17,6 +17,7 @@ from sqlalchemy.orm import Session
 from ..database import engine
 from ..env import getenv
 from .. import entities
+from ..services.permission_cache import permission_cache
 
 from ..test.services import role_data, user_data, permission_data, room_data
 from ..test.services.organization import organization_test_data
@@ -58,3 +59,6 @@ with Session(engine) as session:
 
     # Commit changes to the database
     session.commit()
+
+# Permissions cached by running workers describe the old database
+permission_cache.bump()
@@ -0,0 +1,219 @@
+"""Maintenance of the matrix of applicant priorities used to check hiring conflicts.
+
+Services that change what the matrix is computed from refresh the affected rows within their own
+transactions: `HiringService` as reviews are ranked, assignments are made, and course sites are
+created; `ApplicationService` as students rank sections; and `CourseSiteService` as sections move
+between course sites. Rebuilding recomputes a whole term, or every term, from scratch.
+
+Usage: see `backend/script/rebuild_application_priorities.py`.
+"""
+
+from sqlalchemy import ColumnElement, Select, case, delete, func, select, text
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session
+
+from ...entities.academics import SectionEntity
+from ...entities.academics.hiring.application_priority_entity import (
+    ApplicationPriorityEntity,
+)
+from ...entities.academics.hiring.application_review_entity import (
+    ApplicationReviewEntity,
+)
+from ...entities.academics.hiring.hiring_assignment_entity import (
+    HiringAssignmentEntity,
+)
+from ...entities.application_entity import ApplicationEntity
+from ...entities.section_application_table import section_application_table
+from ...models.academics.hiring.application_review import ApplicationReviewStatus
+
+__authors__ = ["Kris Jordan"]
+__copyright__ = "Copyright 2025"
+__license__ = "MIT"
+
+_COLUMNS = [
+    ApplicationPriorityEntity.term_id,
+    ApplicationPriorityEntity.application_id,
+    ApplicationPriorityEntity.course_site_id,
+    ApplicationPriorityEntity.student_priority,
+    ApplicationPriorityEntity.instructor_priority,
+    ApplicationPriorityEntity.hiring_assignment_id,
+]
+
+
+def refresh_application_priorities(
+    session: Session,
+    *,
+    term_id: str | None = None,
+    application_id: int | None = None,
+    course_site_id: int | None = None,
+) -> None:
+    """Recomputes the matrix rows matching every given key, committed along with the session.
+
+    Args:
+        session (Session): The session whose transaction changed the rows' sources.
+        term_id (str | None): Refresh the rows of this term's applications.
+        application_id (int | None): Refresh the rows of this application.
+        course_site_id (int | None): Refresh the rows of this course site.
+    """
+    session.flush()
+    criteria: list[ColumnElement[bool]] = []
+    if term_id is not None:
+        criteria.append(ApplicationPriorityEntity.term_id == term_id)
+    if application_id is not None:
+        criteria.append(ApplicationPriorityEntity.application_id == application_id)
+    if course_site_id is not None:
+        criteria.append(ApplicationPriorityEntity.course_site_id == course_site_id)
+
+    session.execute(delete(ApplicationPriorityEntity).where(*criteria))
+    # Rows a concurrent refresh inserted after this one deleted are overwritten.
+    statement = insert(ApplicationPriorityEntity).from_select(
+        _COLUMNS, _priority_rows(term_id, application_id, course_site_id)
+    )
+    session.execute(
+        statement.on_conflict_do_update(
+            index_elements=[
+                ApplicationPriorityEntity.application_id,
+                ApplicationPriorityEntity.course_site_id,
+            ],
+            set_={
+                column.key: getattr(statement.excluded, column.key)
+                for column in _COLUMNS
+            },
+        )
+    )
+
+
+def rebuild_application_priorities(session: Session, term_id: str | None = None) -> int:
+    """Recomputes the matrix for a term, or for every term, and commits it.
+
+    Args:
+        session (Session): The database session to use.
+        term_id (str | None): Term to rebuild, or None to rebuild every term.
+
+    Returns:
+        int: The number of matrix rows written.
+    """
+    session.execute(
+        text("LOCK TABLE academics__hiring__application_priority IN EXCLUSIVE MODE")
+    )
+    session.execute(
+        delete(ApplicationPriorityEntity).where(
+            *([ApplicationPriorityEntity.term_id == term_id] if term_id else [])
+        )
+    )
+    result = session.execute(
+        insert(ApplicationPriorityEntity).from_select(
+            _COLUMNS, _priority_rows(term_id, None, None)
+        )
+    )
+    session.commit()
+    return result.rowcount
+
+
+def _priority_rows(
+    term_id: str | None, application_id: int | None, course_site_id: int | None
+) -> Select:
+    """Matrix rows for the applications and course sites matching every given key, in `_COLUMNS` order."""
+
+    def matching(
+        application_column: ColumnElement, course_site_column: ColumnElement
+    ) -> list[ColumnElement[bool]]:
+        criteria: list[ColumnElement[bool]] = []
+        if term_id is not None:
+            criteria.append(
+                application_column.in_(
+                    select(ApplicationEntity.id).where(
+                        ApplicationEntity.term_id == term_id
+                    )
+                )
+            )
+        if application_id is not None:
+            criteria.append(application_column == application_id)
+        if course_site_id is not None:
+            criteria.append(course_site_column == course_site_id)
+        return criteria
+
+    # How highly each student ranked a section of each course site.
+    student = (
+        select(
+            section_application_table.c.application_id,
+            SectionEntity.course_site_id,
+            func.min(section_application_table.c.preference).label("priority"),
+        )
+        .join(SectionEntity, SectionEntity.id == section_application_table.c.section_id)
+        .where(
+            SectionEntity.course_site_id.isnot(None),
+            *matching(
+                section_application_table.c.application_id,
+                SectionEntity.course_site_id,
+            ),
+        )
+        .group_by(
+            section_application_table.c.application_id, SectionEntity.course_site_id
+        )
+        .subquery()
+    )
+
+    # How highly each course site's instructors ranked each student, and whom they hired.
+    assignment_id = (
+        select(func.max(HiringAssignmentEntity.id))
+        .where(
+            HiringAssignmentEntity.application_review_id == ApplicationReviewEntity.id
+        )
+        .scalar_subquery()
+    )
+    instructor = (
+        select(
+            ApplicationReviewEntity.application_id,
+            ApplicationReviewEntity.course_site_id,
+            case(
+                (
+                    ApplicationReviewEntity.status == ApplicationReviewStatus.PREFERRED,
+                    ApplicationReviewEntity.preference,
+                ),
+            ).label("priority"),
+            assignment_id.label("hiring_assignment_id"),
+        )
+        .where(
+            *matching(
+                ApplicationReviewEntity.application_id,
+                ApplicationReviewEntity.course_site_id,
+            )
+        )
+        .subquery()
+    )
+
+    pairs = (
+        select(
+            func.coalesce(student.c.application_id, instructor.c.application_id).label(
+                "application_id"
+            ),
+            func.coalesce(student.c.course_site_id, instructor.c.course_site_id).label(
+                "course_site_id"
+            ),
+            student.c.priority.label("student_priority"),
+            instructor.c.priority.label("instructor_priority"),
+            instructor.c.hiring_assignment_id,
+        )
+        .select_from(student)
+        .join(
+            instructor,
+            (student.c.application_id == instructor.c.application_id)
+            & (student.c.course_site_id == instructor.c.course_site_id),
+            full=True,
+        )
+        .subquery()
+    )
+
+    return (
+        select(
+            ApplicationEntity.term_id,
+            pairs.c.application_id,
+            pairs.c.course_site_id,
+            pairs.c.student_priority,
+            pairs.c.instructor_priority,
+            pairs.c.hiring_assignment_id,
+        )
+        .join(ApplicationEntity, ApplicationEntity.id == pairs.c.application_id)
+        .where(*([ApplicationEntity.term_id == term_id] if term_id else []))
+    )
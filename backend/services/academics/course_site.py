@@ -10,6 +10,8 @@ from sqlalchemy.orm import Session, joinedload
 from ...database import db_session
 from ...models.user import User
 from ...models.pagination import PaginationParams, Paginated
+from ..pagination import paginate
+from .application_priorities import refresh_application_priorities
 from ...models.academics.section_member import RosterRole
 from ...models.academics.my_courses import (
     CourseSiteOverview,
@@ -183,12 +185,6 @@ class CourseSiteService:
             .options(joinedload(SectionMemberEntity.user))
         )
 
-        # Add order by sort from pagination parameters
-        if pagination_params.order_by != "":
-            member_query = member_query.order_by(
-                getattr(UserEntity, pagination_params.order_by)
-            )
-
         # Create query off of the member query for just the members matching
         # with the current user (used to determine permissions)
         user_member_query = member_query.where(SectionMemberEntity.user_id == user.id)
@@ -220,32 +216,23 @@ class CourseSiteService:
             )
             member_query = member_query.where(criteria)
 
-        # Count the number of rows before applying pagination and filter.
-        count_query = select(func.count()).select_from(member_query.subquery())
-        length = self._session.scalar(count_query)
-
-        # Calculate offset and limit for pagination
-        offset = pagination_params.page * pagination_params.page_size
-        limit = pagination_params.page_size
-        member_query = (
-            member_query.offset(offset)
-            .limit(limit)
-            .order_by(SectionEntity.id)
-            .order_by(UserEntity.first_name)
-            .order_by(SectionMemberEntity.member_role)
-        )
-
-        # Load the final query
-        section_member_entities = self._session.scalars(member_query).all()
-
-        # Create paginated representation of data and return
-        return Paginated(
-            items=[
-                self._to_course_member_overview(member, is_student)
-                for member in section_member_entities
-            ],
-            length=length,
-            params=pagination_params,
+        # Sort by the requested user column, then by section, name, and role
+        sort = [
+            SectionEntity.id,
+            UserEntity.first_name,
+            SectionMemberEntity.member_role,
+            SectionMemberEntity.id,
+        ]
+        if pagination_params.order_by != "":
+            sort.insert(0, getattr(UserEntity, pagination_params.order_by))
+
+        # Load the requested page and create its paginated representation
+        return paginate(
+            self._session,
+            member_query,
+            pagination_params,
+            sort,
+            lambda member: self._to_course_member_overview(member, is_student),
         )
 
     def _to_course_member_overview(
@@ -492,7 +479,8 @@ class CourseSiteService:
         for section_entity in section_entities:
             section_entity.course_site_id = course_site_entity.id
 
-        # Save changes
+        # Save changes, along with the course sites applicants ranked
+        refresh_application_priorities(self._session, term_id=new_site.term_id)
         self._session.commit()
 
         # Return the model
@@ -659,7 +647,10 @@ class CourseSiteService:
                     if existing_entity.member_role != RosterRole.INSTRUCTOR:
                         existing_entity.member_role == RosterRole.UTA
 
-        # Save all changes in one commit
+        # Save all changes in one commit, along with the course sites applicants ranked
+        refresh_application_priorities(
+            self._session, term_id=course_site_entity.term_id
+        )
         self._session.commit()
 
         # Return updated site
@@ -4,11 +4,32 @@ Service for hiring.
 
 from itertools import groupby
 from operator import attrgetter
+from typing import Any, Callable, Iterable, Iterator, Sequence, TypeVar
 from fastapi import Depends
-from sqlalchemy import String, func, or_, select, update
-from sqlalchemy.orm import Session, joinedload, with_polymorphic, selectinload
+from sqlalchemy import (
+    Integer,
+    Select,
+    String,
+    case,
+    cast,
+    column,
+    func,
+    or_,
+    select,
+    update,
+    values,
+)
+from sqlalchemy.orm import (
+    Session,
+    contains_eager,
+    joinedload,
+    with_polymorphic,
+    selectinload,
+)
 
 from backend.models.pagination import Paginated, PaginationParams
+from ..pagination import paginate
+from .application_priorities import refresh_application_priorities
 from ...database import db_session
 from ..permission import PermissionService
 from ...models.user import User
@@ -26,6 +47,9 @@ from ...entities.academics.hiring.application_review_entity import (
 from ...entities.section_application_table import section_application_table
 from ...entities.academics.hiring.hiring_level_entity import HiringLevelEntity
 from ...entities.academics.hiring.hiring_assignment_entity import HiringAssignmentEntity
+from ...entities.academics.hiring.application_priority_entity import (
+    ApplicationPriorityEntity,
+)
 
 from ..exceptions import CoursePermissionException, ResourceNotFoundException
 from ...services import PermissionService
@@ -44,6 +68,11 @@ __authors__ = ["Ajay Gandecha", "Kris Jordan"]
 __copyright__ = "Copyright 2024"
 __license__ = "MIT"
 
+T = TypeVar("T")
+
+CSV_BATCH_SIZE = 500
+"""Number of entities fetched from the database at a time while streaming a CSV export."""
+
 
 class HiringService:
     """
@@ -81,7 +110,7 @@ class HiringService:
         # Step 2: Ensure all applications have an application_review entity.
         self._create_missing_reviews(site_entity)
 
-        # Step 3: Load all reviews for the course site.
+        # Step 3: Load all reviews for the course site, in a fixed number of queries.
         review_models: list[ApplicationReviewOverview] = self._to_review_models(
             site_entity
         )
@@ -107,10 +136,19 @@ class HiringService:
                 subject, "hiring.get_status", f"course_site/{course_site_id}"
             )
 
-        # Step 2: Update the values for all reviews.
+        # Step 2: Find the reviews whose status, preference, or notes changed.
+        persisted_query = select(
+            ApplicationReviewEntity.id,
+            ApplicationReviewEntity.status,
+            ApplicationReviewEntity.preference,
+            ApplicationReviewEntity.notes,
+        ).where(ApplicationReviewEntity.course_site_id == course_site_id)
+        persisted: dict[int, tuple] = {
+            id: (status, preference, notes)
+            for id, status, preference, notes in self._session.execute(persisted_query)
+        }
 
-        # Retrieve all reviews, indexed by ID for efficient searching.
-        hiring_status_reviews_by_id: dict[int, ApplicationReviewOverview] = {}
+        changes: list[tuple] = []
         for pool in (
             hiring_status.not_preferred,
             hiring_status.not_processed,
@@ -118,29 +156,39 @@ class HiringService:
         ):
             for review_overview in pool:
                 assert review_overview.id is not None
-                hiring_status_reviews_by_id[review_overview.id] = review_overview
-
-        # Update every application associated with the site.
-        updates: list[dict] = []
-        for persisted in site_entity.application_reviews:
-            request = hiring_status_reviews_by_id[persisted.id]
-            if (
-                persisted.status != request.status
-                or persisted.preference != request.preference
-                or persisted.notes != request.notes
-            ):
-                updates.append(
-                    {
-                        "id": persisted.id,
-                        "status": request.status,
-                        "preference": request.preference,
-                        "notes": request.notes,
-                    }
+                requested = (
+                    review_overview.status,
+                    review_overview.preference,
+                    review_overview.notes,
                 )
-
-        # Bulk update
-        if len(updates) > 0:
-            self._session.execute(update(ApplicationReviewEntity), updates)
+                # Reviews of other course sites are not persisted here, so never change.
+                if persisted.get(review_overview.id, requested) != requested:
+                    changes.append((review_overview.id, *requested))
+
+        # Step 3: Apply every change in one UPDATE ... FROM (VALUES ...) statement.
+        if len(changes) > 0:
+            status_type = ApplicationReviewEntity.status.type
+            changed = values(
+                column("id", Integer),
+                column("status", status_type),
+                column("preference", Integer),
+                column("notes", String),
+                name="changed",
+            ).data(changes)
+            self._session.execute(
+                update(ApplicationReviewEntity)
+                .where(
+                    ApplicationReviewEntity.id == changed.c.id,
+                    ApplicationReviewEntity.course_site_id == course_site_id,
+                )
+                .values(
+                    status=cast(changed.c.status, status_type),
+                    preference=changed.c.preference,
+                    notes=changed.c.notes,
+                )
+                .execution_options(synchronize_session=False)
+            )
+            refresh_application_priorities(self._session, course_site_id=course_site_id)
             self._session.commit()
 
         # Reload the data and return the hiring status.
@@ -182,26 +230,42 @@ class HiringService:
                 section.course_site = course_site
             self._session.add(course_site)
 
+        refresh_application_priorities(self._session, term_id=term_id)
         self._session.commit()
         return True
 
     def get_phd_applicants(
         self, subject: User, term_id: str
-    ) -> list[PhDApplicationReview]:
+    ) -> Iterator[PhDApplicationReview]:
+        """
+        Streams the graduate applications of a term with their student and instructor
+        preferences, loading them in batches of `CSV_BATCH_SIZE`.
+        """
         self._permission.enforce(
             subject, "hiring.get_phd_applicants", f"course_sites/term:{term_id}"
         )
 
-        query = select(ApplicationEntity).where(
-            ApplicationEntity.term_id == term_id,
-            ApplicationEntity.type == "gta",
-            ApplicationEntity.program_pursued.in_({"PhD", "PhD (ABD)", "MS", "BS/MS"}),
+        query = (
+            select(ApplicationEntity)
+            .where(
+                ApplicationEntity.term_id == term_id,
+                ApplicationEntity.type == "gta",
+                ApplicationEntity.program_pursued.in_(
+                    {"PhD", "PhD (ABD)", "MS", "BS/MS"}
+                ),
+            )
+            .order_by(ApplicationEntity.id)
+            .options(selectinload(ApplicationEntity.user))
         )
-        all = self._session.scalars(query).all()
+        return self._stream(query, lambda batch: self._phd_applicants(term_id, batch))
 
+    def _phd_applicants(
+        self, term_id: str, applications: Sequence[ApplicationEntity]
+    ) -> list[PhDApplicationReview]:
+        """Converts a batch of applications into models with their preferences."""
         # Create the models
         phd_applications = {}
-        for application in all:
+        for application in applications:
             phd_application = PhDApplicationReview(
                 id=application.id,
                 applicant=application.user.to_model(),
@@ -214,23 +278,27 @@ class HiringService:
             )
             phd_applications[application.id] = phd_application
 
-        sections_query = select(SectionEntity).where(SectionEntity.term_id == term_id)
-        sections = {
-            section.id: section
-            for section in self._session.scalars(sections_query).all()
-        }
-
         # Grab student preferences of sections
         application_ids = list(phd_applications.keys())
         section_application_query = (
-            select(section_application_table)
+            select(
+                section_application_table.c.application_id,
+                SectionEntity.course_id,
+                SectionEntity.number,
+            )
+            .join(
+                SectionEntity,
+                SectionEntity.id == section_application_table.c.section_id,
+            )
             .where(section_application_table.c.application_id.in_(application_ids))
+            .where(SectionEntity.term_id == term_id)
             .order_by(section_application_table.c.preference)
         )
-        for section_application in self._session.execute(section_application_query):
-            _, section_id, application_id = section_application
+        for application_id, course_id, number in self._session.execute(
+            section_application_query
+        ):
             phd_applications[application_id].student_preferences.append(
-                f"{sections[section_id].course_id}.{sections[section_id].number}"
+                f"{course_id}.{number}"
             )
 
         # Grab instructor preferences of applications
@@ -239,9 +307,15 @@ class HiringService:
             .where(ApplicationReviewEntity.application_id.in_(application_ids))
             .where(ApplicationReviewEntity.status == ApplicationReviewStatus.PREFERRED)
             .order_by(ApplicationReviewEntity.preference)
-            .options(joinedload(ApplicationReviewEntity.course_site))
+            .options(
+                joinedload(ApplicationReviewEntity.course_site).selectinload(
+                    CourseSiteEntity.sections
+                )
+            )
+        )
+        instructor_preferences = (
+            self._session.scalars(instructor_review_query).unique().all()
         )
-        instructor_preferences = self._session.scalars(instructor_review_query).all()
         for review in instructor_preferences:
             phd_applications[review.application_id].instructor_preferences.append(
                 f"({review.preference}) {review.course_site.sections[0].course_id}.{review.course_site.sections[0].number}"
@@ -249,6 +323,32 @@ class HiringService:
 
         return list(phd_applications.values())
 
+    def _stream(
+        self, query: Select, to_rows: Callable[[Sequence[Any]], Iterable[T]]
+    ) -> Iterator[T]:
+        """
+        Yields the rows converted from the entities a query selects, fetching `CSV_BATCH_SIZE`
+        entities at a time from a server-side cursor so that exports need not fit in memory.
+
+        CSV routes consume these rows while their response streams, after the request's session
+        dependency has exited, so the session is closed again once the rows are exhausted.
+
+        Args:
+            query (Select): Selects the entities to export.
+            to_rows (Callable): Converts a batch of entities into rows.
+
+        Returns:
+            Iterator[T]: The rows, loaded lazily as they are iterated.
+        """
+        try:
+            result = self._session.scalars(
+                query.execution_options(yield_per=CSV_BATCH_SIZE)
+            )
+            for batch in result.partitions():
+                yield from to_rows(batch)
+        finally:
+            self._session.close()
+
     def _load_course_site(self, course_site_id: int) -> CourseSiteEntity:
         """
         Loads a course site given a subject and course site ID.
@@ -301,8 +401,8 @@ class HiringService:
     def _create_missing_reviews(self, site: CourseSiteEntity) -> None:
         need_review: list[int] = self._select_application_ids_without_reviews(site)
 
-        preference: int = self._count_unprocessed(site)
         if len(need_review) > 0:
+            preference: int = self._count_unprocessed(site)
             for application_id in need_review:
                 review = ApplicationReviewEntity(
                     application_id=application_id,
@@ -369,7 +469,8 @@ class HiringService:
         self, course_site: CourseSiteEntity
     ) -> list[ApplicationReviewEntity]:
         """
-        Loads all application reviews for a given course site.
+        Loads all application reviews for a given course site, along with each review's
+        application and applicant in the same query.
 
         Args:
             course_site (CourseSiteEntity): The course site to check against.
@@ -377,57 +478,25 @@ class HiringService:
         Returns:
             list[ApplicationReviewEntity]: A list of application reviews for the course site.
         """
-        reviews_query = select(ApplicationReviewEntity).where(
-            ApplicationReviewEntity.course_site_id == course_site.id
+        reviews_query = (
+            select(ApplicationReviewEntity)
+            .where(ApplicationReviewEntity.course_site_id == course_site.id)
+            .options(
+                joinedload(ApplicationReviewEntity.application).joinedload(
+                    ApplicationEntity.user
+                )
+            )
         )
         return list(self._session.scalars(reviews_query).all())
 
-    def _load_applications(
-        self, reviews: list[ApplicationReviewEntity]
-    ) -> dict[int, ApplicationEntity]:
-        """
-        Loads all applications for a given course site.
-
-        Args:
-            course_site (CourseSiteEntity): The course site to check against.
-
-        Returns:
-            list[ApplicationEntity]: A list of applications for the course site.
-        """
-        applications_query = select(ApplicationEntity).where(
-            ApplicationEntity.id.in_([review.application_id for review in reviews])
-        )
-        # Use a dict comprehension to map application IDs to application entities.
-        return {app.id: app for app in self._session.scalars(applications_query).all()}
-
-    def _load_applicants(
-        self, applications: dict[int, ApplicationEntity]
-    ) -> dict[int, UserEntity]:
-        """
-        Loads all applicants for a given course site.
-
-        Args:
-            applications (dict[int, ApplicationEntity]): A dictionary of application IDs to application entities.
-
-        Returns:
-            dict[int, User]: A dictionary of applicant IDs to applicant entities.
-        """
-        applicant_ids = {app.user_id for app in applications.values()}
-        applicants_query = select(UserEntity).where(UserEntity.id.in_(applicant_ids))
-        # Use a dict comprehension to map applicant IDs to applicant entities.
-        return {
-            applicant.id: applicant
-            for applicant in self._session.scalars(applicants_query).all()
-        }
-
     def _load_application_preferences(
-        self, site: CourseSiteEntity, applications: dict[int, ApplicationEntity]
+        self, course_site: CourseSiteEntity
     ) -> dict[int, int]:
         """
-        Loads all application preferences for a given course site.
+        Loads how highly each applicant to a course site ranked its sections.
 
         Args:
-            applications (dict[int, ApplicationEntity]): A dictionary of application IDs to application entities.
+            course_site (CourseSiteEntity): The course site to check against.
 
         Returns:
             dict[int, int]: A dictionary of application IDs to application preferences.
@@ -437,12 +506,11 @@ class HiringService:
                 section_application_table.c.application_id,
                 func.min(section_application_table.c.preference),
             )
-            .where(section_application_table.c.application_id.in_(applications.keys()))
-            .where(
-                section_application_table.c.section_id.in_(
-                    [section.id for section in site.sections]
-                )
+            .join(
+                SectionEntity,
+                SectionEntity.id == section_application_table.c.section_id,
             )
+            .where(SectionEntity.course_site_id == course_site.id)
             .group_by(section_application_table.c.application_id)
         )
         result = self._session.execute(preferences_query)
@@ -453,32 +521,24 @@ class HiringService:
         site_entity: CourseSiteEntity,
     ) -> list[ApplicationReviewOverview]:
         """
-        Converts a list of application reviews into a list of review models.
+        Loads the application reviews of a course site as review models.
 
         Args:
-            reviews (list[ApplicationReviewEntity]): A list of application reviews.
-            applications (dict[int, ApplicationEntity]): A dictionary of application IDs to application entities.
-            applicants (dict[int, UserEntity]): A dictionary of applicant IDs to applicant entities.
-            applicant_preferences (dict[int, int]): A dictionary of application IDs to application preferences.
+            site_entity (CourseSiteEntity): The course site whose reviews to load.
 
         Returns:
             list[ApplicationReviewOverview]: A list of review models.
         """
         application_reviews = self._load_application_reviews(site_entity)
-        applications = self._load_applications(application_reviews)
-        applicants = self._load_applicants(applications)
-        applicant_preferences = self._load_application_preferences(
-            site_entity, applications
-        )
+        applicant_preferences = self._load_application_preferences(site_entity)
         return [
             ApplicationReviewOverview(
                 id=review.id,
                 course_site_id=review.course_site_id,
                 application_id=review.application_id,
-                applicant_id=applications[review.application_id].user_id,
+                applicant_id=review.application.user_id,
                 application=self._application_model(
-                    applications[review.application_id],
-                    applicants[applications[review.application_id].user_id],
+                    review.application, review.application.user
                 ),
                 status=review.status,
                 preference=review.preference,
@@ -563,59 +623,107 @@ class HiringService:
 
     # Hiring Admin Features
 
-    def _calculate_coverage(
-        self, enrollment: int, assignments: list[HiringAssignmentEntity]
-    ) -> float:
-        coverage: float = 0.0
-        for assignment in assignments:
-            if assignment.hiring_level.classification in {
-                HiringLevelClassification.MS,
-                HiringLevelClassification.PHD,
-            }:
-                coverage += assignment.hiring_level.load
-            elif assignment.hiring_level.classification == HiringLevelClassification.UG:
-                coverage += assignment.hiring_level.load * 0.25
-            else:
-                # IOR
-                coverage += 0
-
-        return (float(enrollment) / 60.0) - coverage
-
     def get_hiring_admin_overview(
         self, subject: User, term_id: str
     ) -> HiringAdminOverview:
-        """Get the overview for hiring during a given term for the site admin."""
+        """
+        Get the overview for hiring during a given term for the site admin.
+
+        Each site's enrollment, cost, and coverage are aggregated by the query loading the
+        sites, and their sections, instructors, and assignments are eager loaded, so the
+        overview takes the same number of queries however many sites the term has.
+        """
         # 1. Check for hiring permissions.
         self._permission.enforce(subject, "hiring.admin", "*")
-        # 2. Find the hiring information based on course sites for a given term
+
+        # 2. Aggregate the enrollment, cost, and coverage of the term's course sites
+        term_site_ids = select(CourseSiteEntity.id).where(
+            CourseSiteEntity.term_id == term_id
+        )
+        enrollment_query = (
+            select(
+                SectionEntity.course_site_id,
+                func.sum(SectionEntity.enrolled).label("total_enrollment"),
+            )
+            .where(SectionEntity.course_site_id.in_(term_site_ids))
+            .group_by(SectionEntity.course_site_id)
+            .subquery()
+        )
+        # Graduate hires cover their full load, undergraduates a quarter of it, and IORs none.
+        covered_load = case(
+            (
+                HiringLevelEntity.classification.in_(
+                    [HiringLevelClassification.MS, HiringLevelClassification.PHD]
+                ),
+                HiringLevelEntity.load,
+            ),
+            (
+                HiringLevelEntity.classification == HiringLevelClassification.UG,
+                HiringLevelEntity.load * 0.25,
+            ),
+            else_=0.0,
+        )
+        assignment_query = (
+            select(
+                HiringAssignmentEntity.course_site_id,
+                func.sum(HiringLevelEntity.salary).label("total_cost"),
+                func.sum(covered_load).label("covered_load"),
+            )
+            .join(HiringAssignmentEntity.hiring_level)
+            .where(HiringAssignmentEntity.course_site_id.in_(term_site_ids))
+            .group_by(HiringAssignmentEntity.course_site_id)
+            .subquery()
+        )
         course_site_query = (
-            select(CourseSiteEntity)
-            .join(CourseSiteEntity.term)
-            .where(TermEntity.id == term_id)
+            select(
+                CourseSiteEntity,
+                func.coalesce(enrollment_query.c.total_enrollment, 0),
+                func.coalesce(assignment_query.c.total_cost, 0.0),
+                func.coalesce(assignment_query.c.covered_load, 0.0),
+            )
+            .outerjoin(
+                enrollment_query,
+                enrollment_query.c.course_site_id == CourseSiteEntity.id,
+            )
+            .outerjoin(
+                assignment_query,
+                assignment_query.c.course_site_id == CourseSiteEntity.id,
+            )
+            .where(CourseSiteEntity.term_id == term_id)
+            .order_by(CourseSiteEntity.id)
             .options(
-                joinedload(CourseSiteEntity.sections),
+                selectinload(CourseSiteEntity.sections).selectinload(
+                    SectionEntity.course
+                ),
+                selectinload(CourseSiteEntity.sections)
+                .selectinload(SectionEntity.staff)
+                .selectinload(SectionMemberEntity.user),
+                selectinload(CourseSiteEntity.hiring_assignments).options(
+                    selectinload(HiringAssignmentEntity.user),
+                    selectinload(HiringAssignmentEntity.hiring_level),
+                ),
             )
         )
-        course_site_entities = self._session.scalars(course_site_query).unique().all()
 
         # 3. Assemble the overview models
         hiring_course_site_overviews: list[HiringCourseSiteOverview] = []
-        for course_site_entity in course_site_entities:
-            # Find all of the data for a course site overview
-            section_entites = course_site_entity.sections
+        for (
+            course_site_entity,
+            total_enrollment,
+            total_cost,
+            covered_load,
+        ) in self._session.execute(course_site_query):
+            # Find the sections and instructors of the course site
             sections = [
-                section.to_catalog_identity_model() for section in section_entites
+                section.to_catalog_identity_model()
+                for section in course_site_entity.sections
             ]
-            instructors: list[PublicUser] = []
-            total_enrollment = 0
-            for section_entity in section_entites:
-                instructors += [
-                    staff.user.to_public_model()
-                    for staff in section_entity.staff
-                    if staff.member_role == RosterRole.INSTRUCTOR
-                ]
-                total_enrollment += section_entity.enrolled
-
+            instructors = {
+                staff.user.to_public_model()
+                for section in course_site_entity.sections
+                for staff in section.staff
+                if staff.member_role == RosterRole.INSTRUCTOR
+            }
             assignments = sorted(
                 [
                     assignment.to_overview_model()
@@ -623,19 +731,15 @@ class HiringService:
                 ],
                 key=lambda x: x.user.last_name,
             )
-            total_cost = sum([assignment.level.salary for assignment in assignments])
-            coverage = self._calculate_coverage(
-                total_enrollment, course_site_entity.hiring_assignments
-            )
 
             # Create overview with found data
             course_site_overview = HiringCourseSiteOverview(
                 course_site_id=course_site_entity.id,
                 sections=sections,
-                instructors=list(set(instructors)),
+                instructors=list(instructors),
                 total_enrollment=total_enrollment,
                 total_cost=total_cost,
-                coverage=coverage,
+                coverage=(float(total_enrollment) / 60.0) - covered_load,
                 assignments=assignments,
             )
 
@@ -713,6 +817,7 @@ class HiringService:
         # 2. Create the entity and persist.
         assignment_entity = HiringAssignmentEntity.from_draft_model(assignment)
         self._session.add(assignment_entity)
+        self._refresh_review_priorities(assignment_entity.application_review_id)
         self._session.commit()
 
         return assignment_entity.to_overview_model()
@@ -759,9 +864,22 @@ class HiringService:
         model = assignment_entity.to_overview_model()
         # 3. Delete and save
         self._session.delete(assignment_entity)
+        self._refresh_review_priorities(assignment_entity.application_review_id)
         self._session.commit()
         return model
 
+    def _refresh_review_priorities(self, application_review_id: int | None) -> None:
+        """Refreshes the priority of the application and course site of a review, if any."""
+        if application_review_id is None:
+            return
+        review = self._session.get(ApplicationReviewEntity, application_review_id)
+        if review is not None:
+            refresh_application_priorities(
+                self._session,
+                application_id=review.application_id,
+                course_site_id=review.course_site_id,
+            )
+
     def get_hiring_levels(self, subject: User) -> list[HiringLevel]:
         """Retrieves all of the hiring levels."""
         # 1. Check user permissions
@@ -833,9 +951,6 @@ class HiringService:
             .join(HiringAssignmentEntity.user)
             .where(HiringAssignmentEntity.term_id == term_id)
             .where(HiringAssignmentEntity.status.in_(SUMMARY_STATUSES))
-            .order_by(
-                UserEntity.last_name, UserEntity.first_name
-            )  # Secondary sort for stability
         )
 
         # 4. Apply search filter if present
@@ -849,39 +964,26 @@ class HiringService:
             )
             base_query = base_query.where(criteria)
 
-        # 5. Create count query from base query
-        count_query = select(func.count()).select_from(base_query.subquery())
-
-        # 6. Create assignment query with eager loading
+        # 5. Create assignment query with eager loading
         assignment_query = base_query.options(
             joinedload(HiringAssignmentEntity.course_site)
             .joinedload(CourseSiteEntity.sections)
             .joinedload(SectionEntity.staff),
         )
 
-        # 7. Apply pagination
-        offset = pagination_params.page * pagination_params.page_size
-        limit = pagination_params.page_size
-        assignment_query = assignment_query.offset(offset).limit(limit)
-
-        # 8. Execute queries
-        length = self._session.scalar(count_query) or 0
-        assignment_entities = self._session.scalars(assignment_query).unique().all()
-
-        # 9. Build and return response
-        return Paginated(
-            items=[
-                assignment.to_summary_overview_model()
-                for assignment in assignment_entities
-            ],
-            length=length,
-            params=pagination_params,
+        # 6. Load and return the page, sorted by name with the assignment ID for stability
+        return paginate(
+            self._session,
+            assignment_query,
+            pagination_params,
+            [UserEntity.last_name, UserEntity.first_name, HiringAssignmentEntity.id],
+            lambda assignment: assignment.to_summary_overview_model(),
         )
 
     def get_hiring_summary_for_csv(
         self, subject: User, term_id: str
-    ) -> list[HiringAssignmentCsvRow]:
-        """Returns the hires to show on a summary page for a given term."""
+    ) -> Iterator[HiringAssignmentCsvRow]:
+        """Streams the hires to show on a summary page for a given term."""
         # 1. Check for hiring permissions.
         self._permission.enforce(subject, "hiring.summary", "*")
         # 2. Build query
@@ -895,17 +997,27 @@ class HiringService:
                 )
             )
             .order_by(UserEntity.last_name, UserEntity.first_name)
+            .options(
+                contains_eager(HiringAssignmentEntity.user),
+                selectinload(HiringAssignmentEntity.hiring_level),
+                selectinload(HiringAssignmentEntity.course_site)
+                .selectinload(CourseSiteEntity.sections)
+                .selectinload(SectionEntity.staff)
+                .selectinload(SectionMemberEntity.user),
+            )
+        )
+        # 3. Stream items
+        return self._stream(
+            assignment_query,
+            lambda batch: [
+                assignment_entity.to_csv_row() for assignment_entity in batch
+            ],
         )
-        # 3. Return items
-        assignment_entities = self._session.scalars(assignment_query).all()
-        return [
-            assignment_entity.to_csv_row() for assignment_entity in assignment_entities
-        ]
 
     def get_course_site_hiring_status_csv(
         self, subject: User, course_site_id: int
-    ) -> list[ApplicationReviewCsvRow]:
-        """Retrieves the applications to a course for a CSV export."""
+    ) -> Iterator[ApplicationReviewCsvRow]:
+        """Streams the applications to a course for a CSV export."""
         # Step 0: Load a Course Site
         site_entity = self._load_course_site(course_site_id)
 
@@ -915,10 +1027,23 @@ class HiringService:
                 subject, "hiring.get_status", f"course_site/{course_site_id}"
             )
 
-        # Step 2: Convert all applicants to rows and return
-        return [
-            application.to_csv_row() for application in site_entity.application_reviews
-        ]
+        # Step 2: Stream all applicants as rows
+        reviews_query = (
+            select(ApplicationReviewEntity)
+            .where(ApplicationReviewEntity.course_site_id == course_site_id)
+            .order_by(ApplicationReviewEntity.id)
+            .options(
+                selectinload(ApplicationReviewEntity.application).selectinload(
+                    ApplicationEntity.user
+                ),
+                selectinload(ApplicationReviewEntity.application)
+                .selectinload(ApplicationEntity.preferred_sections)
+                .selectinload(SectionEntity.course),
+            )
+        )
+        return self._stream(
+            reviews_query, lambda batch: [review.to_csv_row() for review in batch]
+        )
 
     def get_hiring_assignments_for_course_site(
         self, subject: User, course_site_id: int, pagination_params: PaginationParams
@@ -979,8 +1104,8 @@ class HiringService:
 
     def get_assignment_summary_for_instructors_csv(
         self, subject: User, course_site_id: int
-    ) -> list[HiringAssignmentSummaryCsvRow]:
-        """Returns the hires to show for a course site as a CSV."""
+    ) -> Iterator[HiringAssignmentSummaryCsvRow]:
+        """Streams the hires to show for a course site as a CSV."""
         # 1. Check for hiring permissions.
         course_site = self._load_course_site(course_site_id)
         if not self._is_instructor(subject, course_site):
@@ -997,88 +1122,101 @@ class HiringService:
                     [HiringAssignmentStatus.COMMIT, HiringAssignmentStatus.FINAL]
                 )
             )
+            .order_by(HiringAssignmentEntity.id)
+            .options(
+                selectinload(HiringAssignmentEntity.user),
+                selectinload(HiringAssignmentEntity.hiring_level),
+            )
         )
 
-        # 3. Return items
-        assignment_entities = self._session.scalars(assignments_query).all()
+        # 3. Stream items
+        return self._stream(
+            assignments_query,
+            lambda batch: [
+                assignment_entity.to_summary_csv_row() for assignment_entity in batch
+            ],
+        )
+
+    def conflict_check(self, subject: User, application_id: int) -> ConflictCheck:
+        """
+        Checks an application for conflicts between the course sites that prefer it.
+
+        Reads the application's rows of the priority matrix, which are kept in sync as
+        reviews, assignments, and section preferences change.
+        """
+        self._permission.enforce(subject, "hiring.conflict_check", "*")
+        conflicts = self._load_conflicts(
+            ApplicationPriorityEntity.application_id == application_id
+        )
+        return conflicts.get(
+            application_id,
+            ConflictCheck(application_id=application_id, assignments=[], priorities=[]),
+        )
+
+    def get_conflicts(self, subject: User, term_id: str) -> list[ConflictCheck]:
+        """
+        Returns the conflict checks of every application in a term preferred by the
+        instructors of more than one of the course sites the student ranked.
+        """
+        self._permission.enforce(subject, "hiring.conflict_check", "*")
+        conflicts = self._load_conflicts(ApplicationPriorityEntity.term_id == term_id)
         return [
-            assignment_entity.to_summary_csv_row()
-            for assignment_entity in assignment_entities
+            conflict for conflict in conflicts.values() if len(conflict.priorities) > 1
         ]
 
-    def conflict_check(
-        self, subject: User, application_id: int
-    ) -> list[ApplicationPriority]:
-        self._permission.enforce(subject, "hiring.conflict_check", "*")
-        from sqlalchemy import func, and_
+    def _load_conflicts(self, *criteria) -> dict[int, ConflictCheck]:
+        """
+        Loads the conflict checks of the applications whose priority matrix rows match
+        `criteria`, in two queries however many applications match.
 
-        student_priority = func.min(section_application_table.c.preference).label(
-            "student_priority"
+        Returns:
+            dict[int, ConflictCheck]: Conflict checks indexed by application ID.
+        """
+        priority = ApplicationPriorityEntity
+        priorities_query = (
+            select(priority, CourseSiteEntity.title)
+            .join(CourseSiteEntity, CourseSiteEntity.id == priority.course_site_id)
+            .where(*criteria)
+            .order_by(priority.application_id, priority.student_priority)
         )
-        query = (
-            select(
-                student_priority,
-                func.min(ApplicationReviewEntity.preference).label(
-                    "instructor_priority"
-                ),
-                CourseSiteEntity.id,
-                CourseSiteEntity.title,
-            )
-            .join(
-                CourseSiteEntity,
-                ApplicationReviewEntity.course_site_id == CourseSiteEntity.id,
-                isouter=True,
-            )
-            .join(
-                SectionEntity,
-                SectionEntity.course_site_id == CourseSiteEntity.id,
-                isouter=True,
-            )
-            .join(
-                ApplicationEntity,
-                ApplicationReviewEntity.application_id == ApplicationEntity.id,
-                isouter=True,
-            )
-            .join(
-                section_application_table,
-                and_(
-                    section_application_table.c.section_id == SectionEntity.id,
-                    section_application_table.c.application_id == ApplicationEntity.id,
+        conflicts: dict[int, ConflictCheck] = {}
+        assignment_ids: dict[int, int] = {}
+        for row, title in self._session.execute(priorities_query):
+            conflict = conflicts.setdefault(
+                row.application_id,
+                ConflictCheck(
+                    application_id=row.application_id, assignments=[], priorities=[]
                 ),
-                isouter=True,
-            )
-            .where(
-                ApplicationEntity.id == application_id,
-                ApplicationReviewEntity.status == ApplicationReviewStatus.PREFERRED,
-                section_application_table.c.preference.isnot(None),
             )
-            .group_by(CourseSiteEntity.id)
-            .order_by(student_priority.asc())
-        )
-        preferences = self._session.execute(query).all()
-        priorities: list[ApplicationPriority] = []
-        for student_pri, instructor_pri, course_site_id, title in preferences:
-            priorities.append(
-                ApplicationPriority(
-                    student_priority=student_pri,
-                    instructor_priority=instructor_pri,
-                    course_site_id=course_site_id,
-                    course_title=title,
+            if row.student_priority is not None and row.instructor_priority is not None:
+                conflict.priorities.append(
+                    ApplicationPriority(
+                        student_priority=row.student_priority,
+                        instructor_priority=row.instructor_priority,
+                        course_site_id=row.course_site_id,
+                        course_title=title,
+                    )
+                )
+            if row.hiring_assignment_id is not None:
+                assignment_ids[row.hiring_assignment_id] = row.application_id
+
+        if len(assignment_ids) > 0:
+            assignments_query = (
+                select(HiringAssignmentEntity)
+                .where(HiringAssignmentEntity.id.in_(assignment_ids.keys()))
+                .order_by(HiringAssignmentEntity.id)
+                .options(
+                    joinedload(HiringAssignmentEntity.user),
+                    joinedload(HiringAssignmentEntity.hiring_level),
+                    selectinload(HiringAssignmentEntity.course_site)
+                    .selectinload(CourseSiteEntity.sections)
+                    .selectinload(SectionEntity.staff)
+                    .selectinload(SectionMemberEntity.user),
                 )
             )
+            for assignment in self._session.scalars(assignments_query):
+                conflicts[assignment_ids[assignment.id]].assignments.append(
+                    assignment.to_summary_overview_model()
+                )
 
-        assignments_query = (
-            select(HiringAssignmentEntity)
-            .join(ApplicationReviewEntity)
-            .join(ApplicationEntity)
-            .where(ApplicationEntity.id == application_id)
-        )
-
-        return ConflictCheck(
-            application_id=application_id,
-            assignments=[
-                a.to_summary_overview_model()
-                for a in self._session.scalars(assignments_query).all()
-            ],
-            priorities=priorities,
-        )
+        return conflicts
@@ -30,6 +30,7 @@ from backend.services.exceptions import (
 )
 
 from .permission import PermissionService
+from .academics.application_priorities import refresh_application_priorities
 
 from ..database import db_session
 from datetime import datetime
@@ -108,6 +109,12 @@ class ApplicationService:
             )
             self._session.commit()  # This is an issue due to the table not being an entity.
 
+        # Update the course sites the applicant ranked
+        refresh_application_priorities(
+            self._session, application_id=application_entity.id
+        )
+        self._session.commit()
+
         # Return the added data
         return application_entity.to_model()
 
@@ -173,6 +180,12 @@ class ApplicationService:
             )
             self._session.commit()  # This is an issue due to the table not being an entity.
 
+        # Update the course sites the applicant ranked
+        refresh_application_priorities(
+            self._session, application_id=application_entity.id
+        )
+        self._session.commit()
+
         # Return the modified data
         return application_entity.to_model()
 
@@ -32,6 +32,7 @@ from ..models.articles import (
 )
 from ..models.coworking import TimeRange
 from ..models.pagination import Paginated, PaginationParams
+from .pagination import paginate
 
 __authors__ = ["Ajay Gandecha"]
 __copyright__ = "Copyright 2024"
@@ -162,18 +163,13 @@ class ArticleService:
         """
         self._permission_svc.enforce(subject, "article.list", "article/")
 
-        statement = select(ArticleEntity).order_by(ArticleEntity.published.desc())
-        length_statement = select(func.count()).select_from(ArticleEntity)
-        offset = pagination_params.page * pagination_params.page_size
-        limit = pagination_params.page_size
-        statement = statement.offset(offset).limit(limit)
-        length = self._session.execute(length_statement).scalar()
-        entities = self._session.execute(statement).scalars()
-
-        return Paginated(
-            items=[entity.to_overview_model() for entity in entities],
-            length=length,
-            params=pagination_params,
+        return paginate(
+            self._session,
+            select(ArticleEntity),
+            pagination_params,
+            [ArticleEntity.published, ArticleEntity.id],
+            lambda entity: entity.to_overview_model(),
+            descending=True,
         )
 
     def create_article(self, subject: User, article: ArticleDraft) -> ArticleOverview:
@@ -0,0 +1,98 @@
+"""Process-wide snapshot of walk-in seat availability in the XL.
+
+Every student's coworking status poll and every signage display asks the same question: which
+seats are open for a walk-in right now? Rather than recomputing seat availability from the database
+on every request, the answer is computed once and shared until it either expires or a reservation
+changes. The time-to-live is configured with the `COWORKING_AVAILABILITY_TTL_SECONDS` environment
+variable.
+
+The snapshot is held in memory, so each worker process keeps its own. Reservation changes made in
+one process invalidate that process's snapshot right away; other processes catch up within the TTL.
+"""
+
+from datetime import datetime, timedelta
+from threading import Lock
+from typing import Callable, Sequence
+
+from ...env import getenv
+from ...models.coworking import SeatAvailability
+
+__authors__ = ["Kris Jordan"]
+__copyright__ = "Copyright 2024"
+__license__ = "MIT"
+
+AVAILABILITY_SNAPSHOT_TTL = timedelta(
+    seconds=float(getenv("COWORKING_AVAILABILITY_TTL_SECONDS", default="10"))
+)
+
+
+class AvailabilitySnapshot:
+    """Caches the most recently computed walk-in seat availability for a short time-to-live."""
+
+    def __init__(self, ttl: timedelta = AVAILABILITY_SNAPSHOT_TTL):
+        """Initializes a new, empty AvailabilitySnapshot.
+
+        Args:
+            ttl (timedelta): How long a computed snapshot may be served before it is recomputed.
+        """
+        self._ttl = ttl
+        self._lock = Lock()
+        self._generation = 0
+        self._seat_availability: Sequence[SeatAvailability] | None = None
+        self._expires_at = datetime.min
+        self._listeners: list[Callable[[], None]] = []
+
+    def get(
+        self, compute: Callable[[], Sequence[SeatAvailability]]
+    ) -> Sequence[SeatAvailability]:
+        """Returns the current snapshot, computing and storing a new one if it is missing or expired.
+
+        A snapshot computed while an invalidation happens is returned to its caller but not stored,
+        so availability computed from data that has since changed is never shared.
+
+        Args:
+            compute (Callable[[], Sequence[SeatAvailability]]): Computes seat availability from scratch.
+
+        Returns:
+            Sequence[SeatAvailability]: Walk-in seat availability.
+        """
+        now = datetime.now()
+        with self._lock:
+            if self._seat_availability is not None and now < self._expires_at:
+                return list(self._seat_availability)
+            generation = self._generation
+
+        seat_availability = compute()
+
+        with self._lock:
+            if generation == self._generation:
+                self._seat_availability = list(seat_availability)
+                self._expires_at = now + self._ttl
+        return seat_availability
+
+    def invalidate(self) -> None:
+        """Discards the current snapshot so the next read recomputes it, then notifies listeners."""
+        with self._lock:
+            self._generation += 1
+            self._seat_availability = None
+            listeners = list(self._listeners)
+        for listener in listeners:
+            listener()
+
+    def add_listener(self, listener: Callable[[], None]) -> None:
+        """Registers a callback run after every invalidation, on the invalidating thread.
+
+        Args:
+            listener (Callable[[], None]): Called with no arguments; it must not block.
+        """
+        with self._lock:
+            self._listeners.append(listener)
+
+
+availability_snapshot = AvailabilitySnapshot()
+"""Process-wide AvailabilitySnapshot shared by every request."""
+
+
+def get_availability_snapshot() -> AvailabilitySnapshot:
+    """Dependency injection of the process-wide AvailabilitySnapshot."""
+    return availability_snapshot
@@ -0,0 +1,73 @@
+"""Rebuilds of the monthly check-in leaderboard from the full reservation history.
+
+The leaderboard in `coworking__checkin_leaderboard` is kept current by database triggers as
+reservations are checked out. Rebuilding recomputes a month from scratch: after restoring data,
+after correcting reservations with triggers disabled, or for months that ended before the
+leaderboard existed.
+
+Usage: see `backend/script/rebuild_checkin_leaderboard.py`.
+"""
+
+from datetime import date, datetime
+from sqlalchemy import Date, delete, func, insert, literal, select, text
+from sqlalchemy.orm import Session
+
+from ...entities.coworking import CheckinLeaderboardEntity
+from ...models.coworking import ReservationState
+from .reservation_history import reservation_user_history
+
+__authors__ = ["Kris Jordan"]
+__copyright__ = "Copyright 2024"
+__license__ = "MIT"
+
+
+def month_of(moment: datetime | date) -> date:
+    """The first day of the month containing `moment`, which keys the leaderboard."""
+    return date(moment.year, moment.month, 1)
+
+
+def rebuild_checkin_leaderboard(session: Session, month: date) -> int:
+    """Recomputes one month of the check-in leaderboard and commits it.
+
+    Args:
+        session (Session): The database session to use.
+        month (date): Any day of the month to rebuild.
+
+    Returns:
+        int: The number of users ranked in the month.
+    """
+    month = month_of(month)
+    start = datetime(month.year, month.month, 1)
+    end = datetime(month.year + month.month // 12, month.month % 12 + 1, 1)
+
+    # Checkouts committing while the month is recounted wait on this lock, and are then counted
+    # on top of the rebuilt rows rather than lost or counted twice.
+    session.execute(text("LOCK TABLE coworking__checkin_leaderboard IN EXCLUSIVE MODE"))
+    session.execute(
+        delete(CheckinLeaderboardEntity).where(CheckinLeaderboardEntity.month == month)
+    )
+
+    # The archive is always included, in case the archive horizon has changed since archiving.
+    history = reservation_user_history(since=start, archive=True)
+    checkouts = (
+        select(
+            literal(month, Date),
+            history.c.user_id,
+            func.count(history.c.id),
+        )
+        .where(history.c.end < end)
+        .where(history.c.state == ReservationState.CHECKED_OUT)
+        .group_by(history.c.user_id)
+    )
+    result = session.execute(
+        insert(CheckinLeaderboardEntity).from_select(
+            [
+                CheckinLeaderboardEntity.month,
+                CheckinLeaderboardEntity.user_id,
+                CheckinLeaderboardEntity.checkouts,
+            ],
+            checkouts,
+        )
+    )
+    session.commit()
+    return result.rowcount
@@ -18,6 +18,12 @@ FRIDAY = 4
 SATURDAY = 5
 SUNDAY = 6
 
+WALKIN_WINDOW = timedelta(minutes=10)
+"""How far into the future walk-ins can be reserved, for every subject."""
+
+WALKIN_INITIAL_DURATION = timedelta(hours=2)
+"""How long a walk-in is initially reserved for, for every subject."""
+
 OH_HOURS = {
     MONDAY: {
         "SN135": [],
@@ -83,11 +89,21 @@ class PolicyService:
 
     def walkin_window(self, _subject: User) -> timedelta:
         """How far into the future can walkins be reserved?"""
-        return timedelta(minutes=10)
+        return WALKIN_WINDOW
 
     def walkin_initial_duration(self, _subject: User) -> timedelta:
         """When making a walkin, this sets how long the initial reservation is for."""
-        return timedelta(hours=2)
+        return WALKIN_INITIAL_DURATION
+
+    def walkin_availability_window(self) -> timedelta:
+        """How far into the future walk-in seat availability is computed.
+
+        We triple walkin duration for end bounds to find seats not pre-reserved later. If XL stays
+        relatively open, the walkin could then more likely be extended while it is not busy.
+        This also prioritizes _not_ placing walkins in reservable seats. The availability is shared
+        by every subject, so it is computed from the walkin policy that applies to all of them.
+        """
+        return WALKIN_WINDOW + 3 * WALKIN_INITIAL_DURATION
 
     def reservation_window(self, _subject: User) -> timedelta:
         """Returns the number of days in advance the user can make reservations."""
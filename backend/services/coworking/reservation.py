@@ -4,8 +4,9 @@ from fastapi import Depends
 from datetime import datetime, timedelta
 from random import random
 from typing import Sequence
-from sqlalchemy import or_, and_
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy import ColumnElement, or_, and_, not_, update, insert, delete, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session, joinedload, selectinload
 from backend.entities.room_entity import RoomEntity
 
 from backend.models.room_details import RoomDetails
@@ -26,10 +27,24 @@ from ...models.coworking import (
     OperatingHours,
 )
 from ...entities import UserEntity
-from ...entities.coworking import ReservationEntity, SeatEntity
+from ...entities.coworking import (
+    ReservationEntity,
+    ReservationArchiveEntity,
+    SeatEntity,
+    reservation_archive_user_table,
+    reservation_archive_seat_table,
+)
+from ...entities.coworking.reservation_user_table import reservation_user_table
+from ...entities.coworking.reservation_seat_table import (
+    SEAT_CLAIM_OVERLAP_CONSTRAINT,
+    reservation_seat_table,
+)
 from .seat import SeatService
 from .policy import PolicyService
 from .operating_hours import OperatingHoursService
+from .room_slot_map import RoomSlotMap
+from .availability_snapshot import AvailabilitySnapshot, get_availability_snapshot
+from .reservation_history import RESERVATION_ARCHIVE_HORIZON
 from ..permission import PermissionService
 
 __authors__ = ["Kris Jordan", "Matt Vu", "Yuvraj Jain"]
@@ -52,17 +67,22 @@ class ReservationService:
         policy_svc: PolicyService = Depends(),
         operating_hours_svc: OperatingHoursService = Depends(),
         seats_svc: SeatService = Depends(),
+        availability_snapshot: AvailabilitySnapshot = Depends(
+            get_availability_snapshot
+        ),
     ):
         """Initializes a new ReservationService.
 
         Args:
             session (Session): The database session to use, typically injected by FastAPI.
+            availability_snapshot (AvailabilitySnapshot): The process-wide walk-in seat availability snapshot.
         """
         self._session = session
         self._permission_svc = permission_svc
         self._policy_svc = policy_svc
         self._operating_hours_svc = operating_hours_svc
         self._seat_svc = seats_svc
+        self._availability_snapshot = availability_snapshot
 
     def get_reservation(self, subject: User, id: int) -> Reservation:
         """Lookup a reservation by ID.
@@ -78,7 +98,10 @@ class ReservationService:
             UserPermissionException
             ResourceNotFoundException
         """
-        reservation: ReservationEntity | None = self._session.get(ReservationEntity, id)
+        reservation: ReservationEntity | ReservationArchiveEntity | None = (
+            self._session.get(ReservationEntity, id)
+            or self._session.get(ReservationArchiveEntity, id)
+        )
         if reservation == None:
             raise ResourceNotFoundException(f"No reservation with an ID of {id} found.")
 
@@ -147,6 +170,7 @@ class ReservationService:
                     [ReservationState.CANCELLED, ReservationState.CHECKED_OUT]
                 ),
                 UserEntity.id == focus.id,
+                not_(self._expired_by_time(datetime.now())),
             )
             .options(
                 joinedload(ReservationEntity.users), joinedload(ReservationEntity.seats)
@@ -155,10 +179,6 @@ class ReservationService:
             .all()
         )
 
-        reservations = self._state_transition_reservation_entities_by_time(
-            datetime.now(), reservations
-        )
-
         return [reservation.to_model() for reservation in reservations]
 
     def _get_active_reservations_for_user_by_state(
@@ -175,6 +195,7 @@ class ReservationService:
                 ReservationEntity.end > time_range.start,
                 ReservationEntity.state == state,
                 UserEntity.id == focus.id,
+                not_(self._expired_by_time(datetime.now())),
             )
             .options(
                 joinedload(ReservationEntity.users), joinedload(ReservationEntity.seats)
@@ -183,10 +204,6 @@ class ReservationService:
             .all()
         )
 
-        reservations = self._state_transition_reservation_entities_by_time(
-            datetime.now(), reservations
-        )
-
         return [reservation.to_model() for reservation in reservations]
 
     def _check_user_reservation_duration(
@@ -323,46 +340,19 @@ class ReservationService:
 
         # Need current time to gray out slots in the past on that day.
         current_time = datetime.now()
-        current_time_idx = self._idx_calculation(current_time, operating_hours_start)
 
+        # Load every room's reservations for the date in a single round-trip.
+        reservations_by_room = self._query_confirmed_reservations_by_date(
+            date, subject, [room.id for room in rooms if room.id != "SN156"]
+        )
+
+        slot_map = RoomSlotMap(
+            [room.id for room in rooms], operating_hours_start, operating_hours_duration
+        )
         for room in rooms:
-            time_slots_for_room = [0] * operating_hours_duration
-
-            # # Making slots up till current time gray
-            # This code no longer required, but may be required in the future.
-            # Please keep this here for now.
-            # if date.date() == current_time.date():
-            #     for i in range(0, current_time_idx):
-            #         time_slots_for_room[i] = RoomState.UNAVAILABLE.value
-
-            if room.id == "SN156":
-                reservations = self._query_xl_reservations_by_date_for_user(
-                    date, subject
-                )
-            else:
-                reservations = self._query_confirmed_reservations_by_date_and_room(
-                    date, room.id
-                )
-            for reservation in reservations:
-                start_idx = self._idx_calculation(
-                    reservation.start, operating_hours_start
-                )
-                end_idx = self._idx_calculation(reservation.end, operating_hours_start)
-
-                if date.date() == current_time.date():
-                    if end_idx < current_time_idx:
-                        continue
-                    start_idx = max(current_time_idx, start_idx)
-
-                for idx in range(start_idx, end_idx):
-                    # Currently only assuming single user.
-                    # TODO: If making group reservations, need to change this.
-                    if reservation.users[0].id == subject.id:
-                        time_slots_for_room[idx] = RoomState.SUBJECT_RESERVED.value
-                    else:
-                        if time_slots_for_room[idx] != RoomState.SUBJECT_RESERVED.value:
-                            time_slots_for_room[idx] = RoomState.RESERVED.value
-            reserved_date_map[room.id] = time_slots_for_room
+            slot_map.paint_reservations(
+                room.id, reservations_by_room.get(room.id, []), subject
+            )
             capacity_map[room.id] = room.capacity
             room_type_map[room.id] = (
                 "Pairing Room"
@@ -370,12 +360,17 @@ class ReservationService:
                 else "Small Group" if room.capacity < 6 else "Large Group"
             )
 
-        self._transform_date_map_for_unavailable(reserved_date_map)
-        if "SN156" in reserved_date_map:
-            del reserved_date_map["SN156"]
-        self._transform_date_map_for_officehours(
-            date, reserved_date_map, operating_hours_start, operating_hours_duration
-        )
+        # Reservations are only shown from the current time onward on today's map.
+        # Making slots up till current time gray is no longer required, but may be
+        # required in the future. Please keep this here for now:
+        #     slot_map.paint(room_id, operating_hours_start, current_time, RoomState.UNAVAILABLE)
+        if date.date() == current_time.date():
+            slot_map.clear_before(current_time)
+
+        slot_map.mark_unavailable_alongside_subject_reservations()
+        slot_map.remove("SN156")
+        slot_map.paint_office_hours(date, self._policy_svc.office_hours(date=date))
+        reserved_date_map.update(slot_map.to_date_map())
 
         return ReservationMapDetails(
             reserved_date_map=reserved_date_map,
@@ -420,77 +415,6 @@ class ReservationService:
 
         return rounded_dt
 
-    def _idx_calculation(self, time: datetime, operating_hours_start: datetime) -> int:
-        """
-        Calculates the index of a time slot based on a given time.
-
-        This function converts a datetime object into an index representing a specific
-        time slot in the reservation system. Each hour is divided into two slots.
-
-        Args:
-            time (datetime): The time to convert into an index.
-            operating_hours_start (int): The hour when the XL opens as an int.
-
-        Returns:
-            int: The index of the time slot corresponding to the given time.
-        """
-        return int(2 * (time.hour - operating_hours_start.hour)) + (
-            (time.minute - operating_hours_start.minute) // 30
-        )
-
-    def _transform_date_map_for_unavailable(
-        self, reserved_date_map: dict[str, list[int]]
-    ) -> None:
-        """
-        Modifies the reserved date map to mark certain slots as unavailable.
-
-        This function updates the reserved date map so that if a slot is reserved by the subject
-        (indicated by a 4), then any available slots (indicated by 0) in the same column across
-        all rooms are marked as unavailable (changed to 3).
-
-        Args:
-            reserved_date_map (dict[str, list[int]]): The map of room reservations to be transformed.
-
-        Returns:
-            None: This function modifies the reserved_date_map in place.
-        """
-        # Identify the columns where 4 appears
-        columns_with_4 = set()
-        for key, values in reserved_date_map.items():
-            for i, value in enumerate(values):
-                if value == RoomState.SUBJECT_RESERVED.value:
-                    columns_with_4.add(i)
-
-        # Transform the dictionary as per the rules
-        for key, values in reserved_date_map.items():
-            for i in columns_with_4:
-                if values[i] == RoomState.AVAILABLE.value:
-                    values[i] = RoomState.UNAVAILABLE.value
-
-    def _transform_date_map_for_officehours(
-        self,
-        date: datetime,
-        reserved_date_map: dict[str, list[int]],
-        operating_hours_start: datetime,
-        operating_hours_duration: int,
-    ) -> None:
-        """
-        Transforms date map in place.
-        """
-        office_hours = self._policy_svc.office_hours(date=date)
-        for room_id, hours in office_hours.items():
-            if room_id not in reserved_date_map:
-                continue
-            for start, end in hours:
-                start_idx = max(self._idx_calculation(start, operating_hours_start), 0)
-                end_idx = min(
-                    self._idx_calculation(end, operating_hours_start),
-                    operating_hours_duration,
-                )
-                if start_idx < end_idx:
-                    for idx in range(start_idx, end_idx):
-                        reserved_date_map[room_id][idx] = RoomState.UNAVAILABLE.value
-
     def _query_confirmed_reservations_by_date_and_room(
         self, date: datetime, room_id: str
     ) -> Sequence[Reservation]:
@@ -529,6 +453,57 @@ class ReservationService:
 
         return [reservation.to_model() for reservation in reservations]
 
+    def _query_confirmed_reservations_by_date(
+        self, date: datetime, subject: User, room_ids: Sequence[str]
+    ) -> dict[str, list[Reservation]]:
+        """
+        Queries confirmed and checked-in reservations for a given date across many rooms at once.
+
+        This is the batched counterpart of `_query_confirmed_reservations_by_date_and_room` and
+        `_query_xl_reservations_by_date_for_user`. A single query loads the reservations of every
+        room in `room_ids` along with the subject's own XL reservations for the date, which are then
+        grouped in memory by room ID. XL reservations are grouped under the key "SN156".
+
+        Args:
+            date (datetime): The date for which to query confirmed reservations.
+            subject (User): The user whose XL reservations should be included.
+            room_ids (Sequence[str]): The IDs of the rooms whose reservations should be included.
+
+        Returns:
+            dict[str, list[Reservation]]: Reservations keyed by room ID, ordered by start time.
+        """
+        start = date.replace(hour=0, minute=0, second=0, microsecond=0)
+        reservations = (
+            self._session.query(ReservationEntity)
+            .filter(
+                ReservationEntity.start < start + timedelta(hours=24),
+                ReservationEntity.end > start,
+                ReservationEntity.state.not_in(
+                    [ReservationState.CANCELLED, ReservationState.CHECKED_OUT]
+                ),
+                or_(
+                    ReservationEntity.room_id.in_(room_ids),
+                    and_(
+                        ReservationEntity.room_id == None,
+                        ReservationEntity.users.any(UserEntity.id == subject.id),
+                    ),
+                ),
+            )
+            .options(
+                joinedload(ReservationEntity.room),
+                selectinload(ReservationEntity.users),
+                selectinload(ReservationEntity.seats),
+            )
+            .order_by(ReservationEntity.start)
+            .all()
+        )
+
+        reservations_by_room: dict[str, list[Reservation]] = {}
+        for reservation in reservations:
+            room_id = reservation.room_id if reservation.room_id else "SN156"
+            reservations_by_room.setdefault(room_id, []).append(reservation.to_model())
+        return reservations_by_room
+
     def _query_xl_reservations_by_date_for_user(
         self, date: datetime, subject: User
     ) -> Sequence[Reservation]:
@@ -566,6 +541,7 @@ class ReservationService:
         rooms = (
             self._session.query(RoomEntity)
             .where(or_(RoomEntity.reservable == True, RoomEntity.id == "SN156"))
+            .options(selectinload(RoomEntity.seats))
             .order_by(RoomEntity.id)
             .all()
         )
@@ -594,6 +570,7 @@ class ReservationService:
                     [ReservationState.CANCELLED, ReservationState.CHECKED_OUT]
                 ),
                 SeatEntity.id.in_([seat.id for seat in seats]),
+                not_(self._expired_by_time(datetime.now())),
             )
             .options(
                 joinedload(ReservationEntity.seats), joinedload(ReservationEntity.users)
@@ -601,17 +578,11 @@ class ReservationService:
             .all()
         )
 
-        reservations = self._state_transition_reservation_entities_by_time(
-            datetime.now(), reservations
-        )
-
         return [reservation.to_model() for reservation in reservations]
 
-    def _state_transition_reservation_entities_by_time(
-        self, cutoff: datetime, reservations: Sequence[ReservationEntity]
-    ) -> Sequence[ReservationEntity]:
-        """Private, internal helper method for transitioning reservation entities
-        based on time. Three transitions are time-based:
+    def _expired_by_time(self, cutoff: datetime) -> ColumnElement[bool]:
+        """Private, internal helper method producing a SQL condition for reservations whose
+        state is due for a time-based transition. Three transitions are time-based:
 
         1. Draft -> Cancelled following PolicyService#reservation_draft_timeout() after
            the reservation's created at.
@@ -619,45 +590,150 @@ class ReservationService:
             the reservation's start.
         3. Checked In -> Checked Out following the reservation's end.
 
+        Read paths exclude these reservations without writing. Their states are updated in the
+        database by `sweep_reservation_states`.
+
         Args:
-            moment (datetime): The time in which checks of expiration are made against. In
+            cutoff (datetime): The time in which checks of expiration are made against. In
                 production, this is the current time.
-            reservations (Sequence[ReservationEntity]): The list of entities to state transition.
 
         Returns:
-            Sequence[ReservationEntity] - All ReservationEntities that were not state transitioned.
+            ColumnElement[bool] - Condition that is true for reservations due for a transition.
         """
-        valid: list[ReservationEntity] = []
-        dirty = False
-        for reservation in reservations:
-            if (
-                reservation.state == ReservationState.DRAFT
-                and reservation.created_at
-                + self._policy_svc.reservation_draft_timeout()
-                < cutoff
-            ):
-                reservation.state = ReservationState.CANCELLED
-                dirty = True
-            elif (
-                reservation.state == ReservationState.CONFIRMED
-                and reservation.start + self._policy_svc.reservation_checkin_timeout()
-                < cutoff
-            ):
-                reservation.state = ReservationState.CANCELLED
-                dirty = True
-            elif (
-                reservation.state == ReservationState.CHECKED_IN
-                and reservation.end <= cutoff
-            ):
-                reservation.state = ReservationState.CHECKED_OUT
-                dirty = True
-            else:
-                valid.append(reservation)
+        return or_(
+            *(
+                and_(ReservationEntity.state == from_state, expired)
+                for from_state, _, expired in self._time_based_transitions(cutoff)
+            )
+        )
+
+    def _time_based_transitions(
+        self, cutoff: datetime
+    ) -> list[tuple[ReservationState, ReservationState, ColumnElement[bool]]]:
+        """The (from state, to state, expiration condition) of each time-based transition."""
+        return [
+            (
+                ReservationState.DRAFT,
+                ReservationState.CANCELLED,
+                ReservationEntity.created_at
+                < cutoff - self._policy_svc.reservation_draft_timeout(),
+            ),
+            (
+                ReservationState.CONFIRMED,
+                ReservationState.CANCELLED,
+                ReservationEntity.start
+                < cutoff - self._policy_svc.reservation_checkin_timeout(),
+            ),
+            (
+                ReservationState.CHECKED_IN,
+                ReservationState.CHECKED_OUT,
+                ReservationEntity.end <= cutoff,
+            ),
+        ]
+
+    def sweep_reservation_states(self, cutoff: datetime | None = None) -> int:
+        """Applies time-based state transitions to all reservations that are due for one.
+
+        Each transition is applied with a single set-based UPDATE. This is run on a fixed cadence
+        by the reservation state sweeper rather than by read paths.
+
+        Args:
+            cutoff (datetime | None): The time in which checks of expiration are made against.
+                Defaults to the current time.
+
+        Returns:
+            int - The number of reservations transitioned.
+        """
+        if cutoff is None:
+            cutoff = datetime.now()
+
+        swept = 0
+        for from_state, to_state, expired in self._time_based_transitions(cutoff):
+            result = self._session.execute(
+                update(ReservationEntity)
+                .where(ReservationEntity.state == from_state, expired)
+                .values(state=to_state)
+            )
+            swept += result.rowcount
+        self._session.commit()
+
+        if swept > 0:
+            self._availability_snapshot.invalidate()
+        return swept
+
+    def archive_reservations(
+        self, cutoff: datetime | None = None, batch_size: int = 1000
+    ) -> int:
+        """Moves finished reservations that ended before a cutoff into the reservation archive.
 
-        if dirty:
+        Checked out and cancelled reservations are copied into the archive tables along with their
+        users and seats, then deleted from the hot tables, in batches of `batch_size` with each
+        batch committed on its own. Each batch locks its reservations and skips those locked by a
+        concurrent sweep, so sweeps never archive the same reservation twice. Archived reservations
+        keep their IDs, so `get_reservation` and the reporting queries in `reservation_history`
+        still find them.
+
+        Args:
+            cutoff (datetime | None): Reservations ending before this time are archived. Defaults
+                to the current time less the archive horizon.
+            batch_size (int): The maximum number of reservations moved per transaction.
+
+        Returns:
+            int - The number of reservations archived.
+        """
+        if cutoff is None:
+            cutoff = datetime.now() - RESERVATION_ARCHIVE_HORIZON
+
+        reservation_columns = [column.name for column in ReservationEntity.__table__.c]
+        archived = 0
+        while True:
+            ids = self._session.scalars(
+                select(ReservationEntity.id)
+                .where(
+                    ReservationEntity.state.in_(
+                        (ReservationState.CHECKED_OUT, ReservationState.CANCELLED)
+                    ),
+                    ReservationEntity.end < cutoff,
+                )
+                .order_by(ReservationEntity.id)
+                .limit(batch_size)
+                # Reservations another sweep is archiving are left to it.
+                .with_for_update(skip_locked=True)
+            ).all()
+            if len(ids) == 0:
+                break
+
+            self._session.execute(
+                insert(ReservationArchiveEntity).from_select(
+                    reservation_columns,
+                    select(*ReservationEntity.__table__.c).where(
+                        ReservationEntity.id.in_(ids)
+                    ),
+                )
+            )
+            for hot_table, cold_table in (
+                (reservation_user_table, reservation_archive_user_table),
+                (reservation_seat_table, reservation_archive_seat_table),
+            ):
+                columns = [column.name for column in cold_table.c]
+                self._session.execute(
+                    insert(cold_table).from_select(
+                        columns,
+                        select(*(hot_table.c[column] for column in columns)).where(
+                            hot_table.c.reservation_id.in_(ids)
+                        ),
+                    )
+                )
+                self._session.execute(
+                    delete(hot_table).where(hot_table.c.reservation_id.in_(ids))
+                )
+            self._session.execute(
+                delete(ReservationEntity).where(ReservationEntity.id.in_(ids))
+            )
             self._session.commit()
+            archived += len(ids)
 
-        return valid
+        return archived
 
     def seat_availability(
         self, seats: Sequence[Seat], bounds: TimeRange
@@ -745,6 +821,25 @@ class ReservationService:
 
         return available_seats
 
+    def walkin_seat_availability(self) -> Sequence[SeatAvailability]:
+        """Returns the availability of all seats in the XL for walk-ins starting now.
+
+        Results are read from the process-wide availability snapshot, which is shared by the
+        coworking status and signage endpoints and invalidated whenever a reservation changes.
+
+        Returns:
+            Sequence[SeatAvailability]: All seat availability ordered by nearest and longest available.
+        """
+        return self._availability_snapshot.get(self._compute_walkin_seat_availability)
+
+    def _compute_walkin_seat_availability(self) -> Sequence[SeatAvailability]:
+        now = datetime.now()
+        walkin_window = TimeRange(
+            start=now, end=now + self._policy_svc.walkin_availability_window()
+        )
+        seats = self._seat_svc.list()  # All Seats are fair game for walkin purposes
+        return self.seat_availability(seats, walkin_window)
+
     def draft_reservation(
         self, subject: User, request: ReservationRequest
     ) -> Reservation:
@@ -882,18 +977,38 @@ class ReservationService:
             if len(conflicts) > 0:
                 raise ReservationException("The requested room is no longer available.")
 
-        draft = ReservationEntity(
-            state=ReservationState.DRAFT,
-            start=bounds.start,
-            end=bounds.end,
-            users=user_entities,
-            walkin=is_walkin,
-            room_id=request.room.id if request.room else None,
-            seats=seat_entities,
-        )
+        # Seat conflicts are settled by the database: the exclusion constraint on seat claims
+        # rejects the INSERT if another active reservation overlaps the seat. A claim may still be
+        # held by a reservation that has expired but not yet been swept, so on conflict expired
+        # reservations are swept and the INSERT is retried once.
+        for attempt in range(2):
+            draft = ReservationEntity(
+                state=ReservationState.DRAFT,
+                start=bounds.start,
+                end=bounds.end,
+                users=user_entities,
+                walkin=is_walkin,
+                room_id=request.room.id if request.room else None,
+                seats=seat_entities,
+            )
+            self._session.add(draft)
+            try:
+                self._session.commit()
+                break
+            except IntegrityError as e:
+                self._session.rollback()
+                # Only a seat claim overlapping another reservation's means the seat is taken.
+                constraint = getattr(
+                    getattr(e.orig, "diag", None), "constraint_name", None
+                )
+                if constraint != SEAT_CLAIM_OVERLAP_CONSTRAINT:
+                    raise
+                if attempt > 0 or self.sweep_reservation_states() == 0:
+                    raise ReservationException(
+                        "The requested seat(s) are no longer available."
+                    )
 
-        self._session.add(draft)
-        self._session.commit()
+        self._availability_snapshot.invalidate()
         return draft.to_model()
 
     def change_reservation(
@@ -956,6 +1071,7 @@ class ReservationService:
 
         if dirty:  # and valid():
             self._session.commit()
+            self._availability_snapshot.invalidate()
 
         return entity.to_model()
 
@@ -1106,6 +1222,7 @@ class ReservationService:
         if entity.state == ReservationState.CONFIRMED:
             entity.state = ReservationState.CHECKED_IN
             self._session.commit()
+            self._availability_snapshot.invalidate()
         elif entity.state in (
             ReservationState.CANCELLED,
             ReservationState.CHECKED_OUT,
@@ -1138,7 +1255,9 @@ class ReservationService:
     ) -> dict[int, SeatAvailability]:
         return {
             seat.id: SeatAvailability(
-                availability=availability.model_copy(deep=True).availability,
+                # TimeRanges are never mutated by availability operations, so each seat's
+                # list can share them rather than deep copying.
+                availability=list(availability.availability),
                 **seat.model_dump(),
             )
             for seat in seats
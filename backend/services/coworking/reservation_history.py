@@ -0,0 +1,85 @@
+"""Query layer over the full reservation history, spanning the hot and archived reservation tables.
+
+Reservations that are checked out or cancelled and ended more than the archive horizon ago are moved
+out of `coworking__reservation` into `coworking__reservation_archive`. The horizon is configured with
+the `COWORKING_ARCHIVE_HORIZON_DAYS` environment variable.
+
+Queries about current and upcoming reservations only need the hot table. Reporting queries that
+reach back before the horizon use the selectables here, which only union in the archive when the
+period queried could include archived reservations.
+"""
+
+from datetime import datetime, timedelta
+from sqlalchemy import Subquery, select, union_all
+
+from ...env import getenv
+from ...entities.coworking import ReservationEntity, ReservationArchiveEntity
+from ...entities.coworking.reservation_user_table import reservation_user_table
+from ...entities.coworking.reservation_archive_tables import (
+    reservation_archive_user_table,
+)
+
+__authors__ = ["Kris Jordan"]
+__copyright__ = "Copyright 2024"
+__license__ = "MIT"
+
+RESERVATION_ARCHIVE_HORIZON = timedelta(
+    days=float(getenv("COWORKING_ARCHIVE_HORIZON_DAYS", default="90"))
+)
+
+
+def includes_archive(since: datetime, now: datetime | None = None) -> bool:
+    """Whether reservations ending at or after `since` may have been archived."""
+    if now is None:
+        now = datetime.now()
+    return since < now - RESERVATION_ARCHIVE_HORIZON
+
+
+def reservation_user_history(since: datetime, archive: bool | None = None) -> Subquery:
+    """Each (reservation, user) pair of reservations ending at or after `since`.
+
+    Args:
+        since (datetime): The earliest reservation end to include.
+        archive (bool | None): Whether to include the archive, by default only if `since` is
+            before the archive horizon.
+
+    Returns:
+        Subquery: Selectable with `id`, `start`, `end`, `state`, `room_id`, and `user_id` columns.
+    """
+    hot = (
+        select(
+            ReservationEntity.id,
+            ReservationEntity.start,
+            ReservationEntity.end,
+            ReservationEntity.state,
+            ReservationEntity.room_id,
+            reservation_user_table.c.user_id,
+        )
+        .join(
+            reservation_user_table,
+            reservation_user_table.c.reservation_id == ReservationEntity.id,
+        )
+        .where(ReservationEntity.end >= since)
+    )
+    if archive is None:
+        archive = includes_archive(since)
+    if not archive:
+        return hot.subquery("reservation_user_history")
+
+    cold = (
+        select(
+            ReservationArchiveEntity.id,
+            ReservationArchiveEntity.start,
+            ReservationArchiveEntity.end,
+            ReservationArchiveEntity.state,
+            ReservationArchiveEntity.room_id,
+            reservation_archive_user_table.c.user_id,
+        )
+        .join(
+            reservation_archive_user_table,
+            reservation_archive_user_table.c.reservation_id
+            == ReservationArchiveEntity.id,
+        )
+        .where(ReservationArchiveEntity.end >= since)
+    )
+    return union_all(hot, cold).subquery("reservation_user_history")
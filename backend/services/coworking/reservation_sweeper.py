@@ -0,0 +1,71 @@
+"""Background task that applies time-based reservation state transitions on a fixed cadence.
+
+Drafts that are never confirmed, confirmed reservations that are never checked into, and checked
+in reservations that have ended are transitioned here, in bulk, rather than by whichever request
+happens to read them. Read paths exclude these reservations by time without writing. The cadence is
+configured with the `COWORKING_SWEEP_INTERVAL_SECONDS` environment variable.
+
+Each sweep also moves finished reservations older than the archive horizon out of the hot
+reservation table and into the reservation archive.
+
+Each application worker runs its own sweeper. State transitions are idempotent set-based UPDATEs,
+and archival skips reservations locked by another worker's batch, so concurrent sweeps from
+multiple workers are harmless.
+"""
+
+import asyncio
+import logging
+from sqlalchemy.orm import Session
+
+from ...database import engine
+from ...env import getenv
+from ..permission import PermissionService
+from ..permission_cache import get_permission_cache
+from .availability_snapshot import get_availability_snapshot
+from .operating_hours import OperatingHoursService
+from .policy import PolicyService
+from .reservation import ReservationService
+from .seat import SeatService
+
+__authors__ = ["Kris Jordan"]
+__copyright__ = "Copyright 2024"
+__license__ = "MIT"
+
+SWEEP_INTERVAL_SECONDS = float(getenv("COWORKING_SWEEP_INTERVAL_SECONDS", default="30"))
+
+logger = logging.getLogger(__name__)
+
+
+def sweep_reservation_states() -> int:
+    """Runs a single sweep of reservation state transitions, then archival, in its own session.
+
+    Returns:
+        int - The number of reservations transitioned."""
+    with Session(engine) as session:
+        permission_svc = PermissionService(session, get_permission_cache())
+        reservation_svc = ReservationService(
+            session,
+            permission_svc,
+            PolicyService(),
+            OperatingHoursService(session, permission_svc),
+            SeatService(session),
+            get_availability_snapshot(),
+        )
+        swept = reservation_svc.sweep_reservation_states()
+        reservation_svc.archive_reservations()
+        return swept
+
+
+async def run_reservation_state_sweeper(
+    interval_seconds: float = SWEEP_INTERVAL_SECONDS,
+) -> None:
+    """Sweeps reservation states every `interval_seconds` until cancelled.
+
+    Sweeps run in a worker thread so the blocking database calls do not stall the event loop.
+    """
+    while True:
+        try:
+            await asyncio.to_thread(sweep_reservation_states)
+        except Exception:
+            logger.exception("Reservation state sweep failed")
+        await asyncio.sleep(interval_seconds)
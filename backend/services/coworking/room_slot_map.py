@@ -0,0 +1,156 @@
+"""Fixed-width time slot grid used to build the room reservation map.
+
+Each room's day is stored as a `bytearray` with one `RoomState` value per time slot. Reservations,
+office hours, and past-time masking are painted as slice assignments, and the cross-room
+"subject already has a reservation at this time" rule is applied to every room at once by treating
+each row as a big integer. This keeps the cost of building the map proportional to the number of
+reservations and rooms rather than to rooms times slots times reservations."""
+
+from datetime import datetime, time, timedelta
+from typing import Iterable, Mapping, Sequence
+
+from ...models.coworking import Reservation, RoomState
+from ...models.user import User
+
+__authors__ = ["Kris Jordan", "Yuvraj Jain"]
+__copyright__ = "Copyright 2024"
+__license__ = "MIT"
+
+# Translation tables used to compute per-slot masks with `bytes.translate`.
+_SUBJECT_RESERVED_TO_ONE = bytes(
+    1 if state == RoomState.SUBJECT_RESERVED.value else 0 for state in range(256)
+)
+_AVAILABLE_TO_ONE = bytes(
+    1 if state == RoomState.AVAILABLE.value else 0 for state in range(256)
+)
+
+
+class RoomSlotMap:
+    """Grid of `RoomState` values for a set of rooms over `number_of_slots` consecutive slots.
+
+    The grid begins at `start` and each slot is `slot_duration` long, so the same engine serves
+    half-hour maps, finer-grained 15-minute maps, and windows spanning multiple days."""
+
+    start: datetime
+    number_of_slots: int
+    slot_duration: timedelta
+
+    def __init__(
+        self,
+        room_ids: Iterable[str],
+        start: datetime,
+        number_of_slots: int,
+        slot_duration: timedelta = timedelta(minutes=30),
+    ):
+        self.start = start
+        self.number_of_slots = max(number_of_slots, 0)
+        self.slot_duration = slot_duration
+        self._rows: dict[str, bytearray] = {
+            room_id: bytearray(self.number_of_slots) for room_id in room_ids
+        }
+
+    @classmethod
+    def from_date_map(
+        cls,
+        reserved_date_map: Mapping[str, Sequence[int]],
+        start: datetime,
+        slot_duration: timedelta = timedelta(minutes=30),
+    ) -> "RoomSlotMap":
+        """Builds a slot map from a `reserved_date_map` of equal length rows."""
+        number_of_slots = max(
+            (len(slots) for slots in reserved_date_map.values()), default=0
+        )
+        slot_map = cls(reserved_date_map.keys(), start, number_of_slots, slot_duration)
+        for room_id, slots in reserved_date_map.items():
+            slot_map._rows[room_id][: len(slots)] = bytes(slots)
+        return slot_map
+
+    def index(self, moment: datetime) -> int:
+        """Returns the (unclipped) index of the slot containing `moment`."""
+        return (moment - self.start) // self.slot_duration
+
+    def _bounds(self, start: datetime, end: datetime) -> tuple[int, int]:
+        return max(self.index(start), 0), min(self.index(end), self.number_of_slots)
+
+    def paint(
+        self, room_id: str, start: datetime, end: datetime, state: RoomState
+    ) -> None:
+        """Sets every slot of a room from `start` up to `end` to `state`.
+
+        Ranges are clipped to the grid and rooms not in the grid are ignored."""
+        row = self._rows.get(room_id)
+        if row is None:
+            return
+        lo, hi = self._bounds(start, end)
+        if lo < hi:
+            row[lo:hi] = bytes((state.value,)) * (hi - lo)
+
+    def paint_reservations(
+        self, room_id: str, reservations: Iterable[Reservation], subject: User
+    ) -> None:
+        """Paints a room's reservations, distinguishing those belonging to the subject.
+
+        Other users' reservations are painted first so that the subject's own reservations
+        take precedence where the two overlap."""
+        # Currently only assuming single user.
+        # TODO: If making group reservations, need to change this.
+        for reservation in sorted(
+            reservations, key=lambda reservation: reservation.users[0].id == subject.id
+        ):
+            state = (
+                RoomState.SUBJECT_RESERVED
+                if reservation.users[0].id == subject.id
+                else RoomState.RESERVED
+            )
+            self.paint(room_id, reservation.start, reservation.end, state)
+
+    def paint_office_hours(
+        self, date: datetime, office_hours: Mapping[str, Sequence[tuple[time, time]]]
+    ) -> None:
+        """Marks the office hours blocks held in each room on `date` as unavailable."""
+        for room_id, hours in office_hours.items():
+            for start, end in hours:
+                self.paint(
+                    room_id,
+                    datetime.combine(date.date(), start),
+                    datetime.combine(date.date(), end),
+                    RoomState.UNAVAILABLE,
+                )
+
+    def clear_before(self, moment: datetime) -> None:
+        """Resets every slot that ends before the slot containing `moment` to available."""
+        end = min(self.index(moment), self.number_of_slots)
+        if end > 0:
+            for row in self._rows.values():
+                row[:end] = bytes(end)
+
+    def mark_unavailable_alongside_subject_reservations(self) -> None:
+        """Marks available slots unavailable in every column holding one of the subject's reservations.
+
+        Each row is viewed as a little-endian integer with one byte per slot. The columns holding a
+        `SUBJECT_RESERVED` slot in any row are found by OR-ing per-row masks, and every available
+        slot in those columns is then raised to `UNAVAILABLE` with a single integer addition per row.
+        """
+        columns = 0
+        for row in self._rows.values():
+            columns |= int.from_bytes(row.translate(_SUBJECT_RESERVED_TO_ONE), "little")
+        if columns == 0:
+            return
+
+        for room_id, row in self._rows.items():
+            available = int.from_bytes(row.translate(_AVAILABLE_TO_ONE), "little")
+            raised = (
+                int.from_bytes(row, "little")
+                + (columns & available) * RoomState.UNAVAILABLE.value
+            )
+            self._rows[room_id] = bytearray(
+                raised.to_bytes(self.number_of_slots, "little")
+            )
+
+    def remove(self, room_id: str) -> None:
+        """Drops a room from the grid if it is present."""
+        self._rows.pop(room_id, None)
+
+    def to_date_map(self) -> dict[str, list[int]]:
+        """Returns the grid as a `reserved_date_map` of room IDs to lists of `RoomState` values."""
+        return {room_id: list(row) for room_id, row in self._rows.items()}
@@ -37,21 +37,10 @@ class StatusService:
             subject, subject
         )
 
-        now = datetime.now()
-        walkin_window = TimeRange(
-            start=now,
-            end=now
-            + self._policies_svc.walkin_window(subject)
-            + 3 * self._policies_svc.walkin_initial_duration(subject),
-            # We triple walkin duration for end bounds to find seats not pre-reserved later. If XL stays
-            # relatively open, the walkin could then more likely be extended while it is not busy.
-            # This also prioritizes _not_ placing walkins in reservable seats.
-        )
-        seats = self._seat_svc.list()  # All Seats are fair game for walkin purposes
-        seat_availability = self._reservation_svc.seat_availability(
-            seats, walkin_window
-        )
+        # Walk-in availability is shared across all users via the availability snapshot.
+        seat_availability = self._reservation_svc.walkin_seat_availability()
 
+        now = datetime.now()
         operating_hours = self._operating_hours_svc.schedule(
             TimeRange(
                 start=now, end=now + self._policies_svc.reservation_window(subject)
@@ -12,6 +12,7 @@ from backend.models.event_registration import EventRegistration, NewEventRegistr
 from ..models.public_user import PublicUser
 from backend.models.organization_details import OrganizationDetails
 from backend.models.pagination import Paginated, PaginationParams
+from .pagination import paginate
 from backend.models.registration_type import RegistrationType
 
 from ..models import User, Paginated, EventPaginationParams
@@ -76,7 +77,6 @@ class EventService:
         """
 
         statement = select(EventEntity)
-        length_statement = select(func.count()).select_from(EventEntity)
         if pagination_params.range_start != "":
             range_start = pagination_params.range_start
             range_end = pagination_params.range_end
@@ -85,7 +85,6 @@ class EventService:
                 EventEntity.start <= datetime.fromisoformat(range_end),
             )
             statement = statement.where(criteria)
-            length_statement = length_statement.where(criteria)
 
         if pagination_params.filter != "":
             query = pagination_params.filter
@@ -103,29 +102,18 @@ class EventService:
                 ),
             )
             statement = statement.where(criteria)
-            length_statement = length_statement.where(criteria)
-
-        offset = pagination_params.page * pagination_params.page_size
-        limit = pagination_params.page_size
 
+        sort = [EventEntity.id]
         if pagination_params.order_by != "":
-            statement = (
-                statement.order_by(getattr(EventEntity, pagination_params.order_by))
-                if pagination_params.ascending
-                else statement.order_by(
-                    getattr(EventEntity, pagination_params.order_by).desc()
-                )
-            )
-
-        statement = statement.offset(offset).limit(limit)
-
-        length = self._session.execute(length_statement).scalar()
-        entities = self._session.execute(statement).scalars()
-
-        return Paginated(
-            items=[entity.to_overview_model(subject) for entity in entities],
-            length=length,
-            params=pagination_params,
+            sort.insert(0, getattr(EventEntity, pagination_params.order_by))
+
+        return paginate(
+            self._session,
+            statement,
+            pagination_params,
+            sort,
+            lambda entity: entity.to_overview_model(subject),
+            descending=not pagination_params.ascending,
         )
 
     def create(self, subject: User, event: EventDraft) -> EventOverview:
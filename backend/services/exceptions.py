@@ -39,8 +39,16 @@ class CourseDataScrapingException(Exception):
     def __init__(self, reason: str):
         super().__init__(f"{reason}")
 
+
 class RecurringOfficeHourEventException(Exception):
     """RecurringOfficeHourEventException is raised when an unexpected error occurs when managing recurring offiec hours events."""
 
     def __init__(self, reason: str):
-        super().__init__(f"{reason}")
\ No newline at end of file
+        super().__init__(f"{reason}")
+
+
+class InvalidPaginationCursorException(Exception):
+    """InvalidPaginationCursorException is raised when a pagination cursor was not returned by a page sorted the same way."""
+
+    def __init__(self):
+        super().__init__("Invalid pagination cursor")
@@ -13,7 +13,16 @@ from typing import Annotated
 from fastapi import Depends
 from sqlalchemy import text
 from ..models.openai_test_response import OpenAITestResponse
-from ..database import Session, db_session
+from ..models.pool_status import DatabasePoolStatus, PoolStatus
+from ..database import (
+    Session,
+    db_session,
+    engine,
+    readonly_engine,
+    async_engine,
+    async_readonly_engine,
+    MeteredQueuePool,
+)
 from ..services.openai import OpenAIService
 
 __authors__ = ["Kris Jordan"]
@@ -39,6 +48,32 @@ class HealthService:
         row = result.all()[0]
         return str(f"{row[0]} @ {row[1]}")
 
+    def check_pool(self) -> DatabasePoolStatus:
+        """Reports the usage of this worker process' database connection pools."""
+        replica = None
+        if readonly_engine.pool is not engine.pool:
+            replica = self._pool_status(readonly_engine.pool)
+        async_replica = None
+        if async_readonly_engine.pool is not async_engine.pool:
+            async_replica = self._pool_status(async_readonly_engine.pool)
+        return DatabasePoolStatus(
+            primary=self._pool_status(engine.pool),
+            replica=replica,
+            async_primary=self._pool_status(async_engine.pool),
+            async_replica=async_replica,
+        )
+
+    def _pool_status(self, pool: MeteredQueuePool) -> PoolStatus:
+        return PoolStatus(
+            size=pool.size(),
+            checked_out=pool.checkedout(),
+            # QueuePool counts overflow from -pool_size until the pool has filled.
+            overflow=max(pool.overflow(), 0),
+            checkouts=pool.checkouts,
+            total_wait_ms=pool.total_wait * 1000,
+            max_wait_ms=pool.max_wait * 1000,
+        )
+
     def check_openai(self) -> OpenAITestResponse:
         # Placeholder for OpenAI health check
         system_prompt = "You are a student at UNC-Chapel Hill."
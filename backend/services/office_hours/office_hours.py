@@ -32,6 +32,7 @@ from ...entities.office_hours.user_created_tickets_table import (
 )
 from ...entities.academics.section_member_entity import SectionMemberEntity
 from ..exceptions import CoursePermissionException, ResourceNotFoundException
+from .queue_index import OfficeHoursQueueIndex, get_office_hours_queue_index
 
 __authors__ = ["Ajay Gandecha", "Jade Keegan", "Kris Jordan"]
 __copyright__ = "Copyright 2024"
@@ -45,11 +46,16 @@ class OfficeHoursService:
     Service that performs all actions for office hour events.
     """
 
-    def __init__(self, session: Session = Depends(db_session)):
+    def __init__(
+        self,
+        session: Session = Depends(db_session),
+        queue_index: OfficeHoursQueueIndex = Depends(get_office_hours_queue_index),
+    ):
         """
-        Initializes the database session.
+        Initializes the database session and the index of open tickets in each queue.
         """
         self._session = session
+        self._queue_index = queue_index
 
     def get_office_hour_queue(
         self, user: User, office_hours_id: int
@@ -157,36 +163,14 @@ class OfficeHoursService:
         # Check permissions
         self._check_site_student_permissions(user, queue_entity.course_site_id)
 
-        # Get ticket for user, if any
-        active_tickets_query = (
-            select(OfficeHoursTicketEntity)
-            .join(user_created_tickets_table)
-            .where(OfficeHoursTicketEntity.office_hours_id == office_hours_id)
-            # .where(user_created_tickets_table.member_id == )
-        )
-        active_tickets = [
-            ticket
-            for ticket in queue_entity.tickets
-            if user.id in [creator.user_id for creator in ticket.creators]
-            and ticket.state in [TicketState.QUEUED, TicketState.CALLED]
-        ]
-
-        active_ticket = active_tickets[0] if len(active_tickets) > 0 else None
-
-        # Find queue position
-        queue_tickets: list[OfficeHoursTicketEntity] = sorted(
-            [
-                ticket
-                for ticket in queue_entity.tickets
-                if ticket.state == TicketState.QUEUED
-            ],
-            key=lambda ticket: ticket.created_at,
+        # Get ticket for user, if any, and its queue position from the queue index
+        active_ticket_id, queue_position = self._queue_index.get_help(
+            self._session, office_hours_id, user.id
         )
-
-        queue_position = (
-            queue_tickets.index(active_ticket) + 1
-            if active_ticket and active_ticket.state == TicketState.QUEUED
-            else -1
+        active_ticket = (
+            self._session.get(OfficeHoursTicketEntity, active_ticket_id)
+            if active_ticket_id is not None
+            else None
         )
 
         # Return data
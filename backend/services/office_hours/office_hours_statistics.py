@@ -1,8 +1,8 @@
-from datetime import datetime, timedelta
+from datetime import date, datetime, time, timedelta
 from fastapi import Depends
 from sqlalchemy import select
 from sqlalchemy.orm import Session, aliased, joinedload
-from sqlalchemy import func, select, and_, func, Select
+from sqlalchemy import Float, cast, func, select, and_, func, or_, Select
 
 from backend.entities.academics.section_entity import SectionEntity
 from backend.entities.user_entity import UserEntity
@@ -18,11 +18,15 @@ from ...entities.academics.section_member_entity import SectionMemberEntity
 from ...entities.office_hours import user_created_tickets_table
 from ...entities.office_hours.course_site_entity import CourseSiteEntity
 from ...entities.office_hours.office_hours_entity import OfficeHoursEntity
+from ...entities.office_hours.ticket_statistics_entity import (
+    OfficeHoursTicketStatisticsEntity,
+)
 
 from ...database import db_session
 
 from ...entities.office_hours.ticket_entity import OfficeHoursTicketEntity
 from ...models.pagination import Paginated, TicketPaginationParams
+from ..pagination import paginate
 from ...models.user import User
 from ...models.academics.my_courses import OfficeHourTicketOverview
 from ...services.office_hours.office_hours import OfficeHoursService
@@ -83,13 +87,12 @@ class OfficeHoursStatisticsService:
         )
 
         # Filter by Start/End Range
-        if pagination_params.range_start != "" and pagination_params.range_end != "":
-            range_start = pagination_params.range_start
-            range_end = pagination_params.range_end
+        date_range = self._date_range(pagination_params)
+        if date_range is not None:
+            range_start, range_end = date_range
             criteria = and_(
-                OfficeHoursTicketEntity.created_at
-                >= datetime.fromisoformat(range_start),
-                OfficeHoursTicketEntity.created_at <= datetime.fromisoformat(range_end),
+                OfficeHoursTicketEntity.created_at >= range_start,
+                OfficeHoursTicketEntity.created_at <= range_end,
             )
             statement = statement.where(criteria)
             length_statement = length_statement.where(criteria)
@@ -135,126 +138,184 @@ class OfficeHoursStatisticsService:
         # Check permissions
         self._office_hours_svc._check_site_admin_permissions(user, site_id)
 
-        # Call create_ticket_query to get the statements
-        statement, length_statement = self.create_ticket_query(
-            site_id, pagination_params
+        # Start of the current week, which begins on Sunday
+        today = date.today()
+        start_of_week = today - timedelta(days=(today.weekday() + 1) % 7)
+
+        # Whole days of the range are summed from the daily rollup, and only the tickets of the
+        # partial days at its ends are aggregated from the tickets themselves.
+        date_range = self._date_range(pagination_params)
+        rollup_days = None
+        if date_range is not None:
+            range_start, range_end = date_range
+            first_day = range_start.date()
+            if range_start.time() != time():
+                first_day += timedelta(days=1)
+            rollup_days = (first_day, range_end.date())
+
+        rollup = self._rollup_statistics(
+            site_id, pagination_params, start_of_week, rollup_days
         )
-        # Create a subquery from statement
-        stmt_subquery = statement.subquery()
-
-        # Create an alias to reference the subquery's columns
-        ticket_alias = aliased(OfficeHoursTicketEntity, stmt_subquery)
-
-        # Total tickets
-        result = self._session.execute(length_statement).scalar()
-        total_tickets = float(result) if result is not None else 0
-
-        # Total tickets per week
-        today = datetime.today()
-        start_of_week = (
-            today - timedelta(days=today.weekday() + 1)
-            if today.weekday() != 6
-            else today
+        remainder = self._ticket_statistics(
+            site_id, pagination_params, start_of_week, rollup_days
+        )
+        (
+            total_tickets,
+            week_tickets,
+            total_conceptual_help,
+            total_assignment_help,
+            called_tickets,
+            wait_seconds,
+            closed_tickets,
+            duration_seconds,
+        ) = [(a or 0) + (b or 0) for a, b in zip(rollup, remainder)]
+
+        avg_wait_time_minutes = (
+            float(wait_seconds) / called_tickets / 60 if called_tickets else 0
+        )
+        avg_duration_minutes = (
+            float(duration_seconds) / closed_tickets / 60 if closed_tickets else 0
         )
 
-        week_tickets_statement = (
-            select(func.count())
-            .select_from(stmt_subquery)
-            .where(ticket_alias.created_at >= start_of_week)
+        return OfficeHoursTicketStatistics(
+            total_tickets=total_tickets,
+            total_tickets_weekly=week_tickets,
+            average_wait_time=avg_wait_time_minutes,
+            average_duration=avg_duration_minutes,
+            total_conceptual=total_conceptual_help,
+            total_assignment=total_assignment_help,
         )
-        result = self._session.execute(week_tickets_statement).scalar()
-        week_tickets = float(result) if result is not None else 0
-
-        # Avg wait time
-        avg_wait_time_statement = (
-            select(
-                func.avg(
-                    func.extract(
-                        "epoch",
-                        ticket_alias.called_at - ticket_alias.created_at,
-                    )
-                )
+
+    def _rollup_statistics(
+        self,
+        site_id: int,
+        pagination_params: TicketPaginationParams,
+        start_of_week: date,
+        days: tuple[date, date] | None,
+    ) -> tuple:
+        """
+        Sum the daily rollup over the filtered days, or every day if `days` is None.
+        `days` holds the first day included and the first day excluded.
+        """
+        rollup = OfficeHoursTicketStatisticsEntity
+        statement = select(
+            func.sum(rollup.tickets),
+            func.sum(rollup.tickets).filter(rollup.day >= start_of_week),
+            func.sum(rollup.conceptual_tickets),
+            func.sum(rollup.assignment_tickets),
+            func.sum(rollup.called_tickets),
+            func.sum(rollup.wait_seconds),
+            func.sum(rollup.closed_tickets),
+            func.sum(rollup.duration_seconds),
+        ).where(rollup.course_site_id == site_id)
+
+        if days is not None:
+            statement = statement.where(rollup.day >= days[0], rollup.day < days[1])
+
+        # Rows per creator count a ticket once for each of the selected students who created it,
+        # and the row without a creator counts each ticket once.
+        if len(pagination_params.student_ids) != 0:
+            statement = statement.where(
+                rollup.creator_user_id.in_(pagination_params.student_ids)
             )
-            .select_from(stmt_subquery)
-            .where(ticket_alias.called_at.isnot(None))
-        )
+        else:
+            statement = statement.where(rollup.creator_user_id.is_(None))
 
-        result = self._session.execute(avg_wait_time_statement).scalar()
-        avg_wait_time = float(result) if result is not None else 0
+        if len(pagination_params.staff_ids) != 0:
+            statement = statement.where(
+                rollup.caller_user_id.in_(pagination_params.staff_ids)
+            )
 
-        avg_wait_time_minutes = avg_wait_time / 60 if avg_wait_time else 0
+        return tuple(self._session.execute(statement).one())
 
-        # Avg duration
-        avg_duration_statement = (
-            select(
-                func.avg(
-                    func.extract(
-                        "epoch",
-                        ticket_alias.closed_at - ticket_alias.called_at,
-                    )
-                )
+    def _ticket_statistics(
+        self,
+        site_id: int,
+        pagination_params: TicketPaginationParams,
+        start_of_week: date,
+        rollup_days: tuple[date, date] | None,
+    ) -> tuple:
+        """
+        Aggregate the filtered tickets that were not summed from the rollup's `rollup_days`,
+        in the same order as `_rollup_statistics`.
+        """
+        if rollup_days is None:
+            return (0,) * 8
+
+        # Call create_ticket_query to get the statement selecting the filtered tickets
+        statement, _ = self.create_ticket_query(site_id, pagination_params)
+        statement = statement.where(
+            or_(
+                OfficeHoursTicketEntity.created_at
+                < datetime.combine(rollup_days[0], time()),
+                OfficeHoursTicketEntity.created_at
+                >= datetime.combine(rollup_days[1], time()),
             )
-            .select_from(stmt_subquery)
-            .where(ticket_alias.closed_at.isnot(None))
         )
-        result = self._session.execute(avg_duration_statement).scalar()
-        avg_duration = float(result) if result is not None else 0
 
-        avg_duration_minutes = avg_duration / 60 if avg_duration else 0
+        # Create a subquery from statement. Its ordering only matters to pages of tickets.
+        stmt_subquery = statement.order_by(None).subquery()
 
-        # Total conceptual
-        conceptual_help_statement = (
-            select(func.count())
-            .select_from(stmt_subquery)
-            .where(ticket_alias.type == TicketType.CONCEPTUAL_HELP)
-        )
-        result = self._session.execute(conceptual_help_statement).scalar()
-        total_conceptual_help = float(result) if result is not None else 0
+        # Create an alias to reference the subquery's columns
+        ticket_alias = aliased(OfficeHoursTicketEntity, stmt_subquery)
 
-        # Total assignment
-        assignment_help_statement = (
-            select(func.count())
-            .select_from(stmt_subquery)
-            .where(ticket_alias.type == TicketType.ASSIGNMENT_HELP)
+        wait_seconds = func.extract(
+            "epoch", ticket_alias.called_at - ticket_alias.created_at
         )
-        result = self._session.execute(assignment_help_statement).scalar()
-        total_assignment_help = float(result) if result is not None else 0
-
-        return OfficeHoursTicketStatistics(
-            total_tickets=total_tickets,
-            total_tickets_weekly=week_tickets,
-            average_wait_time=avg_wait_time_minutes,
-            average_duration=avg_duration_minutes,
-            total_conceptual=total_conceptual_help,
-            total_assignment=total_assignment_help,
+        duration_seconds = func.extract(
+            "epoch", ticket_alias.closed_at - ticket_alias.called_at
         )
 
+        # Compute every statistic in a single pass over the filtered tickets, each
+        # aggregate restricted to its tickets with a FILTER clause.
+        statistics_statement = select(
+            func.count(),
+            func.count().filter(
+                ticket_alias.created_at >= datetime.combine(start_of_week, time())
+            ),
+            func.count().filter(ticket_alias.type == TicketType.CONCEPTUAL_HELP),
+            func.count().filter(ticket_alias.type == TicketType.ASSIGNMENT_HELP),
+            func.count(wait_seconds),
+            cast(func.sum(wait_seconds), Float),
+            func.count(duration_seconds),
+            cast(func.sum(duration_seconds), Float),
+        ).select_from(stmt_subquery)
+        return tuple(self._session.execute(statistics_statement).one())
+
+    @staticmethod
+    def _date_range(
+        pagination_params: TicketPaginationParams,
+    ) -> tuple[datetime, datetime] | None:
+        """
+        Parse the date range filter, if any, into the server's local time, which ticket
+        timestamps are recorded in.
+        """
+        if pagination_params.range_start == "" or pagination_params.range_end == "":
+            return None
+        bounds = []
+        for bound in (pagination_params.range_start, pagination_params.range_end):
+            moment = datetime.fromisoformat(bound)
+            if moment.tzinfo is not None:
+                moment = moment.astimezone().replace(tzinfo=None)
+            bounds.append(moment)
+        return bounds[0], bounds[1]
+
     def get_paginated_tickets(
         self, user: User, site_id: int, pagination_params: TicketPaginationParams
     ) -> Paginated[OfficeHourTicketOverview]:
         # Check permissions
         self._office_hours_svc._check_site_admin_permissions(user, site_id)
 
-        statement, length_statement = self.create_ticket_query(
-            site_id, pagination_params
-        )
-
-        # Calculate where to begin retrieving rows and how many to retrieve
-        offset = pagination_params.page * pagination_params.page_size
-        limit = pagination_params.page_size
-
-        # Retrieve limited items
-        statement = statement.offset(offset).limit(limit)
-
-        # Execute statement and retrieve entities
-        length = self._session.execute(length_statement).scalar()
-        entities = self._session.execute(statement).scalars()
+        statement, _ = self.create_ticket_query(site_id, pagination_params)
 
-        # Convert `UserEntity`s to model and return page
-        return Paginated(
-            items=[entity.to_overview_model() for entity in entities],
-            length=length,
-            params=pagination_params,
+        # Load the page of tickets, newest first
+        return paginate(
+            self._session,
+            statement.order_by(None),
+            pagination_params,
+            [OfficeHoursTicketEntity.created_at, OfficeHoursTicketEntity.id],
+            lambda entity: entity.to_overview_model(),
+            descending=True,
         )
 
     def get_filter_data(self, user: User, site_id: int) -> StatisticsFilterData:
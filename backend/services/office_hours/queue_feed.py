@@ -0,0 +1,291 @@
+"""Feed pushing office hours queue changes to the staff and students watching an event.
+
+Rather than each queue page polling `/api/office-hours/{id}/queue` and each get help page polling
+`/api/office-hours/{id}/get-help`, the pages subscribe to their event's feed and receive a message
+whenever one of its tickets is created, called, canceled, or closed.
+
+`OfficeHourTicketService` announces each change with a Postgres `NOTIFY` sent in the same
+transaction as the change, so it reaches the feed of every worker process once committed. Each
+worker listens on a dedicated connection, applies each change to its `OfficeHoursQueueIndex`, and,
+for events with subscribers, loads the changed ticket and reads queue positions from the index once
+per change, however many pages are watching.
+
+Staff subscribers receive `{"type": "ticket", "data": {...}, "list": ...}` messages carrying the
+changed ticket and the list of the queue page it now belongs in: `"active"`, `"other_called"`,
+`"queue"`, or `null` once it has left the queue. Student subscribers receive
+`{"type": "get_help", "data": {...}}` messages holding the fields of their get help overview that
+changed: `ticket`, when it is their own ticket that changed, and `queue_position`.
+"""
+
+import asyncio
+import json
+import logging
+from datetime import datetime
+from typing import Any, Awaitable, Callable
+
+import asyncpg
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from ...database import _engine_str, async_engine, run_async
+from ...entities.office_hours import OfficeHoursTicketEntity
+from ...models.office_hours.ticket import TicketState
+from .queue_index import OfficeHoursQueueIndex, office_hours_queue_index
+
+__authors__ = ["Kris Jordan"]
+__copyright__ = "Copyright 2025"
+__license__ = "MIT"
+
+OFFICE_HOURS_QUEUE_CHANNEL = "office_hours__queue"
+OFFICE_HOURS_QUEUE_FEED_BACKLOG = 64
+"""Messages a subscriber may fall behind by before it is sent a resync message instead."""
+OFFICE_HOURS_QUEUE_FEED_RECONNECT_SECONDS = 5
+
+logger = logging.getLogger(__name__)
+
+Payload = dict[str, Any]
+
+
+def notify_queue_changed(session: Session, ticket: OfficeHoursTicketEntity) -> None:
+    """Announces a change to a ticket, delivered to every feed once the session commits.
+
+    Args:
+        session (Session): The session whose transaction changed the ticket.
+        ticket (OfficeHoursTicketEntity): The changed ticket.
+    """
+    change = {
+        "office_hours_id": ticket.office_hours_id,
+        "ticket_id": ticket.id,
+        "state": ticket.state.name,
+        "created_at": ticket.created_at.isoformat(),
+        "creator_ids": [creator.user_id for creator in ticket.creators],
+    }
+    session.execute(
+        text("SELECT pg_notify(:channel, :payload)"),
+        {"channel": OFFICE_HOURS_QUEUE_CHANNEL, "payload": json.dumps(change)},
+    )
+
+
+class _Subscriber:
+    """A queue page or get help page watching an office hours event."""
+
+    def __init__(self, user_id: int, staff: bool):
+        self.user_id = user_id
+        self.staff = staff
+        self.queue_position = -1
+        self.messages: asyncio.Queue[Payload] = asyncio.Queue(
+            maxsize=OFFICE_HOURS_QUEUE_FEED_BACKLOG
+        )
+
+    def send(self, message: Payload) -> None:
+        try:
+            self.messages.put_nowait(message)
+        except asyncio.QueueFull:
+            # A page this far behind reloads the event rather than replaying every change.
+            while not self.messages.empty():
+                self.messages.get_nowait()
+            self.messages.put_nowait({"type": "resync"})
+
+
+class OfficeHoursQueueFeed:
+    """Fans changes to office hours tickets out to the subscribers of their event."""
+
+    def __init__(
+        self,
+        load_ticket: Callable[[int], Awaitable[Payload]],
+        load_queue_positions: Callable[[int], Awaitable[dict[int, int]]],
+        queue_index: OfficeHoursQueueIndex,
+        dsn: str | None = None,
+    ):
+        """Initializes an OfficeHoursQueueFeed with no subscribers.
+
+        Args:
+            load_ticket (Callable[[int], Awaitable[Payload]]): Loads a ticket's overview as JSON.
+            load_queue_positions (Callable[[int], Awaitable[dict[int, int]]]): Loads the queue
+                position of each student with a queued ticket in an event, by user ID.
+            queue_index (OfficeHoursQueueIndex): Index to apply the changes of every process to.
+            dsn (str | None): Database to listen for changes on, if `run` is used.
+        """
+        self._load_ticket = load_ticket
+        self._load_queue_positions = load_queue_positions
+        self._queue_index = queue_index
+        self._dsn = dsn
+        self._subscribers: dict[int, set[_Subscriber]] = {}
+        self._pending: asyncio.Queue[tuple[int, int]] = asyncio.Queue()
+
+    def subscribe(
+        self, office_hours_id: int, user_id: int, staff: bool
+    ) -> asyncio.Queue[Payload]:
+        """Subscribes to the changes of an office hours event.
+
+        Args:
+            office_hours_id (int): ID of the office hours event.
+            user_id (int): ID of the subscribing user.
+            staff (bool): Whether the user is on the course staff, and so may see every ticket.
+
+        Returns:
+            asyncio.Queue[Payload]: Messages for the subscriber.
+        """
+        subscriber = _Subscriber(user_id, staff)
+        self._subscribers.setdefault(office_hours_id, set()).add(subscriber)
+        return subscriber.messages
+
+    def unsubscribe(
+        self, office_hours_id: int, messages: asyncio.Queue[Payload]
+    ) -> None:
+        """Removes a subscriber from an office hours event's feed.
+
+        Args:
+            office_hours_id (int): ID of the office hours event.
+            messages (asyncio.Queue[Payload]): The queue returned by `subscribe`."""
+        subscribers = self._subscribers.get(office_hours_id, set())
+        for subscriber in [s for s in subscribers if s.messages is messages]:
+            subscribers.discard(subscriber)
+        if not subscribers:
+            self._subscribers.pop(office_hours_id, None)
+
+    async def changed(self, office_hours_id: int, ticket_id: int) -> None:
+        """Publishes a change to a ticket to the subscribers of its event.
+
+        Args:
+            office_hours_id (int): ID of the ticket's office hours event.
+            ticket_id (int): ID of the changed ticket."""
+        subscribers = self._subscribers.get(office_hours_id)
+        if not subscribers:
+            return
+
+        ticket = await self._load_ticket(ticket_id)
+        creator_ids = {creator["id"] for creator in ticket["creators"]}
+        students = [s for s in subscribers if not s.staff]
+        positions = (
+            await self._load_queue_positions(office_hours_id) if students else {}
+        )
+
+        for subscriber in list(subscribers):
+            if subscriber.staff:
+                subscriber.send(
+                    {
+                        "type": "ticket",
+                        "data": ticket,
+                        "list": self._staff_list(subscriber, ticket),
+                    }
+                )
+                continue
+            delta: Payload = {}
+            if subscriber.user_id in creator_ids:
+                delta["ticket"] = (
+                    ticket
+                    if ticket["state"]
+                    in (TicketState.QUEUED.to_string(), TicketState.CALLED.to_string())
+                    else None
+                )
+            position = positions.get(subscriber.user_id, -1)
+            if "ticket" in delta or position != subscriber.queue_position:
+                delta["queue_position"] = position
+                subscriber.queue_position = position
+            if delta:
+                subscriber.send({"type": "get_help", "data": delta})
+
+    async def run(self) -> None:
+        """Listens for changes to tickets and publishes them until cancelled."""
+        while True:
+            try:
+                connection = await asyncpg.connect(self._dsn)
+            except (OSError, asyncpg.PostgresError):
+                logger.exception("Office hours queue feed could not connect")
+                await asyncio.sleep(OFFICE_HOURS_QUEUE_FEED_RECONNECT_SECONDS)
+                continue
+            try:
+                await connection.add_listener(
+                    OFFICE_HOURS_QUEUE_CHANNEL, self._on_notification
+                )
+                # Changes missed while disconnected are recovered by reloading the queues.
+                self._queue_index.invalidate()
+                self._resync()
+                while not connection.is_closed():
+                    try:
+                        office_hours_id, ticket_id = await asyncio.wait_for(
+                            self._pending.get(),
+                            OFFICE_HOURS_QUEUE_FEED_RECONNECT_SECONDS,
+                        )
+                    except TimeoutError:
+                        continue
+                    try:
+                        await self.changed(office_hours_id, ticket_id)
+                    except Exception:
+                        logger.exception("Office hours queue feed publish failed")
+            finally:
+                await connection.close()
+
+    def _on_notification(
+        self, connection: asyncpg.Connection, pid: int, channel: str, payload: str
+    ) -> None:
+        change = json.loads(payload)
+        self._queue_index.update(
+            change["office_hours_id"],
+            change["ticket_id"],
+            TicketState[change["state"]],
+            datetime.fromisoformat(change["created_at"]),
+            change["creator_ids"],
+        )
+        if change["office_hours_id"] in self._subscribers:
+            # Changes are published in order, one at a time, by `run`.
+            self._pending.put_nowait((change["office_hours_id"], change["ticket_id"]))
+
+    def _resync(self) -> None:
+        for subscribers in self._subscribers.values():
+            for subscriber in subscribers:
+                subscriber.send({"type": "resync"})
+
+    @staticmethod
+    def _staff_list(subscriber: _Subscriber, ticket: Payload) -> str | None:
+        if ticket["state"] == TicketState.QUEUED.to_string():
+            return "queue"
+        if ticket["state"] == TicketState.CALLED.to_string():
+            caller = ticket["caller"]
+            if caller is not None and caller["id"] == subscriber.user_id:
+                return "active"
+            return "other_called"
+        return None
+
+
+def ticket_overview(session: Session, ticket_id: int) -> Payload:
+    """Loads a ticket's overview as JSON.
+
+    Args:
+        session (Session): The session to load the ticket with.
+        ticket_id (int): ID of the ticket.
+
+    Returns:
+        Payload: The ticket's OfficeHourTicketOverview as JSON.
+    """
+    ticket = session.get(OfficeHoursTicketEntity, ticket_id)
+    return ticket.to_overview_model().model_dump(mode="json")
+
+
+async def _load_ticket(ticket_id: int) -> Payload:
+    async with AsyncSession(async_engine) as session:
+        return await run_async(session, lambda s: ticket_overview(s, ticket_id))
+
+
+async def _load_queue_positions(office_hours_id: int) -> dict[int, int]:
+    async with AsyncSession(async_engine) as session:
+        return await run_async(
+            session,
+            lambda s: office_hours_queue_index.queue_positions(s, office_hours_id),
+        )
+
+
+office_hours_queue_feed = OfficeHoursQueueFeed(
+    _load_ticket,
+    _load_queue_positions,
+    office_hours_queue_index,
+    _engine_str(dialect="postgresql"),
+)
+"""Process-wide OfficeHoursQueueFeed shared by every connected queue and get help page."""
+
+
+def get_office_hours_queue_feed() -> OfficeHoursQueueFeed:
+    """Dependency injection of the process-wide OfficeHoursQueueFeed."""
+    return office_hours_queue_feed
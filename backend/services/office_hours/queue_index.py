@@ -0,0 +1,263 @@
+"""Process-wide index of the open tickets in each office hours queue.
+
+Each student on a get help page asks the same questions of their event's queue: which open ticket
+is mine, and how many queued tickets are ahead of it? Rather than loading every ticket of the event
+and its creators for each request, the open tickets of an event are loaded once and kept ordered by
+creation time, with a map from each creator to their tickets. A student's queue position is then a
+binary search of the ordered queue.
+
+The index is held in memory, so each worker process keeps its own. `OfficeHourTicketService`
+updates it as tickets are created, called, canceled, and closed, and the changes other processes
+announce to the `OfficeHoursQueueFeed` are applied as they arrive. As a safety net, an event's
+queue is reloaded from the database once it is older than a time-to-live, configured with the
+`OFFICE_HOURS_QUEUE_INDEX_TTL_SECONDS` environment variable.
+"""
+
+from bisect import bisect_left, insort
+from datetime import datetime, timedelta
+from threading import Lock
+from typing import Callable, Iterable, TypeVar
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from ...entities.academics.section_member_entity import SectionMemberEntity
+from ...entities.office_hours import OfficeHoursTicketEntity, user_created_tickets_table
+from ...env import getenv
+from ...models.office_hours.ticket import TicketState
+
+__authors__ = ["Kris Jordan"]
+__copyright__ = "Copyright 2025"
+__license__ = "MIT"
+
+OFFICE_HOURS_QUEUE_INDEX_TTL = timedelta(
+    seconds=float(getenv("OFFICE_HOURS_QUEUE_INDEX_TTL_SECONDS", default="60"))
+)
+
+T = TypeVar("T")
+
+
+class _EventQueue:
+    """The open tickets of one office hours event."""
+
+    def __init__(self, expires_at: datetime):
+        self.expires_at = expires_at
+        self.queued: list[tuple[datetime, int]] = []
+        """Creation time and ID of each queued ticket, in queue order."""
+        self.tickets: dict[int, tuple[TicketState, datetime, tuple[int, ...]]] = {}
+        """State, creation time, and creator user IDs of each open ticket, by ticket ID."""
+        self.user_tickets: dict[int, set[int]] = {}
+        """IDs of each user's open tickets, by user ID."""
+        self.closed: set[int] = set()
+        """IDs of tickets closed or canceled since the queue was loaded."""
+
+    def update(
+        self,
+        ticket_id: int,
+        state: TicketState,
+        created_at: datetime,
+        creator_ids: Iterable[int],
+    ) -> None:
+        if ticket_id in self.closed:
+            return
+        previous = self.tickets.get(ticket_id)
+        if previous is not None:
+            # Tickets only move forward from queued to called to closed or canceled, so a change
+            # announced after a later one was applied is stale.
+            if state.value <= previous[0].value:
+                return
+            self._remove(ticket_id)
+
+        if state in (TicketState.QUEUED, TicketState.CALLED):
+            creator_ids = tuple(creator_ids)
+            self.tickets[ticket_id] = (state, created_at, creator_ids)
+            for user_id in creator_ids:
+                self.user_tickets.setdefault(user_id, set()).add(ticket_id)
+            if state == TicketState.QUEUED:
+                insort(self.queued, (created_at, ticket_id))
+        else:
+            self.closed.add(ticket_id)
+
+    def get_help(self, user_id: int) -> tuple[int | None, int]:
+        ticket_ids = self.user_tickets.get(user_id)
+        if not ticket_ids:
+            return None, -1
+        ticket_id = min(ticket_ids)
+        state, created_at, _ = self.tickets[ticket_id]
+        if state != TicketState.QUEUED:
+            return ticket_id, -1
+        return ticket_id, bisect_left(self.queued, (created_at, ticket_id)) + 1
+
+    def queue_positions(self) -> dict[int, int]:
+        positions: dict[int, int] = {}
+        for position, (_, ticket_id) in enumerate(self.queued, start=1):
+            for user_id in self.tickets[ticket_id][2]:
+                positions.setdefault(user_id, position)
+        return positions
+
+    def _remove(self, ticket_id: int) -> None:
+        state, created_at, creator_ids = self.tickets.pop(ticket_id)
+        for user_id in creator_ids:
+            user_tickets = self.user_tickets[user_id]
+            user_tickets.discard(ticket_id)
+            if not user_tickets:
+                del self.user_tickets[user_id]
+        if state == TicketState.QUEUED:
+            del self.queued[bisect_left(self.queued, (created_at, ticket_id))]
+
+
+class OfficeHoursQueueIndex:
+    """Indexes the open tickets of office hours events for queue position lookups."""
+
+    def __init__(self, ttl: timedelta = OFFICE_HOURS_QUEUE_INDEX_TTL):
+        """Initializes a new, empty OfficeHoursQueueIndex.
+
+        Args:
+            ttl (timedelta): How long an event's queue may be served before it is reloaded.
+        """
+        self._ttl = ttl
+        self._lock = Lock()
+        self._events: dict[int, _EventQueue] = {}
+        self._changes = 0
+        self._changed_at: dict[int, int] = {}
+
+    def get_help(
+        self, session: Session, office_hours_id: int, user_id: int
+    ) -> tuple[int | None, int]:
+        """Finds a user's open ticket in an event and its position in the queue.
+
+        Args:
+            session (Session): Session to load the event's queue with, if it is not indexed.
+            office_hours_id (int): ID of the office hours event.
+            user_id (int): ID of the user.
+
+        Returns:
+            tuple[int | None, int]: ID of the user's open ticket, or None if they have none, and its
+                1-based queue position, or -1 if it is not queued.
+        """
+        return self._read(
+            session, office_hours_id, lambda queue: queue.get_help(user_id)
+        )
+
+    def queue_positions(self, session: Session, office_hours_id: int) -> dict[int, int]:
+        """Finds the queue position of every student with a queued ticket in an event.
+
+        Args:
+            session (Session): Session to load the event's queue with, if it is not indexed.
+            office_hours_id (int): ID of the office hours event.
+
+        Returns:
+            dict[int, int]: The 1-based queue position of each ticket creator, by user ID.
+        """
+        return self._read(session, office_hours_id, _EventQueue.queue_positions)
+
+    def update(
+        self,
+        office_hours_id: int,
+        ticket_id: int,
+        state: TicketState,
+        created_at: datetime,
+        creator_ids: Iterable[int],
+    ) -> None:
+        """Applies a change to a ticket. Changes older than one already applied are ignored.
+
+        Args:
+            office_hours_id (int): ID of the ticket's office hours event.
+            ticket_id (int): ID of the ticket.
+            state (TicketState): The ticket's new state.
+            created_at (datetime): When the ticket was created.
+            creator_ids (Iterable[int]): User IDs of the ticket's creators.
+        """
+        with self._lock:
+            self._changes += 1
+            self._changed_at[office_hours_id] = self._changes
+            queue = self._events.get(office_hours_id)
+            if queue is not None:
+                queue.update(ticket_id, state, created_at, creator_ids)
+
+    def update_ticket(self, ticket: OfficeHoursTicketEntity) -> None:
+        """Applies the current state of a ticket entity.
+
+        Args:
+            ticket (OfficeHoursTicketEntity): The changed ticket.
+        """
+        self.update(
+            ticket.office_hours_id,
+            ticket.id,
+            ticket.state,
+            ticket.created_at,
+            [creator.user_id for creator in ticket.creators],
+        )
+
+    def invalidate(self) -> None:
+        """Discards every indexed queue so each is reloaded when next read."""
+        with self._lock:
+            self._changes += 1
+            for office_hours_id in self._events:
+                self._changed_at[office_hours_id] = self._changes
+            self._events.clear()
+
+    def _read(
+        self,
+        session: Session,
+        office_hours_id: int,
+        read: Callable[[_EventQueue], T],
+    ) -> T:
+        now = datetime.now()
+        with self._lock:
+            queue = self._events.get(office_hours_id)
+            if queue is not None and now < queue.expires_at:
+                return read(queue)
+            loaded_after = self._changes
+
+        queue = self._load(session, office_hours_id, now + self._ttl)
+
+        with self._lock:
+            # A queue loaded while one of its tickets changed may predate the change, so it is
+            # read once but not kept.
+            if self._changed_at.get(office_hours_id, 0) <= loaded_after:
+                self._events = {
+                    id: event
+                    for id, event in self._events.items()
+                    if now < event.expires_at
+                }
+                self._events[office_hours_id] = queue
+            return read(queue)
+
+    def _load(
+        self, session: Session, office_hours_id: int, expires_at: datetime
+    ) -> _EventQueue:
+        rows = session.execute(
+            select(
+                OfficeHoursTicketEntity.id,
+                OfficeHoursTicketEntity.state,
+                OfficeHoursTicketEntity.created_at,
+                SectionMemberEntity.user_id,
+            )
+            .select_from(OfficeHoursTicketEntity)
+            .join(user_created_tickets_table)
+            .join(SectionMemberEntity)
+            .where(OfficeHoursTicketEntity.office_hours_id == office_hours_id)
+            .where(
+                OfficeHoursTicketEntity.state.in_(
+                    [TicketState.QUEUED, TicketState.CALLED]
+                )
+            )
+        )
+        tickets: dict[int, tuple[TicketState, datetime, list[int]]] = {}
+        for ticket_id, state, created_at, user_id in rows:
+            tickets.setdefault(ticket_id, (state, created_at, []))[2].append(user_id)
+
+        queue = _EventQueue(expires_at)
+        for ticket_id, (state, created_at, creator_ids) in tickets.items():
+            queue.update(ticket_id, state, created_at, creator_ids)
+        return queue
+
+
+office_hours_queue_index = OfficeHoursQueueIndex()
+"""Process-wide OfficeHoursQueueIndex shared by every request."""
+
+
+def get_office_hours_queue_index() -> OfficeHoursQueueIndex:
+    """Dependency injection of the process-wide OfficeHoursQueueIndex."""
+    return office_hours_queue_index
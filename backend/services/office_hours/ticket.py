@@ -28,6 +28,9 @@ from ...entities.office_hours import (
 )
 from ...entities.academics.section_member_entity import SectionMemberEntity
 from ..exceptions import CoursePermissionException, ResourceNotFoundException
+from .queue_feed import notify_queue_changed
+from .queue_index import OfficeHoursQueueIndex, get_office_hours_queue_index
+from .ticket_statistics import record_closed_ticket
 from ...entities.office_hours import user_created_tickets_table
 
 __authors__ = ["Ajay Gandecha"]
@@ -40,11 +43,16 @@ class OfficeHourTicketService:
     Service that performs all of the actions for office hour tickets.
     """
 
-    def __init__(self, session: Session = Depends(db_session)):
+    def __init__(
+        self,
+        session: Session = Depends(db_session),
+        queue_index: OfficeHoursQueueIndex = Depends(get_office_hours_queue_index),
+    ):
         """
-        Initializes the database session.
+        Initializes the database session and the queue index kept in sync with ticket changes.
         """
         self._session = session
+        self._queue_index = queue_index
 
     def call_ticket(self, user: User, ticket_id: int) -> OfficeHourTicketOverview:
         """
@@ -93,8 +101,8 @@ class OfficeHourTicketService:
         ticket_entity.called_at = datetime.now()
         ticket_entity.state = TicketState.CALLED
 
-        # Save changes
-        self._session.commit()
+        # Save changes and announce them to the queue feed and index
+        self._save(ticket_entity)
 
         # Return the changed ticket
         return ticket_entity.to_overview_model()
@@ -138,8 +146,8 @@ class OfficeHourTicketService:
         # Cancel the ticket
         ticket_entity.state = TicketState.CANCELED
 
-        # Save changes
-        self._session.commit()
+        # Save changes and announce them to the queue feed and index
+        self._save(ticket_entity)
 
         # Return the changed ticket
         return ticket_entity.to_overview_model()
@@ -191,8 +199,11 @@ class OfficeHourTicketService:
         ticket_entity.have_concerns = payload.has_concerns
         ticket_entity.caller_notes = payload.caller_notes
 
-        # Save changes
-        self._session.commit()
+        # Add the closed ticket to the daily statistics rollup in the same transaction
+        record_closed_ticket(self._session, ticket_entity)
+
+        # Save changes and announce them to the queue feed and index
+        self._save(ticket_entity)
 
         # Return the changed ticket
         return ticket_entity.to_overview_model()
@@ -346,7 +357,15 @@ class OfficeHourTicketService:
                 )
             )
 
-        self._session.commit()
+        self._save(oh_ticket_entity)
 
         # Return details model
         return oh_ticket_entity.to_overview_model()
+
+    def _save(self, ticket_entity: OfficeHoursTicketEntity) -> None:
+        """
+        Commits a change to a ticket and announces it to the queue feed and index of every process.
+        """
+        notify_queue_changed(self._session, ticket_entity)
+        self._session.commit()
+        self._queue_index.update_ticket(ticket_entity)
@@ -0,0 +1,170 @@
+"""Maintenance of the daily rollup of closed office hours ticket statistics.
+
+Closing a ticket adds it to the rollup in `office_hours__ticket_daily_statistics` within the same
+transaction, and the migration creating the rollup backfilled the tickets closed before it.
+Rebuilding recomputes a range of days from the tickets themselves, after tickets were corrected
+by hand.
+
+Usage: see `backend/script/rebuild_office_hours_ticket_statistics.py`.
+"""
+
+from datetime import date, datetime, time, timedelta
+from sqlalchemy import (
+    ColumnElement,
+    Date,
+    Integer,
+    Select,
+    cast,
+    delete,
+    func,
+    null,
+    select,
+    text,
+    union_all,
+)
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.orm import Session, aliased
+
+from ...entities.academics.section_member_entity import SectionMemberEntity
+from ...entities.office_hours import (
+    OfficeHoursEntity,
+    OfficeHoursTicketEntity,
+    OfficeHoursTicketStatisticsEntity,
+    user_created_tickets_table,
+)
+from ...models.office_hours.ticket_state import TicketState
+from ...models.office_hours.ticket_type import TicketType
+
+__authors__ = ["Kris Jordan"]
+__copyright__ = "Copyright 2025"
+__license__ = "MIT"
+
+_KEY = [
+    OfficeHoursTicketStatisticsEntity.course_site_id,
+    OfficeHoursTicketStatisticsEntity.day,
+    OfficeHoursTicketStatisticsEntity.caller_user_id,
+    OfficeHoursTicketStatisticsEntity.creator_user_id,
+]
+_SUMS = [
+    OfficeHoursTicketStatisticsEntity.tickets,
+    OfficeHoursTicketStatisticsEntity.conceptual_tickets,
+    OfficeHoursTicketStatisticsEntity.assignment_tickets,
+    OfficeHoursTicketStatisticsEntity.called_tickets,
+    OfficeHoursTicketStatisticsEntity.wait_seconds,
+    OfficeHoursTicketStatisticsEntity.closed_tickets,
+    OfficeHoursTicketStatisticsEntity.duration_seconds,
+]
+
+
+def record_closed_ticket(session: Session, ticket: OfficeHoursTicketEntity) -> None:
+    """Adds a ticket that was just closed to the rollup, committed along with the session.
+
+    Args:
+        session (Session): The session whose transaction closed the ticket.
+        ticket (OfficeHoursTicketEntity): The closed ticket.
+    """
+    session.flush()
+    statement = insert(OfficeHoursTicketStatisticsEntity).from_select(
+        _KEY + _SUMS, _statistics_rows(OfficeHoursTicketEntity.id == ticket.id)
+    )
+    session.execute(
+        statement.on_conflict_do_update(
+            index_elements=_KEY,
+            set_={
+                column.key: column + getattr(statement.excluded, column.key)
+                for column in _SUMS
+            },
+        )
+    )
+
+
+def rebuild_ticket_statistics(
+    session: Session, start: date | None = None, end: date | None = None
+) -> int:
+    """Recomputes the rollup for a range of days and commits it.
+
+    Args:
+        session (Session): The database session to use.
+        start (date | None): First day to rebuild, or None to start from the earliest ticket.
+        end (date | None): Last day to rebuild, or None to end with the latest ticket.
+
+    Returns:
+        int: The number of rollup rows written.
+    """
+    criteria: list[ColumnElement[bool]] = []
+    days: list[ColumnElement[bool]] = []
+    if start is not None:
+        criteria.append(
+            OfficeHoursTicketEntity.created_at >= datetime.combine(start, time())
+        )
+        days.append(OfficeHoursTicketStatisticsEntity.day >= start)
+    if end is not None:
+        criteria.append(
+            OfficeHoursTicketEntity.created_at
+            < datetime.combine(end + timedelta(days=1), time())
+        )
+        days.append(OfficeHoursTicketStatisticsEntity.day <= end)
+
+    # Tickets closing while the days are recounted wait on this lock, and are then added on top
+    # of the rebuilt rows rather than lost or counted twice.
+    session.execute(
+        text("LOCK TABLE office_hours__ticket_daily_statistics IN EXCLUSIVE MODE")
+    )
+    session.execute(delete(OfficeHoursTicketStatisticsEntity).where(*days))
+    result = session.execute(
+        insert(OfficeHoursTicketStatisticsEntity).from_select(
+            _KEY + _SUMS, _statistics_rows(*criteria)
+        )
+    )
+    session.commit()
+    return result.rowcount
+
+
+def _statistics_rows(*criteria: ColumnElement[bool]) -> Select:
+    """Rollup rows summing the closed tickets matching `criteria`, in `_KEY + _SUMS` order."""
+    CallerEntity = aliased(SectionMemberEntity)
+    CreatorEntity = aliased(SectionMemberEntity)
+    ticket = OfficeHoursTicketEntity
+
+    day = cast(ticket.created_at, Date)
+    wait_seconds = func.extract("epoch", ticket.called_at - ticket.created_at)
+    duration_seconds = func.extract("epoch", ticket.closed_at - ticket.called_at)
+    sums = [
+        func.count(),
+        func.count().filter(ticket.type == TicketType.CONCEPTUAL_HELP),
+        func.count().filter(ticket.type == TicketType.ASSIGNMENT_HELP),
+        func.count(wait_seconds),
+        func.coalesce(func.sum(wait_seconds), 0),
+        func.count(duration_seconds),
+        func.coalesce(func.sum(duration_seconds), 0),
+    ]
+
+    def closed_tickets(creator_user_id) -> Select:
+        return (
+            select(
+                OfficeHoursEntity.course_site_id,
+                day,
+                CallerEntity.user_id,
+                creator_user_id,
+                *sums,
+            )
+            .select_from(ticket)
+            .join(OfficeHoursEntity)
+            .outerjoin(CallerEntity, CallerEntity.id == ticket.caller_id)
+            .where(ticket.state == TicketState.CLOSED, *criteria)
+            .group_by(OfficeHoursEntity.course_site_id, day, CallerEntity.user_id)
+        )
+
+    # Each ticket once, for statistics across all of a site's students.
+    every_ticket = closed_tickets(cast(null(), Integer))
+    # Each ticket once per creator, for statistics filtered by student.
+    per_creator = (
+        closed_tickets(CreatorEntity.user_id)
+        .join(
+            user_created_tickets_table,
+            user_created_tickets_table.c.ticket_id == ticket.id,
+        )
+        .join(CreatorEntity, CreatorEntity.id == user_created_tickets_table.c.member_id)
+        .group_by(CreatorEntity.user_id)
+    )
+    return union_all(every_ticket, per_creator)
@@ -0,0 +1,201 @@
+"""Pagination of select statements by page offset or by cursor.
+
+Offset pagination skips `page * page_size` rows, so the database still reads every skipped row and
+deep pages grow slower as tables grow. Cursor pagination (also called keyset pagination) instead
+resumes after the last row of the previous page: each page carries a `next_cursor` encoding that
+row's sort key, and passing it back as the `cursor` parameter selects only rows after it, which an
+index on the sort key finds directly.
+
+Sort columns may be nullable. Postgres sorts NULLs after every value in ascending order and before
+them in descending order, so cursors into a nullable column compare rows with that rule instead of
+a row comparison, which is unknown wherever a NULL is involved.
+
+Counting every matching row is often the most expensive part of a page. Clients may ask for the
+`"exact"` count, the query planner's `"estimate"`, or `"none"`, in which case `length` is -1.
+"""
+
+import base64
+import json
+from datetime import date, datetime
+from enum import Enum
+from typing import Any, Callable, Sequence, TypeVar
+
+from sqlalchemy import (
+    ColumnElement,
+    Select,
+    and_,
+    false,
+    func,
+    literal,
+    or_,
+    select,
+    tuple_,
+)
+from sqlalchemy.ext.compiler import compiles
+from sqlalchemy.orm import Session
+from sqlalchemy.sql.expression import ClauseElement, Executable
+
+from ..models.pagination import Paginated, PaginationParams
+from .exceptions import InvalidPaginationCursorException
+
+__authors__ = ["Kris Jordan"]
+__copyright__ = "Copyright 2025"
+__license__ = "MIT"
+
+T = TypeVar("T")
+
+
+def paginate(
+    session: Session,
+    statement: Select,
+    pagination_params: PaginationParams,
+    sort: Sequence[ColumnElement],
+    to_model: Callable[[Any], T],
+    descending: bool = False,
+) -> Paginated[T]:
+    """Loads a page of the entities selected by a statement.
+
+    Args:
+        session (Session): The session to load the page with.
+        statement (Select): Selects the entities to paginate, without ordering or limits.
+        pagination_params (PaginationParams): The page, or cursor, its size, and how to count.
+        sort (Sequence[ColumnElement]): Columns the entities are sorted by, ending with a unique,
+            non-null column such as the primary key so that every entity has a distinct position.
+        to_model (Callable[[Any], T]): Converts each entity into its model.
+        descending (bool): Whether the entities are sorted in descending order.
+
+    Returns:
+        Paginated[T]: The page of models, the total length, and the cursor of the next page.
+
+    Raises:
+        InvalidPaginationCursorException: If the cursor was not returned by a page sorted the
+            same way.
+    """
+    length = _count(session, statement, pagination_params.count)
+
+    page_statement = statement.add_columns(*sort).order_by(
+        *[column.desc() if descending else column for column in sort]
+    )
+    if pagination_params.cursor != "":
+        page_statement = page_statement.where(
+            _after(sort, _decode_cursor(pagination_params.cursor, sort), descending)
+        )
+    else:
+        page_statement = page_statement.offset(
+            pagination_params.page * pagination_params.page_size
+        )
+
+    # One row past the page tells whether there is a next page.
+    rows = (
+        session.execute(page_statement.limit(pagination_params.page_size + 1))
+        .unique()
+        .all()
+    )
+    next_cursor = None
+    if len(rows) > pagination_params.page_size:
+        rows = rows[: pagination_params.page_size]
+        next_cursor = _encode_cursor(rows[-1][1:])
+
+    return Paginated(
+        items=[to_model(row[0]) for row in rows],
+        length=length,
+        params=pagination_params,
+        next_cursor=next_cursor,
+    )
+
+
+def _after(
+    sort: Sequence[ColumnElement], values: Sequence[Any], descending: bool
+) -> ColumnElement[bool]:
+    """Selects the rows sorted after the row whose sort key is `values`."""
+    if None not in values and not any(_nullable(column) for column in sort):
+        after = tuple_(*sort)
+        position = tuple_(
+            *[literal(value, column.type) for value, column in zip(values, sort)]
+        )
+        return after < position if descending else after > position
+
+    # Rows after the position tie with it on a prefix of the sort key and follow it on the next
+    # column, where NULLs come last in ascending order and first in descending order.
+    alternatives = []
+    for i, (column, value) in enumerate(zip(sort, values)):
+        if value is None:
+            follows = column.isnot(None) if descending else false()
+        elif descending:
+            follows = column < literal(value, column.type)
+        else:
+            follows = or_(column > literal(value, column.type), column.is_(None))
+        ties = [
+            (
+                prefix_column.is_(None)
+                if prefix_value is None
+                else prefix_column == literal(prefix_value, prefix_column.type)
+            )
+            for prefix_column, prefix_value in zip(sort[:i], values[:i])
+        ]
+        alternatives.append(and_(*ties, follows))
+    return or_(*alternatives)
+
+
+def _nullable(column: ColumnElement) -> bool:
+    return getattr(getattr(column, "expression", column), "nullable", True)
+
+
+class _Explain(Executable, ClauseElement):
+    """An `EXPLAIN (FORMAT JSON)` of a statement, whose plan estimates its number of rows."""
+
+    inherit_cache = False
+
+    def __init__(self, statement: Select):
+        self.statement = statement
+
+
+@compiles(_Explain, "postgresql")
+def _compile_explain(element: _Explain, compiler, **kw) -> str:
+    return "EXPLAIN (FORMAT JSON) " + compiler.process(element.statement, **kw)
+
+
+def _count(session: Session, statement: Select, count: str) -> int:
+    if count == "none":
+        return -1
+    rows = statement.order_by(None).subquery()
+    if count == "estimate":
+        plan = session.execute(_Explain(select(rows))).scalar()
+        return int(plan[0]["Plan"]["Plan Rows"])
+    return session.execute(select(func.count()).select_from(rows)).scalar()
+
+
+def _encode_cursor(values: Sequence[Any]) -> str:
+    encoded = [
+        (
+            value.name
+            if isinstance(value, Enum)
+            else value.isoformat() if isinstance(value, (date, datetime)) else value
+        )
+        for value in values
+    ]
+    return base64.urlsafe_b64encode(json.dumps(encoded).encode()).decode()
+
+
+def _decode_cursor(cursor: str, sort: Sequence[ColumnElement]) -> list[Any]:
+    try:
+        encoded = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        if not isinstance(encoded, list) or len(encoded) != len(sort):
+            raise ValueError()
+        values = []
+        for value, column in zip(encoded, sort):
+            python_type = column.type.python_type
+            if value is None:
+                pass
+            elif issubclass(python_type, Enum):
+                value = python_type[value]
+            elif issubclass(python_type, datetime):
+                value = datetime.fromisoformat(value)
+            elif issubclass(python_type, date):
+                value = date.fromisoformat(value)
+            elif not isinstance(value, python_type):
+                raise ValueError()
+            values.append(value)
+        return values
+    except (ValueError, KeyError, TypeError, NotImplementedError):
+        raise InvalidPaginationCursorException()
@@ -3,17 +3,24 @@ Permission Service grants, revokes, tests, and enforces permissions for users an
 
 This Service is more of an internal service that other services take dependency on. It is not directly
 exposed via the API.
+
+FastAPI resolves a single PermissionService per request, shared by every service that depends on it. The
+service remembers each subject's effective permissions the first time they are checked, so repeated
+`check` and `enforce` calls within a request are answered from memory. Across requests and worker
+processes, effective permissions are shared through the version-stamped `PermissionCache`. Changes
+made through `grant`, `revoke`, or `RoleService` membership changes clear what has been remembered
+and bump the shared version.
 """
 
-import re
 from fastapi import Depends
-from functools import lru_cache
-from sqlalchemy import select
+from sqlalchemy import select, or_
 from sqlalchemy.orm import Session
 from ..database import db_session
 from ..models import User, Permission, Role, RoleDetails
-from ..entities import UserEntity, PermissionEntity, RoleEntity
+from ..entities import UserEntity, PermissionEntity, RoleEntity, user_role_table
 from ..services.exceptions import UserPermissionException
+from .permission_cache import Grant, PermissionCache, get_permission_cache
+from .permission_matcher import PermissionMatcher
 
 __authors__ = ["Kris Jordan"]
 __copyright__ = "Copyright 2023"
@@ -24,13 +31,23 @@ class PermissionService:
     """PermissionService grants, revokes, tests, and enforces permissions for users and roles in the system."""
 
     _session: Session
-
-    def __init__(self, session: Session = Depends(db_session)):
+    _permission_cache: PermissionCache
+    _permission_matchers: dict[int, PermissionMatcher]
+
+    def __init__(
+        self,
+        session: Session = Depends(db_session),
+        permission_cache: PermissionCache = Depends(get_permission_cache),
+    ):
         """Initialize a new PermissionService instance.
 
         Args:
-            session (Session): The SQLAlchemy session to use for database operations."""
+            session (Session): The SQLAlchemy session to use for database operations.
+            permission_cache (PermissionCache): The cache of effective permissions shared across workers.
+        """
         self._session = session
+        self._permission_cache = permission_cache
+        self._permission_matchers = {}
 
     def get_permissions(self, subject: User) -> list[Permission]:
         """Get the permissions for a user.
@@ -83,6 +100,7 @@ class PermissionService:
 
         self._session.add(permission_entity)
         self._session.commit()
+        self.invalidate()
         return True
 
     def revoke(self, revoker: User, permission: Permission) -> bool:
@@ -110,6 +128,7 @@ class PermissionService:
 
         self._session.delete(permission_entity)
         self._session.commit()
+        self.invalidate()
         return True
 
     def enforce(self, subject: User, action: str, resource: str) -> None:
@@ -138,14 +157,59 @@ class PermissionService:
         Returns:
             bool: True if the user has permission to carry out the action on the resource, False otherwise.
         """
-        # Check user permissions
-        user_perms = self._get_user_permissions(subject)
-        if self._has_permission(user_perms, action, resource):
-            return True
+        return self._get_permission_matcher(subject).matches(action, resource)
+
+    def invalidate(self) -> None:
+        """Forget all effective permissions loaded by this service and bump the shared permissions version.
+
+        Must be called after any change to permissions or role membership so that later checks, in
+        this request and every other, reload them."""
+        self._permission_matchers.clear()
+        self._permission_cache.bump()
+
+    def _get_permission_matcher(self, subject: User) -> PermissionMatcher:
+        """Get the compiled matcher of the permissions granted to a user directly and through their roles.
+
+        The permissions are read from the shared permission cache, or loaded with a single query
+        when they are not cached at the current version. They are compiled the first time a subject
+        is checked, then remembered until `invalidate` is called.
 
-        # Check role permissions
-        role_permissions = self._get_user_roles_permissions(subject)
-        return self._has_permission(role_permissions, action, resource)
+        Args:
+            subject (User): The user to get permissions for.
+
+        Returns:
+            PermissionMatcher: The effective permissions of the user."""
+        matcher = self._permission_matchers.get(subject.id)
+        if matcher is None:
+            grants = self._permission_cache.get(subject.id)
+            if grants is None:
+                version = self._permission_cache.version()
+                grants = self._get_user_grants(subject)
+                self._permission_cache.put(subject.id, version, grants)
+            matcher = PermissionMatcher(grants)
+            self._permission_matchers[subject.id] = matcher
+        return matcher
+
+    def _get_user_grants(self, subject: User) -> list[Grant]:
+        """Get the grants of a user directly and through their roles with a single query.
+
+        Args:
+            subject (User): The user to get grants for.
+
+        Returns:
+            list[Grant]: The effective grants of the user."""
+        role_ids = select(user_role_table.c.role_id).where(
+            user_role_table.c.user_id == subject.id
+        )
+        query = select(PermissionEntity.action, PermissionEntity.resource).where(
+            or_(
+                PermissionEntity.user_id == subject.id,
+                PermissionEntity.role_id.in_(role_ids),
+            )
+        )
+        return [
+            Grant(action, resource) for action, resource in self._session.execute(query)
+        ]
 
     def _get_user_permissions(self, subject: User) -> list[PermissionEntity]:
         """Get the permissions for a user.
@@ -181,53 +245,34 @@ class PermissionService:
         return [p for p in self._session.execute(role_query).scalars()]
 
     def _has_permission(
-        self, permissions: list[PermissionEntity], action: str, resource: str
+        self,
+        permissions: list[PermissionEntity] | list[Permission],
+        action: str,
+        resource: str,
     ) -> bool:
         """Check if a user has permission to carry out an action on a resource in a list of permissions.
 
         Args:
-            permissions (list[PermissionEntity]): The permissions to check.
+            permissions (list[PermissionEntity] | list[Permission]): The permissions to check.
             action (str): The action in question.
             resource (str): The resource in question.
 
         Returns:
             bool: True if the user has permission to carry out the action on the resource, False otherwise.
         """
-        for permission in permissions:
-            if self._check_permission(permission, action, resource):
-                return True
-        return False
+        return PermissionMatcher(permissions).matches(action, resource)
 
     def _check_permission(
-        self, permission: PermissionEntity, action: str, resource: str
+        self, permission: PermissionEntity | Permission, action: str, resource: str
     ) -> bool:
         """Check if a user has permission to carry out an action on a resource.
 
         Args:
-            permission (PermissionEntity): The permission to check.
+            permission (PermissionEntity | Permission): The permission to check.
             action (str): The action in question.
             resource (str): The resource in question.
 
         Returns:
             bool: True if the user has permission to carry out the action on the resource, False otherwise.
         """
-        action_re = self._expand_pattern(permission.action)
-        if action_re.fullmatch(action) is not None:
-            resource_re = self._expand_pattern(permission.resource)
-            return resource_re.fullmatch(resource) is not None
-        else:
-            return False
-
-    @lru_cache()
-    def _expand_pattern(self, pattern: str) -> re.Pattern:
-        """Expand a permission pattern into a regular expression.
-
-        This function is memoized to avoid recompiling the same regular expression multiple times.
-
-        Args:
-            pattern (str): The pattern to expand.
-
-        Returns:
-            re.Pattern: The compiled regular expression."""
-        search = pattern.replace("*", ".*")
-        return re.compile(f"^{search}$")
+        return PermissionMatcher([permission]).matches(action, resource)
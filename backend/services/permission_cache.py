@@ -0,0 +1,138 @@
+"""Cache of users' effective permissions shared by every worker process on a host.
+
+Production runs several uvicorn worker processes. Each request's PermissionService would otherwise
+reload the same grants from Postgres, so effective permissions are shared through a small SQLite
+key/value file that all workers on the host open. The file location is configured with the
+`PERMISSION_CACHE_PATH` environment variable.
+
+Every entry is stamped with the permissions version current when it was loaded. Granting or
+revoking a permission, or changing a role's membership, increments the version. Entries stamped with
+an older version are never served, so there is no window in which a stale grant set is trusted.
+"""
+
+import json
+import os
+import sqlite3
+import tempfile
+from threading import Lock
+from typing import NamedTuple, Sequence
+
+from ..env import getenv
+
+__authors__ = ["Kris Jordan"]
+__copyright__ = "Copyright 2024"
+__license__ = "MIT"
+
+PERMISSION_CACHE_PATH = getenv(
+    "PERMISSION_CACHE_PATH",
+    default=os.path.join(
+        tempfile.gettempdir(),
+        f"csxl-permission-cache-{getenv('POSTGRES_DATABASE', default='csxl')}.sqlite3",
+    ),
+)
+
+
+class Grant(NamedTuple):
+    """The action and resource patterns of a permission."""
+
+    action: str
+    resource: str
+
+
+class PermissionCache:
+    """Version-stamped cache of each user's effective grants."""
+
+    def __init__(self, path: str = PERMISSION_CACHE_PATH):
+        """Initializes a PermissionCache backed by the SQLite database at `path`.
+
+        Args:
+            path (str): Path to the SQLite database file, or ":memory:" for a private cache.
+        """
+        self._path = path
+        self._lock = Lock()
+        self._connection: sqlite3.Connection | None = None
+        self._pid: int | None = None
+
+    def _connect(self) -> sqlite3.Connection:
+        # Connections are opened lazily and never shared across a fork.
+        if self._connection is None or self._pid != os.getpid():
+            connection = sqlite3.connect(
+                self._path, timeout=5, isolation_level=None, check_same_thread=False
+            )
+            if self._path != ":memory:":
+                connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS version (id INTEGER PRIMARY KEY, value INTEGER NOT NULL)"
+            )
+            connection.execute(
+                "INSERT OR IGNORE INTO version (id, value) VALUES (0, 0)"
+            )
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS grants "
+                "(user_id INTEGER PRIMARY KEY, version INTEGER NOT NULL, grants TEXT NOT NULL)"
+            )
+            self._connection = connection
+            self._pid = os.getpid()
+        return self._connection
+
+    def version(self) -> int:
+        """The current permissions version."""
+        with self._lock:
+            row = self._connect().execute("SELECT value FROM version").fetchone()
+        return row[0]
+
+    def get(self, user_id: int) -> list[Grant] | None:
+        """Get a user's grants if they were cached at the current permissions version.
+
+        Args:
+            user_id (int): The ID of the user.
+
+        Returns:
+            list[Grant] | None: The user's grants, or None if they are not cached or are stale.
+        """
+        with self._lock:
+            row = (
+                self._connect()
+                .execute(
+                    "SELECT grants.grants FROM grants JOIN version ON grants.version = version.value "
+                    "WHERE grants.user_id = ?",
+                    (user_id,),
+                )
+                .fetchone()
+            )
+        if row is None:
+            return None
+        return [Grant(action, resource) for action, resource in json.loads(row[0])]
+
+    def put(self, user_id: int, version: int, grants: Sequence[Grant]) -> None:
+        """Cache a user's grants as loaded at a given permissions version.
+
+        The version must be read before the grants are loaded. If the version is bumped while they
+        are loading, the entry is stored already stale and is never served.
+
+        Args:
+            user_id (int): The ID of the user.
+            version (int): The permissions version read before the grants were loaded.
+            grants (Sequence[Grant]): The user's grants."""
+        payload = json.dumps([[grant.action, grant.resource] for grant in grants])
+        with self._lock:
+            self._connect().execute(
+                "INSERT OR REPLACE INTO grants (user_id, version, grants) VALUES (?, ?, ?)",
+                (user_id, version, payload),
+            )
+
+    def bump(self) -> None:
+        """Increment the permissions version, making every cached entry stale."""
+        with self._lock:
+            connection = self._connect()
+            connection.execute("UPDATE version SET value = value + 1")
+            connection.execute("DELETE FROM grants")
+
+
+permission_cache = PermissionCache()
+"""Host-wide PermissionCache shared by every request in every worker."""
+
+
+def get_permission_cache() -> PermissionCache:
+    """Dependency injection of the host-wide PermissionCache."""
+    return permission_cache
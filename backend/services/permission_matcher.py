@@ -0,0 +1,130 @@
+"""Compiled matcher answering whether any of a set of permissions allows an action on a resource.
+
+Permission actions and resources are patterns in which `*` matches any run of characters, including
+the `.` and `/` separators. Rather than testing each permission in turn, the patterns are compiled
+into a trie: the action patterns share one trie, and each action pattern's node holds a second trie
+over the resource patterns granted with it. `*` is a wildcard edge out of a node. A check walks both
+tries once, so its cost grows with the length of the action and resource strings rather than with
+the number of permissions.
+"""
+
+from typing import Iterable, Protocol, Self
+
+__authors__ = ["Kris Jordan"]
+__copyright__ = "Copyright 2024"
+__license__ = "MIT"
+
+WILDCARD = "*"
+
+
+class PermissionPattern(Protocol):
+    """Anything with an action and resource pattern, such as a Permission or PermissionEntity."""
+
+    action: str
+    resource: str
+
+
+class _PatternTrie:
+    """Trie over patterns, one character per edge, with `*` as a wildcard edge."""
+
+    __slots__ = ("children", "wildcard", "terminal", "resources")
+
+    def __init__(self):
+        self.children: dict[str, Self] = {}
+        self.wildcard: Self | None = None
+        self.terminal = False
+        self.resources: _PatternTrie | None = None
+
+    def insert(self, pattern: str) -> Self:
+        """Adds a pattern to the trie and returns the node it ends at."""
+        node = self
+        for character in pattern:
+            if character == WILDCARD:
+                # Consecutive wildcards match the same strings as one.
+                if node.wildcard is not node:
+                    if node.wildcard is None:
+                        node.wildcard = _PatternTrie()
+                    node = node.wildcard
+                    node.wildcard = node
+            else:
+                child = node.children.get(character)
+                if child is None:
+                    child = node.children[character] = _PatternTrie()
+                node = child
+        node.terminal = True
+        return node
+
+    def match(self, string: str) -> list[Self]:
+        """Returns every terminal node whose pattern matches the whole string."""
+        matches: dict[int, _PatternTrie] = {}
+        self._match(string, 0, matches, set())
+        return list(matches.values())
+
+    def _match(
+        self,
+        string: str,
+        i: int,
+        matches: dict[int, Self],
+        visited: set[tuple[int, int]],
+    ) -> None:
+        # A node is only ever explored once per position in the string, which bounds the work of
+        # wildcards that may consume any number of characters.
+        key = (id(self), i)
+        if key in visited:
+            return
+        visited.add(key)
+
+        if self.wildcard is self:
+            # This node is reached through a wildcard: it may consume any suffix of the string,
+            # so it matches here and its children may continue from any later position.
+            if self.terminal:
+                matches[id(self)] = self
+            if self.children:
+                for j in range(i, len(string)):
+                    child = self.children.get(string[j])
+                    if child is not None:
+                        child._match(string, j + 1, matches, visited)
+            return
+
+        if self.wildcard is not None:
+            self.wildcard._match(string, i, matches, visited)
+        if i == len(string):
+            if self.terminal:
+                matches[id(self)] = self
+            return
+        child = self.children.get(string[i])
+        if child is not None:
+            child._match(string, i + 1, matches, visited)
+
+
+class PermissionMatcher:
+    """Matches an action and resource against a set of permissions compiled into tries."""
+
+    __slots__ = ("_actions",)
+
+    def __init__(self, permissions: Iterable[PermissionPattern]):
+        """Compiles a set of permissions into a PermissionMatcher.
+
+        Args:
+            permissions (Iterable[PermissionPattern]): The permissions to match against.
+        """
+        self._actions = _PatternTrie()
+        for permission in permissions:
+            node = self._actions.insert(permission.action)
+            if node.resources is None:
+                node.resources = _PatternTrie()
+            node.resources.insert(permission.resource)
+
+    def matches(self, action: str, resource: str) -> bool:
+        """Check if any permission allows an action on a resource.
+
+        Args:
+            action (str): The action in question.
+            resource (str): The resource in question.
+
+        Returns:
+            bool: True if a permission matching the action also matches the resource."""
+        for node in self._actions.match(action):
+            if node.resources is not None and node.resources.match(resource):
+                return True
+        return False
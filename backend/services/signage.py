@@ -11,8 +11,7 @@ from backend.models.office_hours.ticket_state import TicketState
 
 from ..database import db_session
 
-from datetime import datetime, timedelta
-from ..models.coworking import TimeRange
+from datetime import datetime
 
 from ..models.signage import (
     SignageOverviewFast,
@@ -22,10 +21,11 @@ from ..models.signage import (
     SignageProfile,
 )
 from ..services.coworking import ReservationService, SeatService
+from ..services.coworking.checkin_leaderboard import month_of
 from ..services import RoomService
 
 from ..entities import ArticleEntity, RoomEntity, UserEntity, EventEntity
-from ..entities.coworking import ReservationEntity
+from ..entities.coworking import ReservationEntity, CheckinLeaderboardEntity
 from ..entities.office_hours import OfficeHoursEntity
 from ..models.articles import ArticleState
 
@@ -142,18 +142,7 @@ class SignageService:
         available_rooms = [room.to_model().id for room in room_entities]
 
         # Seats
-        now = datetime.now()
-        walkin_window = TimeRange(
-            start=now,
-            end=now
-            + timedelta(
-                hours=6, minutes=10
-            ),  # Makes sure open seats are available for 2hr walkin reservation
-        )
-        seats = self._seat_svc.list()  # All Seats are fair game for walkin purposes
-        seat_availability = self._reservation_svc.seat_availability(
-            seats, walkin_window
-        )
+        seat_availability = self._reservation_svc.walkin_seat_availability()
 
         return SignageOverviewFast(
             active_office_hours=active_office_hours,
@@ -174,18 +163,15 @@ class SignageService:
         newest_news = [news.to_overview_model() for news in news_entities]
 
         # Checkin Leaderboard
-        start_of_month = datetime.today().replace(
-            day=1, hour=0, minute=0, second=0, microsecond=0
-        )
         top_users_query = (
-            select(
-                UserEntity, func.count(ReservationEntity.id).label("reservation_count")
+            select(UserEntity)
+            .join(
+                CheckinLeaderboardEntity,
+                CheckinLeaderboardEntity.user_id == UserEntity.id,
             )
-            .join(ReservationEntity.users)
-            .where(ReservationEntity.end >= start_of_month)
-            .where(ReservationEntity.state == ReservationState.CHECKED_OUT)
-            .group_by(UserEntity.id)
-            .order_by(func.count(ReservationEntity.id).desc())
+            .where(CheckinLeaderboardEntity.month == month_of(datetime.today()))
+            .where(CheckinLeaderboardEntity.checkouts > 0)
+            .order_by(CheckinLeaderboardEntity.checkouts.desc())
             .limit(MAX_LEADERBOARD_SLOTS)
         )
 
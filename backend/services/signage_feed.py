@@ -0,0 +1,190 @@
+"""Broadcast feed of signage data pushed to every connected signage display.
+
+Rather than each display polling `/api/signage/fast` and `/api/signage/slow`, one background task
+per worker computes the signage data and pushes it to the displays connected to that worker. The
+fast data is recomputed every tick and as soon as a reservation changes seat availability; the slow
+data is recomputed on a longer cadence. Nothing is computed while no display is connected. The
+cadences are configured with the `SIGNAGE_FEED_FAST_SECONDS` and `SIGNAGE_FEED_SLOW_SECONDS`
+environment variables.
+
+Displays first receive the complete data and afterwards only deltas, messages of the form
+`{"type": "fast" | "slow", "data": {...}}` whose `data` holds just the fields that changed.
+"""
+
+import asyncio
+import logging
+from time import monotonic
+from typing import Any, Awaitable, Callable
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from ..database import async_readonly_engine, run_async
+from ..env import getenv
+from .coworking import (
+    OperatingHoursService,
+    PolicyService,
+    ReservationService,
+    SeatService,
+)
+from .coworking.availability_snapshot import get_availability_snapshot
+from .permission import PermissionService
+from .permission_cache import get_permission_cache
+from .room import RoomService
+from .signage import SignageService
+
+__authors__ = ["Kris Jordan"]
+__copyright__ = "Copyright 2025"
+__license__ = "MIT"
+
+SIGNAGE_FEED_FAST_SECONDS = float(getenv("SIGNAGE_FEED_FAST_SECONDS", default="10"))
+SIGNAGE_FEED_SLOW_SECONDS = float(getenv("SIGNAGE_FEED_SLOW_SECONDS", default="600"))
+SIGNAGE_FEED_BACKLOG = 16
+"""Messages a display may fall behind by before its backlog is replaced with the complete data."""
+
+logger = logging.getLogger(__name__)
+
+Payload = dict[str, Any]
+
+
+class SignageFeed:
+    """Computes signage payloads on a cadence and fans their deltas out to subscribers."""
+
+    def __init__(
+        self,
+        compute_fast: Callable[[], Awaitable[Payload]],
+        compute_slow: Callable[[], Awaitable[Payload]],
+        fast_seconds: float = SIGNAGE_FEED_FAST_SECONDS,
+        slow_seconds: float = SIGNAGE_FEED_SLOW_SECONDS,
+    ):
+        """Initializes a SignageFeed with no subscribers and no data.
+
+        Args:
+            compute_fast (Callable[[], Awaitable[Payload]]): Computes the fast signage data as JSON.
+            compute_slow (Callable[[], Awaitable[Payload]]): Computes the slow signage data as JSON.
+            fast_seconds (float): Seconds between recomputations of the fast data.
+            slow_seconds (float): Seconds between recomputations of the slow data.
+        """
+        self._compute = {"fast": compute_fast, "slow": compute_slow}
+        self._fast_seconds = fast_seconds
+        self._slow_seconds = slow_seconds
+        self._payloads: dict[str, Payload] = {}
+        self._subscribers: set[asyncio.Queue[Payload]] = set()
+        self._changed = asyncio.Event()
+        self._loop: asyncio.AbstractEventLoop | None = None
+
+    def subscribe(self) -> asyncio.Queue[Payload]:
+        """Subscribes to the feed.
+
+        Returns:
+            asyncio.Queue[Payload]: Messages for the subscriber, beginning with the complete data.
+        """
+        queue: asyncio.Queue[Payload] = asyncio.Queue(maxsize=SIGNAGE_FEED_BACKLOG)
+        self._send_complete(queue)
+        self._subscribers.add(queue)
+        # Data held from before anyone was subscribed may be stale, so refresh it right away.
+        self._changed.set()
+        return queue
+
+    def unsubscribe(self, queue: asyncio.Queue[Payload]) -> None:
+        """Removes a subscriber from the feed.
+
+        Args:
+            queue (asyncio.Queue[Payload]): The queue returned by `subscribe`."""
+        self._subscribers.discard(queue)
+
+    def notify_changed(self) -> None:
+        """Requests the fast data be recomputed now rather than at the next tick. Safe from any thread."""
+        if self._loop is not None:
+            self._loop.call_soon_threadsafe(self._changed.set)
+
+    async def refresh(self, kind: str) -> None:
+        """Recomputes the fast or slow data and publishes the fields that changed.
+
+        Args:
+            kind (str): Either "fast" or "slow"."""
+        payload = await self._compute[kind]()
+        previous = self._payloads.get(kind, {})
+        delta = {
+            field: value
+            for field, value in payload.items()
+            if field not in previous or previous[field] != value
+        }
+        self._payloads[kind] = payload
+        if delta:
+            self._publish({"type": kind, "data": delta})
+
+    async def run(self) -> None:
+        """Refreshes the data for subscribers until cancelled."""
+        self._loop = asyncio.get_running_loop()
+        slow_due = 0.0
+        while True:
+            if self._subscribers:
+                try:
+                    if monotonic() >= slow_due:
+                        await self.refresh("slow")
+                        slow_due = monotonic() + self._slow_seconds
+                    await self.refresh("fast")
+                except Exception:
+                    logger.exception("Signage feed refresh failed")
+            try:
+                await asyncio.wait_for(self._changed.wait(), self._fast_seconds)
+            except TimeoutError:
+                ...
+            self._changed.clear()
+
+    def _publish(self, message: Payload) -> None:
+        for queue in self._subscribers:
+            try:
+                queue.put_nowait(message)
+            except asyncio.QueueFull:
+                # A display this far behind catches up from the complete data rather than deltas.
+                while not queue.empty():
+                    queue.get_nowait()
+                self._send_complete(queue)
+
+    def _send_complete(self, queue: asyncio.Queue[Payload]) -> None:
+        for kind, payload in self._payloads.items():
+            queue.put_nowait({"type": kind, "data": payload})
+
+
+def _signage_svc(session: Session) -> SignageService:
+    permission_svc = PermissionService(session, get_permission_cache())
+    seat_svc = SeatService(session)
+    reservation_svc = ReservationService(
+        session,
+        permission_svc,
+        PolicyService(),
+        OperatingHoursService(session, permission_svc),
+        seat_svc,
+        get_availability_snapshot(),
+    )
+    return SignageService(
+        session,
+        reservation_svc,
+        seat_svc,
+        RoomService(session, permission_svc),
+    )
+
+
+async def _compute_fast() -> Payload:
+    async with AsyncSession(async_readonly_engine) as session:
+        data = await run_async(session, lambda s: _signage_svc(s).get_fast_data())
+    return data.model_dump(mode="json")
+
+
+async def _compute_slow() -> Payload:
+    async with AsyncSession(async_readonly_engine) as session:
+        data = await run_async(session, lambda s: _signage_svc(s).get_slow_data())
+    return data.model_dump(mode="json")
+
+
+signage_feed = SignageFeed(_compute_fast, _compute_slow)
+"""Process-wide SignageFeed shared by every connected display."""
+
+get_availability_snapshot().add_listener(signage_feed.notify_changed)
+
+
+def get_signage_feed() -> SignageFeed:
+    """Dependency injection of the process-wide SignageFeed."""
+    return signage_feed
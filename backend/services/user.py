@@ -10,7 +10,9 @@ from ..database import db_session
 from ..models import User, UserDetails, Paginated, PaginationParams, PublicUser
 from ..entities import UserEntity
 from .exceptions import ResourceNotFoundException
+from .pagination import paginate
 from .permission import PermissionService
+from .user_cache import UserCache, get_user_cache
 
 __authors__ = ["Kris Jordan"]
 __copyright__ = "Copyright 2023"
@@ -20,15 +22,18 @@ __license__ = "MIT"
 class UserService:
     _session: Session
     _permission: PermissionService
+    _user_cache: UserCache
 
     def __init__(
         self,
         session: Session = Depends(db_session),
         permission: PermissionService = Depends(),
+        user_cache: UserCache = Depends(get_user_cache),
     ):
         """Initialize the User Service."""
         self._session = session
         self._permission = permission
+        self._user_cache = user_cache
 
     def get(self, pid: int) -> UserDetails | None:
         """Get a User by PID.
@@ -157,7 +162,6 @@ class UserService:
         self._permission.enforce(subject, "user.list", "user/")
 
         statement = select(UserEntity)
-        length_statement = select(func.count()).select_from(UserEntity)
         if pagination_params.filter != "":
             query = pagination_params.filter
             criteria = or_(
@@ -166,25 +170,17 @@ class UserService:
                 UserEntity.onyen.ilike(f"%{query}%"),
             )
             statement = statement.where(criteria)
-            length_statement = length_statement.where(criteria)
-
-        offset = pagination_params.page * pagination_params.page_size
-        limit = pagination_params.page_size
 
+        sort = [UserEntity.id]
         if pagination_params.order_by != "":
-            statement = statement.order_by(
-                getattr(UserEntity, pagination_params.order_by)
-            )
-
-        statement = statement.offset(offset).limit(limit)
-
-        length = self._session.execute(length_statement).scalar()
-        entities = self._session.execute(statement).scalars()
-
-        return Paginated(
-            items=[entity.to_model() for entity in entities],
-            length=length,
-            params=pagination_params,
+            sort.insert(0, getattr(UserEntity, pagination_params.order_by))
+
+        return paginate(
+            self._session,
+            statement,
+            pagination_params,
+            sort,
+            lambda entity: entity.to_model(),
         )
 
     def create(self, subject: User, user: User) -> User:
@@ -207,6 +203,7 @@ class UserService:
         entity = UserEntity.from_model(user)
         self._session.add(entity)
         self._session.commit()
+        self._user_cache.evict_user(entity.pid)
         return entity.to_model()
 
     def update(self, subject: User, user: User) -> User:
@@ -229,4 +226,5 @@ class UserService:
         entity = self._session.get(UserEntity, user.id)
         entity.update(user)
         self._session.commit()
+        self._user_cache.evict_user(entity.pid)
         return entity.to_model()
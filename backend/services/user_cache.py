@@ -0,0 +1,139 @@
+"""In-process cache of authenticated users and their decoded bearer tokens.
+
+Every authenticated API request decodes its bearer token and looks up the user's `UserDetails`. Both
+are cached here, bounded in size and time-to-live, so that hot users skip the HMAC verification and
+the database lookup. The bounds are configured with the `USER_CACHE_SIZE` and
+`USER_CACHE_TTL_SECONDS` environment variables.
+
+`UserDetails` include the user's permissions, so each entry is stamped with the permissions version
+of the shared `PermissionCache` and is never served after a grant, revoke, or role membership change.
+`UserService` evicts a user's entry when it creates or updates them, which covers profile edits and
+linking or unlinking GitHub. Each worker process keeps its own cache, so a profile edit served by one
+worker is seen by the others within the time-to-live.
+"""
+
+from collections import OrderedDict
+from datetime import datetime, timedelta
+from math import inf
+from threading import Lock
+from time import time
+from typing import Any
+
+from ..env import getenv
+from ..models import UserDetails
+
+__authors__ = ["Kris Jordan"]
+__copyright__ = "Copyright 2024"
+__license__ = "MIT"
+
+USER_CACHE_SIZE = int(getenv("USER_CACHE_SIZE", default="1024"))
+USER_CACHE_TTL = timedelta(
+    seconds=float(getenv("USER_CACHE_TTL_SECONDS", default="30"))
+)
+
+
+class UserCache:
+    """Bounded LRU cache of UserDetails by PID and of decoded token claims by token."""
+
+    def __init__(self, size: int = USER_CACHE_SIZE, ttl: timedelta = USER_CACHE_TTL):
+        """Initializes a new, empty UserCache.
+
+        Args:
+            size (int): The maximum number of users, and separately of tokens, to hold.
+            ttl (timedelta): How long a cached user may be served.
+        """
+        self._size = size
+        self._ttl = ttl
+        self._lock = Lock()
+        self._users: OrderedDict[int, tuple[UserDetails, int, datetime]] = OrderedDict()
+        self._claims: OrderedDict[str, tuple[dict[str, Any], float]] = OrderedDict()
+
+    def get_user(self, pid: int, version: int) -> UserDetails | None:
+        """Get a cached user by PID.
+
+        Args:
+            pid (int): The PID of the user.
+            version (int): The current permissions version.
+
+        Returns:
+            UserDetails | None: A copy of the cached user, or None if missing, expired, or stale.
+        """
+        now = datetime.now()
+        with self._lock:
+            entry = self._users.get(pid)
+            if entry is None:
+                return None
+            user, user_version, expires_at = entry
+            if user_version != version or now >= expires_at:
+                del self._users[pid]
+                return None
+            self._users.move_to_end(pid)
+        # Callers may mutate the user they are handed, so the cached instance is never shared.
+        return user.model_copy(deep=True)
+
+    def put_user(self, user: UserDetails, version: int) -> None:
+        """Cache a user loaded at a given permissions version.
+
+        Args:
+            user (UserDetails): The user.
+            version (int): The permissions version read before the user was loaded.
+        """
+        expires_at = datetime.now() + self._ttl
+        with self._lock:
+            self._users[user.pid] = (user.model_copy(deep=True), version, expires_at)
+            self._users.move_to_end(user.pid)
+            while len(self._users) > self._size:
+                self._users.popitem(last=False)
+
+    def evict_user(self, pid: int) -> None:
+        """Remove a user from the cache.
+
+        Args:
+            pid (int): The PID of the user."""
+        with self._lock:
+            self._users.pop(pid, None)
+
+    def get_claims(self, token: str) -> dict[str, Any] | None:
+        """Get the cached claims of a previously decoded token, if it has not expired.
+
+        Args:
+            token (str): The encoded bearer token.
+
+        Returns:
+            dict[str, Any] | None: The token's claims, or None if it is not cached or has expired.
+        """
+        now = time()
+        with self._lock:
+            entry = self._claims.get(token)
+            if entry is None:
+                return None
+            claims, expires_at = entry
+            if now >= expires_at:
+                del self._claims[token]
+                return None
+            self._claims.move_to_end(token)
+            return claims
+
+    def put_claims(self, token: str, claims: dict[str, Any]) -> None:
+        """Cache the claims of a token whose signature has been verified.
+
+        Claims are held no longer than the token's own `exp` claim, a POSIX timestamp.
+
+        Args:
+            token (str): The encoded bearer token.
+            claims (dict[str, Any]): The decoded claims."""
+        expires_at = float(claims.get("exp", inf))
+        with self._lock:
+            self._claims[token] = (claims, expires_at)
+            self._claims.move_to_end(token)
+            while len(self._claims) > self._size:
+                self._claims.popitem(last=False)
+
+
+user_cache = UserCache()
+"""Process-wide UserCache shared by every request."""
+
+
+def get_user_cache() -> UserCache:
+    """Dependency injection of the process-wide UserCache."""
+    return user_cache
@@ -0,0 +1,111 @@
+"""Micro-benchmarks for AvailabilityIndex over a full XL day with hundreds of reservations.
+
+Run with `pytest -rP` to see the timings printed by these tests."""
+
+from random import Random
+from time import perf_counter
+
+from ....models.coworking import AvailabilityIndex, TimeRange
+from ...services.coworking.time import *
+
+__authors__ = ["Kris Jordan"]
+__copyright__ = "Copyright 2024"
+__license__ = "MIT"
+
+NUMBER_OF_SEATS = 80
+NUMBER_OF_RESERVATIONS = 600
+
+
+def _linear_subtract(
+    availability: list[TimeRange], block: TimeRange
+) -> list[TimeRange]:
+    """Reference implementation: the linear scan AvailabilityList used before the index."""
+    front = 0
+    while front < len(availability) and not block.overlaps(availability[front]):
+        front += 1
+
+    end = front + 1
+    while end < len(availability) and block.overlaps(availability[end]):
+        end += 1
+
+    result: list[TimeRange] = availability[:front]
+    for i in range(front, min(end, len(availability))):
+        result += availability[i].subtract(block)
+    result += availability[end:]
+    return result
+
+
+def _xl_day(time: dict[str, datetime]) -> tuple[TimeRange, list[tuple[int, TimeRange]]]:
+    """An XL day open 8am to midnight with reservations of 30 minutes to 2 hours."""
+    open_hours = TimeRange(
+        start=time[MIDNIGHT_TODAY] + 8 * ONE_HOUR, end=time[MIDNIGHT_TOMORROW]
+    )
+    random = Random(423)
+    reservations = []
+    for _ in range(NUMBER_OF_RESERVATIONS):
+        start = open_hours.start + random.randrange(0, 31) * THIRTY_MINUTES
+        end = start + random.randrange(1, 5) * THIRTY_MINUTES
+        reservations.append(
+            (random.randrange(NUMBER_OF_SEATS), TimeRange(start=start, end=end))
+        )
+    return open_hours, reservations
+
+
+def test_benchmark_subtract_full_xl_day(time: dict[str, datetime]):
+    open_hours, reservations = _xl_day(time)
+
+    start = perf_counter()
+    linear = {seat: [open_hours] for seat in range(NUMBER_OF_SEATS)}
+    for seat, block in reservations:
+        linear[seat] = _linear_subtract(linear[seat], block)
+    linear_latency = perf_counter() - start
+
+    start = perf_counter()
+    indexed = {seat: AvailabilityIndex([open_hours]) for seat in range(NUMBER_OF_SEATS)}
+    for seat, block in reservations:
+        indexed[seat].subtract(block)
+    indexed_latency = perf_counter() - start
+
+    for seat in range(NUMBER_OF_SEATS):
+        assert indexed[seat].ranges == linear[seat]
+
+    print(
+        f"{NUMBER_OF_RESERVATIONS} reservations over {NUMBER_OF_SEATS} seats: "
+        f"linear scan {linear_latency * 1000:.1f}ms, index {indexed_latency * 1000:.1f}ms"
+    )
+
+
+def test_benchmark_fragmented_availability(time: dict[str, datetime]):
+    """A single seat fragmented into hundreds of ranges is where binary search pays off."""
+    open_hours = TimeRange(
+        start=time[MIDNIGHT_TODAY] + 8 * ONE_HOUR, end=time[MIDNIGHT_TOMORROW]
+    )
+    blocks = [
+        TimeRange(
+            start=open_hours.start + i * 2 * ONE_MINUTE,
+            end=open_hours.start + (i * 2 + 1) * ONE_MINUTE,
+        )
+        for i in range(480)
+    ]
+
+    start = perf_counter()
+    linear = [open_hours]
+    for block in blocks:
+        linear = _linear_subtract(linear, block)
+    linear_latency = perf_counter() - start
+
+    start = perf_counter()
+    index = AvailabilityIndex([open_hours])
+    for block in blocks:
+        index.subtract(block)
+    indexed_latency = perf_counter() - start
+
+    assert index.ranges == linear
+    assert len(index.ranges) == 480
+    index.filter_time_ranges_below(TEN_MINUTES)
+    assert len(index.ranges) == 0
+
+    print(
+        f"{len(blocks)} blocks over one seat: "
+        f"linear scan {linear_latency * 1000:.1f}ms, index {indexed_latency * 1000:.1f}ms"
+    )
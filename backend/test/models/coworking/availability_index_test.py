@@ -0,0 +1,66 @@
+"""Unit tests for AvailabilityIndex model."""
+
+from ....models.coworking import AvailabilityIndex, AvailabilityList, TimeRange
+from ...services.coworking.time import *
+
+__authors__ = ["Kris Jordan"]
+__copyright__ = "Copyright 2024"
+__license__ = "MIT"
+
+
+def test_overlapping(time: dict[str, datetime]):
+    index = AvailabilityIndex(
+        [
+            TimeRange(start=time[NOW], end=time[IN_THIRTY_MINUTES]),
+            TimeRange(start=time[IN_ONE_HOUR], end=time[IN_TWO_HOURS]),
+            TimeRange(start=time[IN_THREE_HOURS], end=time[IN_EIGHT_HOURS]),
+        ]
+    )
+    assert index.overlapping(
+        TimeRange(start=time[IN_THIRTY_MINUTES], end=time[IN_ONE_HOUR])
+    ) == (1, 1)
+    assert index.overlapping(
+        TimeRange(start=time[IN_TEN_MINUTES], end=time[IN_THREE_HOURS])
+    ) == (0, 2)
+    assert index.overlapping(
+        TimeRange(start=time[IN_TWO_HOURS], end=time[IN_EIGHT_HOURS] + ONE_HOUR)
+    ) == (2, 3)
+
+
+def test_subtract_across_many(time: dict[str, datetime]):
+    index = AvailabilityIndex(
+        [
+            TimeRange(start=time[NOW], end=time[IN_THIRTY_MINUTES]),
+            TimeRange(start=time[IN_ONE_HOUR], end=time[IN_TWO_HOURS]),
+            TimeRange(start=time[IN_THREE_HOURS], end=time[IN_EIGHT_HOURS]),
+        ]
+    )
+    index.subtract(TimeRange(start=time[IN_TEN_MINUTES], end=time[IN_THREE_HOURS]))
+    assert index.ranges == [
+        TimeRange(start=time[NOW], end=time[IN_TEN_MINUTES]),
+        TimeRange(start=time[IN_THREE_HOURS], end=time[IN_EIGHT_HOURS]),
+    ]
+
+
+def test_subtract_does_not_mutate_shared_ranges(time: dict[str, datetime]):
+    shared = TimeRange(start=time[NOW], end=time[IN_TWO_HOURS])
+    first = AvailabilityList(availability=[shared])
+    second = AvailabilityList(availability=[shared])
+    first.subtract(TimeRange(start=time[IN_ONE_HOUR], end=time[IN_THREE_HOURS]))
+    first.constrain(TimeRange(start=time[IN_THIRTY_MINUTES], end=time[IN_TWO_HOURS]))
+    assert first.availability == [
+        TimeRange(start=time[IN_THIRTY_MINUTES], end=time[IN_ONE_HOUR])
+    ]
+    assert second.availability == [TimeRange(start=time[NOW], end=time[IN_TWO_HOURS])]
+
+
+def test_availability_list_index_is_a_view(time: dict[str, datetime]):
+    availability_list = AvailabilityList(
+        availability=[TimeRange(start=time[NOW], end=time[IN_TWO_HOURS])]
+    )
+    availability_list.index().subtract(
+        TimeRange(start=time[NOW], end=time[IN_ONE_HOUR])
+    )
+    assert availability_list.availability == [
+        TimeRange(start=time[IN_ONE_HOUR], end=time[IN_TWO_HOURS])
+    ]
@@ -84,6 +84,30 @@ def test_get_course_site_roster_filter(course_site_svc: CourseSiteService):
         assert item.last_name == filter
 
 
+def test_get_course_site_roster_cursor(course_site_svc: CourseSiteService):
+    """Ensures that following roster cursors produces the same members as paging by offset."""
+    by_offset = course_site_svc.get_course_site_roster(
+        user_data.instructor,
+        office_hours_data.comp_110_site.id,
+        PaginationParams(page_size=5),
+    )
+
+    pagination_params = PaginationParams(page_size=2)
+    by_cursor = []
+    while True:
+        roster = course_site_svc.get_course_site_roster(
+            user_data.instructor, office_hours_data.comp_110_site.id, pagination_params
+        )
+        by_cursor.extend(roster.items)
+        if roster.next_cursor is None:
+            break
+        pagination_params = pagination_params.model_copy(
+            update={"cursor": roster.next_cursor}
+        )
+
+    assert by_cursor == by_offset.items
+
+
 def test_get_course_site_roster_not_member(course_site_svc: CourseSiteService):
     """Ensures that non-members are unable to access course rosters."""
     pagination_params = PaginationParams()
@@ -0,0 +1,154 @@
+"""Tests for the matrix of applicant priorities behind HiringService#conflict_check."""
+
+from datetime import datetime
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from .....entities.academics.hiring.application_priority_entity import (
+    ApplicationPriorityEntity,
+)
+from .....models.academics.hiring.application_review import ApplicationReviewStatus
+from .....models.academics.hiring.hiring_assignment import (
+    HiringAssignmentDraft,
+    HiringAssignmentStatus,
+)
+from .....services.academics import HiringService
+from .....services.academics.application_priorities import (
+    rebuild_application_priorities,
+)
+
+# Injected Service Fixtures
+from .fixtures import hiring_svc
+
+# Import the setup_teardown fixture explicitly to load entities in database
+from ...core_data import setup_insert_data_fixture as insert_order_0
+from ...academics.term_data import fake_data_fixture as insert_order_1
+from ...academics.course_data import fake_data_fixture as insert_order_2
+from ...academics.section_data import fake_data_fixture as insert_order_3
+from ...room_data import fake_data_fixture as insert_order_4
+from ...office_hours.office_hours_data import fake_data_fixture as insert_order_5
+from .hiring_data import fake_data_fixture as insert_order_6
+
+# Test data
+from ... import user_data
+from ...academics import term_data
+from ...office_hours import office_hours_data
+from . import hiring_data
+
+__authors__ = ["Kris Jordan"]
+__copyright__ = "Copyright 2025"
+__license__ = "MIT"
+
+
+def matrix_rows(session: Session) -> list[tuple]:
+    """The rows of the priority matrix, in key order."""
+    priority = ApplicationPriorityEntity
+    return [
+        tuple(row)
+        for row in session.execute(
+            select(
+                priority.term_id,
+                priority.application_id,
+                priority.course_site_id,
+                priority.student_priority,
+                priority.instructor_priority,
+                priority.hiring_assignment_id,
+            ).order_by(priority.application_id, priority.course_site_id)
+        )
+    ]
+
+
+def prefer(hiring_svc: HiringService, course_site_id: int, application_id: int) -> int:
+    """Move an application to the top of a course site's preferred applicants."""
+    status = hiring_svc.get_status(user_data.root, course_site_id)
+    reviews = status.not_preferred + status.not_processed + status.preferred
+    review = next(r for r in reviews if r.application_id == application_id)
+    for other in status.preferred:
+        other.preference += 1
+    review.status = ApplicationReviewStatus.PREFERRED
+    review.preference = 0
+    hiring_svc.update_status(user_data.root, course_site_id, status)
+    assert review.id is not None
+    return review.id
+
+
+def test_conflict_check_reads_preferred_sites(hiring_svc: HiringService):
+    """The sites preferring an application are listed by the student's ranking."""
+    prefer(
+        hiring_svc, office_hours_data.comp_110_site.id, hiring_data.application_one.id
+    )
+
+    conflict = hiring_svc.conflict_check(user_data.root, hiring_data.application_one.id)
+    assert conflict.application_id == hiring_data.application_one.id
+    assert conflict.assignments == []
+    assert [
+        (p.course_site_id, p.student_priority, p.instructor_priority)
+        for p in conflict.priorities
+    ] == [(office_hours_data.comp_110_site.id, 1, 0)]
+
+
+def test_get_conflicts_lists_applications_preferred_twice(
+    hiring_svc: HiringService,
+):
+    """Applications preferred by more than one site they ranked are conflicts."""
+    prefer(
+        hiring_svc, office_hours_data.comp_110_site.id, hiring_data.application_one.id
+    )
+    assert hiring_svc.get_conflicts(user_data.root, term_data.current_term.id) == []
+
+    prefer(
+        hiring_svc, office_hours_data.comp_301_site.id, hiring_data.application_one.id
+    )
+    conflicts = hiring_svc.get_conflicts(user_data.root, term_data.current_term.id)
+    assert conflicts == [
+        hiring_svc.conflict_check(user_data.root, hiring_data.application_one.id)
+    ]
+    assert [p.course_site_id for p in conflicts[0].priorities] == [
+        office_hours_data.comp_301_site.id,
+        office_hours_data.comp_110_site.id,
+    ]
+
+
+def test_assignments_are_kept_in_sync(session: Session, hiring_svc: HiringService):
+    """Assignments made from a review appear in, and leave, its application's conflict check."""
+    review_id = prefer(
+        hiring_svc, office_hours_data.comp_110_site.id, hiring_data.application_one.id
+    )
+    assignment = hiring_svc.create_hiring_assignment(
+        user_data.root,
+        HiringAssignmentDraft(
+            user_id=user_data.student.id,
+            term_id=term_data.current_term.id,
+            course_site_id=office_hours_data.comp_110_site.id,
+            application_review_id=review_id,
+            level=hiring_data.uta_level,
+            status=HiringAssignmentStatus.DRAFT,
+            position_number="",
+            epar="",
+            i9=False,
+            notes="",
+            created=datetime.now(),
+            modified=datetime.now(),
+        ),
+    )
+    conflict = hiring_svc.conflict_check(user_data.root, hiring_data.application_one.id)
+    assert [a.id for a in conflict.assignments] == [assignment.id]
+
+    # The incremental matrix matches one rebuilt from its sources.
+    incremental = matrix_rows(session)
+    rebuild_application_priorities(session)
+    assert matrix_rows(session) == incremental
+
+    hiring_svc.delete_hiring_assignment(user_data.root, assignment.id)
+    conflict = hiring_svc.conflict_check(user_data.root, hiring_data.application_one.id)
+    assert conflict.assignments == []
+
+
+def test_rebuild_term_keeps_other_terms(session: Session):
+    """Rebuilding one term leaves the matrix as it was."""
+    rows = matrix_rows(session)
+    assert len(rows) > 0
+    assert rebuild_application_priorities(session, term_data.current_term.id) == len(
+        rows
+    )
+    assert matrix_rows(session) == rows
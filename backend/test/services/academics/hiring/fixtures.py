@@ -6,6 +6,7 @@ from sqlalchemy.orm import Session
 
 from .....services.academics.hiring import HiringService
 from .....services.permission import PermissionService
+from .....services.permission_cache import PermissionCache
 
 __authors__ = ["Ajay Gandecha"]
 __copyright__ = "Copyright 2024"
@@ -15,4 +16,6 @@ __license__ = "MIT"
 @pytest.fixture()
 def hiring_svc(session: Session):
     """HiringService fixture."""
-    return HiringService(session, PermissionService(session))
+    return HiringService(
+        session, PermissionService(session, PermissionCache(":memory:"))
+    )
@@ -1,6 +1,9 @@
 import pytest
 from sqlalchemy.orm import Session
 from ....services.reset_table_id_seq import reset_table_id_seq
+from .....services.academics.application_priorities import (
+    rebuild_application_priorities,
+)
 
 from .....entities.application_entity import ApplicationEntity
 from .....entities.section_application_table import section_application_table
@@ -352,6 +355,8 @@ def insert_fake_data(session: Session):
 
     session.commit()
 
+    rebuild_application_priorities(session)
+
 
 @pytest.fixture(autouse=True)
 def fake_data_fixture(session: Session):
@@ -3,7 +3,20 @@
 # PyTest
 import pytest
 from unittest.mock import create_autospec
-
+from sqlalchemy.orm import Session
+
+from datetime import datetime
+from .....entities import UserEntity
+from .....entities.academics import SectionEntity
+from .....entities.academics.section_member_entity import SectionMemberEntity
+from .....entities.academics.hiring.hiring_assignment_entity import (
+    HiringAssignmentEntity,
+)
+from .....entities.application_entity import ApplicationEntity
+from .....entities.office_hours import CourseSiteEntity
+from .....models.academics.hiring.hiring_assignment import HiringAssignmentStatus
+from .....models.academics.section_member import RosterRole
+from .....entities.section_application_table import section_application_table
 from backend.services.exceptions import (
     UserPermissionException,
     ResourceNotFoundException,
@@ -36,8 +49,9 @@ from .hiring_data import fake_data_fixture as insert_order_6
 
 # Test data
 from ... import user_data
-from ...academics import section_data, term_data
+from ...academics import course_data, section_data, term_data
 from ...office_hours import office_hours_data
+from ...query_counter import count_queries
 from . import hiring_data
 
 __authors__ = ["Ajay Gandecha"]
@@ -69,6 +83,54 @@ def test_get_status(hiring_svc: HiringService):
     )
 
 
+def add_applicants(session: Session, count: int) -> None:
+    """Add applicants to COMP 110 who each applied to one of its sections."""
+    for i in range(count):
+        applicant = UserEntity(
+            pid=900_000_000 + i,
+            onyen=f"applicant{i}",
+            email=f"applicant{i}@unc.edu",
+            first_name="Applicant",
+            last_name=str(i),
+        )
+        application = ApplicationEntity(
+            user=applicant, type="new_uta", term_id=term_data.current_term.id
+        )
+        session.add(application)
+        session.flush()
+        session.execute(
+            section_application_table.insert().values(
+                section_id=section_data.comp_110_001_current_term.id,
+                application_id=application.id,
+                preference=0,
+            )
+        )
+    session.commit()
+
+
+def test_get_status_query_count_is_constant(
+    session: Session, hiring_svc: HiringService
+):
+    """Test that the hiring board loads in the same number of queries for any number of applicants."""
+    hiring_svc.get_status(user_data.instructor, office_hours_data.comp_110_site.id)
+    session.expire_all()
+    with count_queries(session) as few_applicants:
+        seeded = hiring_svc.get_status(
+            user_data.instructor, office_hours_data.comp_110_site.id
+        )
+
+    add_applicants(session, 25)
+    hiring_svc.get_status(user_data.instructor, office_hours_data.comp_110_site.id)
+    session.expire_all()
+    with count_queries(session) as many_applicants:
+        hiring_status = hiring_svc.get_status(
+            user_data.instructor, office_hours_data.comp_110_site.id
+        )
+
+    assert len(hiring_status.not_processed) == len(seeded.not_processed) + 25
+    assert many_applicants.count == few_applicants.count
+
+
 def test_get_status_site_not_found(hiring_svc: HiringService):
     """Ensures that hiring is not possible if a course site does not exist."""
     with pytest.raises(ResourceNotFoundException):
@@ -116,6 +178,47 @@ def test_update_status(hiring_svc: HiringService):
     )
 
 
+def test_update_status_unchanged_is_no_op(session: Session, hiring_svc: HiringService):
+    """Test that resending an unchanged hiring board writes nothing."""
+    status = hiring_svc.get_status(
+        user_data.instructor, office_hours_data.comp_110_site.id
+    )
+    with count_queries(session) as counter:
+        new_status = hiring_svc.update_status(
+            user_data.instructor, office_hours_data.comp_110_site.id, status
+        )
+    assert new_status == status
+    assert not any(
+        statement.lstrip().upper().startswith(("UPDATE", "INSERT"))
+        for statement in counter.statements
+    )
+
+
+def test_update_status_changes_in_one_statement(
+    session: Session, hiring_svc: HiringService
+):
+    """Test that every changed review is updated by a single statement."""
+    status = hiring_svc.get_status(
+        user_data.instructor, office_hours_data.comp_110_site.id
+    )
+    status.not_processed[0].preference = 1
+    status.not_processed[1].preference = 0
+    status.preferred[0].status = ApplicationReviewStatus.NOT_PREFERRED
+    with count_queries(session) as counter:
+        new_status = hiring_svc.update_status(
+            user_data.instructor, office_hours_data.comp_110_site.id, status
+        )
+    updates = [
+        statement
+        for statement in counter.statements
+        if statement.lstrip().upper().startswith("UPDATE")
+    ]
+    assert len(updates) == 1
+    assert len(new_status.preferred) == 0
+    assert len(new_status.not_preferred) == 2
+    assert new_status.not_processed[0].id == status.not_processed[1].id
+
+
 def test_update_status_site_not_found(hiring_svc: HiringService):
     """Ensures that updating hiring is not possible if a course site does not exist."""
     status = hiring_svc.get_status(
@@ -155,6 +258,95 @@ def test_get_hiring_admin_overview(hiring_svc: HiringService):
     assert len(hiring_admin_overview.sites) == 2
 
 
+def add_course_sites(session: Session, count: int) -> None:
+    """Add course sites to the current term, each with a staffed section and a hire."""
+    for i in range(count):
+        course_site = CourseSiteEntity(
+            title=f"Benchmark Site {i}", term_id=term_data.current_term.id
+        )
+        section = SectionEntity(
+            course_id=course_data.comp_110.id,
+            number=f"9{i:02}",
+            term_id=term_data.current_term.id,
+            enrolled=120,
+            total_seats=120,
+            course_site=course_site,
+        )
+        session.add_all(
+            [
+                course_site,
+                section,
+                SectionMemberEntity(
+                    section=section,
+                    user_id=user_data.instructor.id,
+                    member_role=RosterRole.INSTRUCTOR,
+                ),
+                HiringAssignmentEntity(
+                    course_site=course_site,
+                    user_id=user_data.student.id,
+                    term_id=term_data.current_term.id,
+                    hiring_level_id=hiring_data.uta_level.id,
+                    status=HiringAssignmentStatus.COMMIT,
+                    position_number="",
+                    epar="",
+                    i9=False,
+                    notes="",
+                    created=datetime.now(),
+                    modified=datetime.now(),
+                ),
+            ]
+        )
+    session.commit()
+
+
+def test_get_hiring_admin_overview_totals(session: Session, hiring_svc: HiringService):
+    """Ensures each site's totals match those computed from its sections and hires."""
+    add_course_sites(session, 2)
+    overview = hiring_svc.get_hiring_admin_overview(
+        user_data.root, term_data.current_term.id
+    )
+    assert len(overview.sites) == 4
+    for site in overview.sites:
+        course_site = session.get(CourseSiteEntity, site.course_site_id)
+        assert course_site is not None
+        enrollment = sum(section.enrolled for section in course_site.sections)
+        assert site.total_enrollment == enrollment
+        assert len(site.sections) == len(course_site.sections)
+        assert len(site.assignments) == len(course_site.hiring_assignments)
+        assert site.total_cost == pytest.approx(
+            sum(
+                assignment.hiring_level.salary
+                for assignment in course_site.hiring_assignments
+            )
+        )
+        assert site.coverage == pytest.approx(
+            enrollment / 60.0 - 0.25 * len(course_site.hiring_assignments)
+        )
+    assert [user.id for user in overview.sites[-1].instructors] == [
+        user_data.instructor.id
+    ]
+
+
+def test_get_hiring_admin_overview_query_count_is_constant(
+    session: Session, hiring_svc: HiringService
+):
+    """Ensures the overview takes the same number of queries for any number of sites."""
+    hiring_svc.get_hiring_admin_overview(user_data.root, term_data.current_term.id)
+    session.expire_all()
+    with count_queries(session) as few_sites:
+        hiring_svc.get_hiring_admin_overview(user_data.root, term_data.current_term.id)
+
+    add_course_sites(session, 20)
+    session.expire_all()
+    with count_queries(session) as many_sites:
+        overview = hiring_svc.get_hiring_admin_overview(
+            user_data.root, term_data.current_term.id
+        )
+
+    assert len(overview.sites) == 22
+    assert many_sites.count == few_sites.count
+
+
 def test_get_hiring_admin_overview_checks_permission(hiring_svc: HiringService):
     """Ensures that nobody else is able to check the hiring data."""
     with pytest.raises(UserPermissionException):
@@ -299,7 +491,63 @@ def test_create_missing_course_sites_for_term(
 def test_get_phd_applicants(hiring_svc: HiringService):
     user = user_data.root
     term = term_data.current_term
-    applicants = hiring_svc.get_phd_applicants(user, term.id)
+    applicants = list(hiring_svc.get_phd_applicants(user, term.id))
     assert len(applicants) > 0
     for applicant in applicants:
         assert applicant.program_pursued in {"PhD", "PhD (ABD)"}
+    assert applicants[0].student_preferences == [
+        f"{section_data.comp_301_001_current_term.course_id}.{section_data.comp_301_001_current_term.number}"
+    ]
+
+
+def test_get_hiring_summary_for_csv(hiring_svc: HiringService):
+    """Test that the term's committed hires are streamed as CSV rows."""
+    rows = list(
+        hiring_svc.get_hiring_summary_for_csv(user_data.root, term_data.current_term.id)
+    )
+    assert len(rows) == len(hiring_data.hiring_assignments)
+    assert rows[0].onyen == user_data.student.onyen
+    assert rows[0].level_title == hiring_data.uta_level.title
+
+
+def test_get_hiring_summary_for_csv_checks_permission(hiring_svc: HiringService):
+    """Test that permission is checked before any CSV rows are streamed."""
+    hiring_svc._permission = create_autospec(hiring_svc._permission)
+    hiring_svc.get_hiring_summary_for_csv(user_data.root, term_data.current_term.id)
+    hiring_svc._permission.enforce.assert_called_with(
+        user_data.root, "hiring.summary", "*"
+    )
+
+
+def test_get_course_site_hiring_status_csv(
+    hiring_svc: HiringService, monkeypatch: pytest.MonkeyPatch
+):
+    """Test that a site's applications are streamed as CSV rows across batches."""
+    monkeypatch.setattr("backend.services.academics.hiring.CSV_BATCH_SIZE", 1)
+    rows = list(
+        hiring_svc.get_course_site_hiring_status_csv(
+            user_data.instructor, office_hours_data.comp_110_site.id
+        )
+    )
+    assert len(rows) == len(hiring_data.reviews)
+    assert [row.status for row in rows] == [
+        review.status for review in hiring_data.reviews
+    ]
+
+
+def test_get_course_site_hiring_status_csv_not_instructor(hiring_svc: HiringService):
+    """Test that non-instructors are rejected before any CSV rows are streamed."""
+    with pytest.raises(UserPermissionException):
+        hiring_svc.get_course_site_hiring_status_csv(
+            user_data.student, office_hours_data.comp_110_site.id
+        )
+
+
+def test_get_assignment_summary_for_instructors_csv(hiring_svc: HiringService):
+    """Test that a site's hires are streamed as CSV rows for its instructors."""
+    rows = list(
+        hiring_svc.get_assignment_summary_for_instructors_csv(
+            user_data.instructor, office_hours_data.comp_110_site.id
+        )
+    )
+    assert [row.onyen for row in rows] == [user_data.student.onyen]
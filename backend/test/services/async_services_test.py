@@ -0,0 +1,130 @@
+"""Tests for the async service variants served over an AsyncSession."""
+
+import pytest
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from ...api.async_services import (
+    async_event_svc,
+    async_office_hours_svc,
+    async_signage_svc,
+    async_status_svc,
+)
+from ...models import EventPaginationParams
+from ...services import SignageService
+from ...services.coworking.availability_snapshot import AvailabilitySnapshot
+from ...services.exceptions import CoursePermissionException
+from ...services.office_hours import OfficeHoursService
+from ...services.office_hours.queue_index import OfficeHoursQueueIndex
+from ...services.permission_cache import PermissionCache
+from ...services.user_cache import UserCache
+
+# Imported fixtures provide dependencies injected for the tests as parameters.
+from .fixtures import signage_svc
+from .coworking.time import time
+from .coworking.fixtures import *
+from .office_hours.fixtures import oh_svc, queue_index
+
+# Data Setup and Injected Service Fixtures
+from .core_data import setup_insert_data_fixture as insert_order_0
+from .academics.term_data import fake_data_fixture as insert_order_1
+from .academics.course_data import fake_data_fixture as insert_order_2
+from .academics.section_data import fake_data_fixture as insert_order_3
+from .room_data import fake_data_fixture as insert_order_4
+from .coworking.seat_data import fake_data_fixture as insert_order_5
+from .coworking.operating_hours_data import fake_data_fixture as insert_order_6
+from .coworking.reservation.reservation_data import (
+    fake_data_fixture as insert_order_7,
+)
+from .office_hours.office_hours_data import (
+    fake_data_fixture as insert_order_8,
+)
+from .signage_data import fake_data_fixture as insert_order_9
+from .articles.article_data import fake_data_fixture as insert_order_10
+
+#  Import the fake model data in a namespace for test assertions
+from . import user_data
+from .office_hours import office_hours_data
+from .coworking.reservation import reservation_data
+
+__authors__ = ["Kris Jordan"]
+__copyright__ = "Copyright 2025"
+__license__ = "MIT"
+
+
+@pytest.mark.asyncio
+async def test_get_fast_data_async(
+    async_session: AsyncSession, signage_svc: SignageService
+):
+    svc = await async_signage_svc(
+        async_session, PermissionCache(":memory:"), AvailabilitySnapshot()
+    )
+    fast_data = await svc.run(SignageService.get_fast_data)
+    expected = signage_svc.get_fast_data()
+    assert fast_data.active_office_hours == expected.active_office_hours
+    assert fast_data.available_rooms == expected.available_rooms
+    # Availability begins at the moment it is computed, so only the seats are compared.
+    assert sorted(seat.id for seat in fast_data.seat_availability) == sorted(
+        seat.id for seat in expected.seat_availability
+    )
+
+
+@pytest.mark.asyncio
+async def test_get_slow_data_async(
+    async_session: AsyncSession, signage_svc: SignageService
+):
+    svc = await async_signage_svc(
+        async_session, PermissionCache(":memory:"), AvailabilitySnapshot()
+    )
+    slow_data = await svc.run(SignageService.get_slow_data)
+    assert slow_data == signage_svc.get_slow_data()
+
+
+@pytest.mark.asyncio
+async def test_get_coworking_status_async(async_session: AsyncSession):
+    svc = await async_status_svc(
+        async_session, PermissionCache(":memory:"), AvailabilitySnapshot()
+    )
+    status = await svc.run(lambda svc: svc.get_coworking_status(user_data.user))
+    assert reservation_data.reservation_1.id in [
+        reservation.id for reservation in status.my_reservations
+    ]
+    assert len(status.seat_availability) > 0
+    assert len(status.operating_hours) > 0
+
+
+@pytest.mark.asyncio
+async def test_get_office_hour_queue_async(
+    async_session: AsyncSession, oh_svc: OfficeHoursService
+):
+    svc = await async_office_hours_svc(async_session, OfficeHoursQueueIndex())
+    queue = await svc.run(
+        lambda svc: svc.get_office_hour_queue(
+            user_data.instructor, office_hours_data.comp_110_current_office_hours.id
+        )
+    )
+    assert queue == oh_svc.get_office_hour_queue(
+        user_data.instructor, office_hours_data.comp_110_current_office_hours.id
+    )
+
+
+@pytest.mark.asyncio
+async def test_get_office_hour_queue_async_not_member(async_session: AsyncSession):
+    svc = await async_office_hours_svc(async_session, OfficeHoursQueueIndex())
+    with pytest.raises(CoursePermissionException):
+        await svc.run(
+            lambda svc: svc.get_office_hour_queue(
+                user_data.user, office_hours_data.comp_110_current_office_hours.id
+            )
+        )
+
+
+@pytest.mark.asyncio
+async def test_get_paginated_events_async(async_session: AsyncSession):
+    svc = await async_event_svc(async_session, PermissionCache(":memory:"), UserCache())
+    events = await svc.run(
+        lambda svc: svc.get_paginated_events(
+            EventPaginationParams(filter="Workshop"), user_data.ambassador
+        )
+    )
+    assert len(events.items) == 1
@@ -1,8 +1,10 @@
 """Shared pytest fixtures for database dependent tests."""
 
 import pytest
+import pytest_asyncio
 
 from sqlalchemy import create_engine, text, Engine
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
 from sqlalchemy.orm import Session
 from sqlalchemy.exc import OperationalError, ProgrammingError
 
@@ -56,3 +58,17 @@ def session(test_engine: Engine):
         yield session
     finally:
         session.close()
+
+
+@pytest_asyncio.fixture()
+async def async_session(session: Session):
+    """AsyncSession over the test database, which sees the data committed through `session`."""
+    engine = create_async_engine(
+        _engine_str(POSTGRES_DATABASE, dialect="postgresql+asyncpg")
+    )
+    async_session = AsyncSession(engine)
+    try:
+        yield async_session
+    finally:
+        await async_session.close()
+        await engine.dispose()
@@ -0,0 +1,56 @@
+"""Tests for the process-wide AvailabilitySnapshot."""
+
+from datetime import timedelta
+from unittest.mock import MagicMock
+
+from ....services.coworking.availability_snapshot import (
+    AvailabilitySnapshot,
+    availability_snapshot,
+    get_availability_snapshot,
+)
+
+__authors__ = ["Kris Jordan"]
+__copyright__ = "Copyright 2024"
+__license__ = "MIT"
+
+
+def test_get_computes_once_within_ttl():
+    snapshot = AvailabilitySnapshot(ttl=timedelta(minutes=1))
+    compute = MagicMock(return_value=[])
+    assert snapshot.get(compute) == []
+    assert snapshot.get(compute) == []
+    compute.assert_called_once()
+
+
+def test_get_recomputes_after_ttl():
+    snapshot = AvailabilitySnapshot(ttl=timedelta(0))
+    compute = MagicMock(return_value=[])
+    snapshot.get(compute)
+    snapshot.get(compute)
+    assert compute.call_count == 2
+
+
+def test_invalidate_forces_recompute():
+    snapshot = AvailabilitySnapshot(ttl=timedelta(minutes=1))
+    compute = MagicMock(return_value=[])
+    snapshot.get(compute)
+    snapshot.invalidate()
+    snapshot.get(compute)
+    assert compute.call_count == 2
+
+
+def test_snapshot_invalidated_during_compute_is_not_stored():
+    snapshot = AvailabilitySnapshot(ttl=timedelta(minutes=1))
+
+    def compute_while_invalidated():
+        snapshot.invalidate()
+        return []
+
+    snapshot.get(compute_while_invalidated)
+    compute = MagicMock(return_value=[])
+    snapshot.get(compute)
+    compute.assert_called_once()
+
+
+def test_get_availability_snapshot_is_process_wide():
+    assert get_availability_snapshot() is availability_snapshot
@@ -0,0 +1,116 @@
+"""Tests for the trigger-maintained monthly check-in leaderboard and its rebuilds."""
+
+from datetime import datetime, timedelta
+from sqlalchemy import select, update
+from sqlalchemy.orm import Session
+
+from ....entities.coworking import CheckinLeaderboardEntity, ReservationEntity
+from ....models.coworking import ReservationState
+from ....services.coworking import ReservationService
+from ....services.coworking.checkin_leaderboard import (
+    month_of,
+    rebuild_checkin_leaderboard,
+)
+
+# Imported fixtures provide dependencies injected for the tests as parameters.
+from .fixtures import reservation_svc, permission_svc, seat_svc, policy_svc
+from .fixtures import operating_hours_svc
+from .time import *
+
+# Data Setup and Injected Service Fixtures
+from ..core_data import setup_insert_data_fixture as insert_order_0
+from ..room_data import fake_data_fixture as insert_order_1
+from .seat_data import fake_data_fixture as insert_order_2
+from .operating_hours_data import fake_data_fixture as insert_order_3
+from .reservation.reservation_data import fake_data_fixture as insert_order_4
+from ..signage_data import fake_data_fixture as insert_order_5
+
+#  Import the fake model data in a namespace for test assertions
+from .. import user_data
+from ..signage_data import checked_out_reservation_1
+
+__authors__ = ["Kris Jordan"]
+__copyright__ = "Copyright 2024"
+__license__ = "MIT"
+
+
+def leaderboard(session: Session, month: datetime) -> dict[int, int]:
+    rows = session.execute(
+        select(CheckinLeaderboardEntity.user_id, CheckinLeaderboardEntity.checkouts)
+        .where(CheckinLeaderboardEntity.month == month_of(month))
+        .where(CheckinLeaderboardEntity.checkouts > 0)
+    ).all()
+    return dict(rows)
+
+
+def history_counts(session: Session, month: datetime) -> dict[int, int]:
+    """Recount a month from scratch, as the leaderboard must always agree with it."""
+    rebuild_checkin_leaderboard(session, month)
+    return leaderboard(session, month)
+
+
+def test_inserted_checkouts_are_counted(session: Session, time: dict[str, datetime]):
+    counts = leaderboard(session, time[NOW])
+    assert counts[user_data.ambassador.id] > counts[user_data.root.id]
+    assert counts == history_counts(session, time[NOW])
+
+
+def test_check_out_is_counted(session: Session, time: dict[str, datetime]):
+    before = leaderboard(session, time[NOW])
+    session.execute(
+        update(ReservationEntity)
+        .where(ReservationEntity.state == ReservationState.CHECKED_IN)
+        .values(state=ReservationState.CHECKED_OUT, end=time[NOW])
+    )
+    session.commit()
+
+    after = leaderboard(session, time[NOW])
+    assert sum(after.values()) > sum(before.values())
+    assert after == history_counts(session, time[NOW])
+
+
+def test_leaving_checked_out_is_uncounted(session: Session, time: dict[str, datetime]):
+    before = leaderboard(session, time[NOW])
+    reservation = session.get(ReservationEntity, checked_out_reservation_1.id)
+    reservation.state = ReservationState.CHECKED_IN
+    session.commit()
+
+    after = leaderboard(session, time[NOW])
+    ambassador = user_data.ambassador.id
+    assert after[ambassador] == before[ambassador] - 1
+    assert after == history_counts(session, time[NOW])
+
+
+def test_moving_checkout_to_another_month(session: Session, time: dict[str, datetime]):
+    last_month = month_of(time[NOW]) - timedelta(days=1)
+    reservation = session.get(ReservationEntity, checked_out_reservation_1.id)
+    reservation.start = datetime.combine(last_month, datetime.min.time())
+    reservation.end = reservation.start + timedelta(hours=1)
+    session.commit()
+
+    assert leaderboard(session, last_month) == {user_data.ambassador.id: 1}
+    assert leaderboard(session, time[NOW]) == history_counts(session, time[NOW])
+
+
+def test_archived_checkouts_stay_counted(
+    session: Session,
+    reservation_svc: ReservationService,
+    time: dict[str, datetime],
+):
+    before = leaderboard(session, time[NOW])
+    assert reservation_svc.archive_reservations(time[IN_ONE_HOUR]) > 0
+    assert leaderboard(session, time[NOW]) == before
+    assert history_counts(session, time[NOW]) == before
+
+
+def test_rebuild_past_month(session: Session, time: dict[str, datetime]):
+    last_month = month_of(time[NOW]) - timedelta(days=1)
+    session.add(
+        CheckinLeaderboardEntity(
+            month=month_of(last_month), user_id=user_data.root.id, checkouts=7
+        )
+    )
+    session.commit()
+
+    assert rebuild_checkin_leaderboard(session, last_month) == 0
+    assert leaderboard(session, last_month) == {}
@@ -14,6 +14,8 @@ from ....services.coworking import (
     PolicyService,
     StatusService,
 )
+from ....services.coworking.availability_snapshot import AvailabilitySnapshot
+from ....services.permission_cache import PermissionCache
 
 __authors__ = [
     "Kris Jordan",
@@ -29,7 +31,7 @@ __license__ = "MIT"
 @pytest.fixture()
 def permission_svc(session: Session):
     """PermissionService fixture."""
-    return PermissionService(session)
+    return PermissionService(session, PermissionCache(":memory:"))
 
 
 @pytest.fixture()
@@ -64,9 +66,14 @@ def reservation_svc(
     operating_hours_svc: OperatingHoursService,
     seat_svc: SeatService,
 ):
-    """ReservationService fixture."""
+    """ReservationService fixture with its own AvailabilitySnapshot, isolated between tests."""
     return ReservationService(
-        session, permission_svc, policy_svc, operating_hours_svc, seat_svc
+        session,
+        permission_svc,
+        policy_svc,
+        operating_hours_svc,
+        seat_svc,
+        AvailabilitySnapshot(),
     )
 
 
@@ -2,6 +2,7 @@
 
 from ....services.coworking import PolicyService
 from .fixtures import policy_svc
+from ..core_data import user_data
 
 
 from ....services.coworking.policy import OH_HOURS, MONDAY, TUESDAY, WEDNESDAY, THURSDAY, FRIDAY, SATURDAY, SUNDAY
@@ -57,4 +58,11 @@ def test_office_hours_sunday(policy_svc: PolicyService):
     today = datetime.now()
     days_to_sunday = (today.weekday() - 6) % 7
     sunday = today - timedelta(days=days_to_sunday)
-    assert policy_svc.office_hours(sunday) == OH_HOURS[SATURDAY]
\ No newline at end of file
+    assert policy_svc.office_hours(sunday) == OH_HOURS[SATURDAY]
+
+def test_walkin_availability_window(policy_svc: PolicyService):
+    """The shared walkin availability follows the walkin policy of every subject."""
+    for subject in [user_data.user, user_data.ambassador, user_data.root]:
+        assert policy_svc.walkin_availability_window() == policy_svc.walkin_window(
+            subject
+        ) + 3 * policy_svc.walkin_initial_duration(subject)
@@ -0,0 +1,117 @@
+"""ReservationService#archive_reservations and reservation history tests"""
+
+from sqlalchemy import Engine, select, func
+from sqlalchemy.orm import Session
+
+from .....services.coworking import ReservationService
+from .....services.coworking.reservation_history import (
+    includes_archive,
+    reservation_user_history,
+)
+from .....entities.coworking import ReservationEntity, ReservationArchiveEntity
+
+# Imported fixtures provide dependencies injected for the tests as parameters.
+# Dependent fixtures (seat_svc) are required to be imported in the testing module.
+from ..fixtures import (
+    reservation_svc,
+    permission_svc,
+    seat_svc,
+    policy_svc,
+    operating_hours_svc,
+)
+from ..time import *
+
+# Import the setup_teardown fixture explicitly to load entities in database.
+# The order in which these fixtures run is dependent on their imported alias.
+# Since there are relationship dependencies between the entities, order matters.
+from ...core_data import setup_insert_data_fixture as insert_order_0
+from ..operating_hours_data import fake_data_fixture as insert_order_1
+from ...room_data import fake_data_fixture as insert_order_2
+from ..seat_data import fake_data_fixture as insert_order_3
+from .reservation_data import fake_data_fixture as insert_order_4
+
+# Import the fake model data in a namespace for test assertions
+from ...core_data import user_data
+from .. import seat_data
+from . import reservation_data
+
+__authors__ = ["Kris Jordan"]
+__copyright__ = "Copyright 2024"
+__license__ = "MIT"
+
+
+def test_archive_reservations_noop(
+    session: Session, reservation_svc: ReservationService, time: dict[str, datetime]
+):
+    assert reservation_svc.archive_reservations(time[NOW]) == 0
+    assert session.scalar(select(func.count(ReservationArchiveEntity.id))) == 0
+
+
+def test_archive_reservations_moves_finished_reservations(
+    session: Session, reservation_svc: ReservationService, time: dict[str, datetime]
+):
+    assert reservation_svc.archive_reservations(time[IN_ONE_HOUR], batch_size=1) == 2
+
+    archived_ids = {
+        reservation_data.reservation_2.id,
+        reservation_data.reservation_3.id,
+    }
+    hot_ids = set(session.scalars(select(ReservationEntity.id)).all())
+    assert hot_ids.isdisjoint(archived_ids)
+    assert reservation_data.reservation_1.id in hot_ids
+
+    archived = session.get(ReservationArchiveEntity, reservation_data.reservation_2.id)
+    assert archived is not None
+    assert [user.id for user in archived.users] == [user_data.ambassador.id]
+    assert [seat.id for seat in archived.seats] == [seat_data.monitor_seat_01.id]
+
+
+def test_archive_reservations_skips_locked_reservations(
+    session: Session,
+    test_engine: Engine,
+    reservation_svc: ReservationService,
+    time: dict[str, datetime],
+):
+    with Session(test_engine) as concurrent_sweep:
+        concurrent_sweep.execute(
+            select(ReservationEntity.id)
+            .where(ReservationEntity.id == reservation_data.reservation_2.id)
+            .with_for_update()
+        )
+        assert reservation_svc.archive_reservations(time[IN_ONE_HOUR]) == 1
+        assert (
+            session.get(ReservationArchiveEntity, reservation_data.reservation_3.id)
+            is not None
+        )
+        concurrent_sweep.rollback()
+
+    assert reservation_svc.archive_reservations(time[IN_ONE_HOUR]) == 1
+    assert (
+        session.get(ReservationArchiveEntity, reservation_data.reservation_2.id)
+        is not None
+    )
+
+
+def test_get_reservation_from_archive(
+    reservation_svc: ReservationService, time: dict[str, datetime]
+):
+    reservation_svc.archive_reservations(time[IN_ONE_HOUR])
+    reservation = reservation_svc.get_reservation(
+        user_data.ambassador, reservation_data.reservation_2.id
+    )
+    assert reservation.id == reservation_data.reservation_2.id
+    assert reservation.start == reservation_data.reservation_2.start
+    assert reservation.seats[0].id == seat_data.monitor_seat_01.id
+
+
+def test_reservation_user_history_spans_archive(
+    session: Session, reservation_svc: ReservationService, time: dict[str, datetime]
+):
+    reservation_svc.archive_reservations(time[IN_ONE_HOUR])
+    since = time[NOW] - 365 * ONE_DAY
+    assert includes_archive(since)
+
+    history = reservation_user_history(since)
+    rows = session.execute(select(history.c.id, history.c.user_id)).all()
+    assert (reservation_data.reservation_2.id, user_data.ambassador.id) in rows
+    assert (reservation_data.reservation_1.id, user_data.user.id) in rows
@@ -0,0 +1,175 @@
+"""Tests for the seat claim exclusion constraint backing ReservationService#draft_reservation"""
+
+import pytest
+from sqlalchemy import select, func
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from .....services.coworking import ReservationService
+from .....services.coworking.reservation import ReservationException
+from .....models.coworking import (
+    ReservationRequest,
+    ReservationState,
+    SeatAvailability,
+    TimeRange,
+)
+from .....models.room import RoomPartial
+from .....models.coworking.seat import SeatIdentity
+from .....entities.coworking import ReservationEntity, SeatEntity
+from .....entities import UserEntity
+
+# Imported fixtures provide dependencies injected for the tests as parameters.
+# Dependent fixtures (seat_svc) are required to be imported in the testing module.
+from ..fixtures import (
+    reservation_svc,
+    permission_svc,
+    seat_svc,
+    policy_svc,
+    operating_hours_svc,
+)
+from ..time import *
+
+# Import the setup_teardown fixture explicitly to load entities in database.
+# The order in which these fixtures run is dependent on their imported alias.
+# Since there are relationship dependencies between the entities, order matters.
+from ...core_data import setup_insert_data_fixture as insert_order_0
+from ..operating_hours_data import fake_data_fixture as insert_order_1
+from ...room_data import fake_data_fixture as insert_order_2
+from ..seat_data import fake_data_fixture as insert_order_3
+from .reservation_data import fake_data_fixture as insert_order_4
+
+# Import the fake model data in a namespace for test assertions
+from ...core_data import user_data
+from .. import seat_data
+from . import reservation_data
+
+__authors__ = ["Kris Jordan"]
+__copyright__ = "Copyright 2024"
+__license__ = "MIT"
+
+
+def _reservation(
+    session: Session,
+    seat_id: int,
+    start: datetime,
+    end: datetime,
+    state: ReservationState = ReservationState.CONFIRMED,
+    created_at: datetime | None = None,
+) -> ReservationEntity:
+    return ReservationEntity(
+        start=start,
+        end=end,
+        state=state,
+        walkin=False,
+        users=[session.get(UserEntity, user_data.root.id)],
+        seats=[session.get(SeatEntity, seat_id)],
+        created_at=created_at or start,
+    )
+
+
+def test_overlapping_seat_claims_rejected(session: Session, time: dict[str, datetime]):
+    """reservation_1 is checked in to monitor_seat_00 until ten minutes from now."""
+    session.add(
+        _reservation(
+            session,
+            seat_data.monitor_seat_00.id,
+            time[NOW],
+            time[IN_THIRTY_MINUTES],
+        )
+    )
+    with pytest.raises(IntegrityError):
+        session.commit()
+
+
+def test_inactive_seat_claims_do_not_conflict(
+    session: Session, time: dict[str, datetime]
+):
+    """reservation_3 is a cancelled reservation of monitor_seat_10 for the same window."""
+    session.add(
+        _reservation(
+            session,
+            seat_data.monitor_seat_10.id,
+            time[THIRTY_MINUTES_AGO],
+            time[IN_THIRTY_MINUTES],
+        )
+    )
+    session.commit()
+
+
+def test_checkout_releases_seat_claim(session: Session, time: dict[str, datetime]):
+    checked_in = session.get(ReservationEntity, reservation_data.reservation_1.id)
+    checked_in.state = ReservationState.CHECKED_OUT
+    session.commit()
+
+    session.add(
+        _reservation(
+            session,
+            seat_data.monitor_seat_00.id,
+            time[NOW],
+            time[IN_THIRTY_MINUTES],
+        )
+    )
+    session.commit()
+
+
+def test_draft_reservation_concurrent_seat_conflict(
+    session: Session, reservation_svc: ReservationService, time: dict[str, datetime]
+):
+    """Simulates a draft whose availability check ran before another draft claimed the seat."""
+    reservation_svc.seat_availability = lambda seats, bounds: [
+        SeatAvailability(
+            **seat_data.monitor_seat_00.model_dump(),
+            availability=[TimeRange(start=bounds.start, end=bounds.end)],
+        )
+    ]
+    before = session.scalar(select(func.count(ReservationEntity.id)))
+    with pytest.raises(ReservationException):
+        reservation_svc.draft_reservation(
+            user_data.ambassador,
+            reservation_data.test_request(
+                {"seats": [SeatIdentity(id=seat_data.monitor_seat_00.id)]}
+            ),
+        )
+    assert session.scalar(select(func.count(ReservationEntity.id))) == before
+
+
+def test_draft_reservation_reclaims_expired_seat_claim(
+    session: Session, reservation_svc: ReservationService, time: dict[str, datetime]
+):
+    """A draft that has timed out but not yet been swept still holds its seat claim."""
+    stale = _reservation(
+        session,
+        seat_data.monitor_seat_10.id,
+        time[NOW],
+        time[IN_THIRTY_MINUTES],
+        state=ReservationState.DRAFT,
+        created_at=time[NOW] - 2 * TEN_MINUTES,
+    )
+    session.add(stale)
+    session.commit()
+    stale_id = stale.id
+
+    reservation = reservation_svc.draft_reservation(
+        user_data.ambassador,
+        reservation_data.test_request(
+            {"seats": [SeatIdentity(id=seat_data.monitor_seat_10.id)]}
+        ),
+    )
+    assert reservation.seats[0].id == seat_data.monitor_seat_10.id
+    session.expire_all()
+    assert session.get(ReservationEntity, stale_id).state == ReservationState.CANCELLED
+
+
+def test_draft_reservation_other_integrity_errors_are_raised(
+    reservation_svc: ReservationService, time: dict[str, datetime]
+):
+    """Only an overlapping seat claim is reported as the seat no longer being available."""
+    request = ReservationRequest(
+        seats=[],
+        room=RoomPartial(id="SN999"),
+        start=time[IN_ONE_HOUR],
+        end=time[IN_ONE_HOUR] + TEN_MINUTES,
+        users=[user_data.ambassador],
+    )
+    with pytest.raises(IntegrityError):
+        reservation_svc.draft_reservation(user_data.ambassador, request)
@@ -1,8 +1,9 @@
-"""Tests for ReservationService#get_map_reservations_for_date and helper functions."""
+"""Tests for ReservationService#get_map_reservations_for_date and helper functions.
+
+The painting of the map itself is tested in `room_slot_map_test.py`."""
 
 from backend.models.coworking.availability import RoomState
 from backend.models.coworking.reservation import ReservationState
-from datetime import date, time as Time
 
 from .....services.coworking import ReservationService, PolicyService
 
@@ -43,101 +44,6 @@ __copyright__ = "Copyright 2023-24"
 __license__ = "MIT"
 
 
-def test_transform_date_map_for_unavailable_simple(reservation_svc: ReservationService):
-    """
-    Validates the transformation of the date map to indicate unavailable time slots.
-
-    This test ensures that time slots are appropriately grayed out for all other rooms
-    once a user has made a reservation. For example, if Sally Student reserves room SN135
-    from 1 pm to 3 pm on February 29, she should be prevented from booking any other room
-    during these hours. The function verifies that the data map returned by the endpoint
-    accurately reflects these unavailable slots, enhancing the user experience by
-    preventing double bookings.
-    """
-
-    sample_date_map_1 = {
-        "SN135": [0, 0, 0, 0],
-        "SN137": [0, 0, 4, 4],
-        "SN139": [0, 0, 0, 0],
-    }
-
-    expected_transformed_date_map_1 = {
-        "SN135": [0, 0, 3, 3],
-        "SN137": [0, 0, 4, 4],
-        "SN139": [0, 0, 3, 3],
-    }
-
-    reservation_svc._transform_date_map_for_unavailable(sample_date_map_1)
-    assert sample_date_map_1 == expected_transformed_date_map_1
-
-
-def test_transform_date_map_for_unavailable_complex(
-    reservation_svc: ReservationService,
-):
-    sample_date_map_2 = {
-        "SN135": [0, 0, 0, 0, 0, 0, 1, 1, 1, 1],
-        "SN137": [0, 0, 1, 1, 4, 4, 4, 4, 0, 0],
-        "SN139": [0, 4, 4, 1, 1, 0, 0, 0, 0, 0],
-    }
-
-    expected_transformed_date_map_2 = {
-        "SN135": [0, 3, 3, 0, 3, 3, 1, 1, 1, 1],
-        "SN137": [0, 3, 1, 1, 4, 4, 4, 4, 0, 0],
-        "SN139": [0, 4, 4, 1, 1, 3, 3, 3, 0, 0],
-    }
-
-    reservation_svc._transform_date_map_for_unavailable(sample_date_map_2)
-    assert expected_transformed_date_map_2 == sample_date_map_2
-
-
-def test_transform_date_map_for_office_hours(
-    reservation_svc: ReservationService, policy_svc: PolicyService
-):
-    """Tests to make sure that office hours events in rooms
-    are marked unavailable (3)"""
-    policy_svc.office_hours = MagicMock(
-        return_value={
-            "SN135": [],
-            "SN137": [(Time(hour=15), Time(hour=16))],
-            "SN139": [],
-            "SN141": [(Time(hour=10), Time(hour=16))],
-            "SN144": [],
-            "SN146": [],
-            "SN147": [],
-        }
-    )
-    date = datetime(year=2024, month=5, day=1)
-    start = datetime(year=2024, month=5, day=1, hour=10, minute=0)
-    reserved_date_map = {
-        "SN135": [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
-        "SN137": [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
-        "SN141": [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
-    }
-
-    expected_transformed_date_map = {
-        "SN135": [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
-        "SN137": [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 3, 3, 0, 0, 0, 0],
-        "SN141": [3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 0, 0, 0, 0],
-    }
-
-    reservation_svc._transform_date_map_for_officehours(
-        date, reserved_date_map, start, 16
-    )
-    assert reserved_date_map == expected_transformed_date_map
-
-
-def test_idx_calculation(reservation_svc: ReservationService):
-    time_1 = datetime.now().replace(hour=10, minute=12)
-    oh_start = datetime.now().replace(hour=10, minute=0)
-    assert reservation_svc._idx_calculation(time_1, oh_start) == 0
-
-    time_2 = datetime.now().replace(hour=12, minute=30)
-    assert reservation_svc._idx_calculation(time_2, oh_start) == 5
-
-    time_3 = datetime.now().replace(hour=13, minute=40)
-    assert reservation_svc._idx_calculation(time_3, oh_start) == 7
-
-
 def test_round_idx_calculation(reservation_svc: ReservationService):
     time = datetime.now().replace(hour=10, minute=0)
     time2 = datetime.now().replace(hour=18, minute=0)
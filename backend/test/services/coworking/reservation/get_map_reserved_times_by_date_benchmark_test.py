@@ -0,0 +1,150 @@
+"""Benchmark for ReservationService#get_map_reserved_times_by_date with many rooms.
+
+Run with `pytest -rP` to see the query counts and latencies printed by these tests."""
+
+from time import perf_counter
+from unittest.mock import MagicMock
+from sqlalchemy.orm import Session
+
+from .....entities import RoomEntity, UserEntity
+from .....entities.coworking import ReservationEntity
+from .....models.coworking import ReservationState, RoomState
+from .....services.coworking import ReservationService, PolicyService
+
+# Imported fixtures provide dependencies injected for the tests as parameters.
+# Dependent fixtures (seat_svc) are required to be imported in the testing module.
+from ..fixtures import (
+    reservation_svc,
+    permission_svc,
+    seat_svc,
+    policy_svc,
+    operating_hours_svc,
+)
+
+from ..time import *
+
+# Import the setup_teardown fixture explicitly to load entities in database.
+# The order in which these fixtures run is dependent on their imported alias.
+# Since there are relationship dependencies between the entities, order matters.
+from ...core_data import setup_insert_data_fixture as insert_order_0
+from ..operating_hours_data import fake_data_fixture as insert_order_1
+from ...room_data import fake_data_fixture as insert_order_2
+from ..seat_data import fake_data_fixture as insert_order_3
+from .reservation_data import fake_data_fixture as insert_order_4
+
+# Import the fake model data in a namespace for test assertions
+from ...core_data import user_data
+from .. import operating_hours_data
+from ...query_counter import count_queries
+
+__authors__ = ["Kris Jordan"]
+__copyright__ = "Copyright 2024"
+__license__ = "MIT"
+
+NUMBER_OF_BENCHMARK_ROOMS = 60
+
+
+def insert_benchmark_rooms(session: Session) -> list[str]:
+    """Insert many reservable rooms, each with a confirmed reservation two days from now."""
+    reservation_start = operating_hours_data.future.start.replace(
+        second=0, microsecond=0
+    ) + timedelta(hours=1)
+    root = session.get(UserEntity, user_data.root.id)
+    room_ids = []
+    for i in range(NUMBER_OF_BENCHMARK_ROOMS):
+        room_id = f"BM{i:03}"
+        session.add(
+            RoomEntity(
+                id=room_id,
+                building="Benchmark",
+                room=f"{i:03}",
+                nickname=f"Benchmark Room {i}",
+                capacity=4,
+                reservable=True,
+            )
+        )
+        session.add(
+            ReservationEntity(
+                start=reservation_start,
+                end=reservation_start + THIRTY_MINUTES,
+                state=ReservationState.CONFIRMED,
+                walkin=False,
+                room_id=room_id,
+                users=[root],
+                seats=[],
+            )
+        )
+        room_ids.append(room_id)
+    session.commit()
+    return room_ids
+
+
+def test_get_map_reserved_times_by_date_query_count_is_constant(
+    session: Session,
+    reservation_svc: ReservationService,
+    policy_svc: PolicyService,
+    time: dict[str, datetime],
+):
+    """The number of queries should not grow with the number of reservable rooms."""
+    policy_svc.office_hours = MagicMock(return_value={})
+    test_time = time[NOW] + 2 * ONE_DAY
+
+    session.expire_all()
+    with count_queries(session) as few_rooms:
+        reservation_svc.get_map_reserved_times_by_date(test_time, user_data.user)
+
+    room_ids = insert_benchmark_rooms(session)
+
+    session.expire_all()
+    start = perf_counter()
+    with count_queries(session) as many_rooms:
+        details = reservation_svc.get_map_reserved_times_by_date(
+            test_time, user_data.user
+        )
+    batched_latency = perf_counter() - start
+
+    assert many_rooms.count == few_rooms.count
+    for room_id in room_ids:
+        assert RoomState.RESERVED.value in details.reserved_date_map[room_id]
+
+    # Compare against loading each room's reservations with its own query.
+    session.expire_all()
+    start = perf_counter()
+    with count_queries(session) as per_room:
+        for room_id in room_ids:
+            reservation_svc._query_confirmed_reservations_by_date_and_room(
+                test_time, room_id
+            )
+    per_room_latency = perf_counter() - start
+
+    assert many_rooms.count < per_room.count
+    print(
+        f"{NUMBER_OF_BENCHMARK_ROOMS} rooms: batched map {many_rooms.count} queries "
+        f"in {batched_latency * 1000:.1f}ms, per-room reservations alone "
+        f"{per_room.count} queries in {per_room_latency * 1000:.1f}ms"
+    )
+
+
+def test_query_confirmed_reservations_by_date(
+    reservation_svc: ReservationService, time: dict[str, datetime]
+):
+    """Batched reservations match the per-room and XL queries they replace."""
+    test_time = time[NOW] + 2 * ONE_DAY
+    reservations_by_room = reservation_svc._query_confirmed_reservations_by_date(
+        test_time, user_data.user, ["SN135", "SN137", "SN139", "SN141"]
+    )
+    assert reservations_by_room["SN135"] == list(
+        reservation_svc._query_confirmed_reservations_by_date_and_room(
+            test_time, "SN135"
+        )
+    )
+    assert "SN137" not in reservations_by_room
+
+    reservations_by_room = reservation_svc._query_confirmed_reservations_by_date(
+        time[NOW], user_data.user, []
+    )
+    assert reservations_by_room["SN156"] == list(
+        reservation_svc._query_xl_reservations_by_date_for_user(
+            time[NOW], user_data.user
+        )
+    )
@@ -1,4 +1,4 @@
-"""ReservationService#_state_transition tests"""
+"""ReservationService#sweep_reservation_states and time-based state transition tests"""
 
 import pytest
 from unittest.mock import create_autospec
@@ -50,105 +50,100 @@ __copyright__ = "Copyright 2023"
 __license__ = "MIT"
 
 
-def test_state_transition_reservation_entities_by_time_noop(
+def _state(session: Session, id: int) -> ReservationState:
+    return session.get(ReservationEntity, id, populate_existing=True).state
+
+
+def test_sweep_reservation_states_noop(
     session: Session, reservation_svc: ReservationService, time: dict[str, datetime]
 ):
-    entities: list[ReservationEntity] = [
-        session.get(ReservationEntity, reservation.id)
-        for reservation in reservation_data.active_reservations
-    ]
-    collected = reservation_svc._state_transition_reservation_entities_by_time(
-        time[NOW], entities
-    )
-    assert collected is not entities
-    assert collected == entities
+    reservation_svc.sweep_reservation_states(time[NOW])
+    for reservation in reservation_data.active_reservations:
+        assert _state(session, reservation.id) == ReservationState.CHECKED_IN
 
 
-def test_state_transition_reservation_entities_by_time_expired_active(
+def test_sweep_reservation_states_expired_active(
     session: Session, reservation_svc: ReservationService
 ):
-    entities: list[ReservationEntity] = [
-        session.get(ReservationEntity, reservation.id)
-        for reservation in reservation_data.active_reservations
-    ]
-    cutoff = entities[0].end
-    collected = reservation_svc._state_transition_reservation_entities_by_time(
-        cutoff, entities
-    )
-
-    assert len(collected) == len(entities) - 1
-    reservation = session.get(ReservationEntity, entities[0].id, populate_existing=True)
-    assert reservation.state == ReservationState.CHECKED_OUT
+    reservation = reservation_data.active_reservations[0]
+    swept = reservation_svc.sweep_reservation_states(reservation.end)
+    assert swept >= 1
+    assert _state(session, reservation.id) == ReservationState.CHECKED_OUT
 
 
-def test_state_transition_reservation_entities_by_time_active_draft(
+def test_sweep_reservation_states_active_draft(
     session: Session, reservation_svc: ReservationService, policy_svc: PolicyService
 ):
-    entities: list[ReservationEntity] = [
-        session.get(ReservationEntity, reservation.id)
-        for reservation in reservation_data.draft_reservations
-    ]
-    cutoff = entities[0].created_at + policy_svc.reservation_draft_timeout()
-    collected = reservation_svc._state_transition_reservation_entities_by_time(
-        cutoff, entities
-    )
-    assert len(collected) == len(entities)
-    assert collected[0].state == ReservationState.DRAFT
+    reservation = reservation_data.draft_reservations[0]
+    cutoff = reservation.created_at + policy_svc.reservation_draft_timeout()
+    reservation_svc.sweep_reservation_states(cutoff)
+    assert _state(session, reservation.id) == ReservationState.DRAFT
 
 
-def test_state_transition_reservation_entities_by_time_expired_draft(
+def test_sweep_reservation_states_expired_draft(
     session: Session, reservation_svc: ReservationService, policy_svc: PolicyService
 ):
     policy_mock = create_autospec(PolicyService)
     policy_mock.reservation_draft_timeout.return_value = (
         policy_svc.reservation_draft_timeout()
     )
+    policy_mock.reservation_checkin_timeout.return_value = (
+        policy_svc.reservation_checkin_timeout()
+    )
     reservation_svc._policy_svc = policy_mock
-
-    entities: list[ReservationEntity] = [
-        session.get(ReservationEntity, reservation.id)
-        for reservation in reservation_data.draft_reservations
-    ]
+    reservation = reservation_data.draft_reservations[0]
     cutoff = (
-        entities[0].created_at
+        reservation.created_at
         + policy_svc.reservation_draft_timeout()
         + timedelta(seconds=1)
     )
-    collected = reservation_svc._state_transition_reservation_entities_by_time(
-        cutoff, entities
-    )
-    assert len(collected) == len(entities) - 1
-
-    reservation = session.get(ReservationEntity, entities[0].id, populate_existing=True)
-    assert reservation.state == ReservationState.CANCELLED
-
+    reservation_svc.sweep_reservation_states(cutoff)
+    assert _state(session, reservation.id) == ReservationState.CANCELLED
     policy_mock.reservation_draft_timeout.assert_called_once()
 
 
-def test_state_transition_reservation_entities_by_time_checkin_timeout(
+def test_sweep_reservation_states_checkin_timeout(
     session: Session, reservation_svc: ReservationService, policy_svc: PolicyService
 ):
     policy_mock = create_autospec(PolicyService)
+    policy_mock.reservation_draft_timeout.return_value = (
+        policy_svc.reservation_draft_timeout()
+    )
     policy_mock.reservation_checkin_timeout.return_value = (
         policy_svc.reservation_checkin_timeout()
     )
     reservation_svc._policy_svc = policy_mock
-
-    entities: list[ReservationEntity] = [
-        session.get(ReservationEntity, reservation.id)
-        for reservation in reservation_data.confirmed_reservations
-    ]
+    reservation = reservation_data.confirmed_reservations[0]
     cutoff = (
-        entities[0].start
+        reservation.start
         + policy_svc.reservation_checkin_timeout()
         + timedelta(seconds=1)
     )
-    collected = reservation_svc._state_transition_reservation_entities_by_time(
-        cutoff, entities
-    )
-    assert len(collected) == len(entities) - 1
+    reservation_svc.sweep_reservation_states(cutoff)
+    assert _state(session, reservation.id) == ReservationState.CANCELLED
+    policy_mock.reservation_checkin_timeout.assert_called_once()
 
-    reservation = session.get(ReservationEntity, entities[0].id, populate_existing=True)
-    assert reservation.state == ReservationState.CANCELLED
 
-    policy_mock.reservation_checkin_timeout.assert_called_once()
+def test_sweep_reservation_states_updates_timestamp(
+    session: Session, reservation_svc: ReservationService, time: dict[str, datetime]
+):
+    reservation = reservation_data.active_reservations[0]
+    reservation_svc.sweep_reservation_states(reservation.end)
+    entity = session.get(ReservationEntity, reservation.id, populate_existing=True)
+    assert entity.updated_at > reservation.updated_at
+
+
+def test_read_paths_exclude_expired_without_writing(
+    session: Session, reservation_svc: ReservationService
+):
+    """Reservation 7 is a confirmed room reservation an hour past its check-in timeout."""
+    reservations = reservation_svc.get_current_reservations_for_user(
+        user_data.root, user_data.root
+    )
+    assert reservation_data.reservation_7.id not in [
+        reservation.id for reservation in reservations
+    ]
+    assert _state(session, reservation_data.reservation_7.id) == (
+        ReservationState.CONFIRMED
+    )
+    assert not session.dirty
@@ -0,0 +1,95 @@
+"""ReservationService#walkin_seat_availability tests"""
+
+from unittest.mock import MagicMock
+
+from .....services.coworking import ReservationService
+from .....models.coworking import ReservationPartial, ReservationState
+
+# Imported fixtures provide dependencies injected for the tests as parameters.
+# Dependent fixtures (seat_svc) are required to be imported in the testing module.
+from ..fixtures import (
+    reservation_svc,
+    permission_svc,
+    seat_svc,
+    policy_svc,
+    operating_hours_svc,
+)
+from ..time import *
+
+# Import the setup_teardown fixture explicitly to load entities in database.
+# The order in which these fixtures run is dependent on their imported alias.
+# Since there are relationship dependencies between the entities, order matters.
+from ...core_data import setup_insert_data_fixture as insert_order_0
+from ..operating_hours_data import fake_data_fixture as insert_order_1
+from ...room_data import fake_data_fixture as insert_order_2
+from ..seat_data import fake_data_fixture as insert_order_3
+from .reservation_data import fake_data_fixture as insert_order_4
+
+# Import the fake model data in a namespace for test assertions
+from ...core_data import user_data
+from .. import seat_data
+from . import reservation_data
+
+__authors__ = ["Kris Jordan"]
+__copyright__ = "Copyright 2024"
+__license__ = "MIT"
+
+
+def _first_available(available_seats, seat_id: int) -> datetime:
+    return (
+        next(seat for seat in available_seats if seat.id == seat_id)
+        .availability[0]
+        .start
+    )
+
+
+def test_walkin_seat_availability(
+    reservation_svc: ReservationService, time: dict[str, datetime]
+):
+    """Walk-in availability covers every seat, starting once active reservations end."""
+    available_seats = reservation_svc.walkin_seat_availability()
+    assert len(available_seats) == len(seat_data.seats)
+    assert_equal_times(
+        reservation_data.reservation_1.end,
+        _first_available(available_seats, seat_data.monitor_seat_00.id),
+    )
+
+
+def test_walkin_seat_availability_is_cached(reservation_svc: ReservationService):
+    """Repeated reads are served from the snapshot without recomputing."""
+    reservation_svc.walkin_seat_availability()
+    reservation_svc.seat_availability = MagicMock()
+    reservation_svc.walkin_seat_availability()
+    reservation_svc.seat_availability.assert_not_called()
+
+
+def test_walkin_seat_availability_invalidated_by_draft(
+    reservation_svc: ReservationService, time: dict[str, datetime]
+):
+    """Drafting a reservation takes effect in walk-in availability immediately."""
+    before = reservation_svc.walkin_seat_availability()
+    draft = reservation_svc.draft_reservation(
+        user_data.ambassador, reservation_data.test_request()
+    )
+    after = reservation_svc.walkin_seat_availability()
+    seat_id = draft.seats[0].id
+    assert_equal_times(time[NOW], _first_available(before, seat_id))
+    assert_equal_times(draft.end, _first_available(after, seat_id))
+
+
+def test_walkin_seat_availability_invalidated_by_change(
+    reservation_svc: ReservationService, time: dict[str, datetime]
+):
+    """Changing a reservation's state takes effect in walk-in availability immediately."""
+    draft = reservation_svc.draft_reservation(
+        user_data.ambassador, reservation_data.test_request()
+    )
+    before = reservation_svc.walkin_seat_availability()
+    reservation_svc.change_reservation(
+        user_data.ambassador,
+        ReservationPartial(id=draft.id, state=ReservationState.CANCELLED),
+    )
+    after = reservation_svc.walkin_seat_availability()
+    seat_id = draft.seats[0].id
+    assert_equal_times(draft.end, _first_available(before, seat_id))
+    assert_equal_times(time[NOW], _first_available(after, seat_id))
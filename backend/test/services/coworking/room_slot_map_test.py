@@ -0,0 +1,160 @@
+"""Tests for the RoomSlotMap used to build the room reservation map."""
+
+from datetime import datetime, time, timedelta
+
+from ....models.coworking import Reservation, ReservationState, RoomState
+from ....services.coworking.room_slot_map import RoomSlotMap
+from ..core_data import user_data
+
+__authors__ = ["Kris Jordan", "Yuvraj Jain"]
+__copyright__ = "Copyright 2024"
+__license__ = "MIT"
+
+OPEN = datetime(year=2024, month=5, day=1, hour=10)
+
+
+def _reservation(start: datetime, end: datetime, user=user_data.user) -> Reservation:
+    return Reservation(
+        id=1,
+        start=start,
+        end=end,
+        state=ReservationState.CONFIRMED,
+        users=[user],
+        created_at=start,
+        updated_at=start,
+    )
+
+
+def test_paint_clips_to_grid():
+    slot_map = RoomSlotMap(["SN135"], OPEN, 4)
+    slot_map.paint(
+        "SN135",
+        OPEN - timedelta(hours=1),
+        OPEN + timedelta(hours=1),
+        RoomState.RESERVED,
+    )
+    slot_map.paint(
+        "SN135",
+        OPEN + timedelta(hours=1, minutes=30),
+        OPEN + timedelta(hours=5),
+        RoomState.RESERVED,
+    )
+    assert slot_map.to_date_map() == {"SN135": [1, 1, 0, 1]}
+
+
+def test_paint_ignores_unknown_rooms():
+    slot_map = RoomSlotMap(["SN135"], OPEN, 2)
+    slot_map.paint("SN999", OPEN, OPEN + timedelta(hours=1), RoomState.RESERVED)
+    assert slot_map.to_date_map() == {"SN135": [0, 0]}
+
+
+def test_paint_reservations_subject_takes_precedence():
+    slot_map = RoomSlotMap(["SN135"], OPEN, 4)
+    slot_map.paint_reservations(
+        "SN135",
+        [
+            _reservation(OPEN + timedelta(minutes=30), OPEN + timedelta(hours=1)),
+            _reservation(OPEN, OPEN + timedelta(hours=2), user_data.root),
+        ],
+        user_data.user,
+    )
+    assert slot_map.to_date_map() == {"SN135": [1, 4, 1, 1]}
+
+
+def test_index():
+    slot_map = RoomSlotMap(["SN135"], OPEN, 16)
+    assert slot_map.index(OPEN.replace(minute=12)) == 0
+    assert slot_map.index(OPEN.replace(hour=12, minute=30)) == 5
+    assert slot_map.index(OPEN.replace(hour=13, minute=40)) == 7
+
+
+def test_mark_unavailable_alongside_subject_reservation():
+    """Once a user has reserved a room, the same times are unavailable in every other room.
+
+    For example, if Sally Student reserves room SN137 from 11 am to noon, she is prevented from
+    booking any other room during these hours."""
+    slot_map = RoomSlotMap.from_date_map(
+        {
+            "SN135": [0, 0, 0, 0],
+            "SN137": [0, 0, 4, 4],
+            "SN139": [0, 0, 0, 0],
+        },
+        OPEN,
+    )
+    slot_map.mark_unavailable_alongside_subject_reservations()
+    assert slot_map.to_date_map() == {
+        "SN135": [0, 0, 3, 3],
+        "SN137": [0, 0, 4, 4],
+        "SN139": [0, 0, 3, 3],
+    }
+
+
+def test_mark_unavailable_alongside_subject_reservations():
+    slot_map = RoomSlotMap.from_date_map(
+        {
+            "SN135": [0, 0, 0, 0, 0, 0, 1, 1, 1, 1],
+            "SN137": [0, 0, 1, 1, 4, 4, 4, 4, 0, 0],
+            "SN139": [0, 4, 4, 1, 1, 0, 0, 0, 0, 0],
+        },
+        OPEN,
+    )
+    slot_map.mark_unavailable_alongside_subject_reservations()
+    assert slot_map.to_date_map() == {
+        "SN135": [0, 3, 3, 0, 3, 3, 1, 1, 1, 1],
+        "SN137": [0, 3, 1, 1, 4, 4, 4, 4, 0, 0],
+        "SN139": [0, 4, 4, 1, 1, 3, 3, 3, 0, 0],
+    }
+
+
+def test_paint_office_hours():
+    slot_map = RoomSlotMap(["SN137", "SN141"], OPEN, 8)
+    slot_map.paint_office_hours(
+        OPEN,
+        {
+            "SN135": [(time(hour=10), time(hour=11))],
+            "SN137": [(time(hour=12), time(hour=1))],
+            "SN141": [(time(hour=11), time(hour=12, minute=30))],
+        },
+    )
+    assert slot_map.to_date_map() == {
+        "SN137": [0, 0, 0, 0, 0, 0, 0, 0],
+        "SN141": [0, 0, 3, 3, 3, 0, 0, 0],
+    }
+
+
+def test_paint_office_hours_over_operating_hours():
+    """Office hours events in rooms are marked unavailable (3) across a full day."""
+    slot_map = RoomSlotMap(["SN135", "SN137", "SN141"], OPEN, 16)
+    slot_map.paint_office_hours(
+        OPEN,
+        {
+            "SN135": [],
+            "SN137": [(time(hour=15), time(hour=16))],
+            "SN139": [],
+            "SN141": [(time(hour=10), time(hour=16))],
+        },
+    )
+    assert slot_map.to_date_map() == {
+        "SN135": [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 0],
+        "SN137": [0, 0, 0, 0, 0, 0, 0, 0, 0, 0, 3, 3, 0, 0, 0, 0],
+        "SN141": [3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 3, 0, 0, 0, 0],
+    }
+
+
+def test_clear_before():
+    slot_map = RoomSlotMap.from_date_map({"SN135": [1, 1, 4, 4]}, OPEN)
+    slot_map.clear_before(OPEN + timedelta(minutes=45))
+    assert slot_map.to_date_map() == {"SN135": [0, 1, 4, 4]}
+
+
+def test_fifteen_minute_slots_over_multiple_days():
+    slot_map = RoomSlotMap(["SN135"], OPEN, 4 * 24 * 2, timedelta(minutes=15))
+    slot_map.paint(
+        "SN135",
+        OPEN + timedelta(days=1, minutes=15),
+        OPEN + timedelta(days=1, minutes=45),
+        RoomState.RESERVED,
+    )
+    slots = slot_map.to_date_map()["SN135"]
+    assert slots.count(RoomState.RESERVED.value) == 2
+    assert slots[4 * 24 + 1] == slots[4 * 24 + 2] == RoomState.RESERVED.value
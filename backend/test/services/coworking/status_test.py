@@ -24,10 +24,7 @@ def test_status_dispatch(status_svc: StatusService):
     status_svc._reservation_svc.get_current_reservations_for_user.return_value = [
         reservation_data.reservation_1
     ]
-    status_svc._policies_svc.walkin_window.return_value = timedelta(minutes=15)
-    status_svc._policies_svc.walkin_initial_duration.return_value = timedelta(hours=1)
     status_svc._policies_svc.reservation_window.return_value = timedelta(weeks=1)
-    status_svc._seat_svc.list.return_value = []
     status_svc._operating_hours_svc.schedule.return_value = [operating_hours_data.today]
 
     seat_availability = [
@@ -43,7 +40,9 @@ def test_status_dispatch(status_svc: StatusService):
             y=0,
         )
     ]
-    status_svc._reservation_svc.seat_availability.return_value = seat_availability
+    status_svc._reservation_svc.walkin_seat_availability.return_value = (
+        seat_availability
+    )
 
     # Call the method
     status = status_svc.get_coworking_status(user_data.root)
@@ -52,7 +51,7 @@ def test_status_dispatch(status_svc: StatusService):
     status_svc._reservation_svc.get_current_reservations_for_user.assert_called_once_with(
         user_data.root, user_data.root
     )
-    status_svc._reservation_svc.seat_availability.assert_called_once()
+    status_svc._reservation_svc.walkin_seat_availability.assert_called_once()
     status_svc._operating_hours_svc.schedule.assert_called_once()
 
     # Look for expected RVs
@@ -0,0 +1,144 @@
+"""Tests for the connection pool configuration and read-only sessions in the database module."""
+
+import pytest
+from sqlalchemy import Engine, text
+from sqlalchemy.exc import InternalError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from ...database import (
+    _create_async_engine,
+    _create_engine,
+    _engine_str,
+    _replica_engine_str,
+    engine,
+    readonly_db_session,
+    readonly_engine,
+    MeteredAsyncQueuePool,
+    MeteredQueuePool,
+)
+from ...env import getenv
+from ...services import health
+from ...services.health import HealthService
+from .conftest import POSTGRES_DATABASE
+
+__authors__ = ["Kris Jordan"]
+__copyright__ = "Copyright 2025"
+__license__ = "MIT"
+
+
+@pytest.fixture()
+def metered_engine(test_engine: Engine):
+    engine = _create_engine(_engine_str(POSTGRES_DATABASE))
+    try:
+        yield engine
+    finally:
+        engine.dispose()
+
+
+def test_engine_uses_metered_pool(metered_engine: Engine):
+    assert isinstance(metered_engine.pool, MeteredQueuePool)
+
+
+def test_pool_status_counts_checkouts(metered_engine: Engine):
+    health_svc = HealthService(None, None)  # type: ignore
+    with metered_engine.connect():
+        status = health_svc._pool_status(metered_engine.pool)  # type: ignore
+        assert status.checked_out == 1
+        assert status.overflow == 0
+    with metered_engine.connect():
+        ...
+    status = health_svc._pool_status(metered_engine.pool)  # type: ignore
+    assert status.checked_out == 0
+    assert status.checkouts == 2
+    assert status.max_wait_ms >= 0
+    assert status.total_wait_ms >= status.max_wait_ms
+
+
+def test_check_pool_reports_primary(session: Session):
+    status = HealthService(session, None).check_pool()  # type: ignore
+    assert status.primary.size > 0
+    assert status.replica is None
+    assert status.async_replica is None
+    assert status.async_primary.size > 0
+
+
+def test_readonly_engine_rejects_writes(metered_engine: Engine):
+    readonly_engine = metered_engine.execution_options(postgresql_readonly=True)
+    with Session(readonly_engine) as session:
+        assert session.execute(text("SELECT 1")).scalar() == 1
+        with pytest.raises(InternalError):
+            session.execute(text("CREATE TEMPORARY TABLE readonly_probe (id int)"))
+
+
+def test_readonly_connection_writable_after_checkin(metered_engine: Engine):
+    readonly_engine = metered_engine.execution_options(postgresql_readonly=True)
+    with Session(readonly_engine) as session:
+        session.execute(text("SELECT 1"))
+    with Session(metered_engine) as session:
+        session.execute(text("CREATE TEMPORARY TABLE writable_probe (id int)"))
+        session.rollback()
+
+
+def replica_url() -> str:
+    """The test database's connection URL, as POSTGRES_REPLICA_URL would be configured."""
+    user = getenv("POSTGRES_USER")
+    password = getenv("POSTGRES_PASSWORD")
+    host = getenv("POSTGRES_HOST")
+    port = getenv("POSTGRES_PORT")
+    return f"postgresql://{user}:{password}@{host}:{port}/{POSTGRES_DATABASE}"
+
+
+def test_replica_engine_str_sets_dialect():
+    assert _replica_engine_str(replica_url()) == _engine_str(POSTGRES_DATABASE)
+    assert _replica_engine_str(
+        replica_url(), dialect="postgresql+asyncpg"
+    ) == _engine_str(POSTGRES_DATABASE, dialect="postgresql+asyncpg")
+
+
+def test_replica_engine_connects(test_engine: Engine):
+    replica_engine = _create_engine(_replica_engine_str(replica_url()))
+    try:
+        with Session(replica_engine) as session:
+            assert session.execute(text("SELECT current_database()")).scalar() == (
+                POSTGRES_DATABASE
+            )
+    finally:
+        replica_engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_async_replica_engine_connects(test_engine: Engine):
+    replica_engine = _create_async_engine(
+        _replica_engine_str(replica_url(), dialect="postgresql+asyncpg")
+    )
+    assert isinstance(replica_engine.pool, MeteredAsyncQueuePool)
+    try:
+        async with AsyncSession(replica_engine) as session:
+            result = await session.execute(text("SELECT current_database()"))
+            assert result.scalar() == POSTGRES_DATABASE
+    finally:
+        await replica_engine.dispose()
+
+
+def test_readonly_engine_without_replica():
+    assert readonly_engine.pool is engine.pool
+    assert readonly_engine.get_execution_options()["postgresql_readonly"] is True
+
+
+def test_readonly_db_session_uses_readonly_engine():
+    sessions = readonly_db_session()
+    session = next(sessions)
+    assert session.get_bind() is readonly_engine
+    sessions.close()
+
+
+def test_check_pool_reports_replica(
+    session: Session, metered_engine: Engine, monkeypatch: pytest.MonkeyPatch
+):
+    monkeypatch.setattr(health, "readonly_engine", metered_engine)
+    with metered_engine.connect():
+        status = HealthService(session, None).check_pool()  # type: ignore
+    assert status.replica is not None
+    assert status.replica.checked_out == 1
+    assert status.async_replica is None
@@ -14,6 +14,8 @@ from ...services import (
     SignageService,
 )
 from ...services.academics import HiringService
+from ...services.permission_cache import PermissionCache
+from ...services.user_cache import UserCache
 from ...services.article import ArticleService
 from ...services.coworking import (
     PolicyService,
@@ -29,7 +31,7 @@ __license__ = "MIT"
 
 @pytest.fixture()
 def permission_svc(session: Session):
-    return PermissionService(session)
+    return PermissionService(session, PermissionCache(":memory:"))
 
 
 @pytest.fixture()
@@ -41,13 +43,15 @@ def permission_svc_mock():
 @pytest.fixture()
 def user_svc(session: Session, permission_svc_mock: PermissionService):
     """This fixture is used to test the UserService class with a mocked PermissionService."""
-    return UserService(session, permission_svc_mock)
+    return UserService(session, permission_svc_mock, UserCache())
 
 
 @pytest.fixture()
 def user_svc_integration(session: Session):
     """This fixture is used to test the UserService class with a real PermissionService."""
-    return UserService(session, PermissionService(session))
+    return UserService(
+        session, PermissionService(session, PermissionCache(":memory:")), UserCache()
+    )
 
 
 @pytest.fixture()
@@ -68,32 +72,40 @@ def signage_svc(
 @pytest.fixture()
 def organization_svc_integration(session: Session):
     """This fixture is used to test the OrganizationService class with a real PermissionService."""
-    return OrganizationService(session, PermissionService(session))
+    return OrganizationService(
+        session, PermissionService(session, PermissionCache(":memory:"))
+    )
 
 
 @pytest.fixture()
 def event_svc_integration(session: Session, user_svc_integration: UserService):
     """This fixture is used to test the EventService class with a real PermissionService."""
-    return EventService(session, PermissionService(session))
+    return EventService(
+        session, PermissionService(session, PermissionCache(":memory:"))
+    )
 
 
 @pytest.fixture()
 def room_svc(session: Session):
     """RoomService fixture."""
-    return RoomService(session, PermissionService(session))
+    return RoomService(session, PermissionService(session, PermissionCache(":memory:")))
 
 
 @pytest.fixture()
 def article_svc(session: Session):
     return ArticleService(
         session,
-        PermissionService(session),
+        PermissionService(session, PermissionCache(":memory:")),
         PolicyService(),
-        OperatingHoursService(session, PermissionService(session)),
+        OperatingHoursService(
+            session, PermissionService(session, PermissionCache(":memory:"))
+        ),
     )
 
 
 @pytest.fixture()
 def application_svc(session: Session):
     """ApplicationService fixture."""
-    return ApplicationService(session, PermissionService(session))
+    return ApplicationService(
+        session, PermissionService(session, PermissionCache(":memory:"))
+    )
@@ -8,6 +8,8 @@ from ....services.office_hours.office_hours_recurrence import (
     OfficeHoursRecurrenceService,
 )
 from ....services import PermissionService
+from ....services.permission_cache import PermissionCache
+from ....services.office_hours.queue_index import OfficeHoursQueueIndex
 from ....services.office_hours import (
     OfficeHourTicketService,
     OfficeHoursService,
@@ -22,13 +24,19 @@ __license__ = "MIT"
 @pytest.fixture()
 def permission_svc(session: Session):
     """PermissionService fixture."""
-    return PermissionService(session)
+    return PermissionService(session, PermissionCache(":memory:"))
 
 
 @pytest.fixture()
-def oh_svc(session: Session):
+def queue_index():
+    """OfficeHoursQueueIndex fixture."""
+    return OfficeHoursQueueIndex()
+
+
+@pytest.fixture()
+def oh_svc(session: Session, queue_index: OfficeHoursQueueIndex):
     """OfficeHoursEventService fixture."""
-    return OfficeHoursService(session)
+    return OfficeHoursService(session, queue_index)
 
 
 @pytest.fixture()
@@ -38,18 +46,22 @@ def oh_svc_mock():
 
 
 @pytest.fixture()
-def oh_ticket_svc(session: Session):
+def oh_ticket_svc(session: Session, queue_index: OfficeHoursQueueIndex):
     """OfficeHoursEventService fixture."""
-    return OfficeHourTicketService(session)
+    return OfficeHourTicketService(session, queue_index)
 
 
 @pytest.fixture()
 def oh_recurrence_svc(session: Session):
     """OfficeHoursRecurrenceService fixture."""
-    return OfficeHoursRecurrenceService(session, OfficeHoursService(session))
+    return OfficeHoursRecurrenceService(
+        session, OfficeHoursService(session, OfficeHoursQueueIndex())
+    )
 
 
 @pytest.fixture()
 def oh_statistics_svc(session: Session):
     """OfficeHoursStatisticsService fixture."""
-    return OfficeHoursStatisticsService(session, OfficeHoursService(session))
+    return OfficeHoursStatisticsService(
+        session, OfficeHoursService(session, OfficeHoursQueueIndex())
+    )
@@ -4,6 +4,7 @@ import pytest
 from datetime import datetime, date, timedelta
 from sqlalchemy.orm import Session
 from ...services.reset_table_id_seq import reset_table_id_seq
+from ....services.office_hours.ticket_statistics import rebuild_ticket_statistics
 
 from ....test.services import user_data, room_data
 from ..academics import section_data
@@ -439,6 +440,9 @@ def insert_fake_data(session: Session):
 
     session.commit()
 
+    # Step 6: Roll up the statistics of the closed tickets
+    rebuild_ticket_statistics(session)
+
 
 @pytest.fixture(autouse=True)
 def fake_data_fixture(session: Session):
@@ -0,0 +1,160 @@
+"""Benchmark for OfficeHoursStatisticsService#get_statistics over a course site with many tickets.
+
+Run with `pytest -rP` to see the query counts and latencies printed by these tests."""
+
+from datetime import date, datetime, time, timedelta
+from time import perf_counter
+from pytest import approx
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+from ....services.office_hours import OfficeHoursStatisticsService
+from ....services.office_hours.ticket_statistics import rebuild_ticket_statistics
+from ....models.pagination import TicketPaginationParams
+
+# Imported fixtures provide dependencies injected for the tests as parameters.
+from .fixtures import oh_statistics_svc
+
+# Import the setup_teardown fixture explicitly to load entities in database
+from ..core_data import setup_insert_data_fixture as insert_order_0
+from ..academics.term_data import fake_data_fixture as insert_order_1
+from ..academics.course_data import fake_data_fixture as insert_order_2
+from ..academics.section_data import fake_data_fixture as insert_order_3
+from ..room_data import fake_data_fixture as insert_order_4
+from ..office_hours.office_hours_data import fake_data_fixture as insert_order_5
+
+# Import the fake model data in a namespace for test assertions
+from .. import user_data
+from ..academics import section_data
+from ..office_hours import office_hours_data
+from ..query_counter import count_queries
+
+__authors__ = ["Kris Jordan"]
+__copyright__ = "Copyright 2025"
+__license__ = "MIT"
+
+NUMBER_OF_BENCHMARK_TICKETS = 100_000
+
+ALL_TICKETS = TicketPaginationParams(
+    range_start="", range_end="", student_ids=[], staff_ids=[]
+)
+
+
+def insert_benchmark_tickets(session: Session) -> None:
+    """Insert many closed tickets over the past year, each with a creator, and roll them up."""
+    session.execute(
+        text(
+            """
+            WITH ticket AS (
+                INSERT INTO office_hours__ticket (
+                    description, type, state, created_at, called_at, closed_at,
+                    have_concerns, caller_notes, office_hours_id, caller_id
+                )
+                SELECT
+                    'Benchmark ticket',
+                    CAST(CASE WHEN i % 3 = 0 THEN 'ASSIGNMENT_HELP'
+                              ELSE 'CONCEPTUAL_HELP' END AS tickettype),
+                    'CLOSED',
+                    :now - i * interval '5 minutes',
+                    :now - i * interval '5 minutes' + (i % 20) * interval '1 minute',
+                    :now - i * interval '5 minutes' + (i % 20 + i % 7) * interval '1 minute',
+                    false,
+                    '',
+                    :office_hours_id,
+                    :caller_id
+                FROM generate_series(1, :tickets) AS i
+                RETURNING id
+            )
+            INSERT INTO office_hours__user_created_ticket (ticket_id, member_id)
+            SELECT id, :creator_id FROM ticket
+            """
+        ),
+        {
+            "now": datetime.now(),
+            "tickets": NUMBER_OF_BENCHMARK_TICKETS,
+            "office_hours_id": office_hours_data.comp_110_current_office_hours.id,
+            "caller_id": section_data.comp110_instructor.id,
+            "creator_id": section_data.comp110_student_1.id,
+        },
+    )
+    session.commit()
+    rebuild_ticket_statistics(session)
+    session.execute(text("ANALYZE office_hours__ticket"))
+
+
+def query_statistics_separately(session: Session) -> list:
+    """Compute each statistic of the site's closed tickets from the tickets, one query each."""
+    tickets = """
+        FROM office_hours__ticket t JOIN office_hours oh ON oh.id = t.office_hours_id
+        WHERE oh.course_site_id = :site_id AND t.state = 'CLOSED'
+    """
+    today = date.today()
+    start_of_week = datetime.combine(
+        today - timedelta(days=(today.weekday() + 1) % 7), time()
+    )
+    parameters = {
+        "site_id": office_hours_data.comp_110_site.id,
+        "start_of_week": start_of_week,
+    }
+    return [
+        session.execute(
+            text(f"SELECT {aggregate} {tickets} {where}"), parameters
+        ).scalar()
+        for aggregate, where in [
+            ("count(*)", ""),
+            ("count(*)", "AND t.created_at >= :start_of_week"),
+            (
+                "avg(extract(epoch FROM t.called_at - t.created_at)) / 60",
+                "AND t.called_at IS NOT NULL",
+            ),
+            (
+                "avg(extract(epoch FROM t.closed_at - t.called_at)) / 60",
+                "AND t.closed_at IS NOT NULL",
+            ),
+            ("count(*)", "AND t.type = 'CONCEPTUAL_HELP'"),
+            ("count(*)", "AND t.type = 'ASSIGNMENT_HELP'"),
+        ]
+    ]
+
+
+def test_get_statistics_query_count_is_constant(
+    session: Session, oh_statistics_svc: OfficeHoursStatisticsService
+):
+    """Statistics are read from the daily rollup in a constant number of queries."""
+    with count_queries(session) as few_tickets:
+        seeded = oh_statistics_svc.get_statistics(
+            user_data.instructor, office_hours_data.comp_110_site.id, ALL_TICKETS
+        )
+
+    insert_benchmark_tickets(session)
+
+    session.expire_all()
+    start = perf_counter()
+    with count_queries(session) as many_tickets:
+        statistics = oh_statistics_svc.get_statistics(
+            user_data.instructor, office_hours_data.comp_110_site.id, ALL_TICKETS
+        )
+    rollup_latency = perf_counter() - start
+
+    assert many_tickets.count == few_tickets.count
+
+    start = perf_counter()
+    with count_queries(session) as separate:
+        expected = query_statistics_separately(session)
+    separate_latency = perf_counter() - start
+
+    assert statistics.total_tickets == expected[0]
+    assert (
+        statistics.total_tickets == NUMBER_OF_BENCHMARK_TICKETS + seeded.total_tickets
+    )
+    assert statistics.total_tickets_weekly == expected[1]
+    assert statistics.average_wait_time == approx(float(expected[2]))
+    assert statistics.average_duration == approx(float(expected[3]))
+    assert statistics.total_conceptual == expected[4]
+    assert statistics.total_assignment == expected[5]
+    print(
+        f"{NUMBER_OF_BENCHMARK_TICKETS} closed tickets: get_statistics from the rollup "
+        f"{many_tickets.count} queries in {rollup_latency * 1000:.1f}ms, "
+        f"statistics queried separately {separate.count} queries "
+        f"in {separate_latency * 1000:.1f}ms"
+    )
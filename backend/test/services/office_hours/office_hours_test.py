@@ -12,7 +12,7 @@ from ....services.office_hours import OfficeHoursService
 from ....services.exceptions import CoursePermissionException, ResourceNotFoundException
 
 # Imported fixtures provide dependencies injected for the tests as parameters.
-from .fixtures import oh_svc
+from .fixtures import oh_svc, queue_index
 
 # Import the setup_teardown fixture explicitly to load entities in database
 from ..core_data import setup_insert_data_fixture as insert_order_0
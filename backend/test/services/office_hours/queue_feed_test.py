@@ -0,0 +1,234 @@
+"""Tests for the OfficeHoursQueueFeed pushing ticket changes to queue and get help pages."""
+
+import asyncio
+import pytest
+from sqlalchemy.orm import Session
+
+from ....models.office_hours.ticket import TicketState
+from ....services.office_hours import OfficeHourTicketService
+from ....services.office_hours.queue_feed import (
+    OFFICE_HOURS_QUEUE_FEED_BACKLOG,
+    OfficeHoursQueueFeed,
+    ticket_overview,
+)
+from ....services.office_hours.queue_index import OfficeHoursQueueIndex
+from ..conftest import POSTGRES_DATABASE
+from ....database import _engine_str
+
+# Imported fixtures provide dependencies injected for the tests as parameters.
+from .fixtures import oh_ticket_svc, queue_index
+
+# Import the setup_teardown fixture explicitly to load entities in database
+from ..core_data import setup_insert_data_fixture as insert_order_0
+from ..academics.term_data import fake_data_fixture as insert_order_1
+from ..academics.course_data import fake_data_fixture as insert_order_2
+from ..academics.section_data import fake_data_fixture as insert_order_3
+from ..room_data import fake_data_fixture as insert_order_4
+from ..office_hours.office_hours_data import fake_data_fixture as insert_order_5
+
+# Import the fake model data in a namespace for test assertions
+from .. import user_data
+from ..office_hours import office_hours_data
+
+__authors__ = ["Kris Jordan"]
+__copyright__ = "Copyright 2025"
+__license__ = "MIT"
+
+EVENT_ID = 1
+STUDENT_ID = 10
+OTHER_STUDENT_ID = 11
+STAFF_ID = 20
+
+
+class FakeQueue:
+    """Ticket overviews and queue positions a test controls, counting how often each is loaded."""
+
+    def __init__(self):
+        self.ticket = ticket_json(1, "Queued", creator_id=STUDENT_ID)
+        self.positions: dict[int, int] = {STUDENT_ID: 1}
+        self.loaded = {"ticket": 0, "positions": 0}
+
+    async def load_ticket(self, ticket_id: int):
+        self.loaded["ticket"] += 1
+        return self.ticket
+
+    async def load_queue_positions(self, office_hours_id: int):
+        self.loaded["positions"] += 1
+        return dict(self.positions)
+
+
+def ticket_json(id: int, state: str, creator_id: int, caller_id: int | None = None):
+    return {
+        "id": id,
+        "state": state,
+        "creators": [{"id": creator_id}],
+        "caller": {"id": caller_id} if caller_id else None,
+    }
+
+
+def drain(queue: asyncio.Queue) -> list[dict]:
+    messages = []
+    while not queue.empty():
+        messages.append(queue.get_nowait())
+    return messages
+
+
+@pytest.fixture()
+def fake_queue() -> FakeQueue:
+    return FakeQueue()
+
+
+@pytest.fixture()
+def feed(fake_queue: FakeQueue) -> OfficeHoursQueueFeed:
+    return OfficeHoursQueueFeed(
+        fake_queue.load_ticket, fake_queue.load_queue_positions, OfficeHoursQueueIndex()
+    )
+
+
+@pytest.mark.asyncio
+async def test_change_without_subscribers_loads_nothing(feed, fake_queue):
+    await feed.changed(EVENT_ID, 1)
+    assert fake_queue.loaded == {"ticket": 0, "positions": 0}
+
+
+@pytest.mark.asyncio
+async def test_staff_receive_ticket_and_its_list(feed, fake_queue):
+    staff = feed.subscribe(EVENT_ID, STAFF_ID, staff=True)
+    await feed.changed(EVENT_ID, 1)
+    fake_queue.ticket = ticket_json(1, "Called", STUDENT_ID, caller_id=STAFF_ID)
+    await feed.changed(EVENT_ID, 1)
+    fake_queue.ticket = ticket_json(1, "Called", STUDENT_ID, caller_id=STAFF_ID + 1)
+    await feed.changed(EVENT_ID, 1)
+    fake_queue.ticket = ticket_json(1, "Closed", STUDENT_ID, caller_id=STAFF_ID)
+    await feed.changed(EVENT_ID, 1)
+    assert [message["list"] for message in drain(staff)] == [
+        "queue",
+        "active",
+        "other_called",
+        None,
+    ]
+    # Queue positions are only computed for students.
+    assert fake_queue.loaded["positions"] == 0
+
+
+@pytest.mark.asyncio
+async def test_student_receives_own_ticket_and_position(feed, fake_queue):
+    student = feed.subscribe(EVENT_ID, STUDENT_ID, staff=False)
+    await feed.changed(EVENT_ID, 1)
+    assert drain(student) == [
+        {
+            "type": "get_help",
+            "data": {"ticket": fake_queue.ticket, "queue_position": 1},
+        }
+    ]
+
+    fake_queue.ticket = ticket_json(1, "Canceled", STUDENT_ID)
+    fake_queue.positions = {}
+    await feed.changed(EVENT_ID, 1)
+    assert drain(student) == [
+        {"type": "get_help", "data": {"ticket": None, "queue_position": -1}}
+    ]
+
+
+@pytest.mark.asyncio
+async def test_student_receives_only_position_changes_of_others(feed, fake_queue):
+    other = feed.subscribe(EVENT_ID, OTHER_STUDENT_ID, staff=False)
+    fake_queue.positions = {STUDENT_ID: 1, OTHER_STUDENT_ID: 2}
+    await feed.changed(EVENT_ID, 1)
+    assert drain(other) == [{"type": "get_help", "data": {"queue_position": 2}}]
+
+    # Another student's ticket changing without moving this student sends nothing.
+    await feed.changed(EVENT_ID, 1)
+    assert drain(other) == []
+
+    fake_queue.ticket = ticket_json(1, "Called", STUDENT_ID, caller_id=STAFF_ID)
+    fake_queue.positions = {OTHER_STUDENT_ID: 1}
+    await feed.changed(EVENT_ID, 1)
+    assert drain(other) == [{"type": "get_help", "data": {"queue_position": 1}}]
+
+
+@pytest.mark.asyncio
+async def test_changes_are_computed_once_for_all_subscribers(feed, fake_queue):
+    subscribers = [
+        feed.subscribe(EVENT_ID, STUDENT_ID + i, staff=False) for i in range(10)
+    ]
+    fake_queue.positions = {STUDENT_ID + i: i + 1 for i in range(10)}
+    await feed.changed(EVENT_ID, 1)
+    assert fake_queue.loaded == {"ticket": 1, "positions": 1}
+    assert all(len(drain(queue)) == 1 for queue in subscribers)
+
+
+@pytest.mark.asyncio
+async def test_changes_only_reach_their_event(feed, fake_queue):
+    other_event = feed.subscribe(EVENT_ID + 1, STAFF_ID, staff=True)
+    feed.subscribe(EVENT_ID, STAFF_ID, staff=True)
+    await feed.changed(EVENT_ID, 1)
+    assert drain(other_event) == []
+
+
+@pytest.mark.asyncio
+async def test_unsubscribe(feed, fake_queue):
+    staff = feed.subscribe(EVENT_ID, STAFF_ID, staff=True)
+    feed.unsubscribe(EVENT_ID, staff)
+    await feed.changed(EVENT_ID, 1)
+    assert drain(staff) == []
+    assert fake_queue.loaded["ticket"] == 0
+
+
+@pytest.mark.asyncio
+async def test_lagging_subscriber_is_told_to_resync(feed, fake_queue):
+    staff = feed.subscribe(EVENT_ID, STAFF_ID, staff=True)
+    for _ in range(OFFICE_HOURS_QUEUE_FEED_BACKLOG + 1):
+        await feed.changed(EVENT_ID, 1)
+    assert drain(staff) == [{"type": "resync"}]
+
+
+def test_ticket_overview(session: Session):
+    ticket = ticket_overview(session, office_hours_data.comp_110_queued_ticket.id)
+    assert ticket["id"] == office_hours_data.comp_110_queued_ticket.id
+    assert ticket["state"] == TicketState.QUEUED.to_string()
+    assert ticket["creators"][0]["id"] == user_data.student.id
+
+
+@pytest.mark.asyncio
+async def test_ticket_changes_are_announced_on_commit(
+    session: Session, oh_ticket_svc: OfficeHourTicketService
+):
+    """Ticket changes committed by any process reach a running feed and its queue index."""
+
+    async def load_ticket(ticket_id: int):
+        return ticket_overview(session, ticket_id)
+
+    listening_index = OfficeHoursQueueIndex()
+    feed = OfficeHoursQueueFeed(
+        load_ticket,
+        None,
+        listening_index,
+        _engine_str(POSTGRES_DATABASE, dialect="postgresql"),
+    )
+    event_id = office_hours_data.comp_110_current_office_hours.id
+    staff = feed.subscribe(event_id, user_data.instructor.id, staff=True)
+    task = asyncio.create_task(feed.run())
+    try:
+        assert await asyncio.wait_for(staff.get(), 5) == {"type": "resync"}
+        assert listening_index.get_help(session, event_id, user_data.student.id) == (
+            office_hours_data.comp_110_queued_ticket.id,
+            1,
+        )
+        oh_ticket_svc.call_ticket(
+            user_data.instructor, office_hours_data.comp_110_queued_ticket.id
+        )
+        message = await asyncio.wait_for(staff.get(), 5)
+    finally:
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+
+    assert message["type"] == "ticket"
+    assert message["list"] == "active"
+    assert message["data"]["id"] == office_hours_data.comp_110_queued_ticket.id
+    assert message["data"]["state"] == TicketState.CALLED.to_string()
+    # The listening process' index was updated without reloading the queue.
+    assert listening_index.get_help(None, event_id, user_data.student.id) == (
+        office_hours_data.comp_110_queued_ticket.id,
+        -1,
+    )
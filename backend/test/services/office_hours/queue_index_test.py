@@ -0,0 +1,138 @@
+"""Tests for the OfficeHoursQueueIndex of open tickets in each office hours queue."""
+
+from datetime import datetime, timedelta
+from sqlalchemy.orm import Session
+
+from ....entities.office_hours import OfficeHoursTicketEntity
+from ....models.office_hours.ticket import TicketState
+from ....services.office_hours import OfficeHourTicketService
+from ....services.office_hours.queue_index import OfficeHoursQueueIndex
+
+# Imported fixtures provide dependencies injected for the tests as parameters.
+from .fixtures import oh_ticket_svc, queue_index
+
+# Import the setup_teardown fixture explicitly to load entities in database
+from ..core_data import setup_insert_data_fixture as insert_order_0
+from ..academics.term_data import fake_data_fixture as insert_order_1
+from ..academics.course_data import fake_data_fixture as insert_order_2
+from ..academics.section_data import fake_data_fixture as insert_order_3
+from ..room_data import fake_data_fixture as insert_order_4
+from ..office_hours.office_hours_data import fake_data_fixture as insert_order_5
+
+# Import the fake model data in a namespace for test assertions
+from .. import user_data
+from ..office_hours import office_hours_data
+
+__authors__ = ["Kris Jordan"]
+__copyright__ = "Copyright 2025"
+__license__ = "MIT"
+
+EVENT_ID = office_hours_data.comp_110_current_office_hours.id
+QUEUED_TICKET_ID = office_hours_data.comp_110_queued_ticket.id
+CALLED_TICKET_ID = office_hours_data.comp_110_called_ticket.id
+
+
+def test_get_help(session: Session, queue_index: OfficeHoursQueueIndex):
+    assert queue_index.get_help(session, EVENT_ID, user_data.student.id) == (
+        QUEUED_TICKET_ID,
+        1,
+    )
+
+
+def test_get_help_without_ticket(session: Session, queue_index: OfficeHoursQueueIndex):
+    assert queue_index.get_help(session, EVENT_ID, user_data.user.id) == (None, -1)
+
+
+def test_queue_is_loaded_once(session: Session, queue_index: OfficeHoursQueueIndex):
+    queue_index.get_help(session, EVENT_ID, user_data.student.id)
+    # Without a session, a queue which was not indexed could not be loaded.
+    assert queue_index.queue_positions(None, EVENT_ID) == {user_data.student.id: 1}
+
+
+def test_queue_is_reloaded_after_ttl(session: Session):
+    queue_index = OfficeHoursQueueIndex(timedelta(0))
+    queue_index.get_help(session, EVENT_ID, user_data.student.id)
+    session.get(OfficeHoursTicketEntity, QUEUED_TICKET_ID).state = TicketState.CANCELED
+    session.commit()
+    assert queue_index.get_help(session, EVENT_ID, user_data.student.id) == (
+        CALLED_TICKET_ID,
+        -1,
+    )
+
+
+def test_positions_follow_creation_order(
+    session: Session, queue_index: OfficeHoursQueueIndex
+):
+    # Bracket the fixture's queued ticket, whose creation time is fixed when its data is imported.
+    queued_at = office_hours_data.comp_110_queued_ticket.created_at
+    queue_index.get_help(session, EVENT_ID, user_data.student.id)
+    queue_index.update(
+        EVENT_ID, 101, TicketState.QUEUED, queued_at + timedelta(minutes=1), [1001]
+    )
+    queue_index.update(
+        EVENT_ID, 100, TicketState.QUEUED, queued_at - timedelta(minutes=1), [1000]
+    )
+    assert queue_index.queue_positions(None, EVENT_ID) == {
+        1000: 1,
+        user_data.student.id: 2,
+        1001: 3,
+    }
+    assert queue_index.get_help(None, EVENT_ID, 1001) == (101, 3)
+
+    queue_index.update(
+        EVENT_ID, 100, TicketState.CALLED, queued_at - timedelta(minutes=1), [1000]
+    )
+    assert queue_index.get_help(None, EVENT_ID, 1000) == (100, -1)
+    assert queue_index.get_help(None, EVENT_ID, 1001) == (101, 2)
+
+    queue_index.update(
+        EVENT_ID, 100, TicketState.CLOSED, queued_at - timedelta(minutes=1), [1000]
+    )
+    assert queue_index.get_help(None, EVENT_ID, 1000) == (None, -1)
+
+
+def test_stale_changes_are_ignored(
+    session: Session, queue_index: OfficeHoursQueueIndex
+):
+    now = datetime.now()
+    queue_index.get_help(session, EVENT_ID, user_data.student.id)
+    queue_index.update(EVENT_ID, 100, TicketState.CALLED, now, [1000])
+    queue_index.update(EVENT_ID, 100, TicketState.QUEUED, now, [1000])
+    assert queue_index.get_help(None, EVENT_ID, 1000) == (100, -1)
+
+    queue_index.update(EVENT_ID, 100, TicketState.CANCELED, now, [1000])
+    queue_index.update(EVENT_ID, 100, TicketState.QUEUED, now, [1000])
+    assert queue_index.get_help(None, EVENT_ID, 1000) == (None, -1)
+
+
+def test_changes_to_unindexed_events_are_ignored(
+    session: Session, queue_index: OfficeHoursQueueIndex
+):
+    queue_index.update(EVENT_ID, 100, TicketState.QUEUED, datetime.now(), [1000])
+    assert queue_index.get_help(session, EVENT_ID, 1000) == (None, -1)
+
+
+def test_invalidate(session: Session, queue_index: OfficeHoursQueueIndex):
+    queue_index.get_help(session, EVENT_ID, user_data.student.id)
+    queue_index.update(EVENT_ID, 100, TicketState.QUEUED, datetime.now(), [1000])
+    queue_index.invalidate()
+    assert queue_index.get_help(session, EVENT_ID, 1000) == (None, -1)
+
+
+def test_ticket_lifecycle_updates_index(
+    session: Session,
+    queue_index: OfficeHoursQueueIndex,
+    oh_ticket_svc: OfficeHourTicketService,
+):
+    queue_index.get_help(session, EVENT_ID, user_data.student.id)
+
+    oh_ticket_svc.call_ticket(user_data.instructor, QUEUED_TICKET_ID)
+    assert queue_index.queue_positions(None, EVENT_ID) == {}
+
+    oh_ticket_svc.close_ticket(
+        user_data.instructor,
+        QUEUED_TICKET_ID,
+        office_hours_data.sample_delete_payload,
+    )
+    oh_ticket_svc.cancel_ticket(user_data.instructor, CALLED_TICKET_ID)
+    assert queue_index.get_help(None, EVENT_ID, user_data.student.id) == (None, -1)
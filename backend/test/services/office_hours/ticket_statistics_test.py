@@ -0,0 +1,214 @@
+"""Tests for the daily rollup of closed office hours ticket statistics."""
+
+from datetime import datetime, time, timedelta
+from pytest import approx
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from ....entities.academics.section_member_entity import SectionMemberEntity
+from ....entities.office_hours import (
+    OfficeHoursTicketEntity,
+    OfficeHoursTicketStatisticsEntity,
+)
+from ....models.office_hours.ticket_state import TicketState
+from ....models.office_hours.ticket_type import TicketType
+from ....models.pagination import TicketPaginationParams
+from ....services.office_hours import (
+    OfficeHoursStatisticsService,
+    OfficeHourTicketService,
+)
+from ....services.office_hours.ticket_statistics import rebuild_ticket_statistics
+
+# Imported fixtures provide dependencies injected for the tests as parameters.
+from .fixtures import oh_statistics_svc, oh_ticket_svc, queue_index
+
+# Import the setup_teardown fixture explicitly to load entities in database
+from ..core_data import setup_insert_data_fixture as insert_order_0
+from ..academics.term_data import fake_data_fixture as insert_order_1
+from ..academics.course_data import fake_data_fixture as insert_order_2
+from ..academics.section_data import fake_data_fixture as insert_order_3
+from ..room_data import fake_data_fixture as insert_order_4
+from ..office_hours.office_hours_data import fake_data_fixture as insert_order_5
+
+# Import the fake model data in a namespace for test assertions
+from .. import user_data
+from ..academics import section_data
+from ..office_hours import office_hours_data
+
+__authors__ = ["Kris Jordan"]
+__copyright__ = "Copyright 2025"
+__license__ = "MIT"
+
+SITE_ID = office_hours_data.comp_110_site.id
+
+
+def params(
+    range_start: datetime | None = None,
+    range_end: datetime | None = None,
+    student_ids: list[int] = [],
+    staff_ids: list[int] = [],
+) -> TicketPaginationParams:
+    return TicketPaginationParams(
+        range_start=range_start.isoformat() if range_start else "",
+        range_end=range_end.isoformat() if range_end else "",
+        student_ids=student_ids,
+        staff_ids=staff_ids,
+    )
+
+
+def rollup_rows(session: Session) -> list[tuple]:
+    """The rollup's rows, with sums of seconds rounded to the millisecond."""
+    rollup = OfficeHoursTicketStatisticsEntity
+    return [
+        tuple(round(value, 3) if isinstance(value, float) else value for value in row)
+        for row in session.execute(
+            select(
+                rollup.course_site_id,
+                rollup.day,
+                rollup.caller_user_id,
+                rollup.creator_user_id,
+                rollup.tickets,
+                rollup.conceptual_tickets,
+                rollup.assignment_tickets,
+                rollup.called_tickets,
+                rollup.wait_seconds,
+                rollup.closed_tickets,
+                rollup.duration_seconds,
+            ).order_by(
+                rollup.course_site_id,
+                rollup.day,
+                rollup.caller_user_id,
+                rollup.creator_user_id.nulls_first(),
+            )
+        )
+    ]
+
+
+def add_closed_ticket(
+    session: Session, created_at: datetime, creator_ids: list[int]
+) -> None:
+    """Add a closed assignment ticket waiting 10 minutes and helped for 5 minutes."""
+    ticket = OfficeHoursTicketEntity(
+        description="Closed ticket",
+        type=TicketType.ASSIGNMENT_HELP,
+        state=TicketState.CLOSED,
+        created_at=created_at,
+        called_at=created_at + timedelta(minutes=10),
+        closed_at=created_at + timedelta(minutes=15),
+        office_hours_id=office_hours_data.comp_110_current_office_hours.id,
+        caller_id=section_data.comp110_uta.id,
+    )
+    ticket.creators = [
+        session.get(SectionMemberEntity, creator_id) for creator_id in creator_ids
+    ]
+    session.add(ticket)
+    session.commit()
+
+
+def test_close_ticket_adds_to_rollup(
+    session: Session,
+    oh_ticket_svc: OfficeHourTicketService,
+    oh_statistics_svc: OfficeHoursStatisticsService,
+):
+    oh_ticket_svc.close_ticket(
+        user_data.instructor,
+        office_hours_data.comp_110_called_ticket.id,
+        office_hours_data.sample_delete_payload,
+    )
+    statistics = oh_statistics_svc.get_statistics(
+        user_data.instructor, SITE_ID, params()
+    )
+    assert statistics.total_tickets == 4
+    assert statistics.total_assignment == 1
+
+    # The incremental rollup matches one rebuilt from the tickets.
+    incremental = rollup_rows(session)
+    rebuild_ticket_statistics(session)
+    assert rollup_rows(session) == incremental
+
+
+def test_group_ticket_is_counted_once_per_selected_creator(
+    session: Session, oh_statistics_svc: OfficeHoursStatisticsService
+):
+    add_closed_ticket(
+        session,
+        datetime.now() - timedelta(days=3),
+        [section_data.comp110_student_0.id, section_data.comp110_student_1.id],
+    )
+    rebuild_ticket_statistics(session)
+
+    every_student = oh_statistics_svc.get_statistics(
+        user_data.instructor, SITE_ID, params()
+    )
+    assert every_student.total_tickets == 4
+    assert every_student.total_assignment == 1
+
+    both_students = oh_statistics_svc.get_statistics(
+        user_data.instructor,
+        SITE_ID,
+        params(student_ids=[user_data.user.id, user_data.student.id]),
+    )
+    raw_tickets = oh_statistics_svc.get_paginated_tickets(
+        user_data.instructor,
+        SITE_ID,
+        params(student_ids=[user_data.user.id, user_data.student.id]),
+    )
+    assert both_students.total_tickets == raw_tickets.length == 5
+
+    uta = oh_statistics_svc.get_statistics(
+        user_data.instructor,
+        SITE_ID,
+        params(student_ids=[user_data.user.id], staff_ids=[user_data.uta.id]),
+    )
+    assert uta.total_tickets == 1
+    assert uta.average_wait_time == approx(10)
+    assert uta.average_duration == approx(5)
+
+
+def test_partial_days_of_range_are_read_from_tickets(
+    session: Session, oh_statistics_svc: OfficeHoursStatisticsService
+):
+    midnight = datetime.combine(datetime.now().date(), time()) - timedelta(days=10)
+    for created_at in [
+        midnight + timedelta(hours=8),
+        midnight + timedelta(hours=16),
+        midnight + timedelta(days=1, hours=12),
+        midnight + timedelta(days=2, hours=8),
+        midnight + timedelta(days=2, hours=16),
+    ]:
+        add_closed_ticket(session, created_at, [section_data.comp110_student_0.id])
+    rebuild_ticket_statistics(session)
+
+    def total_tickets(range_start: datetime, range_end: datetime) -> int:
+        return oh_statistics_svc.get_statistics(
+            user_data.instructor, SITE_ID, params(range_start, range_end)
+        ).total_tickets
+
+    assert total_tickets(midnight, midnight + timedelta(days=3)) == 5
+    assert (
+        total_tickets(
+            midnight + timedelta(hours=12), midnight + timedelta(days=2, hours=12)
+        )
+        == 3
+    )
+    assert (
+        total_tickets(midnight + timedelta(hours=12), midnight + timedelta(hours=20))
+        == 1
+    )
+
+
+def test_rebuild_range_keeps_other_days(session: Session):
+    add_closed_ticket(
+        session,
+        datetime.now() - timedelta(days=3),
+        [section_data.comp110_student_0.id],
+    )
+    rebuild_ticket_statistics(session)
+    rows = rollup_rows(session)
+
+    today = datetime.now().date()
+    rebuild_ticket_statistics(session, today, today)
+    assert rollup_rows(session) == rows
+
+    rebuild_ticket_statistics(session, today - timedelta(days=3), today)
+    assert rollup_rows(session) == rows
@@ -0,0 +1,46 @@
+"""Tests for the PermissionCache shared by PermissionService instances."""
+
+from pathlib import Path
+
+from ...services.permission_cache import Grant, PermissionCache
+
+__authors__ = ["Kris Jordan"]
+__copyright__ = "Copyright 2024"
+__license__ = "MIT"
+
+
+def test_get_missing():
+    cache = PermissionCache(":memory:")
+    assert cache.get(1) is None
+
+
+def test_put_and_get():
+    cache = PermissionCache(":memory:")
+    cache.put(1, cache.version(), [Grant("checkin.create", "checkin")])
+    assert cache.get(1) == [Grant("checkin.create", "checkin")]
+    assert cache.get(2) is None
+
+
+def test_bump_makes_entries_stale():
+    cache = PermissionCache(":memory:")
+    cache.put(1, cache.version(), [Grant("checkin.create", "checkin")])
+    cache.bump()
+    assert cache.get(1) is None
+
+
+def test_entry_loaded_before_a_bump_is_never_served():
+    cache = PermissionCache(":memory:")
+    version = cache.version()
+    cache.bump()
+    cache.put(1, version, [Grant("checkin.create", "checkin")])
+    assert cache.get(1) is None
+
+
+def test_shared_between_processes_through_file(tmp_path: Path):
+    """Two caches over the same file stand in for two worker processes."""
+    path = str(tmp_path / "permissions.sqlite3")
+    first, second = PermissionCache(path), PermissionCache(path)
+    first.put(1, first.version(), [Grant("*", "*")])
+    assert second.get(1) == [Grant("*", "*")]
+    second.bump()
+    assert first.get(1) is None
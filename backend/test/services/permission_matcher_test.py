@@ -0,0 +1,96 @@
+"""Tests for the PermissionMatcher used by PermissionService."""
+
+import re
+from random import Random
+
+from ...models import Permission
+from ...services.permission_matcher import PermissionMatcher
+
+__authors__ = ["Kris Jordan"]
+__copyright__ = "Copyright 2024"
+__license__ = "MIT"
+
+
+def _regex_matches(permissions: list[Permission], action: str, resource: str) -> bool:
+    """Reference implementation: a glob-style regex per permission."""
+
+    def expand(pattern: str) -> re.Pattern:
+        return re.compile(re.escape(pattern).replace(r"\*", ".*"))
+
+    return any(
+        expand(p.action).fullmatch(action) and expand(p.resource).fullmatch(resource)
+        for p in permissions
+    )
+
+
+def test_no_permissions():
+    assert PermissionMatcher([]).matches("user.delete", "user/1") is False
+
+
+def test_exact_permission():
+    matcher = PermissionMatcher(
+        [Permission(action="checkin.create", resource="checkin")]
+    )
+    assert matcher.matches("checkin.create", "checkin")
+    assert matcher.matches("checkin.create", "checkin/1") is False
+    assert matcher.matches("checkin.createx", "checkin") is False
+    assert matcher.matches("checkin", "checkin") is False
+
+
+def test_wildcards_cross_separators():
+    matcher = PermissionMatcher([Permission(action="coworking.*", resource="user/*")])
+    assert matcher.matches("coworking.reservation.read", "user/1")
+    assert matcher.matches("coworking.", "user/")
+    assert matcher.matches("coworking.reservation.read", "user/1/profile")
+    assert matcher.matches("coworkingx", "user/1") is False
+
+
+def test_wildcard_inside_pattern():
+    matcher = PermissionMatcher(
+        [Permission(action="academics.*.update", resource="section/*/staff")]
+    )
+    assert matcher.matches("academics.section.update", "section/4/staff")
+    assert matcher.matches("academics.update", "section/4/staff") is False
+    assert matcher.matches("academics..update", "section//staff")
+    assert matcher.matches("academics.section.update", "section/4/staff/1") is False
+
+
+def test_dot_is_literal():
+    matcher = PermissionMatcher([Permission(action="checkin.delete", resource="*")])
+    assert matcher.matches("checkinxdelete", "checkin") is False
+
+
+def test_resource_is_scoped_to_its_action():
+    matcher = PermissionMatcher(
+        [
+            Permission(action="organization.update", resource="organization/cads"),
+            Permission(action="organization.*", resource="organization/acm"),
+        ]
+    )
+    assert matcher.matches("organization.update", "organization/cads")
+    assert matcher.matches("organization.update", "organization/acm")
+    assert matcher.matches("organization.delete", "organization/acm")
+    assert matcher.matches("organization.delete", "organization/cads") is False
+
+
+def test_matches_regex_reference():
+    random = Random(423)
+    alphabet = "ab.*/"
+
+    def pattern() -> str:
+        return "".join(random.choice(alphabet) for _ in range(random.randrange(0, 7)))
+
+    def string() -> str:
+        return "".join(random.choice("ab./") for _ in range(random.randrange(0, 7)))
+
+    for _ in range(300):
+        permissions = [
+            Permission(action=pattern(), resource=pattern())
+            for _ in range(random.randrange(1, 4))
+        ]
+        matcher = PermissionMatcher(permissions)
+        for _ in range(20):
+            action, resource = string(), string()
+            assert matcher.matches(action, resource) == _regex_matches(
+                permissions, action, resource
+            ), (permissions, action, resource)
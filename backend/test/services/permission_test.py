@@ -1,10 +1,12 @@
 """Tests for the PermissionService class."""
 
 import pytest
+from sqlalchemy.orm import Session
 
 # Tested Dependencies
 from ...models import Permission, User
-from ...services import PermissionService
+from ...services import PermissionService, RoleService
+from ...services.permission_cache import PermissionCache
 
 # Data Setup and Injected Service Fixtures
 from .core_data import setup_insert_data_fixture
@@ -14,6 +16,7 @@ from .fixtures import permission_svc
 from .role_data import ambassador_role
 from .user_data import root, ambassador, user
 from .permission_data import ambassador_permission
+from .query_counter import count_queries
 
 __authors__ = ["Kris Jordan"]
 __copyright__ = "Copyright 2023"
@@ -127,3 +130,52 @@ def test_check_specific_permission(permission_svc: PermissionService):
 def test_get_user_roles_permissions(permission_svc: PermissionService):
     """Test covers an edge case of _get_user_roles_permissions when user does not exist"""
     assert permission_svc._get_user_roles_permissions(User(id=423)) == []
+
+
+def test_check_loads_permissions_once(
+    session: Session, permission_svc: PermissionService
+):
+    """Tests that repeated checks for a subject are answered without further queries"""
+    assert permission_svc.check(ambassador, "checkin.create", "checkin")
+    with count_queries(session) as counter:
+        assert permission_svc.check(ambassador, "checkin.create", "checkin")
+        assert permission_svc.check(ambassador, "checkin.delete", "checkin") is False
+        permission_svc.enforce(ambassador, "checkin.create", "checkin")
+    assert counter.count == 0
+
+
+def test_check_after_role_membership_changes(
+    session: Session, permission_svc: PermissionService
+):
+    """Tests that checks reflect role membership changes made through RoleService"""
+    role_svc = RoleService(session, permission_svc)
+    assert permission_svc.check(user, "checkin.create", "checkin") is False
+    role_svc.add_member(root, ambassador_role.id, user)
+    assert permission_svc.check(user, "checkin.create", "checkin")
+    role_svc.remove_member(root, ambassador_role.id, user.id)
+    assert permission_svc.check(user, "checkin.create", "checkin") is False
+
+
+def test_check_shares_permissions_across_services(session: Session):
+    """Tests that a new request's PermissionService reads permissions from the shared cache"""
+    cache = PermissionCache(":memory:")
+    assert PermissionService(session, cache).check(
+        ambassador, "checkin.create", "checkin"
+    )
+    with count_queries(session) as counter:
+        assert PermissionService(session, cache).check(
+            ambassador, "checkin.create", "checkin"
+        )
+    assert counter.count == 0
+
+
+def test_grant_invalidates_shared_permissions(session: Session):
+    """Tests that a grant in one request is seen by later requests sharing the cache"""
+    cache = PermissionCache(":memory:")
+    assert (
+        PermissionService(session, cache).check(user, "checkin.delete", "checkin")
+        is False
+    )
+    p = Permission(action="checkin.delete", resource="*")
+    PermissionService(session, cache).grant(root, user, p)
+    assert PermissionService(session, cache).check(user, "checkin.delete", "checkin")
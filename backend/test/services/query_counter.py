@@ -0,0 +1,51 @@
+"""Helper context manager for counting the SQL statements a block of code emits.
+
+Performance-sensitive service methods are tested by asserting the number of database
+round-trips they make stays constant as the amount of data grows."""
+
+from contextlib import contextmanager
+from typing import Iterator
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+__authors__ = ["Kris Jordan"]
+__copyright__ = "Copyright 2024"
+__license__ = "MIT"
+
+
+class QueryCounter:
+    """Records the SQL statements executed while a `count_queries` block is active."""
+
+    statements: list[str]
+
+    def __init__(self):
+        self.statements = []
+
+    @property
+    def count(self) -> int:
+        return len(self.statements)
+
+
+@contextmanager
+def count_queries(session: Session) -> Iterator[QueryCounter]:
+    """Count the statements executed on the engine bound to `session`.
+
+    Args:
+        session (Session) - A SQLAlchemy Session
+
+    Returns:
+        Iterator[QueryCounter] - A counter whose `count` is the number of statements executed
+    """
+    counter = QueryCounter()
+    engine = session.get_bind()
+
+    def before_cursor_execute(
+        conn, cursor, statement, parameters, context, executemany
+    ):
+        counter.statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        yield counter
+    finally:
+        event.remove(engine, "before_cursor_execute", before_cursor_execute)
@@ -0,0 +1,73 @@
+"""Tests for the services served over a read-only Session."""
+
+import pytest
+from sqlalchemy import Engine
+from sqlalchemy.orm import Session
+
+from ...api.readonly_services import (
+    readonly_article_svc,
+    readonly_course_svc,
+    readonly_organization_svc,
+)
+from ...services import ArticleService, OrganizationService
+from ...services.academics import CourseService
+from ...services.permission_cache import PermissionCache
+
+# Injected Service Fixtures
+from .fixtures import article_svc, organization_svc_integration
+from .academics.fixtures import permission_svc, course_svc
+
+# Import the setup_teardown fixture explicitly to load entities in database
+from .core_data import setup_insert_data_fixture as insert_order_0
+from .academics.course_data import fake_data_fixture as insert_order_1
+from .articles.article_data import fake_data_fixture as insert_order_2
+
+# Test data
+from . import user_data
+from .academics import course_data
+from .articles import article_data
+
+__authors__ = ["Kris Jordan"]
+__copyright__ = "Copyright 2025"
+__license__ = "MIT"
+
+
+@pytest.fixture()
+def readonly_session(session: Session, test_engine: Engine):
+    """Session over read-only transactions, which sees the data committed through `session`."""
+    readonly_session = Session(test_engine.execution_options(postgresql_readonly=True))
+    try:
+        yield readonly_session
+    finally:
+        readonly_session.close()
+
+
+def test_get_welcome_overview_readonly(
+    readonly_session: Session, article_svc: ArticleService
+):
+    svc = readonly_article_svc(readonly_session, PermissionCache(":memory:"))
+    assert svc.get_welcome_overview(user_data.student) == (
+        article_svc.get_welcome_overview(user_data.student)
+    )
+    assert svc.get_welcome_overview(None) == article_svc.get_welcome_overview(None)
+
+
+def test_get_article_readonly(readonly_session: Session):
+    svc = readonly_article_svc(readonly_session, PermissionCache(":memory:"))
+    article = article_data.articles[0]
+    assert svc.get_article(article.slug).id == article.id
+
+
+def test_all_organizations_readonly(
+    readonly_session: Session, organization_svc_integration: OrganizationService
+):
+    svc = readonly_organization_svc(readonly_session, PermissionCache(":memory:"))
+    assert svc.all() == organization_svc_integration.all()
+
+
+def test_courses_readonly(readonly_session: Session, course_svc: CourseService):
+    svc = readonly_course_svc(readonly_session, PermissionCache(":memory:"))
+    assert svc.all() == course_svc.all()
+    assert svc.get_by_id(course_data.comp_110.id) == course_svc.get_by_id(
+        course_data.comp_110.id
+    )
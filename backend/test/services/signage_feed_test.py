@@ -0,0 +1,127 @@
+"""Tests for the SignageFeed broadcasting signage data to displays."""
+
+import asyncio
+import pytest
+
+from ...services.signage_feed import SignageFeed, SIGNAGE_FEED_BACKLOG
+
+__authors__ = ["Kris Jordan"]
+__copyright__ = "Copyright 2025"
+__license__ = "MIT"
+
+
+class FakeSignage:
+    """Signage payloads a test controls, counting how often each is computed."""
+
+    def __init__(self):
+        self.fast = {"available_rooms": ["SN135"], "seat_availability": []}
+        self.slow = {"top_users": [], "announcements": []}
+        self.computed = {"fast": 0, "slow": 0}
+
+    async def compute_fast(self):
+        self.computed["fast"] += 1
+        return dict(self.fast)
+
+    async def compute_slow(self):
+        self.computed["slow"] += 1
+        return dict(self.slow)
+
+
+def drain(queue: asyncio.Queue) -> list[dict]:
+    messages = []
+    while not queue.empty():
+        messages.append(queue.get_nowait())
+    return messages
+
+
+@pytest.fixture()
+def signage() -> FakeSignage:
+    return FakeSignage()
+
+
+@pytest.fixture()
+def feed(signage: FakeSignage) -> SignageFeed:
+    return SignageFeed(signage.compute_fast, signage.compute_slow, 60, 600)
+
+
+@pytest.mark.asyncio
+async def test_subscriber_receives_complete_data(feed: SignageFeed, signage):
+    await feed.refresh("fast")
+    await feed.refresh("slow")
+    queue = feed.subscribe()
+    assert drain(queue) == [
+        {"type": "fast", "data": signage.fast},
+        {"type": "slow", "data": signage.slow},
+    ]
+
+
+@pytest.mark.asyncio
+async def test_refresh_publishes_only_changed_fields(feed: SignageFeed, signage):
+    await feed.refresh("fast")
+    queue = feed.subscribe()
+    drain(queue)
+
+    signage.fast["available_rooms"] = []
+    await feed.refresh("fast")
+    assert drain(queue) == [{"type": "fast", "data": {"available_rooms": []}}]
+
+
+@pytest.mark.asyncio
+async def test_refresh_without_changes_publishes_nothing(feed: SignageFeed):
+    await feed.refresh("fast")
+    queue = feed.subscribe()
+    drain(queue)
+
+    await feed.refresh("fast")
+    assert drain(queue) == []
+
+
+@pytest.mark.asyncio
+async def test_unsubscribed_receives_nothing(feed: SignageFeed, signage):
+    queue = feed.subscribe()
+    feed.unsubscribe(queue)
+    signage.fast["available_rooms"] = []
+    await feed.refresh("fast")
+    assert drain(queue) == []
+
+
+@pytest.mark.asyncio
+async def test_lagging_subscriber_is_sent_complete_data(feed: SignageFeed, signage):
+    await feed.refresh("fast")
+    queue = feed.subscribe()
+    # The complete data fills one slot, so the last of these deltas overflows the backlog.
+    for i in range(SIGNAGE_FEED_BACKLOG):
+        signage.fast["available_rooms"] = [f"SN{i}"]
+        await feed.refresh("fast")
+    assert drain(queue) == [{"type": "fast", "data": signage.fast}]
+
+
+@pytest.mark.asyncio
+async def test_run_computes_only_with_subscribers(feed: SignageFeed, signage):
+    task = asyncio.create_task(feed.run())
+    await asyncio.sleep(0.01)
+    assert signage.computed == {"fast": 0, "slow": 0}
+
+    queue = feed.subscribe()
+    message = await asyncio.wait_for(queue.get(), 1)
+    assert message["type"] == "slow"
+    message = await asyncio.wait_for(queue.get(), 1)
+    assert message == {"type": "fast", "data": signage.fast}
+    task.cancel()
+    await asyncio.gather(task, return_exceptions=True)
+
+
+@pytest.mark.asyncio
+async def test_notify_changed_refreshes_before_the_tick(feed: SignageFeed, signage):
+    task = asyncio.create_task(feed.run())
+    queue = feed.subscribe()
+    await asyncio.wait_for(queue.get(), 1)
+    await asyncio.wait_for(queue.get(), 1)
+
+    signage.fast["available_rooms"] = []
+    await asyncio.to_thread(feed.notify_changed)
+    message = await asyncio.wait_for(queue.get(), 1)
+    assert message == {"type": "fast", "data": {"available_rooms": []}}
+    assert signage.computed["slow"] == 1
+    task.cancel()
+    await asyncio.gather(task, return_exceptions=True)
@@ -0,0 +1,63 @@
+"""Benchmark of authentication overhead per request with and without the UserCache.
+
+Run with `pytest -rP` to see the timings printed by this test."""
+
+from time import perf_counter
+
+import jwt
+from fastapi.security.http import HTTPAuthorizationCredentials
+from sqlalchemy.orm import Session
+
+from ...api.authentication import registered_user, _generate_token
+from ...services import UserService, PermissionService
+from ...services.permission_cache import PermissionCache
+from ...services.user_cache import UserCache
+
+# Data Setup and Injected Service Fixtures
+from .core_data import setup_insert_data_fixture
+from .query_counter import count_queries
+
+# Data Models for Fake Data Inserted in Setup
+from .user_data import ambassador
+
+__authors__ = ["Kris Jordan"]
+__copyright__ = "Copyright 2024"
+__license__ = "MIT"
+
+NUMBER_OF_REQUESTS = 500
+
+
+def _authenticate(session: Session, user_cache: UserCache, requests: int):
+    permission_cache = PermissionCache(":memory:")
+    token = HTTPAuthorizationCredentials(
+        scheme="Bearer", credentials=_generate_token(ambassador.onyen, ambassador.pid)
+    )
+    start = perf_counter()
+    with count_queries(session) as counter:
+        for _ in range(requests):
+            # Each request gets fresh request-scoped services, as FastAPI would provide.
+            user_svc = UserService(
+                session, PermissionService(session, permission_cache), user_cache
+            )
+            user = registered_user(user_svc, token, user_cache, permission_cache)
+            assert user.pid == ambassador.pid
+    return perf_counter() - start, counter.count
+
+
+def test_benchmark_registered_user(session: Session):
+    # A cache of size zero never holds an entry, which is the behavior without a cache.
+    uncached_latency, uncached_queries = _authenticate(
+        session, UserCache(size=0), NUMBER_OF_REQUESTS
+    )
+    cached_latency, cached_queries = _authenticate(
+        session, UserCache(), NUMBER_OF_REQUESTS
+    )
+
+    assert cached_queries < NUMBER_OF_REQUESTS
+    assert uncached_queries >= NUMBER_OF_REQUESTS
+
+    print(
+        f"{NUMBER_OF_REQUESTS} authenticated requests: "
+        f"uncached {uncached_latency * 1000:.1f}ms ({uncached_queries} queries), "
+        f"cached {cached_latency * 1000:.1f}ms ({cached_queries} queries)"
+    )
@@ -0,0 +1,92 @@
+"""Tests for the UserCache of authenticated users and decoded tokens."""
+
+from datetime import timedelta
+from time import time
+
+from ...models import UserDetails
+from ...services import UserService
+from ...services.user_cache import UserCache
+
+# Data Setup and Injected Service Fixtures
+from .core_data import setup_insert_data_fixture
+from .fixtures import user_svc_integration
+
+# Data Models for Fake Data Inserted in Setup
+from .user_data import root, user
+
+__authors__ = ["Kris Jordan"]
+__copyright__ = "Copyright 2024"
+__license__ = "MIT"
+
+
+def _details(pid: int, first_name: str = "Rhonda") -> UserDetails:
+    return UserDetails(id=pid, pid=pid, onyen=f"user{pid}", first_name=first_name)
+
+
+def test_get_user_missing():
+    assert UserCache().get_user(1, 0) is None
+
+
+def test_put_and_get_user():
+    cache = UserCache()
+    cache.put_user(_details(1), 0)
+    cached = cache.get_user(1, 0)
+    assert cached is not None
+    assert cached.first_name == "Rhonda"
+
+
+def test_cached_user_is_not_shared():
+    cache = UserCache()
+    cache.put_user(_details(1), 0)
+    cache.get_user(1, 0).first_name = "Mutated"
+    assert cache.get_user(1, 0).first_name == "Rhonda"
+
+
+def test_stale_permissions_version_is_not_served():
+    cache = UserCache()
+    cache.put_user(_details(1), 0)
+    assert cache.get_user(1, 1) is None
+    assert cache.get_user(1, 0) is None
+
+
+def test_expired_user_is_not_served():
+    cache = UserCache(ttl=timedelta(0))
+    cache.put_user(_details(1), 0)
+    assert cache.get_user(1, 0) is None
+
+
+def test_least_recently_used_user_evicted():
+    cache = UserCache(size=2)
+    cache.put_user(_details(1), 0)
+    cache.put_user(_details(2), 0)
+    cache.get_user(1, 0)
+    cache.put_user(_details(3), 0)
+    assert cache.get_user(1, 0) is not None
+    assert cache.get_user(2, 0) is None
+    assert cache.get_user(3, 0) is not None
+
+
+def test_claims_expire_with_token():
+    cache = UserCache()
+    cache.put_claims("fresh", {"pid": 1, "exp": time() + 60})
+    cache.put_claims("expired", {"pid": 2, "exp": time() - 1})
+    assert cache.get_claims("fresh")["pid"] == 1
+    assert cache.get_claims("expired") is None
+
+
+def test_update_evicts_user(user_svc_integration: UserService):
+    cache: UserCache = user_svc_integration._user_cache
+    cached = user_svc_integration.get(user.pid)
+    cache.put_user(cached, 0)
+    cached.first_name = "Updated"
+    user_svc_integration.update(root, cached)
+    assert cache.get_user(user.pid, 0) is None
+
+
+def test_create_evicts_user(user_svc_integration: UserService):
+    cache: UserCache = user_svc_integration._user_cache
+    cache.put_user(_details(123456789), 0)
+    user_svc_integration.create(
+        root, UserDetails(pid=123456789, onyen="newuser", email="new@unc.edu")
+    )
+    assert cache.get_user(123456789, 0) is None
@@ -1,12 +1,17 @@
 """Tests for the UserService class."""
 
 import pytest
+from sqlalchemy.orm import Session
 
 # Tested Dependencies
+from ...entities import UserEntity
 from ...models.user import User, NewUser
 from ...models.pagination import PaginationParams
 from ...services import UserService, PermissionService
-from ...services.exceptions import ResourceNotFoundException
+from ...services.exceptions import (
+    InvalidPaginationCursorException,
+    ResourceNotFoundException,
+)
 
 # Data Setup and Injected Service Fixtures
 from .core_data import setup_insert_data_fixture
@@ -179,6 +184,80 @@ def test_list_filter(user_svc: UserService):
     assert users.items[0].id == ambassador.id
 
 
+def list_by_cursor(user_svc: UserService, order_by: str) -> list[int]:
+    """The IDs of every user, listed two at a time by following cursors."""
+    pagination_params = PaginationParams(page_size=2, order_by=order_by, filter="")
+    by_cursor = []
+    while True:
+        users = user_svc.list(ambassador, pagination_params)
+        by_cursor.extend(user.id for user in users.items)
+        if users.next_cursor is None:
+            return by_cursor
+        pagination_params = pagination_params.model_copy(
+            update={"cursor": users.next_cursor}
+        )
+
+
+def list_by_offset(user_svc: UserService, order_by: str) -> list[int]:
+    """The IDs of every user, listed in one page."""
+    by_offset = user_svc.list(
+        ambassador,
+        PaginationParams(page_size=len(user_data.users), order_by=order_by),
+    )
+    assert by_offset.next_cursor is None
+    return [user.id for user in by_offset.items]
+
+
+def test_list_cursor(user_svc: UserService):
+    """Test that following cursors produces the same users as paging by offset."""
+    assert list_by_cursor(user_svc, "first_name") == list_by_offset(
+        user_svc, "first_name"
+    )
+
+
+def test_list_cursor_nullable(session: Session, user_svc: UserService):
+    """Test that cursors page through users sorted by a column with NULLs."""
+    session.get(UserEntity, user_data.user.id).bio = "Hello"
+    session.get(UserEntity, user_data.root.id).bio = "Hello"
+    session.commit()
+
+    by_offset = list_by_offset(user_svc, "bio")
+    assert by_offset[:2] == sorted([user_data.user.id, user_data.root.id])
+    assert list_by_cursor(user_svc, "bio") == by_offset
+
+
+def test_list_count(user_svc: UserService):
+    """Test that the length of a list is exact, estimated, or skipped as requested."""
+    exact = user_svc.list(ambassador, PaginationParams(page_size=2))
+    assert exact.length == len(user_data.users)
+
+    estimate = user_svc.list(
+        ambassador, PaginationParams(page_size=2, count="estimate")
+    )
+    assert estimate.length >= 0
+    assert [user.id for user in estimate.items] == [user.id for user in exact.items]
+
+    none = user_svc.list(ambassador, PaginationParams(page_size=2, count="none"))
+    assert none.length == -1
+    assert [user.id for user in none.items] == [user.id for user in exact.items]
+
+
+def test_list_invalid_cursor(user_svc: UserService):
+    """Test that a cursor not returned by a list is rejected."""
+    with pytest.raises(InvalidPaginationCursorException):
+        user_svc.list(ambassador, PaginationParams(cursor="not-a-cursor"))
+    with pytest.raises(InvalidPaginationCursorException):
+        user_svc.list(
+            ambassador,
+            PaginationParams(
+                order_by="first_name",
+                cursor=user_svc.list(
+                    ambassador, PaginationParams(page_size=1)
+                ).next_cursor,
+            ),
+        )
+
+
 def test_list_enforces_permission(
     user_svc: UserService, permission_svc_mock: PermissionService
 ):
@@ -19,7 +19,9 @@ import { MyCoursesService } from 'src/app/my-courses/my-courses.service';
 import {
   OfficeHourGetHelpOverview,
   OfficeHourTicketOverview,
-  TicketDraft
+  OfficeHourTicketOverviewJson,
+  TicketDraft,
+  parseOfficeHourTicketOverviewJson
 } from 'src/app/my-courses/my-courses.model';
 import { Subscription, timer } from 'rxjs';
 import { FormBuilder, FormControl, Validators } from '@angular/forms';
@@ -54,8 +56,8 @@ export class OfficeHoursGetHelpComponent implements OnInit, OnDestroy {
   data: WritableSignal<OfficeHourGetHelpOverview | undefined> =
     signal(undefined);
 
-  /** Stores subscription to the timer observable that refreshes data every 10s */
-  timer!: Subscription;
+  /** Stores subscription to the feed pushing changes to the user's ticket and queue position */
+  feedSubscription!: Subscription;
 
   /** Stores subscription to a timer observable for flashing the title for notifications */
   titleFlashTimer: Subscription | undefined;
@@ -82,20 +84,26 @@ export class OfficeHoursGetHelpComponent implements OnInit, OnDestroy {
     this.ohEventId = this.route.snapshot.params['event_id'];
   }
 
-  /** Create a timer subscription to poll office hour data at an interval at view initalization */
+  /** Load office hour data and subscribe to changes to the user's ticket at view initialization */
   ngOnInit(): void {
-    this.timer = timer(0, 10000).subscribe(() => {
-      this.pollData();
-    });
+    this.feedSubscription = this.myCoursesService
+      .getOfficeHoursQueueFeed(this.ohEventId, () => this.pollData())
+      .subscribe((message) => {
+        if (message.type === 'get_help') {
+          this.applyGetHelpChange(message.data);
+        } else if (message.type === 'resync') {
+          this.pollData();
+        }
+      });
   }
 
-  /** Remove the timer subscriptions when the view is destroyed so polling/flashing does not persist on other pages */
+  /** Remove the subscriptions when the view is destroyed so the feed/flashing does not persist on other pages */
   ngOnDestroy(): void {
-    this.timer.unsubscribe();
+    this.feedSubscription.unsubscribe();
     this.titleFlashTimer?.unsubscribe();
   }
 
-  /** Sends a notification if necessary on each pollData call */
+  /** Sends a notification if necessary whenever the data changes */
   handleNotification(getHelpData: OfficeHourGetHelpOverview): void {
     /**
      * If a ticket exists in the new data, and its state is Called, and if the
@@ -133,6 +141,29 @@ export class OfficeHoursGetHelpComponent implements OnInit, OnDestroy {
       });
   }
 
+  /** Applies the fields of the data pushed by the feed */
+  applyGetHelpChange(change: {
+    ticket?: OfficeHourTicketOverviewJson | null;
+    queue_position?: number;
+  }): void {
+    const current = this.data();
+    if (!current) {
+      // The data has not loaded yet, and will include the change when it does.
+      return;
+    }
+    const data: OfficeHourGetHelpOverview = { ...current };
+    if (change.ticket !== undefined) {
+      data.ticket = change.ticket
+        ? parseOfficeHourTicketOverviewJson(change.ticket)
+        : undefined;
+    }
+    if (change.queue_position !== undefined) {
+      data.queue_position = change.queue_position;
+    }
+    this.handleNotification(data);
+    this.data.set(data);
+  }
+
   isFormValid(): boolean {
     let contentFieldsValid =
       this.ticketForm.controls['type'].value === 1
@@ -18,7 +18,8 @@ import { ActivatedRoute } from '@angular/router';
 import { Subscription, timer } from 'rxjs';
 import {
   OfficeHourQueueOverview,
-  OfficeHourTicketOverview
+  OfficeHourTicketOverview,
+  parseOfficeHourTicketOverviewJson
 } from 'src/app/my-courses/my-courses.model';
 import { MyCoursesService } from 'src/app/my-courses/my-courses.service';
 import { officeHourPageGuard } from '../office-hours.guard';
@@ -54,8 +55,8 @@ export class OfficeHoursQueueComponent implements OnInit, OnDestroy {
   queue: WritableSignal<OfficeHourQueueOverview | undefined> =
     signal(undefined);
 
-  /** Stores subscription to the timer observable that refreshes data every 10s */
-  timer!: Subscription;
+  /** Stores subscription to the feed pushing changes to the queue's tickets */
+  feedSubscription!: Subscription;
 
   /** Stores subscription to a timer observable for flashing the title for notifications */
   titleFlashTimer: Subscription | undefined;
@@ -71,20 +72,29 @@ export class OfficeHoursQueueComponent implements OnInit, OnDestroy {
     this.ohEventId = this.route.snapshot.params['event_id'];
   }
 
-  /** Create a timer subscription to poll office hour queue data at an interval at view initalization */
+  /** Load the queue and subscribe to changes to its tickets at view initialization */
   ngOnInit(): void {
-    this.timer = timer(0, 10000).subscribe(() => {
-      this.pollQueue();
-    });
+    this.feedSubscription = this.myCoursesService
+      .getOfficeHoursQueueFeed(this.ohEventId, () => this.pollQueue())
+      .subscribe((message) => {
+        if (message.type === 'ticket') {
+          this.applyTicketChange(
+            parseOfficeHourTicketOverviewJson(message.data),
+            message.list
+          );
+        } else if (message.type === 'resync') {
+          this.pollQueue();
+        }
+      });
   }
 
-  /** Remove the timer subscriptions when the view is destroyed so polling/flashing does not persist on other pages */
+  /** Remove the subscriptions when the view is destroyed so the feed/flashing does not persist on other pages */
   ngOnDestroy(): void {
-    this.timer.unsubscribe();
+    this.feedSubscription.unsubscribe();
     this.titleFlashTimer?.unsubscribe();
   }
 
-  /** Sends a notification if necessary on each pollQueue call */
+  /** Sends a notification if necessary whenever the queue data changes */
   handleNotification(queue: OfficeHourQueueOverview): void {
     /**
      * If you have no active/called ticket and the new queue has some ticket
@@ -137,6 +147,37 @@ export class OfficeHoursQueueComponent implements OnInit, OnDestroy {
       });
   }
 
+  /** Moves a changed ticket into the list of the queue it now belongs in, if any */
+  applyTicketChange(
+    ticket: OfficeHourTicketOverview,
+    list: 'active' | 'other_called' | 'queue' | null
+  ): void {
+    const current = this.queue();
+    if (!current) {
+      // The queue has not loaded yet, and will include the change when it does.
+      return;
+    }
+    const others = (tickets: OfficeHourTicketOverview[]) =>
+      tickets.filter((other) => other.id !== ticket.id);
+    const byId = (a: OfficeHourTicketOverview, b: OfficeHourTicketOverview) =>
+      a.id - b.id;
+    const queue: OfficeHourQueueOverview = {
+      ...current,
+      active: current.active?.id === ticket.id ? undefined : current.active,
+      other_called: others(current.other_called),
+      queue: others(current.queue)
+    };
+    if (list === 'active') {
+      queue.active = ticket;
+    } else if (list === 'other_called') {
+      queue.other_called = [...queue.other_called, ticket].sort(byId);
+    } else if (list === 'queue') {
+      queue.queue = [...queue.queue, ticket].sort(byId);
+    }
+    this.handleNotification(queue);
+    this.queue.set(queue);
+  }
+
   /** Calls a ticket and reloads the queue data */
   callTicket(ticket: OfficeHourTicketOverview): void {
     this.myCoursesService.callTicket(ticket.id).subscribe({
@@ -196,6 +196,26 @@ export interface OfficeHourGetHelpOverview {
   queue_position: number;
 }
 
+/**
+ * Message pushed by an office hours event's queue feed. Staff are sent each ticket as it changes,
+ * with the queue list it now belongs in; students are sent the get help fields that changed. A
+ * resync message asks the page to reload the event, as changes may have been missed.
+ */
+export type OfficeHoursQueueFeedMessage =
+  | {
+      type: 'ticket';
+      data: OfficeHourTicketOverviewJson;
+      list: 'active' | 'other_called' | 'queue' | null;
+    }
+  | {
+      type: 'get_help';
+      data: {
+        ticket?: OfficeHourTicketOverviewJson | null;
+        queue_position?: number;
+      };
+    }
+  | { type: 'resync' };
+
 export interface TicketDraft {
   office_hours_id: number;
   description: string;
@@ -40,14 +40,19 @@ import {
   parseOfficeHourStatisticsFilterDataJson,
   OfficeHourStatisticsFilterDataJson,
   OfficeHourStatisticsPaginationParams,
-  OfficeHoursTicketStatistics
+  OfficeHoursTicketStatistics,
+  OfficeHoursQueueFeedMessage
 } from './my-courses.model';
-import { Observable, map } from 'rxjs';
+import { Observable, map, retry } from 'rxjs';
+import { webSocket } from 'rxjs/webSocket';
 import { NagivationAdminGearService } from '../navigation/navigation-admin-gear.service';
 import { Paginated } from '../pagination';
 import saveAs from 'file-saver';
 import { consumerPollProducersForChange } from '@angular/core/primitives/signals';
 
+/** Seconds to wait before reconnecting to an office hours queue feed after it drops. */
+const RECONNECT_SECONDS = 5;
+
 /** Enum for days of the week */
 export enum Weekday {
   Monday = 'Monday',
@@ -152,6 +157,28 @@ export class MyCoursesService {
       .pipe(map(parseOfficeHourQueueOverview));
   }
 
+  /**
+   * Subscribes to the changes of an office hours event's tickets, reconnecting whenever the
+   * connection drops. Changes made while disconnected are missed, so `onConnect` is called each
+   * time the connection opens for the caller to reload the event.
+   *
+   * @param officeHoursEventId: ID of the office hours event to subscribe to
+   * @param onConnect: Called whenever the feed connects
+   * @returns { Observable<OfficeHoursQueueFeedMessage> }
+   */
+  getOfficeHoursQueueFeed(
+    officeHoursEventId: number,
+    onConnect: () => void
+  ): Observable<OfficeHoursQueueFeedMessage> {
+    const protocol = window.location.protocol === 'https:' ? 'wss' : 'ws';
+    const token = localStorage.getItem('bearerToken');
+    const url = `${protocol}://${window.location.host}/ws/office-hours/${officeHoursEventId}/queue?token=${token}`;
+    return webSocket<OfficeHoursQueueFeedMessage>({
+      url,
+      openObserver: { next: onConnect }
+    }).pipe(retry({ delay: RECONNECT_SECONDS * 1000 }));
+  }
+
   /**
    * Calls a ticket.
    * @param ticketId: ID of the ticket to call
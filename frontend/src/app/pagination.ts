@@ -20,6 +20,10 @@ export interface PaginationParams extends URLSearchParams {
   page_size: number;
   order_by: string;
   filter: string;
+  /** Resumes after the page that returned this `next_cursor`, in place of `page`. */
+  cursor?: string;
+  /** Whether the `length` of a page is `exact`, an `estimate`, or skipped (`none`, as -1). */
+  count?: 'exact' | 'estimate' | 'none';
 }
 
 export const DEFAULT_PAGINATION_PARAMS = {
@@ -58,6 +62,7 @@ export interface Paginated<T, ParamType> {
   items: T[];
   length: number;
   params: ParamType;
+  next_cursor?: string | null;
 }
 
 /**
@@ -135,7 +140,8 @@ abstract class PaginatorAbstraction<T, Params extends URLSearchParams> {
           let paginated: Paginated<T, Params> = {
             items: paginatedResponse.items.map(operator),
             length: paginatedResponse.length,
-            params: paginatedResponse.params
+            params: paginatedResponse.params,
+            next_cursor: paginatedResponse.next_cursor
           };
           return paginated;
         }),
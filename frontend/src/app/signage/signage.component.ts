@@ -11,7 +11,6 @@ import { SignageService } from './signage.service';
 import { WeatherService } from './weather.service';
 import { Subscription, timer, delay } from 'rxjs';
 
-const REFRESH_FAST_SECONDS = 20;
 const REFRESH_SLOW_MINUTES = 20;
 
 @Component({
@@ -26,8 +25,7 @@ export class SignageComponent implements OnInit, OnDestroy {
   };
 
   date: number = Date.now();
-  private fastSubscription!: Subscription;
-  private slowSubscription!: Subscription;
+  private feedSubscription!: Subscription;
   private dateSubscription!: Subscription;
   private weatherSubscription!: Subscription;
 
@@ -37,17 +35,8 @@ export class SignageComponent implements OnInit, OnDestroy {
   ) {}
 
   ngOnInit(): void {
-    this.fastSubscription = timer(0, REFRESH_FAST_SECONDS * 1000).subscribe(
-      () => {
-        this.signageService.getFastData();
-      }
-    );
-
-    this.slowSubscription = timer(0, REFRESH_SLOW_MINUTES * 60000).subscribe(
-      () => {
-        this.signageService.getSlowData();
-      }
-    );
+    // Signage data is pushed by the server as it changes rather than polled
+    this.feedSubscription = this.signageService.connect();
 
     this.weatherSubscription = timer(0, REFRESH_SLOW_MINUTES * 60000).subscribe(
       () => {
@@ -65,11 +54,8 @@ export class SignageComponent implements OnInit, OnDestroy {
 
   ngOnDestroy(): void {
     // If statements needed here to prevent null exception
-    if (this.fastSubscription) {
-      this.fastSubscription.unsubscribe();
-    }
-    if (this.slowSubscription) {
-      this.slowSubscription.unsubscribe();
+    if (this.feedSubscription) {
+      this.feedSubscription.unsubscribe();
     }
     if (this.dateSubscription) {
       this.dateSubscription.unsubscribe();
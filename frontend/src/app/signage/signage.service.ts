@@ -10,7 +10,8 @@
 
 import { HttpClient } from '@angular/common/http';
 import { Injectable, signal, WritableSignal } from '@angular/core';
-import { map } from 'rxjs';
+import { map, retry, Subscription } from 'rxjs';
+import { webSocket } from 'rxjs/webSocket';
 import {
   FastSignageData,
   FastSignageDataJson,
@@ -20,6 +21,14 @@ import {
   parseSlowSignageDataJson
 } from './signage.model';
 
+/** Seconds to wait before reconnecting to the signage feed after it drops. */
+const RECONNECT_SECONDS = 5;
+
+/** Message pushed by the signage feed: complete data on connect, then only the fields that changed. */
+type SignageFeedMessage =
+  | { type: 'fast'; data: Partial<FastSignageDataJson> }
+  | { type: 'slow'; data: Partial<SlowSignageDataJson> };
+
 @Injectable({
   providedIn: 'root'
 })
@@ -39,9 +48,31 @@ export class SignageService {
   });
   public slowData = this.slowDataSignal.asReadonly();
 
-  constructor(protected http: HttpClient) {
-    this.getSlowData();
-    this.getFastData();
+  private fastDataJson?: FastSignageDataJson;
+  private slowDataJson?: SlowSignageDataJson;
+
+  constructor(protected http: HttpClient) {}
+
+  /**
+   * Connects to the signage feed, which pushes the signage data and then its changes, and updates
+   * the signals as messages arrive. The connection is retried whenever it drops.
+   *
+   * @return Feed Subscription
+   */
+  connect(): Subscription {
+    const protocol = window.location.protocol === 'https:' ? 'wss' : 'ws';
+    const url = `${protocol}://${window.location.host}/ws/signage`;
+    return webSocket<SignageFeedMessage>({ url })
+      .pipe(retry({ delay: RECONNECT_SECONDS * 1000 }))
+      .subscribe((message) => {
+        if (message.type === 'fast') {
+          this.fastDataJson = { ...this.fastDataJson!, ...message.data };
+          this.fastDataSignal.set(parseFastSignageDataJson(this.fastDataJson));
+        } else {
+          this.slowDataJson = { ...this.slowDataJson!, ...message.data };
+          this.slowDataSignal.set(parseSlowSignageDataJson(this.slowDataJson));
+        }
+      });
   }
 
   /**